@@ -394,11 +394,6 @@ def create_app():
             init_catalog()
         except Exception:
             pass
-        try:
-            from src.core.db import _dedup_price_checks_on_boot
-            _dedup_price_checks_on_boot()
-        except Exception:
-            pass
         # Boot disk cleanup — prune old backups and stale files
         try:
             from src.core.paths import DATA_DIR as _data
@@ -418,30 +413,41 @@ def create_app():
         except Exception as e:
             logging.getLogger("reytech").warning("Boot disk cleanup: %s", e)
 
+        # Data-maintenance backfills, gated by the boot-task ledger
+        # (src/core/boot_tasks.py). Each task records a watermark of its
+        # inputs after it runs; on the next deploy / worker recycle it is
+        # skipped unless those inputs changed. Order is the historical
+        # order — the syncs must land before recovery and the cleanups.
+        def _dedup_pcs():
+            from src.core.db import _dedup_price_checks_on_boot
+            _dedup_price_checks_on_boot()
+
         # Reconciliation tasks — moved off critical startup path (not needed for first request)
-        try:
-            from src.core.db import _reconcile_quotes_json, _boot_sync_quotes, _boot_sync_pcs
+        def _reconcile_quotes():
+            from src.core.db import _reconcile_quotes_json
             _reconcile_quotes_json()
+
+        def _sync_quotes():
+            from src.core.db import _boot_sync_quotes
             _boot_sync_quotes()
+
+        def _sync_pcs():
+            from src.core.db import _boot_sync_pcs
             _boot_sync_pcs()
-        except Exception:
-            pass
-        # Recover PCs stuck in 'enriching' state from interrupted deploys
-        try:
+
+        # Recover PCs stuck in 'enriching' state from interrupted deploys.
+        # The interruption itself is the input, so this one always runs.
+        def _recover_stuck():
             from src.agents.pc_enrichment_pipeline import recover_stuck_enrichments
             recover_stuck_enrichments()
-        except Exception as e:
-            logging.getLogger("reytech").warning("Enrichment recovery on boot: %s", e)
 
         # Junk-pn cleanup (Mike P0 cont. of PR #741): scrub catalog rows
         # whose sku/mfg_number is a buyer placeholder (1-3 chars). Stops
         # match_item Strategy 1 from surfacing the wrong product on lines
         # whose placeholder pn happens to equal an existing junk sku.
-        try:
+        def _catalog_junk_pn():
             from src.agents.product_catalog import cleanup_polluted_catalog_rows
             cleanup_polluted_catalog_rows()
-        except Exception as e:
-            logging.getLogger("reytech").warning("Catalog junk-pn cleanup on boot: %s", e)
 
         # Placeholder-ASIN backfill (Mike P0 2026-05-12 live drive of
         # pc_5728f934). Twin of the junk-pn cleanup above: NULL out
@@ -450,55 +456,79 @@ def create_app():
         # `sanitize_supplier_url` stops new pollution; this backfill
         # clears what already polluted the catalog before the gate
         # landed. Idempotent — re-runs are no-ops.
-        try:
+        def _catalog_placeholder_asin():
             from src.agents.product_catalog import cleanup_placeholder_asin_urls
             cleanup_placeholder_asin_urls()
-        except Exception as e:
-            logging.getLogger("reytech").warning("Placeholder-ASIN cleanup on boot: %s", e)
 
         # JSON-side twin: walks data/rfqs.json + data/price_checks.json and
         # clears item_link on lines whose URL is a placeholder Amazon ASIN.
-        # Same idempotent backfill — covers the on-disk items separately
-        # from the catalog DB cleanup above.
-        try:
+        def _json_placeholder_asin():
             from src.agents.product_catalog import cleanup_placeholder_asin_in_json
             cleanup_placeholder_asin_in_json()
-        except Exception as e:
-            logging.getLogger("reytech").warning("Placeholder-ASIN JSON cleanup on boot: %s", e)
 
         # SCPRS per-SKU rollup (Phase 1.5-A, 2026-05-13). Builds the
-        # `scprs_price_stats` table from scprs_po_lines once on boot so
-        # the oracle has a pre-computed prior available when wire-up
-        # ships in Phase 1.5-B. Idempotent — DELETE+INSERT in one txn.
-        # Gated by env var so we can disable during smoke if a bug
-        # surfaces in prod without redeploy.
-        if os.environ.get("SCPRS_ROLLUP_ON_BOOT", "1") != "0":
-            try:
-                from src.agents.scprs_price_stats import rebuild_scprs_price_stats
-                rebuild_scprs_price_stats()
-            except Exception as e:
-                logging.getLogger("reytech").warning("SCPRS rollup on boot: %s", e)
+        # `scprs_price_stats` table from scprs_po_lines so the oracle has
+        # a pre-computed prior. Idempotent — DELETE+INSERT in one txn.
+        def _scprs_rollup():
+            from src.agents.scprs_price_stats import rebuild_scprs_price_stats
+            rebuild_scprs_price_stats()
 
         # Stale cs_drafts purge: remove untouched auto-drafts >30d old
         # from the email outbox. 132 stale drafts surfaced 2026-05-04;
         # operator never triaged them, original buyer email is past
         # responding-window. Sent / approved / dismissed drafts kept.
-        try:
+        def _purge_cs_drafts():
             from src.agents.cs_agent import purge_stale_cs_drafts
             purge_stale_cs_drafts(max_age_days=30)
-        except Exception as e:
-            logging.getLogger("reytech").warning("CS-draft purge on boot: %s", e)
 
         # SQLite-side companion (Phase 3.3 2026-05-05): the JSON purge
         # above only sweeps email_outbox.json. Prod 2026-05-04 surfaced
-        # 268+ pending drafts living in the SQLite email_outbox table —
-        # an entirely separate data store. This boot job is the SQL
-        # counterpart that actually drains the gmail_send card pile.
-        try:
+        # 268+ pending drafts living in the SQLite email_outbox table.
+        def _purge_outbox_sql():
             from src.agents.cs_agent import purge_stale_email_outbox
             purge_stale_email_outbox(max_age_days=30)
+
+        try:
+            from src.core.boot_tasks import (
+                BootTask, daily_source, file_source, run_boot_tasks, table_source,
+            )
+            _pcs_json = file_source("price_checks.json")
+            _quotes_json = file_source("quotes_log.json")
+            _quotes_tbl = table_source("quotes")
+            _catalog = table_source("product_catalog")
+            _boot_tasks = [
+                BootTask("dedup_price_checks", _dedup_pcs, sources=(_pcs_json,)),
+                BootTask("reconcile_quotes_json", _reconcile_quotes,
+                         sources=(_quotes_json, _quotes_tbl)),
+                BootTask("boot_sync_quotes", _sync_quotes,
+                         sources=(_quotes_json, _quotes_tbl)),
+                BootTask("boot_sync_pcs", _sync_pcs,
+                         sources=(_pcs_json, table_source("price_checks"))),
+                BootTask("recover_stuck_enrichments", _recover_stuck),
+                BootTask("cleanup_polluted_catalog_rows", _catalog_junk_pn,
+                         sources=(_catalog,)),
+                BootTask("cleanup_placeholder_asin_urls", _catalog_placeholder_asin,
+                         sources=(_catalog,)),
+                BootTask("cleanup_placeholder_asin_in_json", _json_placeholder_asin,
+                         sources=(file_source("rfqs.json"), _pcs_json)),
+            ]
+            # Gated by env var so we can disable the rollup during smoke
+            # if a bug surfaces in prod without redeploy.
+            if os.environ.get("SCPRS_ROLLUP_ON_BOOT", "1") != "0":
+                _boot_tasks.append(BootTask(
+                    "rebuild_scprs_price_stats", _scprs_rollup,
+                    sources=(table_source("scprs_po_lines"),
+                             table_source("scprs_po_master"))))
+            # Age-based purges: also re-run once a day when idle.
+            _boot_tasks += [
+                BootTask("purge_stale_cs_drafts", _purge_cs_drafts,
+                         sources=(file_source("email_outbox.json"), daily_source())),
+                BootTask("purge_stale_email_outbox", _purge_outbox_sql,
+                         sources=(table_source("email_outbox"), daily_source())),
+            ]
+            run_boot_tasks(_boot_tasks)
         except Exception as e:
-            logging.getLogger("reytech").warning("Email-outbox SQL purge on boot: %s", e)
+            logging.getLogger("reytech").warning("Boot tasks: %s", e)
 
         # Structured logging already initialized in create_app()
         try:
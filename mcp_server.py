@@ -2,7 +2,9 @@
 """
 mcp_server.py — Claude MCP tool server for Reytech RFQ.
 
-Registers 5 tools that call the Reytech RFQ API endpoints.
+Registers tools that call the Reytech RFQ API endpoints. The list_* tools
+page through /api/v1/rfqs|pcs|orders by cursor: pass back next_cursor to
+continue, and keep the last one to fetch only records changed since.
 Run: python mcp_server.py (or via Claude Desktop config)
 
 Requires: API_KEY env var set, app running at REYTECH_URL.
@@ -29,9 +31,10 @@ def _headers():
     return {"X-API-Key": API_KEY, "Content-Type": "application/json"}
 
 
-def _get(path: str) -> dict:
+def _get(path: str, params: dict = None) -> dict:
     """GET request to Reytech API."""
-    resp = httpx.get(f"{REYTECH_URL}{path}", headers=_headers(), timeout=15)
+    resp = httpx.get(f"{REYTECH_URL}{path}", headers=_headers(),
+                     params=params, timeout=15)
     resp.raise_for_status()
     return resp.json()
 
@@ -44,6 +47,35 @@ def _post(path: str, data: dict = None) -> dict:
     return resp.json()
 
 
+# tool name -> v1 list endpoint (cursor-paginated, change order)
+_LIST_TOOLS = {
+    "list_rfqs": ("/api/v1/rfqs", "RFQs"),
+    "list_price_checks": ("/api/v1/pcs", "price checks"),
+    "list_orders": ("/api/v1/orders", "orders"),
+}
+_LIST_PARAMS = ("status", "agency", "updated_since", "cursor", "limit")
+
+
+def _list_tool(name: str, label: str) -> Tool:
+    return Tool(
+        name=name,
+        description=(f"List {label} a page at a time, oldest change first. Returns "
+                     "items, next_cursor and has_more; call again with cursor="
+                     "next_cursor while has_more. Saving the last next_cursor and "
+                     "calling with it later returns only records changed since."),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "status": {"type": "string", "description": "Comma-separated statuses to include"},
+                "agency": {"type": "string", "description": "Agency code (case-insensitive)"},
+                "updated_since": {"type": "string", "description": "ISO datetime (UTC) or epoch seconds"},
+                "cursor": {"type": "string", "description": "next_cursor from the previous call"},
+                "limit": {"type": "integer", "description": "Page size (max 500)", "default": 100},
+            }
+        }
+    )
+
+
 @server.list_tools()
 async def list_tools():
     return [
@@ -114,7 +146,7 @@ async def list_tools():
                 "required": ["solicitation_number", "agency"]
             }
         ),
-    ]
+    ] + [_list_tool(name, label) for name, (_path, label) in _LIST_TOOLS.items()]
 
 
 @server.call_tool()
@@ -140,6 +172,10 @@ async def call_tool(name: str, arguments: dict):
                 "items": arguments.get("line_items", []),
             }
             result = _post("/api/v1/rfq/create", payload)
+        elif name in _LIST_TOOLS:
+            params = {k: arguments[k] for k in _LIST_PARAMS
+                      if arguments.get(k) not in (None, "")}
+            result = _get(_LIST_TOOLS[name][0], params)
         else:
             return [TextContent(type="text", text=json.dumps({"error": f"Unknown tool: {name}"}))]
 
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Benchmark the merged classifier rule sets against the per-pattern loop.
+
+Replays the email corpus mined by `tools/mine_email_corpus.py` through
+every `RuleSet` family used by request_classifier and email_poller, and
+reports loop-vs-merged timings plus any parity mismatch. A mismatch means
+a merged alternation disagrees with the plain `re.search` loop and the
+family must not ship merged.
+
+Usage:
+    python scripts/bench_classifier_rules.py
+    python scripts/bench_classifier_rules.py data/email_corpus/sales_corpus.jsonl
+    python scripts/bench_classifier_rules.py --repeat 5 --json
+
+Exit codes:
+    0 — all families at parity
+    1 — corpus missing/empty, or at least one parity mismatch
+"""
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+
+os.environ.setdefault("SECRET_KEY", "diag")
+os.environ.setdefault("DASH_USER", "diag")
+os.environ.setdefault("DASH_PASS", "diag")
+os.environ.setdefault("FLASK_ENV", "testing")
+
+DEFAULT_GLOB = os.path.join(REPO, "data", "email_corpus", "*_corpus.jsonl")
+
+
+def load_corpus(paths):
+    """Yield corpus records from one or more mine_email_corpus JSONL files."""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+def families():
+    """(label, RuleSet, op, text_fn) for every merged family in production.
+
+    `op` is the query the production call site uses — any/first/hits —
+    so the timing reflects what each message actually pays.
+    """
+    from src.core import request_classifier as rc
+    from src.agents import email_poller as ep
+
+    def corpus(r):
+        names = " ".join(a.get("filename", "") for a in r.get("attachments") or [])
+        return " ".join([r.get("subject", ""), r.get("body_preview", ""),
+                         r.get("from_email", ""), names]).upper()
+
+    def body(r):
+        return r.get("body_preview", "")
+
+    def subject_low(r):
+        return (r.get("subject") or "").strip().lower()
+
+    def att_names(r):
+        return " ".join(
+            (a.get("filename") or "").lower().replace(" ", ".").replace("-", ".")
+            for a in r.get("attachments") or []
+        )
+
+    return [
+        ("agency_keywords", rc._AGENCY_RULES, "hits", corpus),
+        ("institution_prefixes", rc._INSTITUTION_RULES, "hits", corpus),
+        ("lpa_body", rc._LPA_BODY_RULES, "any", corpus),
+        ("ams704_headline", rc._AMS_704_HEADLINE_RULES, "any", body),
+        ("pricing_page", rc._PRICING_PAGE_RULES, "hits", body),
+        ("proofpoint_sender", rc._PROOFPOINT_SENDER_RULES, "first", lambda r: r.get("from_email", "")),
+        ("proofpoint_subject", rc._PROOFPOINT_SUBJECT_RULES, "first", lambda r: r.get("subject", "")),
+        ("proofpoint_body", rc._PROOFPOINT_BODY_RULES, "first", body),
+        ("newsletter_body", ep._NEWSLETTER_RULES, "hits", lambda r: body(r).lower()),
+        ("pc_subject", ep._PC_SUBJECT_RULES, "first", subject_low),
+        ("rfq_pdf_names", ep._RFQ_PDF_RULES, "any", att_names),
+    ]
+
+
+def _loop(rules, op):
+    """The per-pattern loop each call site used before the merge."""
+    if op == "hits":
+        return rules.naive_hits
+
+    def run(text):
+        for rule in _iter_loop(rules, text):
+            return rule if op == "first" else True
+        return None if op == "first" else False
+    return run
+
+
+def _iter_loop(rules, text):
+    for rule, compiled in zip(rules.rules, rules._singles):
+        if rules._match_one(compiled, text):
+            yield rule
+
+
+def bench(records, repeat=3):
+    rows = []
+    for label, rules, op, text_fn in families():
+        texts = [text_fn(r) for r in records]
+        mismatches = 0
+        for t in texts:
+            if [h.index for h in rules.hits(t)] != [h.index for h in rules.naive_hits(t)]:
+                mismatches += 1
+
+        def timed(fn):
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                for t in texts:
+                    fn(t)
+                best = min(best, time.perf_counter() - t0)
+            return best
+
+        loop_s = timed(_loop(rules, op))
+        merged_s = timed(getattr(rules, op))
+        rows.append({
+            "family": label,
+            "op": op,
+            "rules": len(rules),
+            "loop_ms": round(loop_s * 1000, 2),
+            "merged_ms": round(merged_s * 1000, 2),
+            "speedup": round(loop_s / merged_s, 2) if merged_s else None,
+            "mismatches": mismatches,
+        })
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("corpus", nargs="*", help="corpus JSONL file(s)")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    parser.add_argument("--json", action="store_true", help="machine-readable output")
+    args = parser.parse_args()
+
+    paths = args.corpus or sorted(glob.glob(DEFAULT_GLOB))
+    records = list(load_corpus(paths))
+    if not records:
+        print(f"ERROR: no corpus records (looked in {paths or DEFAULT_GLOB}).\n"
+              "Run tools/mine_email_corpus.py first.", file=sys.stderr)
+        return 1
+
+    rows = bench(records, repeat=args.repeat)
+    if args.json:
+        print(json.dumps({"records": len(records), "families": rows}, indent=2))
+    else:
+        print(f"{len(records)} emails from {len(paths)} file(s)\n")
+        print(f"{'family':<22}{'op':>6}{'rules':>6}{'loop ms':>10}{'merged ms':>11}{'x':>7}{'diff':>6}")
+        for r in rows:
+            print(f"{r['family']:<22}{r['op']:>6}{r['rules']:>6}{r['loop_ms']:>10}"
+                  f"{r['merged_ms']:>11}{r['speedup']:>7}{r['mismatches']:>6}")
+    return 1 if any(r["mismatches"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
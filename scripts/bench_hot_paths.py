@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Offline benchmarks for the hot paths, against a synthetic prod-sized DB.
+
+Runs each benchmark against the dataset from `scripts/gen_synthetic_data.py`
+(generated on first use), reports median / min / p90 per benchmark, and
+compares the medians with the stored baselines in
+`scripts/bench_baselines.json`. A benchmark regresses when its median is
+more than `--threshold` slower than baseline *and* at least `--min-delta`
+ms slower — the absolute floor keeps sub-millisecond noise from failing
+the run.
+
+    smart_search        product_catalog.smart_search — 20 mixed queries
+    get_pricing         pricing_oracle_v2.get_pricing — 10 item descriptions
+    fill_704a           fill_engine.fill — one 12-line AMS 704 (pypdf/pydantic)
+    load_price_checks   data_layer._load_price_checks — all PCs, cold
+    load_rfqs           data_layer.load_rfqs — all RFQs
+    universal_search    routes_search.universal_search — 6 queries (Flask)
+
+Benchmarks whose dependencies aren't installed are reported as skipped,
+not failed. API keys are stripped from the environment before anything
+is imported, so no benchmark can reach a paid API.
+
+Usage:
+    python scripts/bench_hot_paths.py                         # run + compare
+    python scripts/bench_hot_paths.py --only smart_search,get_pricing
+    python scripts/bench_hot_paths.py --repeat 10 --json
+    python scripts/bench_hot_paths.py --update-baseline       # after a deliberate change
+    python scripts/bench_hot_paths.py --data /tmp/bench --scale 0.1
+
+Exit codes:
+    0 — no regressions (or no baseline to compare against)
+    1 — at least one benchmark regressed
+    2 — dataset missing / wrong scale and could not be generated
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+
+from scripts import gen_synthetic_data as gen  # noqa: E402
+
+BASELINE_PATH = os.path.join(HERE, "bench_baselines.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_DELTA_MS = 5.0
+
+_SEARCH_QUERIES = [
+    "nitrile gloves", "sterile gauze 100/bx", "RT-004217", "toner", "adult brief",
+    "heavy duty bag", "blood pressure cuff", "powder-free large gloves",
+    "sharps container", "recycled paper", "A12345-3", "disposable mask",
+    "pediatric thermometer", "clear tape", "soap", "antimicrobial wipes",
+    "binder", "x", "unscented lotion 12/cs", "medium gown",
+]
+_PRICING_ITEMS = [
+    ("nitrile gloves 100/bx", 10), ("sterile gauze 12/cs", 5),
+    ("adult brief 24/cs", 20), ("toner cartridge", 2), ("disposable mask 50/pk", 40),
+    ("blood pressure cuff", 1), ("antimicrobial wipes", 12), ("clear tape", 24),
+    ("recycled paper 500/cs", 6), ("sharps container", 3),
+]
+_UNIVERSAL_QUERIES = ["gloves", "PC-01234", "folsom", "R26Q00042", "buyer 17", ""]
+
+
+@dataclass
+class Bench:
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    requires: tuple = ()
+
+
+@dataclass
+class Result:
+    name: str
+    status: str = "ok"              # ok | skipped | error
+    samples_ms: list = field(default_factory=list)
+    detail: str = ""
+
+    @property
+    def median_ms(self) -> Optional[float]:
+        return round(statistics.median(self.samples_ms), 2) if self.samples_ms else None
+
+    def summary(self) -> dict:
+        out = {"status": self.status}
+        if self.samples_ms:
+            s = sorted(self.samples_ms)
+            out.update(median_ms=self.median_ms, min_ms=round(s[0], 2),
+                       p90_ms=round(s[min(len(s) - 1, int(len(s) * 0.9))], 2),
+                       n=len(s))
+        if self.detail:
+            out["detail"] = self.detail
+        return out
+
+
+# ── benchmark bodies ─────────────────────────────────────────────────────────
+
+def _setup_smart_search():
+    from src.agents.product_catalog import smart_search
+    smart_search("warmup")
+
+    def run():
+        for q in _SEARCH_QUERIES:
+            smart_search(q, limit=20)
+    return run
+
+
+def _setup_get_pricing():
+    from src.core.pricing_oracle_v2 import get_pricing
+
+    def run():
+        for desc, qty in _PRICING_ITEMS:
+            get_pricing(desc, quantity=qty, force_refresh=True)
+    return run
+
+
+def _setup_fill_704a():
+    from src.core.quote_model import Quote
+    from src.forms.fill_engine import fill
+    from src.forms.profile_registry import load_profiles
+    profile = load_profiles()["704a_reytech_standard"]
+    items = [{"line_number": n, "description": f"{desc} — line {n}", "qty": qty,
+              "uom": "EA", "supplier_cost": 4.5 + n, "unit_price": 6.0 + n}
+             for n, (desc, qty) in enumerate((_PRICING_ITEMS * 2)[:12], 1)]
+    pc = {"header": {"pc_number": "PC-BENCH", "institution": "CSP-Sacramento",
+                     "agency": "CDCR", "requestor": "Bench Buyer",
+                     "zip_code": "95671", "due_date": "06/30/2026"},
+          "items": items}
+    quote = Quote.from_legacy_dict(pc, doc_type="pc")
+
+    def run():
+        fill(quote, profile)
+    return run
+
+
+def _setup_load_price_checks():
+    from src.api import data_layer
+
+    def run():
+        data_layer._pc_cache.invalidate()   # measure the load, not the 30s memo
+        data_layer._load_price_checks()
+    return run
+
+
+def _setup_load_rfqs():
+    from src.api.data_layer import load_rfqs
+
+    def run():
+        load_rfqs()
+    return run
+
+
+def _setup_universal_search():
+    from src.api.modules.routes_search import universal_search
+
+    def run():
+        for q in _UNIVERSAL_QUERIES:
+            universal_search(q, limit=50)
+    return run
+
+
+BENCHMARKS = [
+    Bench("smart_search", _setup_smart_search),
+    Bench("get_pricing", _setup_get_pricing),
+    Bench("fill_704a", _setup_fill_704a, requires=("pypdf", "pydantic", "yaml")),
+    Bench("load_price_checks", _setup_load_price_checks),
+    Bench("load_rfqs", _setup_load_rfqs),
+    Bench("universal_search", _setup_universal_search, requires=("flask",)),
+]
+
+
+def _missing(modules) -> list:
+    import importlib.util
+    return [m for m in modules if importlib.util.find_spec(m) is None]
+
+
+def run_benchmarks(names=None, repeat: int = 5, warmup: int = 1) -> dict:
+    """Run the selected benchmarks in-process against the current DB_PATH.
+
+    Returns {name: Result}. Setup cost (imports, warmup query) is outside
+    the timed samples.
+    """
+    selected = [b for b in BENCHMARKS if not names or b.name in names]
+    results = {}
+    for b in selected:
+        res = results[b.name] = Result(b.name)
+        missing = _missing(b.requires)
+        if missing:
+            res.status, res.detail = "skipped", "missing " + ", ".join(missing)
+            continue
+        try:
+            fn = b.setup()
+            for _ in range(warmup):
+                fn()
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                fn()
+                res.samples_ms.append((time.perf_counter() - t0) * 1000)
+        except ImportError as e:
+            res.status, res.detail = "skipped", str(e)
+        except Exception as e:
+            res.status, res.detail = "error", f"{type(e).__name__}: {e}"
+    return results
+
+
+def load_baselines(path: str = BASELINE_PATH) -> dict:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def compare(results: dict, baselines: dict, threshold: float = DEFAULT_THRESHOLD,
+            min_delta_ms: float = DEFAULT_MIN_DELTA_MS) -> dict:
+    """{name: verdict} where verdict is one of ok / regressed / improved /
+    no-baseline / skipped / error, plus the ratio when both sides exist."""
+    stored = baselines.get("results", {})
+    verdicts = {}
+    for name, res in results.items():
+        base = (stored.get(name) or {}).get("median_ms")
+        if res.status != "ok":
+            verdicts[name] = {"verdict": res.status}
+            continue
+        if not base:
+            verdicts[name] = {"verdict": "no-baseline"}
+            continue
+        cur = res.median_ms
+        ratio = cur / base
+        if ratio > 1 + threshold and cur - base >= min_delta_ms:
+            verdict = "regressed"
+        elif ratio < 1 / (1 + threshold) and base - cur >= min_delta_ms:
+            verdict = "improved"
+        else:
+            verdict = "ok"
+        verdicts[name] = {"verdict": verdict, "ratio": round(ratio, 2),
+                          "baseline_ms": base}
+    return verdicts
+
+
+def save_baselines(results: dict, manifest: dict, path: str = BASELINE_PATH) -> None:
+    """Merge `results` into the baseline file (benchmarks that were skipped
+    here keep whatever baseline they already had)."""
+    data = load_baselines(path)
+    stored = data.get("results", {})
+    for name, res in results.items():
+        if res.status == "ok":
+            stored[name] = {"median_ms": res.median_ms}
+    data.update({
+        "scale": manifest.get("scale"), "seed": manifest.get("seed"),
+        "python": platform.python_version(), "machine": platform.machine(),
+        "recorded_at": time.strftime("%Y-%m-%d"), "results": dict(sorted(stored.items())),
+    })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def _prepare_env(data_dir: str) -> None:
+    """Point every module at the synthetic dir and make the run offline.
+    Must happen before the first `src` import."""
+    os.environ["REYTECH_DATA_DIR"] = data_dir
+    os.environ["ENABLE_BACKGROUND_AGENTS"] = "false"
+    for key in ("SECRET_KEY", "DASH_USER", "DASH_PASS"):
+        os.environ.setdefault(key, "bench")
+    os.environ.setdefault("FLASK_ENV", "testing")
+    for key in list(os.environ):
+        if key.endswith(("_API_KEY", "_TOKEN", "_SECRET_KEY")) and key != "SECRET_KEY":
+            os.environ.pop(key)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--data", default=gen.DEFAULT_OUT, help="synthetic data dir")
+    ap.add_argument("--scale", type=float, default=1.0)
+    ap.add_argument("--only", default="", help="comma-separated benchmark names")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                    help="allowed slowdown vs baseline (0.25 = 25%%)")
+    ap.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA_MS,
+                    help="ignore slowdowns smaller than this many ms")
+    ap.add_argument("--update-baseline", action="store_true")
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    data_dir = os.path.abspath(args.data)
+    _prepare_env(data_dir)
+    manifest = gen.read_manifest(data_dir)
+    if manifest is None or manifest.get("scale") != args.scale:
+        print(f"generating synthetic data (scale {args.scale}) in {data_dir} ...",
+              file=sys.stderr)
+        if gen.main(["--out", data_dir, "--scale", str(args.scale), "--force"]) != 0:
+            return 2
+        manifest = gen.read_manifest(data_dir)
+
+    gen.boot_schema()
+
+    names = {n.strip() for n in args.only.split(",") if n.strip()} or None
+    results = run_benchmarks(names, repeat=args.repeat)
+
+    baselines = load_baselines()
+    comparable = baselines.get("scale") == manifest.get("scale")
+    verdicts = compare(results, baselines if comparable else {},
+                       args.threshold, args.min_delta)
+    if args.update_baseline:
+        save_baselines(results, manifest)
+
+    if args.json:
+        print(json.dumps({"scale": manifest.get("scale"),
+                          "results": {n: {**r.summary(), **verdicts[n]}
+                                      for n, r in results.items()}}, indent=2))
+    else:
+        if baselines and not comparable:
+            print(f"baseline recorded at scale {baselines.get('scale')} — not comparing")
+        print(f"{'benchmark':<20} {'median':>10} {'min':>10} {'p90':>10} "
+              f"{'baseline':>10}  verdict")
+        for name, res in results.items():
+            s, v = res.summary(), verdicts[name]
+            fmt = lambda x: f"{x:.1f}ms" if isinstance(x, (int, float)) else "-"
+            print(f"{name:<20} {fmt(s.get('median_ms')):>10} {fmt(s.get('min_ms')):>10} "
+                  f"{fmt(s.get('p90_ms')):>10} {fmt(v.get('baseline_ms')):>10}  "
+                  f"{v['verdict']}{' ' + res.detail if res.detail else ''}")
+        if args.update_baseline:
+            print(f"baselines written to {os.path.relpath(BASELINE_PATH, REPO)}")
+    return 1 if any(v["verdict"] == "regressed" for v in verdicts.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
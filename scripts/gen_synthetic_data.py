@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""Generate a synthetic reytech.db sized like production for benchmarks.
+
+Every row is fabricated from fixed word lists with a seeded RNG, so two
+runs with the same `--seed` and `--scale` produce identical rows and
+benchmark numbers are comparable across machines and commits. Nothing
+here touches the network or the real data directory.
+
+Volumes at `--scale 1.0` (prod, mid-2026):
+
+    product_catalog   50,000 products
+    won_quotes        20,000 award lines
+    price_checks       5,000 PCs (3–15 items each, data_json blobs)
+    rfqs               2,000 RFQs
+    quotes             3,000 quotes
+    scprs_po_master   20,000 POs
+    scprs_po_lines   200,000 lines
+
+Usage:
+    python scripts/gen_synthetic_data.py                      # /tmp/reytech_bench
+    python scripts/gen_synthetic_data.py --out /tmp/bench --scale 0.1
+    python scripts/gen_synthetic_data.py --seed 7 --force
+
+The output directory is a complete REYTECH_DATA_DIR — point the app (or
+scripts/bench_hot_paths.py --data) at it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+
+DEFAULT_OUT = os.path.join(tempfile.gettempdir(), "reytech_bench")
+DEFAULT_SEED = 1234
+
+VOLUMES = {
+    "product_catalog": 50_000,
+    "won_quotes": 20_000,
+    "price_checks": 5_000,
+    "rfqs": 2_000,
+    "quotes": 3_000,
+    "scprs_po_master": 20_000,
+    "scprs_po_lines": 200_000,
+}
+
+_NOUNS = ["gloves", "gauze", "bandage", "syringe", "catheter", "mask", "gown",
+          "wipes", "tape", "swab", "cup", "towel", "brief", "pad", "liner",
+          "razor", "toothbrush", "soap", "lotion", "shampoo", "battery",
+          "pen", "marker", "folder", "paper", "toner", "label", "binder",
+          "stapler", "envelope", "sponge", "bag", "glove liner", "thermometer",
+          "blood pressure cuff", "lancet", "tongue depressor", "sharps container"]
+_ADJS = ["nitrile", "latex-free", "sterile", "non-sterile", "disposable",
+         "powder-free", "adult", "pediatric", "heavy duty", "recycled",
+         "antimicrobial", "hypoallergenic", "extra large", "small", "medium",
+         "large", "blue", "white", "black", "clear", "scented", "unscented"]
+_PACKS = ["100/bx", "50/pk", "12/cs", "1 ea", "200/bx", "24/cs", "10/pk",
+          "500/cs", "6/pk", "1000/cs"]
+_MFGS = ["McKesson", "Medline", "Cardinal Health", "3M", "Kimberly-Clark",
+         "BD", "Dynarex", "Avery", "Bic", "Hammermill", "Duracell", "Colgate"]
+_CATEGORIES = ["Medical", "Janitorial", "Office", "Personal Care", "Food Service",
+               "Safety", "Electronics", "Linens"]
+_AGENCIES = ["CDCR", "CCHCS", "CalVet", "DSH", "CalFire", "DGS", "CHP"]
+_INSTITUTIONS = ["CSP-Sacramento", "Folsom State Prison", "CIW", "Mule Creek",
+                 "Veterans Home Fresno", "Veterans Home Yountville",
+                 "DSH-Atascadero", "DSH-Napa", "San Quentin", "Pelican Bay"]
+_SUPPLIERS = ["Reytech Inc.", "Grainger", "Uline", "Office Depot", "Medline",
+              "Bound Tree", "Henry Schein", "Staples", "Amazon Business"]
+_PC_STATUSES = (["new"] * 3 + ["parsed"] * 4 + ["priced"] * 4 + ["ready"] * 2
+                + ["sent"] * 6 + ["won"] * 2 + ["lost"] * 2 + ["dismissed",
+                "parse_error", "completed", "auto_drafted", "expired"])
+_RFQ_STATUSES = (["new"] * 3 + ["parsed"] * 2 + ["priced"] * 2 + ["generated"]
+                 + ["sent"] * 5 + ["won", "lost", "dismissed"])
+_QUOTE_STATUSES = ["pending"] * 3 + ["sent"] * 5 + ["won"] * 2 + ["lost"] * 2
+
+_EPOCH = datetime(2024, 1, 1)
+
+
+def _scaled(table: str, scale: float) -> int:
+    return max(1, int(VOLUMES[table] * scale))
+
+
+def _when(rng: random.Random, days: int = 900) -> str:
+    return (_EPOCH + timedelta(days=rng.random() * days)).isoformat(timespec="seconds")
+
+
+def _product(rng: random.Random, i: int) -> dict:
+    desc = f"{rng.choice(_ADJS)} {rng.choice(_ADJS)} {rng.choice(_NOUNS)}"
+    cost = round(rng.uniform(0.5, 250.0), 2)
+    return {
+        "name": f"{desc.title()} {rng.choice(_PACKS)} #{i}",
+        "description": f"{desc}, {rng.choice(_PACKS)}",
+        "sku": f"RT-{i:06d}",
+        "mfg_number": f"{rng.choice('ABCDEFGHJK')}{rng.randint(1000, 99999)}-{i % 97}",
+        "upc": f"{rng.randint(10**11, 10**12 - 1)}",
+        "manufacturer": rng.choice(_MFGS),
+        "category": rng.choice(_CATEGORIES),
+        "cost": cost,
+        "sell_price": round(cost * rng.uniform(1.15, 1.6), 2),
+        "times_quoted": rng.randint(0, 40),
+    }
+
+
+def _item(rng: random.Random, n: int) -> dict:
+    cost = round(rng.uniform(0.5, 120.0), 2)
+    return {
+        "line_number": n,
+        "description": f"{rng.choice(_ADJS)} {rng.choice(_NOUNS)} {rng.choice(_PACKS)}",
+        "qty": rng.choice([1, 2, 5, 10, 12, 24, 50, 100]),
+        "uom": rng.choice(["EA", "BX", "CS", "PK"]),
+        "mfg_number": f"{rng.choice('ABCDEFGHJK')}{rng.randint(1000, 99999)}",
+        "supplier_cost": cost,
+        "unit_price": round(cost * 1.3, 2),
+    }
+
+
+def _write_catalog(conn, rng, n):
+    from src.agents.product_catalog import _tokenize
+    now = _when(rng)
+    rows = []
+    for i in range(n):
+        p = _product(rng, i)
+        rows.append((p["name"], p["sku"], p["description"], p["category"],
+                     p["sell_price"], p["cost"], p["manufacturer"], p["mfg_number"],
+                     p["upc"], _tokenize(f"{p['name']} {p['description']}"),
+                     p["times_quoted"], now, now))
+    conn.executemany(
+        "INSERT INTO product_catalog (name, sku, description, category, sell_price, "
+        "cost, manufacturer, mfg_number, upc, search_tokens, times_quoted, "
+        "created_at, updated_at) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+
+def _write_won_quotes(conn, rng, n):
+    rows = []
+    for i in range(n):
+        it = _item(rng, 1)
+        desc = it["description"]
+        qty = it["qty"]
+        price = it["unit_price"]
+        rows.append((f"wq-{i:06d}", f"PO-{rng.randint(1, 99999):05d}", it["mfg_number"],
+                     desc, desc.lower(), " ".join(sorted(set(desc.lower().split()))),
+                     rng.choice(_CATEGORIES), rng.choice(_SUPPLIERS),
+                     rng.choice(_AGENCIES), price, qty, round(price * qty, 2),
+                     _when(rng)[:10], "synthetic", 1.0, _when(rng)))
+    conn.executemany(
+        "INSERT INTO won_quotes (id, po_number, item_number, description, "
+        "normalized_description, tokens, category, supplier, department, "
+        "unit_price, quantity, total, award_date, source, confidence, ingested_at) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+
+def _write_price_checks(conn, rng, n):
+    rows = []
+    for i in range(n):
+        pcid = f"pc_{i:06d}"
+        items = [_item(rng, k + 1) for k in range(rng.randint(3, 15))]
+        status = rng.choice(_PC_STATUSES)
+        created = _when(rng)
+        header = {"pc_number": f"PC-{i:05d}", "institution": rng.choice(_INSTITUTIONS),
+                  "agency": rng.choice(_AGENCIES), "requestor": f"Buyer {i % 300}",
+                  "zip_code": f"9{rng.randint(1000, 6999)}"}
+        blob = {"id": pcid, "pc_number": header["pc_number"], "status": status,
+                "created_at": created, "institution": header["institution"],
+                "agency": header["agency"], "requestor": header["requestor"],
+                "header": header, "items": items,
+                "email_subject": f"Price Check {header['pc_number']}"}
+        rows.append((pcid, created, header["requestor"], header["agency"],
+                     header["institution"], json.dumps(items), header["pc_number"],
+                     len(items), status, blob["email_subject"], json.dumps(blob)))
+    conn.executemany(
+        "INSERT INTO price_checks (id, created_at, requestor, agency, institution, "
+        "items, pc_number, total_items, status, email_subject, data_json) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+
+def _write_rfqs(conn, rng, n):
+    rows = []
+    for i in range(n):
+        rid = f"rfq_{i:06d}"
+        items = [_item(rng, k + 1) for k in range(rng.randint(2, 30))]
+        status = rng.choice(_RFQ_STATUSES)
+        received = _when(rng)
+        blob = {"id": rid, "status": status, "received_at": received,
+                "solicitation_number": f"1{rng.randint(1000000, 9999999)}",
+                "agency": rng.choice(_AGENCIES),
+                "institution": rng.choice(_INSTITUTIONS),
+                "requestor_name": f"Buyer {i % 300}",
+                "requestor_email": f"buyer{i % 300}@example.ca.gov",
+                "line_items": items}
+        rows.append((rid, received, blob["agency"], blob["institution"],
+                     blob["requestor_name"], blob["requestor_email"],
+                     blob["solicitation_number"], json.dumps(items), status,
+                     "email", json.dumps(blob)))
+    conn.executemany(
+        "INSERT INTO rfqs (id, received_at, agency, institution, requestor_name, "
+        "requestor_email, rfq_number, items, status, source, data_json) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+
+def _write_quotes(conn, rng, n):
+    rows = []
+    for i in range(n):
+        items = [_item(rng, k + 1) for k in range(rng.randint(1, 12))]
+        subtotal = round(sum(it["unit_price"] * it["qty"] for it in items), 2)
+        tax = round(subtotal * 0.0775, 2)
+        rows.append((f"R26Q{i:05d}", _when(rng), rng.choice(_AGENCIES),
+                     rng.choice(_INSTITUTIONS), f"Buyer {i % 300}", subtotal, tax,
+                     round(subtotal + tax, 2), len(items),
+                     "; ".join(it["description"] for it in items[:3]),
+                     json.dumps(items), rng.choice(_QUOTE_STATUSES)))
+    conn.executemany(
+        "INSERT INTO quotes (quote_number, created_at, agency, institution, requestor, "
+        "subtotal, tax, total, items_count, items_text, items_detail, status) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+
+
+def _write_scprs(conn, rng, n_pos, n_lines):
+    per_po = max(1, n_lines // n_pos)
+    masters, lines = [], []
+    for i in range(n_pos):
+        po = f"4500{i:06d}"
+        supplier = rng.choice(_SUPPLIERS)
+        start = _when(rng)[:10]
+        po_lines = []
+        for ln in range(1, per_po + 1):
+            it = _item(rng, ln)
+            price = round(it["supplier_cost"] * rng.uniform(1.1, 1.8), 2)
+            po_lines.append((i + 1, po, ln, it["mfg_number"], it["description"],
+                             f"{rng.randint(42000000, 53999999)}", it["uom"],
+                             it["qty"], price, round(price * it["qty"], 2),
+                             "Active", rng.choice(_CATEGORIES)))
+        lines.extend(po_lines)
+        total = round(sum(r[9] for r in po_lines), 2)
+        masters.append((i + 1, _when(rng), po, f"{rng.randint(1000, 9999)}",
+                        rng.choice(_AGENCIES), rng.choice(_INSTITUTIONS), supplier,
+                        "Active", start, start, total, total,
+                        f"Buyer {i % 300}", f"buyer{i % 300}@example.ca.gov",
+                        rng.choice(_AGENCIES).lower()))
+    conn.executemany(
+        "INSERT INTO scprs_po_master (id, pulled_at, po_number, dept_code, dept_name, "
+        "institution, supplier, status, start_date, end_date, merch_amount, "
+        "grand_total, buyer_name, buyer_email, agency_key) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)", masters)
+    conn.executemany(
+        "INSERT INTO scprs_po_lines (po_id, po_number, line_num, item_id, description, "
+        "unspsc, uom, quantity, unit_price, line_total, line_status, category) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?,?,?)", lines)
+
+
+def generate(db_path: str, scale: float = 1.0, seed: int = DEFAULT_SEED) -> dict:
+    """Create the schema at `db_path` and fill it. Returns {table: rows}.
+
+    The tables written here must be empty — rerunning over a populated
+    DB would collide on primary keys; use a fresh path (or `--force`).
+    """
+    from src.core.db import SCHEMA
+    from src.agents.product_catalog import CATALOG_SCHEMA
+
+    rng = random.Random(seed)
+    counts = {t: _scaled(t, scale) for t in VOLUMES}
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executescript(CATALOG_SCHEMA)
+        conn.execute("PRAGMA synchronous=OFF")
+        with conn:
+            _write_catalog(conn, rng, counts["product_catalog"])
+            _write_won_quotes(conn, rng, counts["won_quotes"])
+            _write_price_checks(conn, rng, counts["price_checks"])
+            _write_rfqs(conn, rng, counts["rfqs"])
+            _write_quotes(conn, rng, counts["quotes"])
+            _write_scprs(conn, rng, counts["scprs_po_master"], counts["scprs_po_lines"])
+        counts["scprs_po_lines"] = conn.execute(
+            "SELECT COUNT(*) FROM scprs_po_lines").fetchone()[0]
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    return counts
+
+
+def boot_schema() -> None:
+    """Bring the DB at REYTECH_DATA_DIR to the full prod schema — the same
+    init_db → run_migrations → catalog init sequence app.py runs at boot —
+    so the synthetic rows land in migrated tables with prod indexes."""
+    from src.core.db import init_db
+    from src.core.migrations import run_migrations
+    from src.agents.product_catalog import init_catalog_db
+    init_db()
+    run_migrations()
+    init_catalog_db()
+
+
+def write_manifest(out_dir: str, counts: dict, scale: float, seed: int) -> str:
+    path = os.path.join(out_dir, "synthetic_manifest.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"scale": scale, "seed": seed, "counts": counts,
+                   "generated_at": datetime.now().isoformat(timespec="seconds")},
+                  f, indent=2)
+    return path
+
+
+def read_manifest(out_dir: str) -> dict | None:
+    try:
+        with open(os.path.join(out_dir, "synthetic_manifest.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--out", default=DEFAULT_OUT, help="output data dir")
+    ap.add_argument("--scale", type=float, default=1.0)
+    ap.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    ap.add_argument("--force", action="store_true", help="replace an existing DB")
+    args = ap.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    # Before any src import: module-level DATA_DIR/DB_PATH must resolve to
+    # the synthetic dir, never the real one.
+    os.environ["REYTECH_DATA_DIR"] = os.path.abspath(args.out)
+    db_path = os.path.join(args.out, "reytech.db")
+    if os.path.exists(db_path):
+        if not args.force:
+            print(f"{db_path} exists — pass --force to regenerate", file=sys.stderr)
+            return 1
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+    t0 = time.time()
+    boot_schema()
+    counts = generate(db_path, scale=args.scale, seed=args.seed)
+    write_manifest(args.out, counts, args.scale, args.seed)
+    for table, n in counts.items():
+        print(f"  {table:<18} {n:>9,}")
+    print(f"wrote {db_path} in {time.time() - t0:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
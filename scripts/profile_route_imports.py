@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Profile worker boot: what importing the dashboard and its route modules costs.
+
+Two views:
+
+  default       imports src.api.dashboard in-process and prints the
+                per-route-module profile recorded by `_load_route_module`
+                (wall ms, symbols exported, modules newly pulled in and
+                their top-level packages) — the same data /api/health
+                shows under checks.route_modules.
+
+  --importtime  re-runs the import under `python -X importtime` in a
+                subprocess and rolls the self-time up by top-level
+                package, so a heavy dependency (pypdf, reportlab,
+                googleapiclient, openpyxl...) shows up no matter which
+                route module dragged it in.
+
+`--mode namespace` sets ROUTE_MODULE_INJECT=namespace for the run;
+`--compare` boots once per mode in fresh subprocesses and prints the
+totals side by side.
+
+Usage:
+    python scripts/profile_route_imports.py
+    python scripts/profile_route_imports.py --top 15 --json
+    python scripts/profile_route_imports.py --importtime --top 25
+    python scripts/profile_route_imports.py --compare --repeat 3
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+
+os.environ.setdefault("SECRET_KEY", "diag")
+os.environ.setdefault("DASH_USER", "diag")
+os.environ.setdefault("DASH_PASS", "diag")
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("ENABLE_BACKGROUND_AGENTS", "false")
+
+_BOOT_SNIPPET = (
+    "import json, time; t0 = time.perf_counter(); "
+    "import src.api.dashboard as d; "
+    "p = d.route_load_profile(); "
+    "print(json.dumps({'import_ms': round((time.perf_counter() - t0) * 1000, 1), "
+    "'routes_ms': p['total_ms'], 'mode': p['mode'], 'loaded': p['loaded']}))"
+)
+
+
+def in_process_profile(top: int) -> dict:
+    t0 = time.perf_counter()
+    import src.api.dashboard as dashboard
+    prof = dashboard.route_load_profile(top=top)
+    prof["dashboard_import_ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return prof
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Sum `-X importtime` self-time (µs) per top-level package."""
+    per_pkg = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, _cum, name = [p.strip() for p in line.split(":", 1)[1].split("|")]
+            per_pkg[name.split(".")[0]] += int(self_us)
+        except ValueError:
+            continue
+    return dict(per_pkg)
+
+
+def importtime_profile(top: int, env: dict) -> list:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.api.dashboard"],
+        cwd=REPO, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = [ln for ln in proc.stderr.splitlines() if not ln.startswith("import time:")]
+        raise SystemExit("dashboard import failed:\n" + "\n".join(tail[-20:]))
+    per_pkg = parse_importtime(proc.stderr)
+    ranked = sorted(per_pkg.items(), key=lambda kv: kv[1], reverse=True)
+    return [{"package": k, "self_ms": round(v / 1000, 1)} for k, v in ranked[:top or None]]
+
+
+def boot_once(env: dict) -> dict:
+    proc = subprocess.run([sys.executable, "-c", _BOOT_SNIPPET],
+                          cwd=REPO, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit("dashboard import failed:\n" + proc.stderr[-2000:])
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--top", type=int, default=10, help="rows to show (0 = all)")
+    ap.add_argument("--mode", choices=("copy", "namespace"),
+                    help="ROUTE_MODULE_INJECT for this run")
+    ap.add_argument("--importtime", action="store_true",
+                    help="per-package self time from python -X importtime")
+    ap.add_argument("--compare", action="store_true",
+                    help="cold-boot once per inject mode in subprocesses")
+    ap.add_argument("--repeat", type=int, default=1, help="--compare runs per mode")
+    ap.add_argument("--json", action="store_true", help="emit JSON")
+    args = ap.parse_args()
+
+    env = dict(os.environ)
+    if args.mode:
+        env["ROUTE_MODULE_INJECT"] = args.mode
+        os.environ["ROUTE_MODULE_INJECT"] = args.mode
+
+    if args.compare:
+        out = {}
+        for mode in ("copy", "namespace"):
+            runs = [boot_once({**env, "ROUTE_MODULE_INJECT": mode})
+                    for _ in range(max(1, args.repeat))]
+            out[mode] = {
+                "import_ms": min(r["import_ms"] for r in runs),
+                "routes_ms": min(r["routes_ms"] for r in runs),
+                "loaded": runs[0]["loaded"],
+            }
+        if args.json:
+            print(json.dumps(out, indent=2))
+        else:
+            print(f"{'mode':<10} {'import ms':>10} {'routes ms':>10} {'modules':>8}")
+            for mode, r in out.items():
+                print(f"{mode:<10} {r['import_ms']:>10.1f} {r['routes_ms']:>10.1f} {r['loaded']:>8}")
+        return 0
+
+    if args.importtime:
+        rows = importtime_profile(args.top, env)
+        if args.json:
+            print(json.dumps(rows, indent=2))
+        else:
+            print(f"{'package':<32} {'self ms':>9}")
+            for r in rows:
+                print(f"{r['package']:<32} {r['self_ms']:>9.1f}")
+        return 0
+
+    prof = in_process_profile(args.top)
+    if args.json:
+        print(json.dumps(prof, indent=2))
+        return 0
+    print(f"dashboard import: {prof['dashboard_import_ms']:.0f}ms — "
+          f"{prof['loaded']} route modules in {prof['total_ms']:.0f}ms ({prof['mode']} inject)")
+    print(f"{'module':<34} {'ms':>8} {'syms':>5} {'imports':>8}  packages")
+    for r in prof["modules"]:
+        pkgs = ", ".join(p for p in r["packages"] if p != "src")
+        print(f"{r['module']:<34} {r['ms']:>8.1f} {r['new_symbols']:>5} "
+              f"{r['new_imports']:>8}  {pkgs}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""
+restore_backup.py — Rebuild reytech.db from the incremental backup chain.
+
+Replays a chain's base plus its increments up to the requested time into
+a fresh file and runs integrity_check on the result. Never touches the
+live DB unless --out points at it (stop the app first).
+
+Usage:
+    python scripts/restore_backup.py --list
+    python scripts/restore_backup.py --out /tmp/restored.db
+    python scripts/restore_backup.py --out /tmp/restored.db --at 2026-10-18T09:30
+    python scripts/restore_backup.py --data-dir /data --out /tmp/r.db
+
+Exit codes:
+    0 = restored (or listed)
+    1 = restore failed
+    2 = no backup point at or before --at
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO = os.path.dirname(HERE)
+sys.path.insert(0, REPO)
+
+from src.core import incremental_backup  # noqa: E402
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    ap.add_argument("--data-dir", default=None, help="data dir holding backups/incremental")
+    ap.add_argument("--out", help="path to write the restored DB")
+    ap.add_argument("--at", help="ISO timestamp (UTC if no offset); default latest")
+    ap.add_argument("--list", action="store_true", help="list restore points and exit")
+    args = ap.parse_args(argv)
+
+    if args.list:
+        for p in incremental_backup.list_points(args.data_dir):
+            print(f"{p['created_at']}  {p['chain']}/{p['file']}  "
+                  f"{p['kind']:<11} {p['changed_pages']:>8} pages  {p['size']:>12} B")
+        return 0
+    if not args.out:
+        ap.error("--out is required unless --list")
+
+    at = datetime.fromisoformat(args.at) if args.at else None
+    result = incremental_backup.restore(args.out, at=at, data_dir=args.data_dir)
+    if result["ok"]:
+        print(f"Restored {result['chain']}/{result['point']} "
+              f"({result['created_at']}) → {result['path']}")
+        return 0
+    print(f"Restore failed: {result['error']}", file=sys.stderr)
+    return 2 if result["error"].startswith("No backup point") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
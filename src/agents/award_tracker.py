@@ -130,6 +130,7 @@ MAX_SCPRS_SEARCHES_PER_RUN = 15      # Rate-limit SCPRS requests
 MATCH_CONFIDENCE_THRESHOLD = 0.55    # Min confidence to consider a match
 HIGH_CONFIDENCE_THRESHOLD = 0.80     # Auto-close only at this confidence
 SEARCH_WINDOW_DAYS = 120             # How far back to search SCPRS
+LOCAL_CANDIDATE_LIMIT = 200          # Mirror POs scored per quote
 
 _scheduler_started = False
 _last_run = None
@@ -512,21 +513,51 @@ def run_award_check(force: bool = False) -> dict:
         _last_result = result
         return result
 
-    # ── Initialize SCPRS session ──────────────────────────────────────────
-    try:
-        from src.agents.scprs_lookup import FiscalSession
-        session = FiscalSession()
-        if not session.init_session():
-            conn.close()
-            result = {"ok": False, "error": "SCPRS session unavailable",
-                      "eligible": len(to_check)}
-            _last_result = result
-            return result
-    except Exception as e:
-        conn.close()
-        result = {"ok": False, "error": f"SCPRS init failed: {e}"}
-        _last_result = result
-        return result
+    # ── Resolve from the local SCPRS mirror first ─────────────────────────
+    # Harvested POs (scprs_po_master/lines) answer most award checks
+    # without a live search. A quote counts as resolved only when its best
+    # local match reaches HIGH_CONFIDENCE_THRESHOLD; the rest (no match, or
+    # only a medium-confidence one) still go to the FI$Cal session and
+    # spend the MAX_SCPRS_SEARCHES_PER_RUN budget — the mirror may simply
+    # not have harvested the real award yet.
+    plans = {}
+    for q in to_check:
+        our_items = _parse_line_items_safely(
+            q.get("line_items"),
+            where="run_award_check.line_items",
+        )
+        keywords = _extract_search_keywords(our_items, q.get("items_text", ""))
+        local = []
+        try:
+            local = _local_po_matches(conn, q, keywords[:3], _quote_search_from(q, now))
+        except Exception as e:
+            log.warning("Local SCPRS lookup for %s: %s", q["quote_number"], e)
+        plans[q["quote_number"]] = (our_items, keywords, local)
+    local_resolved = sum(1 for _, _, local in plans.values() if _locally_resolved(local))
+    if local_resolved:
+        log.info("Award check: %d of %d quotes resolved from local SCPRS mirror",
+                 local_resolved, len(to_check))
+
+    # ── Initialize SCPRS session (only if something is left for it) ──────
+    session = None
+    if local_resolved < len(to_check):
+        session_error = ""
+        try:
+            from src.agents.scprs_lookup import FiscalSession
+            session = FiscalSession()
+            if not session.init_session():
+                session, session_error = None, "SCPRS session unavailable"
+        except Exception as e:
+            session, session_error = None, f"SCPRS init failed: {e}"
+        if session is None:
+            if not local_resolved:
+                conn.close()
+                result = {"ok": False, "error": session_error,
+                          "eligible": len(to_check)}
+                _last_result = result
+                return result
+            log.warning("%s — checking only the %d quotes resolved locally",
+                        session_error, local_resolved)
 
     # ── Check each quote ──────────────────────────────────────────────────
     total_checked = 0
@@ -535,45 +566,35 @@ def run_award_check(force: bool = False) -> dict:
     total_prices_recorded = 0
     loss_reports = []
     searches_used = 0
+    live_deferred = 0
 
     for q in to_check:
-        if searches_used >= MAX_SCPRS_SEARCHES_PER_RUN:
-            log.info("SCPRS rate limit reached (%d searches), stopping", searches_used)
-            break
-
         quote_num = q["quote_number"]
         institution = q.get("institution", "") or ""
         agency = q.get("agency", "") or ""
         our_total = q.get("total", 0) or 0
+        our_items, keywords, quote_matches = plans[quote_num]
+
+        if not _locally_resolved(quote_matches) and (
+                session is None or searches_used >= MAX_SCPRS_SEARCHES_PER_RUN):
+            # Needs the live search (no local match, or only a medium-
+            # confidence one) but none is available: not logged as
+            # checked, so the next run searches it.
+            live_deferred += 1
+            continue
 
-        # Parse line items from JSON
-        our_items = _parse_line_items_safely(
-            q.get("line_items"),
-            where="run_award_check.line_items",
-        )
-
-        # Extract search keywords from items
-        keywords = _extract_search_keywords(our_items, q.get("items_text", ""))
-
-        log.info("Award check: %s (agency=%s, inst=%s, $%.2f, %d items, %d keywords)",
-                 quote_num, agency, institution, our_total, len(our_items), len(keywords))
+        log.info("Award check: %s (agency=%s, inst=%s, $%.2f, %d items, %d keywords%s)",
+                 quote_num, agency, institution, our_total, len(our_items), len(keywords),
+                 ", local mirror" if quote_matches else "")
 
-        quote_matches = []
-        for keyword in keywords[:3]:  # Max 3 searches per quote
+        live_searched = not _locally_resolved(quote_matches)
+        seen_pos = {m["po"].get("po_number") for m in quote_matches}
+        for keyword in (keywords[:3] if live_searched else []):  # Max 3 searches per quote
             if searches_used >= MAX_SCPRS_SEARCHES_PER_RUN:
                 break
             try:
                 # Search SCPRS for this keyword
-                from_date = q.get("sent_at") or q.get("created_at", "")
-                if from_date:
-                    # Convert ISO to MM/DD/YYYY
-                    try:
-                        dt = datetime.fromisoformat(from_date[:19])
-                        scprs_from = dt.strftime("%m/%d/%Y")
-                    except Exception:
-                        scprs_from = (now - timedelta(days=SEARCH_WINDOW_DAYS)).strftime("%m/%d/%Y")
-                else:
-                    scprs_from = (now - timedelta(days=SEARCH_WINDOW_DAYS)).strftime("%m/%d/%Y")
+                scprs_from = _quote_search_from(q, now).strftime("%m/%d/%Y")
 
                 results = session.search(description=keyword, from_date=scprs_from)
                 searches_used += 1
@@ -581,7 +602,9 @@ def run_award_check(force: bool = False) -> dict:
 
                 for po in results:
                     confidence, reasons = _match_quote_to_po(q, po, keyword)
-                    if confidence >= MATCH_CONFIDENCE_THRESHOLD:
+                    if (confidence >= MATCH_CONFIDENCE_THRESHOLD
+                            and po.get("po_number") not in seen_pos):
+                        seen_pos.add(po.get("po_number"))
                         # Get line item details
                         detail = None
                         try:
@@ -615,7 +638,10 @@ def run_award_check(force: bool = False) -> dict:
             best_match = max(quote_matches, key=lambda m: m["confidence"])
 
         outcome = "no_match"
-        notes = f"Searched {len(keywords[:3])} keywords, {len(quote_matches)} potential matches"
+        if live_searched:
+            notes = f"Searched {len(keywords[:3])} keywords, {len(quote_matches)} potential matches"
+        else:
+            notes = f"Local SCPRS mirror, {len(quote_matches)} potential matches"
 
         if best_match:
             total_matches += 1
@@ -962,8 +988,15 @@ def run_award_check(force: bool = False) -> dict:
 
         total_checked += 1
 
+    if live_deferred:
+        log.info("SCPRS live search %s — %d quotes deferred to the next run",
+                 "unavailable" if session is None
+                 else f"budget reached ({searches_used} searches)", live_deferred)
+
     conn.commit()
     conn.close()
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("award_tracker_log")
 
     # ── Send loss reports ─────────────────────────────────────────────────
     if loss_reports:
@@ -1008,6 +1041,8 @@ def run_award_check(force: bool = False) -> dict:
         "losses": total_losses,
         "prices_recorded": total_prices_recorded,
         "scprs_searches": searches_used,
+        "local_resolved": local_resolved,
+        "live_deferred": live_deferred,
         "loss_reports": len(loss_reports),
         "reports": loss_reports,
         "patterns_detected": patterns_detected,
@@ -1144,6 +1179,149 @@ def _match_quote_to_po(quote: dict, po: dict, search_term: str) -> tuple:
     return (min(score, 1.0), reasons)
 
 
+# ── Local SCPRS Mirror ───────────────────────────────────────────────────────
+
+def _quote_search_from(quote: dict, now: datetime) -> datetime:
+    """Earliest award date worth matching: the day the quote went out,
+    else SEARCH_WINDOW_DAYS back."""
+    from_date = quote.get("sent_at") or quote.get("created_at", "")
+    if from_date:
+        try:
+            return datetime.fromisoformat(from_date[:19])
+        except Exception:
+            pass
+    return now - timedelta(days=SEARCH_WINDOW_DAYS)
+
+
+def _agency_registry_filter(agency: str) -> tuple:
+    """(agency_keys, dept_codes, dept_name_patterns) for a quote's agency,
+    resolved the way _match_quote_to_po credits an agency match."""
+    agency = (agency or "").upper()
+    keys, codes, patterns = [], [], []
+    if not agency:
+        return keys, codes, patterns
+    try:
+        from src.agents.scprs_intelligence_engine import AGENCY_REGISTRY
+    except Exception:
+        return keys, codes, patterns
+    for ag_key, reg in AGENCY_REGISTRY.items():
+        pats = reg.get("dept_name_patterns", [])
+        if (ag_key.upper() in agency or agency in ag_key.upper()
+                or any(p.upper() in agency for p in pats if len(p) > 2)):
+            keys.append(ag_key)
+            codes.extend(reg.get("dept_codes", []))
+            patterns.extend(p.upper() for p in pats)
+    return keys, codes, patterns
+
+
+def _locally_resolved(matches: list) -> bool:
+    """True if the best local match is strong enough to skip the live search."""
+    return any(m["confidence"] >= HIGH_CONFIDENCE_THRESHOLD for m in matches)
+
+
+def _local_po_matches(conn, quote: dict, keywords: list, from_date: datetime) -> list:
+    """Award candidates for `quote` from the harvested scprs_po_master /
+    scprs_po_lines mirror — no FI$Cal session, no rate limit.
+
+    Candidates are POs pulled since the quote went out (an award can't be
+    harvested before it exists — idx_po_master_pulled), for the quote's
+    agency when the registry resolves it, with a line matching one of the
+    search keywords. Each is shaped like a live search row merged with its
+    detail and scored by _match_quote_to_po. Returns the matches at or
+    above MATCH_CONFIDENCE_THRESHOLD; [] if the mirror tables are absent.
+    """
+    if not keywords:
+        return []
+    has_mirror = conn.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' "
+        "AND name IN ('scprs_po_master', 'scprs_po_lines')").fetchone()[0]
+    if has_mirror < 2:
+        return []
+
+    where = ["m.pulled_at >= ?"]
+    params = [from_date.strftime("%Y-%m-%d")]
+    keys, codes, patterns = _agency_registry_filter(quote.get("agency"))
+    if keys:
+        agency_sql = ["m.agency_key IN (%s)" % ",".join("?" * len(keys))]
+        params += keys
+        if codes:
+            agency_sql.append("m.dept_code IN (%s)" % ",".join("?" * len(codes)))
+            params += codes
+        agency_sql += ["UPPER(m.dept_name) LIKE ?"] * len(patterns)
+        params += [f"%{p}%" for p in patterns]
+        where.append("(" + " OR ".join(agency_sql) + ")")
+    where.append(
+        "EXISTS (SELECT 1 FROM scprs_po_lines l WHERE l.po_number = m.po_number AND ("
+        + " OR ".join(["l.description LIKE ?"] * len(keywords)) + "))")
+    params += [f"%{k}%" for k in keywords]
+
+    masters = conn.execute(f"""
+        SELECT m.po_number, m.supplier, m.grand_total,
+               CAST(REPLACE(REPLACE(m.grand_total,'$',''),',','') AS REAL) AS grand_total_num,
+               m.dept_name, m.dept_code, m.start_date, m.buyer_email, m.agency_key
+        FROM scprs_po_master m
+        WHERE {" AND ".join(where)}
+        ORDER BY m.pulled_at DESC
+        LIMIT {LOCAL_CANDIDATE_LIMIT}
+    """, params).fetchall()
+    pos = {}
+    for m in masters:
+        start = _parse_po_date(m["start_date"])
+        if start is not None and start < from_date.date():
+            continue
+        pos[m["po_number"]] = m
+    if not pos:
+        return []
+
+    lines = {}
+    for row in conn.execute(
+            "SELECT po_number, line_num, item_id, description, uom, quantity, "
+            "unit_price, line_total FROM scprs_po_lines WHERE po_number IN (%s) "
+            "ORDER BY po_number, line_num" % ",".join("?" * len(pos)), list(pos)):
+        lines.setdefault(row["po_number"], []).append({
+            "line_num": row["line_num"], "item_id": row["item_id"] or "",
+            "description": row["description"] or "", "uom": row["uom"] or "",
+            "quantity": row["quantity"] or 0, "unit_price": row["unit_price"] or 0,
+            "line_total": row["line_total"] or 0,
+        })
+
+    matches = []
+    for po_number, m in pos.items():
+        po_lines = lines.get(po_number, [])
+        descs = [ln["description"].upper() for ln in po_lines]
+        keyword = next((k for k in keywords if any(k.upper() in d for d in descs)), "")
+        po = {
+            "po_number": po_number,
+            "supplier_name": m["supplier"] or "",
+            "supplier": m["supplier"] or "",
+            "grand_total": m["grand_total"],
+            "grand_total_num": m["grand_total_num"] or 0,
+            "dept": m["dept_name"] or "",
+            "dept_code": m["dept_code"] or "",
+            "start_date": m["start_date"] or "",
+            "buyer_email": m["buyer_email"] or "",
+            "first_item": po_lines[0]["description"] if po_lines else "",
+            "line_items": po_lines,
+            "_source": "local_mirror",
+        }
+        confidence, reasons = _match_quote_to_po(quote, po, keyword)
+        if confidence >= MATCH_CONFIDENCE_THRESHOLD:
+            matches.append({"po": po, "confidence": confidence,
+                            "reasons": reasons + ["local_mirror"]})
+    return matches
+
+
+def _parse_po_date(value):
+    """SCPRS start_date as a date (MM/DD/YYYY or ISO); None if unparseable."""
+    value = str(value or "").strip()
+    for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value[:10], fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
 # ── Loss Classification ──────────────────────────────────────────────────────
 
 def _classify_loss_reason(pct_diff: float, line_comparison: list,
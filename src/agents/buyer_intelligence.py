@@ -11,153 +11,206 @@ from datetime import datetime
 log = logging.getLogger("reytech.buyer_intelligence")
 
 
-def refresh_buyer_profiles():
-    """Rebuild all buyer profiles from scprs_po_master + scprs_po_lines.
-    Uses batched commits (50 buyers per batch) to avoid holding the DB write
-    lock for minutes and blocking save/generate operations."""
-    import sqlite3
-    import time as _time
-    from src.core.db import DB_PATH
+# ── Incremental refresh state ─────────────────────────────────────────────
+# FI$Cal hands grand_total back as "$1,234.56" text about as often as a
+# number; scprs_po_master.grand_total_num is a generated column holding the
+# parsed value. A buyer needs rebuilding when one of their POs or PO lines
+# is new since the last refresh — found by id past scprs_buyer_marks, so
+# bulk pulls pay nothing extra — or was edited / deleted, which the
+# scprs_buyer_dirty triggers record. Schema and triggers live in db.py.
+
+# Buyers per write transaction. Each holds the write lock for a few ms,
+# so package generation and saves never queue behind a refresh.
+_WRITE_CHUNK = 200
+
+_NEW_BUYERS_SQL = """
+    INSERT OR IGNORE INTO _bp_dirty(email)
+    SELECT buyer_email FROM scprs_po_master
+     WHERE id > ? AND id <= ? AND buyer_email LIKE '%@%'
+    UNION
+    SELECT m.buyer_email FROM scprs_po_lines l
+      JOIN scprs_po_master m ON m.po_number = l.po_number
+     WHERE l.id > ? AND l.id <= ? AND m.buyer_email LIKE '%@%'
+"""
 
-    BATCH_SIZE = 10  # Small batches — yield DB lock frequently for critical operations
+_STATS_SQL = """
+    SELECT m.buyer_email,
+           COUNT(DISTINCT m.po_number),
+           SUM(m.grand_total_num),
+           MIN(m.start_date), MAX(m.start_date),
+           COUNT(DISTINCT CASE WHEN UPPER(m.supplier) LIKE '%REYTECH%'
+                               THEN m.po_number END),
+           SUM(CASE WHEN UPPER(m.supplier) LIKE '%REYTECH%'
+                    THEN m.grand_total_num END),
+           MAX(CASE WHEN UPPER(m.supplier) LIKE '%REYTECH%'
+                    THEN m.start_date END)
+    FROM _bp_dirty d JOIN scprs_po_master m ON m.buyer_email = d.email
+    GROUP BY m.buyer_email
+"""
 
-    # Read-only query to get buyer list (short-lived connection)
-    db = sqlite3.connect(DB_PATH, timeout=30)
-    db.execute("PRAGMA busy_timeout=30000")
-    db.row_factory = None
-    buyers = db.execute("""
-        SELECT DISTINCT buyer_email, buyer_name, dept_name, dept_code
-        FROM scprs_po_master
-        WHERE buyer_email IS NOT NULL AND buyer_email != ''
-    """).fetchall()
-    db.close()
+# Bare columns beside MAX() come from the row holding the max — i.e. the
+# newest PO's name/department for each buyer.
+_IDENTITY_SQL = """
+    SELECT m.buyer_email, MAX(m.id), m.buyer_name, m.dept_name, m.dept_code
+    FROM _bp_dirty d JOIN scprs_po_master m ON m.buyer_email = d.email
+    GROUP BY m.buyer_email
+"""
 
-    log.info("Buyer refresh: processing %d unique buyers", len(buyers))
-    updated = 0
+_LINES_SQL = """
+    SELECT m.buyer_email, l.description
+    FROM _bp_dirty d
+    JOIN scprs_po_master m ON m.buyer_email = d.email
+    JOIN scprs_po_lines l ON l.po_number = m.po_number
+    ORDER BY m.buyer_email
+"""
 
-    for batch_start in range(0, len(buyers), BATCH_SIZE):
-        batch = buyers[batch_start:batch_start + BATCH_SIZE]
-        # Short timeout — yield to package generation and other critical writes
-        db = sqlite3.connect(DB_PATH, timeout=5)
-        db.execute("PRAGMA journal_mode=WAL")
-        db.execute("PRAGMA busy_timeout=2000")  # 2s max wait, not 30s
-        db.row_factory = None
+_UPSERT_SQL = """
+    INSERT INTO scprs_buyers
+    (buyer_email, buyer_name, department, dept_code,
+     total_pos, total_spend, total_line_items,
+     first_po_date, last_po_date, top_categories,
+     buys_from_reytech, reytech_spend, reytech_last_date,
+     relationship_status, prospect_score, updated_at)
+    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'))
+    ON CONFLICT(buyer_email) DO UPDATE SET
+        buyer_name = COALESCE(NULLIF(excluded.buyer_name,''), scprs_buyers.buyer_name),
+        department = COALESCE(NULLIF(excluded.department,''), scprs_buyers.department),
+        total_pos = excluded.total_pos,
+        total_spend = excluded.total_spend,
+        total_line_items = excluded.total_line_items,
+        first_po_date = excluded.first_po_date,
+        last_po_date = excluded.last_po_date,
+        top_categories = excluded.top_categories,
+        buys_from_reytech = excluded.buys_from_reytech,
+        reytech_spend = excluded.reytech_spend,
+        reytech_last_date = excluded.reytech_last_date,
+        relationship_status = CASE
+            WHEN scprs_buyers.relationship_status IN ('outreach_sent','replied','meeting_scheduled')
+            THEN scprs_buyers.relationship_status
+            ELSE excluded.relationship_status END,
+        prospect_score = excluded.prospect_score,
+        updated_at = datetime('now')
+"""
+
+_ITEMS_SQL = """
+    INSERT OR IGNORE INTO scprs_buyer_items
+    (buyer_email, po_number, description, unit_price, quantity, supplier, date)
+    SELECT m.buyer_email, m.po_number, l.description, l.unit_price,
+           l.quantity, m.supplier, m.start_date
+    FROM scprs_po_master m JOIN scprs_po_lines l ON l.po_number = m.po_number
+    WHERE m.buyer_email IN ({marks})
+    ORDER BY m.start_date DESC
+"""
 
-        for email, name, dept, dept_code in batch:
-            if not email or "@" not in email:
-                continue
-            try:
-                stats = db.execute("""
-                    SELECT COUNT(DISTINCT po_number) as total_pos,
-                           SUM(CAST(REPLACE(REPLACE(grand_total,'$',''),',','') AS REAL)) as total_spend,
-                           MIN(start_date) as first_date,
-                           MAX(start_date) as last_date
-                    FROM scprs_po_master WHERE buyer_email = ?
-                """, (email,)).fetchone()
-
-                line_count = db.execute("""
-                    SELECT COUNT(*) FROM scprs_po_lines l
-                    JOIN scprs_po_master m ON l.po_number = m.po_number
-                    WHERE m.buyer_email = ?
-                """, (email,)).fetchone()[0]
-
-                reytech = db.execute("""
-                    SELECT COUNT(DISTINCT po_number),
-                           SUM(CAST(REPLACE(REPLACE(grand_total,'$',''),',','') AS REAL)),
-                           MAX(start_date)
-                    FROM scprs_po_master
-                    WHERE buyer_email = ? AND UPPER(supplier) LIKE '%REYTECH%'
-                """, (email,)).fetchone()
-
-                rt_pos = reytech[0] or 0
-                rt_spend = reytech[1] or 0
-                rt_last = reytech[2] or ""
-
-                items = db.execute("""
-                    SELECT l.description FROM scprs_po_lines l
-                    JOIN scprs_po_master m ON l.po_number = m.po_number
-                    WHERE m.buyer_email = ?
-                """, (email,)).fetchall()
-
-                top_cats = _extract_categories([r[0] for r in items if r[0]])
-                status = "active_customer" if rt_pos > 0 else "prospect"
-
-                score = _calculate_prospect_score(
-                    total_pos=stats[0] or 0, total_spend=stats[1] or 0,
-                    last_date=stats[3] or "", line_items=line_count,
-                    buys_from_reytech=rt_pos > 0, reytech_spend=rt_spend,
-                    categories=top_cats,
-                )
-
-                db.execute("""
-                    INSERT INTO scprs_buyers
-                    (buyer_email, buyer_name, department, dept_code,
-                     total_pos, total_spend, total_line_items,
-                     first_po_date, last_po_date, top_categories,
-                     buys_from_reytech, reytech_spend, reytech_last_date,
-                     relationship_status, prospect_score, updated_at)
-                    VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,datetime('now'))
-                    ON CONFLICT(buyer_email) DO UPDATE SET
-                        buyer_name = COALESCE(NULLIF(excluded.buyer_name,''), scprs_buyers.buyer_name),
-                        department = COALESCE(NULLIF(excluded.department,''), scprs_buyers.department),
-                        total_pos = excluded.total_pos,
-                        total_spend = excluded.total_spend,
-                        total_line_items = excluded.total_line_items,
-                        first_po_date = excluded.first_po_date,
-                        last_po_date = excluded.last_po_date,
-                        top_categories = excluded.top_categories,
-                        buys_from_reytech = excluded.buys_from_reytech,
-                        reytech_spend = excluded.reytech_spend,
-                        reytech_last_date = excluded.reytech_last_date,
-                        relationship_status = CASE
-                            WHEN scprs_buyers.relationship_status IN ('outreach_sent','replied','meeting_scheduled')
-                            THEN scprs_buyers.relationship_status
-                            ELSE excluded.relationship_status END,
-                        prospect_score = excluded.prospect_score,
-                        updated_at = datetime('now')
-                """, (
-                    email, name or "", dept or "", dept_code or "",
-                    stats[0] or 0, stats[1] or 0, line_count,
-                    stats[2] or "", stats[3] or "",
-                    ", ".join(top_cats[:10]),
-                    1 if rt_pos > 0 else 0, rt_spend, rt_last,
-                    status, score,
-                ))
-
-                # Store buyer's item history
-                buyer_items = db.execute("""
-                    SELECT l.description, l.unit_price, l.quantity,
-                           m.supplier, m.start_date, m.po_number
-                    FROM scprs_po_lines l
-                    JOIN scprs_po_master m ON l.po_number = m.po_number
-                    WHERE m.buyer_email = ?
-                    ORDER BY m.start_date DESC
-                """, (email,)).fetchall()
-
-                for bi in buyer_items:
-                    try:
-                        db.execute("""
-                            INSERT OR IGNORE INTO scprs_buyer_items
-                            (buyer_email, po_number, description, unit_price,
-                             quantity, supplier, date)
-                            VALUES (?,?,?,?,?,?,?)
-                        """, (email, bi[5], bi[0], bi[1], bi[2], bi[3], bi[4]))
-                    except Exception as _e:
-                        log.debug('suppressed in refresh_buyer_profiles: %s', _e)
-
-                updated += 1
-            except Exception as e:
-                log.warning("Buyer profile %s failed: %s", email, str(e)[:60])
 
-        # Commit and close after each batch — releases the write lock
+def refresh_buyer_profiles(full=False):
+    """Bring scprs_buyers up to date with scprs_po_master + scprs_po_lines.
+
+    Only buyers with a PO or line added since the last refresh, or one
+    edited or deleted (scprs_buyer_dirty), are rebuilt; full=True redoes
+    every buyer. Their figures come from three grouped queries in one
+    read snapshot (no write lock held), then land in short write
+    transactions of _WRITE_CHUNK buyers each. A buyer whose POs change
+    mid-refresh is picked up by the next run. Returns the number of
+    profiles updated."""
+    import sqlite3
+    from src.core.db import DB_PATH
+
+    db = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+    db.execute("PRAGMA busy_timeout=30000")
+    try:
+        if not db.execute("SELECT 1 FROM sqlite_master WHERE type='table' "
+                          "AND name='scprs_buyer_marks'").fetchone():
+            return 0    # init_db hasn't run
+
+        # ── Read: one snapshot, grouped aggregates ──
+        db.execute("CREATE TEMP TABLE IF NOT EXISTS _bp_dirty "
+                   "(email TEXT PRIMARY KEY, ver INTEGER)")
+        db.execute("BEGIN")
         try:
-            db.commit()
-        except Exception as e:
-            log.warning("Buyer batch commit failed: %s", str(e)[:60])
+            db.execute("DELETE FROM _bp_dirty")
+            seen = {} if full else dict(db.execute(
+                "SELECT source, seen_id FROM scprs_buyer_marks"))
+            top = {t: db.execute(f"SELECT COALESCE(MAX(id), 0) FROM {t}").fetchone()[0]
+                   for t in ("scprs_po_master", "scprs_po_lines")}
+            db.execute("INSERT INTO _bp_dirty SELECT buyer_email, ver "
+                       "FROM scprs_buyer_dirty")
+            db.execute(_NEW_BUYERS_SQL, (
+                seen.get("scprs_po_master", 0), top["scprs_po_master"],
+                seen.get("scprs_po_lines", 0), top["scprs_po_lines"]))
+            dirty = db.execute("SELECT email, ver FROM _bp_dirty").fetchall()
+            stats = {r[0]: r[1:] for r in db.execute(_STATS_SQL)}
+            identity = {r[0]: r[2:] for r in db.execute(_IDENTITY_SQL)}
+            lines = {}      # email → (line count, top categories)
+            email, descs = None, []
+            for row_email, desc in db.execute(_LINES_SQL):
+                if row_email != email:
+                    if email is not None:
+                        lines[email] = (len(descs), _extract_categories(filter(None, descs)))
+                    email, descs = row_email, []
+                descs.append(desc)
+            if email is not None:
+                lines[email] = (len(descs), _extract_categories(filter(None, descs)))
+        finally:
+            db.execute("COMMIT")
+
+        log.info("Buyer refresh: %d changed buyers%s",
+                 len(dirty), " (full)" if full else "")
+
+        profiles = {}
+        for email, _ver in dirty:
+            st = stats.get(email)
+            if st is None:
+                continue    # every PO gone — keep the last profile as-is
+            total_pos, total_spend, first_date, last_date, rt_pos, rt_spend, rt_last = st
+            name, dept, dept_code = identity.get(email, ("", "", ""))
+            line_count, top_cats = lines.get(email, (0, []))
+            score = _calculate_prospect_score(
+                total_pos=total_pos or 0, total_spend=total_spend or 0,
+                last_date=last_date or "", line_items=line_count,
+                buys_from_reytech=rt_pos > 0, reytech_spend=rt_spend or 0,
+                categories=top_cats,
+            )
+            profiles[email] = (
+                email, name or "", dept or "", dept_code or "",
+                total_pos or 0, total_spend or 0, line_count,
+                first_date or "", last_date or "",
+                ", ".join(top_cats[:10]),
+                1 if rt_pos > 0 else 0, rt_spend or 0, rt_last or "",
+                "active_customer" if rt_pos > 0 else "prospect", score,
+            )
+
+        # ── Write: short transactions, dirty rows cleared only if unchanged ──
+        db.execute("PRAGMA busy_timeout=5000")
+        updated, failed = 0, False
+        for start in range(0, len(dirty), _WRITE_CHUNK):
+            chunk = dirty[start:start + _WRITE_CHUNK]
+            emails = [e for e, _ in chunk if e in profiles]
+            try:
+                db.execute("BEGIN IMMEDIATE")
+                db.executemany(_UPSERT_SQL, [profiles[e] for e in emails])
+                if emails:
+                    db.execute(_ITEMS_SQL.format(marks=",".join("?" * len(emails))),
+                               emails)
+                db.executemany("DELETE FROM scprs_buyer_dirty "
+                               "WHERE buyer_email = ? AND ver = ?",
+                               [c for c in chunk if c[1] is not None])
+                db.execute("COMMIT")
+                updated += len(emails)
+            except Exception as e:
+                failed = True
+                if db.in_transaction:
+                    db.execute("ROLLBACK")
+                log.warning("Buyer refresh chunk at %d failed (left dirty): %s",
+                            start, str(e)[:80])
+        if not failed:
+            # Rows past `top` were written after the snapshot: next run.
+            db.executemany(
+                "INSERT INTO scprs_buyer_marks(source, seen_id) VALUES (?, ?) "
+                "ON CONFLICT(source) DO UPDATE SET "
+                "seen_id = MAX(seen_id, excluded.seen_id)", top.items())
+    finally:
         db.close()
-        # Yield for 2 seconds between batches so critical operations
-        # (package generation, save, approve) can acquire the DB lock
-        _time.sleep(2.0)
 
     log.info("Buyer refresh complete: %d profiles updated", updated)
     return updated
@@ -337,6 +337,8 @@ def store_pos(pos: list, search_term: str) -> dict:
 
     conn.commit()
     conn.close()
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("scprs_po_master", "scprs_po_lines")
     return {"new_pos": new_pos, "new_lines": new_lines,
             "gap_items": gap_items, "win_back_items": win_back}
 
@@ -10,10 +10,12 @@ robust reconnection, manual trigger support.
 
 import email
 from email.header import decode_header
-import os, time, json, re, logging, threading
+import os, time, json, re, logging, threading, functools
 from datetime import datetime, timedelta
 import logging
 
+from src.core.rule_engine import RuleSet
+
 log = logging.getLogger("email_poller")
 
 # ── Thread-safety lock for JSON file writes ──
@@ -318,6 +320,17 @@ NEWSLETTER_BODY_SIGNALS = [
 
 NEWSLETTER_SIGNALS_COMPILED = [re.compile(p, re.I) for p in NEWSLETTER_BODY_SIGNALS]
 
+# Merged single-pass form of the signal lists (see src/core/rule_engine.py).
+# is_marketing_email and is_rfq_email both run on every inbound message, so
+# the per-body newsletter count is memoized to scan each body once.
+_NEWSLETTER_RULES = RuleSet(NEWSLETTER_BODY_SIGNALS, flags=re.I, name="newsletter_body")
+
+
+@functools.lru_cache(maxsize=64)
+def _newsletter_hit_count(body_lower: str) -> int:
+    """Number of distinct newsletter signals in an already-lowercased body."""
+    return _NEWSLETTER_RULES.count(body_lower)
+
 
 def is_marketing_email(msg, body):
     """Detect newsletters/marketing blasts that are NOT procurement emails.
@@ -340,8 +353,7 @@ def is_marketing_email(msg, body):
     body_lower = (body or "").lower()
     if len(body_lower) < 50:
         return False  # Too short to be a newsletter
-    hits = sum(1 for pat in NEWSLETTER_SIGNALS_COMPILED if pat.search(body_lower))
-    return hits >= 2
+    return _newsletter_hit_count(body_lower) >= 2
 
 
 PC_KNOWN_SENDERS = [
@@ -373,6 +385,9 @@ RFQ_PDF_PATTERNS = [
     r"^pr.?\d{7,8}",  # "PR 10840486 - ..." state procurement request numbers
 ]
 
+_PC_SUBJECT_RULES = RuleSet(PC_SUBJECT_PATTERNS, anchored=True, name="pc_subject")
+_RFQ_PDF_RULES = RuleSet(RFQ_PDF_PATTERNS, name="rfq_pdf_names")
+
 ATTACHMENT_PATTERNS = {
     "703b": ["703b", "703c", "rfq", "request_for_quotation", "informal_competitive", "fair_and_reasonable", "exempt", "attachment_1", "attachment1"],
     "704b": ["704b", "quote_worksheet", "acquisition_quote", "attachment_2", "attachment2"],
@@ -1276,11 +1291,10 @@ def is_price_check_email(subject, body, sender, pdf_names):
             break
     
     # ── Signal 1b: Subject matches PC pattern (also check early) ──
-    for pat in PC_SUBJECT_PATTERNS:
-        if re.match(pat, subj_lower):
-            signals.append(f"subject_pattern:{pat}")
-            score += 3
-            break
+    _pc_rule = _PC_SUBJECT_RULES.first(subj_lower)
+    if _pc_rule:
+        signals.append(f"subject_pattern:{_pc_rule.pattern}")
+        score += 3
 
     # ── Negative: Has 703B/704B/Bid Package forms → NOT a PC ──
     # BUT: if sender is a KNOWN PC sender AND subject says "Price Check",
@@ -1577,21 +1591,17 @@ def is_rfq_email(subject, body, attachments, sender_email=""):
 
     # ── Negative Gate: Price Check subjects ──
     _subj_low = (subject or "").strip().lower()
-    for _pc_pat in PC_SUBJECT_PATTERNS:
-        if re.match(_pc_pat, _subj_low):
-            log.debug("is_rfq_email: subject matches PC pattern (%s) → not an RFQ", _pc_pat)
-            return False
+    _pc_rule = _PC_SUBJECT_RULES.first(_subj_low)
+    if _pc_rule:
+        log.debug("is_rfq_email: subject matches PC pattern (%s) → not an RFQ", _pc_rule.pattern)
+        return False
 
     # ── Negative Gate: Newsletter / marketing signals in body ──
-    _body_low = (body or "").lower()
-    _newsletter_hits = 0
-    for _np in NEWSLETTER_SIGNALS_COMPILED:
-        if _np.search(_body_low):
-            _newsletter_hits += 1
-            if _newsletter_hits >= 2:
-                log.debug("is_rfq_email: newsletter signals (%d hits) → not an RFQ: %s",
-                          _newsletter_hits, subject[:50])
-                return False
+    _newsletter_hits = _newsletter_hit_count((body or "").lower())
+    if _newsletter_hits >= 2:
+        log.debug("is_rfq_email: newsletter signals (%d hits) → not an RFQ: %s",
+                  _newsletter_hits, subject[:50])
+        return False
 
     # ── Negative Gate (PR-AA, 2026-05-13): non-RFQ team email ──
     # Veto when the body/signature is clearly from accounting,
@@ -1639,16 +1649,13 @@ def is_rfq_email(subject, body, attachments, sender_email=""):
     # ── Tier 2: PDF filenames look like RFQ forms ──
     pdf_names = [a.lower().replace(" ", ".").replace("-", ".") for a in attachments]
     for name in pdf_names:
-        if any(re.search(p, name) for p in RFQ_PDF_PATTERNS):
+        if _RFQ_PDF_RULES.any(name):
             log.info("RFQ detected (PDF filename match): %s", subject[:60])
             return True
 
     # ── Tier 3: Multiple PDFs where at least one matches RFQ patterns ──
     if len(attachments) >= 2:
-        _has_rfq_pdf = any(
-            any(re.search(p, name) for p in RFQ_PDF_PATTERNS)
-            for name in pdf_names
-        )
+        _has_rfq_pdf = any(_RFQ_PDF_RULES.any(name) for name in pdf_names)
         _is_gov_sender = any(d in _sender_low for d in [".ca.gov", ".gov"])
         if _has_rfq_pdf or _is_gov_sender:
             log.info("RFQ detected (multi-PDF + pattern/gov): %s (%d PDFs)", subject[:60], len(attachments))
@@ -1659,10 +1666,7 @@ def is_rfq_email(subject, body, attachments, sender_email=""):
     # ── Tier 4: Forwarded email with RFQ evidence ──
     fwd_indicators = ["fwd:", "fw:", "forwarded", "---------- forwarded"]
     if any(ind in combined for ind in fwd_indicators) and len(attachments) >= 1:
-        _has_rfq_pdf = any(
-            any(re.search(p, name) for p in RFQ_PDF_PATTERNS)
-            for name in pdf_names
-        )
+        _has_rfq_pdf = any(_RFQ_PDF_RULES.any(name) for name in pdf_names)
         _is_gov_sender = any(d in _sender_low for d in [".ca.gov", ".gov"])
         _has_procurement_hint = any(kw in combined for kw in [
             "quote", "pricing", "bid", "rfq", "704", "703",
@@ -5,7 +5,7 @@ Auto-creates follow-up email drafts when outreach goes unanswered.
 
 Scan sources:
   1. email_outbox.json — sent emails without replies
-  2. growth_outreach.json — campaign outreach without response
+  2. growth outreach campaigns — outreach without response
   3. crm_activity.json — quote sends without PO
 
 Schedule: Every hour, checks all sources. Creates draft follow-ups at:
@@ -31,7 +31,6 @@ except ImportError:
     DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data")
 
 OUTBOX_FILE = os.path.join(DATA_DIR, "email_outbox.json")
-GROWTH_FILE = os.path.join(DATA_DIR, "growth_outreach.json")
 ACTIVITY_FILE = os.path.join(DATA_DIR, "crm_activity.json")
 FOLLOWUP_STATE_FILE = os.path.join(DATA_DIR, "follow_up_state.json")
 
@@ -177,9 +176,12 @@ def scan_outbox_for_follow_ups():
 
 
 def scan_growth_for_follow_ups():
-    """Scan growth_outreach.json for campaigns needing follow-up."""
-    data = _load_json(GROWTH_FILE)
-    if not isinstance(data, dict):
+    """Scan growth outreach campaigns for entries needing follow-up."""
+    try:
+        from src.agents.growth_agent import load_outreach_data
+        data = load_outreach_data()
+    except Exception as e:
+        log.debug("growth outreach unavailable: %s", e)
         return []
 
     needs_follow_up = []
@@ -16,6 +16,8 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import logging
 
+from src.core.rule_engine import KeywordCategorizer
+
 # ── Agent Context (Anthropic Skills Guide: Pattern 5 — Domain Intelligence) ──
 try:
     from src.core.agent_context import get_context, get_contact_by_agency, format_context_for_agent
@@ -55,6 +57,7 @@ HISTORY_FILE = os.path.join(DATA_DIR, "growth_reytech_history.json")
 CATEGORIES_FILE = os.path.join(DATA_DIR, "growth_categories.json")
 PROSPECTS_FILE = os.path.join(DATA_DIR, "growth_prospects.json")
 OUTREACH_FILE = os.path.join(DATA_DIR, "growth_outreach.json")
+TIMELINE_FILE = os.path.join(DATA_DIR, "growth_timeline.json")
 
 try:
     from src.agents.scprs_lookup import _get_session
@@ -180,18 +183,313 @@ def _load_persisted_status(name: str) -> dict | None:
         return None
 
 
+# ─── Prospect / outreach / timeline store ─────────────────────────────────
+# Prospects, campaign outreach and the per-prospect timeline used to live in
+# growth_prospects.json / growth_outreach.json / growth_timeline.json. Every
+# status flip or timeline event reloaded a whole file, changed one record and
+# rewrote all of it under _json_write_lock, and get_prospect() walked every
+# campaign to find one prospect's outreach — a bulk send of N prospects
+# rewrote the files O(N) times. They are now rows in growth_prospects,
+# growth_outreach + growth_outreach_entries and growth_timeline (db.py), and
+# each change is a single-row write. The JSON files are imported once per
+# database (marker in app_settings) and left in place untouched afterwards.
+# load_prospects_data() / load_outreach_data() return the old document
+# shapes for readers that want a whole collection.
+
+_IMPORT_MARKER = "growth_json_imported_at"    # all files in; per file: + ":<part>"
+_IMPORT_RETRY_S = 60
+_PROSPECTS_META = "growth_prospects_meta"
+_store_lock = threading.Lock()
+_store_ready: set = set()       # DB paths whose JSON import has completed
+_import_failed_at: dict = {}    # DB path -> monotonic time of the last failed import
+
+
+def _growth_db():
+    """get_db() context manager, after the one-time JSON import for this DB.
+    A failed import is retried (at most every _IMPORT_RETRY_S) until every
+    file is in."""
+    from src.core.db import DB_PATH, get_db
+    if DB_PATH not in _store_ready:
+        with _store_lock:
+            if (DB_PATH not in _store_ready and
+                    time.monotonic() - _import_failed_at.get(DB_PATH, -_IMPORT_RETRY_S)
+                    >= _IMPORT_RETRY_S):
+                if _import_legacy_json():
+                    _store_ready.add(DB_PATH)
+                    _import_failed_at.pop(DB_PATH, None)
+                else:
+                    _import_failed_at[DB_PATH] = time.monotonic()
+    return get_db()
+
+
+def _import_legacy_json() -> bool:
+    """Copy the pre-SQLite JSON state into the growth tables; True once
+    every file is in. Each file is imported on its own and marked on its
+    own, so a corrupt timeline does not hold back the prospects. A file
+    that fails to parse records a json_corruption skip (via _load_json)
+    and stays unmarked; re-runs never overwrite rows the tables already
+    have."""
+    from src.core.db import get_setting, set_setting
+    if get_setting(_IMPORT_MARKER):
+        return True
+    done = True
+    for part, path, importer in (("prospects", PROSPECTS_FILE, _import_prospects),
+                                 ("campaigns", OUTREACH_FILE, _import_campaigns),
+                                 ("timelines", TIMELINE_FILE, _import_timelines)):
+        marker = f"{_IMPORT_MARKER}:{part}"
+        if get_setting(marker):
+            continue
+        try:
+            skips_before = len(_SKIP_LEDGER)
+            doc = _load_json(path)
+            if len(_SKIP_LEDGER) > skips_before:
+                raise ValueError(f"{os.path.basename(path)} is corrupt")
+            n = importer(doc)
+        except Exception as e:
+            log.warning("growth JSON import of %s failed, will retry: %s", part, e)
+            done = False
+            continue
+        set_setting(marker, datetime.now().isoformat())
+        log.info("growth: imported %d %s from JSON", n, part)
+    if done:
+        set_setting(_IMPORT_MARKER, datetime.now().isoformat())
+    return done
+
+
+def _import_prospects(doc) -> int:
+    from src.core.db import get_db, get_setting, set_setting
+    meta, prospects = {}, doc
+    if isinstance(doc, dict):
+        meta = {k: doc[k] for k in ("generated_at", "from_date") if k in doc}
+        prospects = doc.get("prospects")
+    prospects = [p for p in prospects if isinstance(p, dict)] if isinstance(prospects, list) else []
+    with get_db() as conn:
+        _append_prospects(conn, prospects)
+    if meta and not get_setting(_PROSPECTS_META):
+        set_setting(_PROSPECTS_META, json.dumps(meta))
+    return len(prospects)
+
+
+def _import_campaigns(doc) -> int:
+    from src.core.db import get_db
+    campaigns = doc.get("campaigns") if isinstance(doc, dict) else doc
+    campaigns = [c for c in campaigns if isinstance(c, dict)] if isinstance(campaigns, list) else []
+    with get_db() as conn:
+        for camp in campaigns:
+            camp.setdefault("id", f"camp-{uuid.uuid4().hex[:8]}")
+            if not conn.execute("SELECT 1 FROM growth_outreach_entries WHERE campaign_id=? LIMIT 1",
+                                (camp["id"],)).fetchone():
+                _insert_campaign(conn, camp)
+    return len(campaigns)
+
+
+def _import_timelines(doc) -> int:
+    from src.core.db import get_db
+    timeline = doc if isinstance(doc, dict) else {}
+    with get_db() as conn:
+        conn.executemany(
+            "INSERT INTO growth_timeline (prospect_id, type, detail, timestamp, metadata) "
+            "VALUES (?,?,?,?,?)",
+            [(pid, e.get("type", ""), e.get("detail", ""), e.get("timestamp", ""),
+              json.dumps(e.get("metadata") or {}, default=str))
+             for pid, events in timeline.items() if isinstance(events, list)
+             for e in events if isinstance(e, dict)])
+    return len(timeline)
+
+
+def _email_key(p: dict) -> str:
+    # CSV imports carry `email`, everything else `buyer_email`
+    return (p.get("buyer_email") or p.get("email") or "").strip().lower()
+
+
+def _prospect_params(p: dict, seq: int) -> tuple:
+    return (p.get("id") or f"PRO-{uuid.uuid4().hex[:8]}", seq,
+            _email_key(p), p.get("agency") or "",
+            p.get("outreach_status") or "new", datetime.now().isoformat(),
+            json.dumps(p, default=str))
+
+
+def _append_prospects(conn, prospects: list) -> None:
+    """Insert prospects after the current last one; existing ids are kept."""
+    base = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM growth_prospects").fetchone()[0]
+    conn.executemany(
+        "INSERT OR IGNORE INTO growth_prospects "
+        "(id, seq, buyer_email, agency, outreach_status, updated_at, data_json) "
+        "VALUES (?,?,?,?,?,?,?)",
+        [_prospect_params(p, base + i + 1) for i, p in enumerate(prospects)])
+
+
+def _replace_prospects(prospects: list, meta: dict) -> None:
+    """Make `prospects` (in this order) the whole prospect list."""
+    from src.core.db import set_setting
+    rows = [_prospect_params(p, i + 1) for i, p in enumerate(prospects)]
+    with _growth_db() as conn:
+        conn.executemany(
+            "INSERT INTO growth_prospects "
+            "(id, seq, buyer_email, agency, outreach_status, updated_at, data_json) "
+            "VALUES (?,?,?,?,?,?,?) "
+            "ON CONFLICT(id) DO UPDATE SET seq=excluded.seq, buyer_email=excluded.buyer_email, "
+            "agency=excluded.agency, outreach_status=excluded.outreach_status, "
+            "updated_at=excluded.updated_at, data_json=excluded.data_json", rows)
+        conn.execute("DELETE FROM growth_prospects WHERE id NOT IN (SELECT value FROM json_each(?))",
+                     (json.dumps([r[0] for r in rows]),))
+    set_setting(_PROSPECTS_META, json.dumps(meta))
+
+
+def add_prospects(prospects: list) -> int:
+    """Append prospects whose email is new (case-insensitive) and
+    non-empty. Returns how many were added."""
+    added, seen = [], set()
+    with _growth_db() as conn:
+        for p in prospects:
+            em = _email_key(p)
+            if not em or em in seen or conn.execute(
+                    "SELECT 1 FROM growth_prospects WHERE buyer_email=? LIMIT 1", (em,)).fetchone():
+                continue
+            seen.add(em)
+            added.append(p)
+        _append_prospects(conn, added)
+    return len(added)
+
+
+def prospect_emails() -> set:
+    """Lowercased emails of every prospect (for dedupe by callers)."""
+    with _growth_db() as conn:
+        return {r[0] for r in conn.execute(
+            "SELECT DISTINCT buyer_email FROM growth_prospects WHERE buyer_email != ''")}
+
+
+def _get_prospect(conn, prospect_id: str) -> dict | None:
+    row = conn.execute("SELECT data_json FROM growth_prospects WHERE id=?",
+                       (prospect_id,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def _put_prospect(conn, prospect_id: str, p: dict) -> None:
+    conn.execute(
+        "UPDATE growth_prospects SET buyer_email=?, agency=?, outreach_status=?, "
+        "updated_at=?, data_json=? WHERE id=?",
+        (_email_key(p), p.get("agency") or "", p.get("outreach_status") or "new", datetime.now().isoformat(),
+         json.dumps(p, default=str), prospect_id))
+
+
 def _load_prospects_list():
-    """Load prospects as a flat list, handling both dict and list formats.
+    """All prospects as a flat list, in list order."""
+    with _growth_db() as conn:
+        rows = conn.execute("SELECT data_json FROM growth_prospects ORDER BY seq, rowid").fetchall()
+    return [json.loads(r[0]) for r in rows]
 
-    Defensive: a corrupt file where `prospects` decodes to a non-list value
-    (e.g. a string) would cause downstream `for p in ...` loops to iterate
-    over characters. Explicitly validate the returned type.
-    """
-    data = _load_json(PROSPECTS_FILE) or []
-    if isinstance(data, dict):
-        lst = data.get("prospects", [])
-        return lst if isinstance(lst, list) else []
-    return data if isinstance(data, list) else []
+
+def _prospects_meta() -> dict:
+    """{generated_at, from_date} of the last find_category_buyers run."""
+    from src.core.db import get_setting
+    try:
+        meta = json.loads(get_setting(_PROSPECTS_META) or "{}")
+    except (TypeError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def load_prospects_data() -> dict:
+    """Prospects in the old growth_prospects.json shape:
+    {generated_at, from_date, total_prospects, prospects: [...]}."""
+    prospects = _load_prospects_list()
+    return {**_prospects_meta(), "total_prospects": len(prospects), "prospects": prospects}
+
+
+def prospect_status_counts() -> dict:
+    """{outreach_status: prospect count}, counted in SQL."""
+    with _growth_db() as conn:
+        rows = conn.execute("SELECT outreach_status, COUNT(*) FROM growth_prospects "
+                            "GROUP BY outreach_status").fetchall()
+    return {(status or "new"): n for status, n in rows}
+
+
+def _insert_campaign(conn, campaign: dict) -> None:
+    """Save a campaign header and one growth_outreach_entries row per recipient."""
+    from src.core.db import save_growth_campaign
+    save_growth_campaign(campaign, conn=conn)
+    conn.executemany(
+        "INSERT INTO growth_outreach_entries "
+        "(campaign_id, prospect_id, email, email_sent, staged, data_json) VALUES (?,?,?,?,?,?)",
+        [(campaign["id"], o.get("prospect_id") or "", (o.get("email") or "").strip().lower(),
+          1 if o.get("email_sent") else 0, 1 if o.get("staged") else 0,
+          json.dumps(o, default=str))
+         for o in campaign.get("outreach", []) if isinstance(o, dict)])
+
+
+def load_outreach_data() -> dict:
+    """Campaigns in the old growth_outreach.json shape, oldest first:
+    {campaigns: [{..., outreach: [...]}], total_sent, last_distro_campaign}."""
+    from src.core.db import growth_campaign_row
+    with _growth_db() as conn:
+        headers = conn.execute("SELECT * FROM growth_outreach ORDER BY created_at, rowid").fetchall()
+        entries = conn.execute(
+            "SELECT campaign_id, data_json FROM growth_outreach_entries ORDER BY id").fetchall()
+    by_campaign = defaultdict(list)
+    for r in entries:
+        by_campaign[r["campaign_id"]].append(json.loads(r["data_json"]))
+    campaigns = []
+    for h in headers:
+        camp = growth_campaign_row(h)
+        camp["dry_run"] = bool(camp.get("dry_run"))
+        camp["outreach"] = by_campaign.get(camp["id"], [])
+        campaigns.append(camp)
+    distro = [c["id"] for c in campaigns if c.get("type") == "distro_list_phase1"]
+    return {
+        "campaigns": campaigns,
+        "total_sent": sum(1 for c in campaigns for o in c["outreach"] if o.get("email_sent")),
+        "last_distro_campaign": distro[-1] if distro else None,
+    }
+
+
+def _contacted_emails(conn, include_staged: bool = False) -> set:
+    """Lowercased emails that outreach already went (or is staged) to."""
+    sql = "SELECT DISTINCT email FROM growth_outreach_entries WHERE email_sent = 1"
+    if include_staged:
+        sql += " OR staged = 1"
+    return {r[0] for r in conn.execute(sql) if r[0]}
+
+
+def recent_sent_outreach(limit: int = 20) -> list:
+    """The `limit` most recently emailed outreach entries (live campaigns
+    only), newest first — for the activity feed."""
+    with _growth_db() as conn:
+        rows = conn.execute(
+            "SELECT e.prospect_id, e.email, e.data_json FROM growth_outreach_entries e "
+            "JOIN growth_outreach c ON c.id = e.campaign_id "
+            "WHERE e.email_sent = 1 AND NOT c.dry_run "
+            "ORDER BY json_extract(e.data_json, '$.email_sent_at') DESC, e.id DESC "
+            "LIMIT ?", (limit,)).fetchall()
+    out = []
+    for r in rows:
+        entry = json.loads(r["data_json"])
+        entry.setdefault("prospect_id", r["prospect_id"] or entry.get("buyer_id", ""))
+        entry.setdefault("email", r["email"])
+        out.append(entry)
+    return out
+
+
+def _live_sent_entries(conn) -> list:
+    """Outreach entries that were actually emailed, outside dry-run campaigns."""
+    rows = conn.execute(
+        "SELECT e.data_json FROM growth_outreach_entries e "
+        "JOIN growth_outreach c ON c.id = e.campaign_id "
+        "WHERE e.email_sent = 1 AND NOT c.dry_run ORDER BY e.id").fetchall()
+    return [json.loads(r[0]) for r in rows]
+
+
+def _update_outreach_entries(conn, column: str, value: str, fields: dict) -> int:
+    """Set `fields` on every outreach entry whose `column` (prospect_id or
+    email) equals `value` — one indexed UPDATE, no campaign rewrite."""
+    if column not in ("prospect_id", "email"):
+        raise ValueError(column)
+    paths = ", ".join("?, json(?)" for _ in fields)
+    args = [a for k, v in fields.items() for a in (f"$.{k}", json.dumps(v, default=str))]
+    cur = conn.execute(
+        f"UPDATE growth_outreach_entries SET data_json = json_set(data_json, {paths}) "
+        f"WHERE {column} = ?", args + [value])
+    return cur.rowcount
 
 
 # ─── Item Category Mapping ───────────────────────────────────────────────
@@ -230,14 +528,14 @@ CATEGORY_KEYWORDS = {
     ],
 }
 
+# One compiled pass per description, memoized — intel rebuilds categorize
+# hundreds of thousands of (mostly repeated) SCPRS line descriptions.
+ITEM_CATEGORIZER = KeywordCategorizer(CATEGORY_KEYWORDS, default="General Supplies",
+                                      cache_size=8192, name="growth_categories")
+
 def categorize_item(description: str) -> str:
-    desc_lower = (description or "").lower()
-    scores = {}
-    for cat, keywords in CATEGORY_KEYWORDS.items():
-        score = sum(1 for kw in keywords if kw in desc_lower)
-        if score > 0:
-            scores[cat] = score
-    return max(scores, key=scores.get) if scores else "General Supplies"
+    """Category whose keywords occur most in `description`."""
+    return ITEM_CATEGORIZER.best(description)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -439,17 +737,13 @@ def find_category_buyers(max_categories=10, from_date="01/01/2019"):
         # than overwrite. Without this, `outreach_status="contacted"` resets
         # to "new" every run → same buyer gets contacted again → spam flag.
         prospects: dict = {}
-        prior = _load_json(PROSPECTS_FILE)
-        if isinstance(prior, dict):
-            for p in prior.get("prospects") or []:
-                if not isinstance(p, dict):
-                    continue
-                email = (p.get("buyer_email") or "").strip()
-                dept = (p.get("agency") or "").strip()
-                # Match the new-entry key scheme below so repeat finds merge.
-                key = email or f"{dept}_{(p.get('purchase_orders') or [{}])[0].get('po_number', '')}"
-                if key:
-                    prospects[key] = p
+        for p in _load_prospects_list():
+            email = (p.get("buyer_email") or "").strip()
+            dept = (p.get("agency") or "").strip()
+            # Match the new-entry key scheme below so repeat finds merge.
+            key = email or f"{dept}_{(p.get('purchase_orders') or [{}])[0].get('po_number', '')}"
+            if key:
+                prospects[key] = p
 
         for cat_idx, (cat_name, cat_info) in enumerate(cats):
             BUYER_STATUS["progress"] = f"[{cat_idx+1}/{len(cats)}] {cat_name}"
@@ -530,12 +824,8 @@ def find_category_buyers(max_categories=10, from_date="01/01/2019"):
                         log.debug("suppressed: %s", _e)
 
         prospect_list = sorted(prospects.values(), key=lambda p: p["total_spend"], reverse=True)
-        _save_json(PROSPECTS_FILE, {
-            "generated_at": datetime.now().isoformat(),
-            "total_prospects": len(prospect_list),
-            "from_date": from_date,
-            "prospects": prospect_list,
-        })
+        _replace_prospects(prospect_list, {"generated_at": datetime.now().isoformat(),
+                                           "from_date": from_date})
 
         with _status_lock:
             BUYER_STATUS.update({"running": False, "phase": "complete", "prospects_found": len(prospect_list)})
@@ -1122,25 +1412,13 @@ def _enrich_contacts(session, prospects: list, max_detail=10):
 
 
 def _merge_intel_prospects(new_prospects: list):
-    """Merge newly discovered prospects into the main prospects file."""
-    existing_data = _load_json(PROSPECTS_FILE) or {}
-    existing = existing_data.get("prospects", []) if isinstance(existing_data, dict) else []
-
-    existing_emails = set()
-    for p in existing:
-        em = (p.get("buyer_email") or "").strip().lower()
-        if em:
-            existing_emails.add(em)
-
-    added = 0
+    """Merge newly discovered prospects into the prospect table."""
+    converted = []
     for np in new_prospects:
-        em = (np.get("buyer_email") or "").strip().lower()
-        if em and em in existing_emails:
-            continue
-        if not em:
+        if not (np.get("buyer_email") or "").strip():
             continue
         # Convert intel format to standard prospect format
-        prospect = {
+        converted.append({
             "id": np.get("id", f"PRO-{uuid.uuid4().hex[:8]}"),
             "buyer_email": np.get("buyer_email", ""),
             "buyer_name": np.get("buyer_name", ""),
@@ -1156,18 +1434,11 @@ def _merge_intel_prospects(new_prospects: list):
             "source": np.get("source", "intel"),
             "intel_note": np.get("why", ""),
             "added_at": datetime.now().isoformat(),
-        }
-        existing.append(prospect)
-        existing_emails.add(em)
-        added += 1
+        })
 
+    added = add_prospects(converted)
     if added > 0:
-        _save_json(PROSPECTS_FILE, {
-            "generated_at": datetime.now().isoformat(),
-            "total_prospects": len(existing),
-            "prospects": existing,
-        })
-        log.info(f"Intel: merged {added} new prospects (total: {len(existing)})")
+        log.info(f"Intel: merged {added} new prospects")
 
 
 def get_intel_results() -> dict:
@@ -1291,9 +1562,7 @@ def get_follow_up_cohorts() -> dict:
     """Compute follow-up cohorts from outreach campaigns.
     Returns: {no_response: [...], second_followup: [...], stale: [...], responded: [...]}
     """
-    outreach = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach, dict):
-        return {"no_response": [], "second_followup": [], "stale": [], "responded": []}
+    outreach = load_outreach_data()
 
     now = datetime.now()
     no_response = []      # 3-7 days, no reply
@@ -1666,24 +1935,22 @@ def launch_distro_campaign(
                 })
 
     # Source 2: Growth prospects
-    prospect_data = _load_json(PROSPECTS_FILE)
-    if isinstance(prospect_data, dict):
-        for p in prospect_data.get("prospects", []):
-            if p.get("buyer_email") and "@" in p.get("buyer_email", ""):
-                pos = p.get("purchase_orders", [])
-                items = pos[0].get("items", ", ".join(p.get("categories_matched", [])))[:80] if pos else ", ".join(p.get("categories_matched", []))[:80]
-                date = pos[0].get("date", "recently") if pos else "recently"
-                all_buyers.append({
-                    "id": p.get("id", f"prospect_{len(all_buyers)}"),
-                    "name": p.get("buyer_name", ""),
-                    "email": p.get("buyer_email", ""),
-                    "agency": p.get("agency", ""),
-                    "categories": p.get("categories_matched", []),
-                    "spend": p.get("estimated_spend", 0),
-                    "source": "prospect",
-                    "items_mention": items or "supplies",
-                    "purchase_date": date,
-                })
+    for p in _load_prospects_list():
+        if p.get("buyer_email") and "@" in p.get("buyer_email", ""):
+            pos = p.get("purchase_orders", [])
+            items = pos[0].get("items", ", ".join(p.get("categories_matched", [])))[:80] if pos else ", ".join(p.get("categories_matched", []))[:80]
+            date = pos[0].get("date", "recently") if pos else "recently"
+            all_buyers.append({
+                "id": p.get("id", f"prospect_{len(all_buyers)}"),
+                "name": p.get("buyer_name", ""),
+                "email": p.get("buyer_email", ""),
+                "agency": p.get("agency", ""),
+                "categories": p.get("categories_matched", []),
+                "spend": p.get("estimated_spend", 0),
+                "source": "prospect",
+                "items_mention": items or "supplies",
+                "purchase_date": date,
+            })
 
     # Source 3: CRM contacts with email not yet emailed
     for c in ctx.get("contacts", []):
@@ -1703,15 +1970,8 @@ def launch_distro_campaign(
                 })
 
     # ── Deduplicate against previously contacted ───────────────────────────
-    outreach_data = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach_data, dict):
-        outreach_data = {"campaigns": [], "total_sent": 0}
-
-    already_contacted = set()
-    for camp in outreach_data.get("campaigns", []):
-        for o in camp.get("outreach", []):
-            if o.get("email_sent") or o.get("staged"):
-                already_contacted.add(o.get("email", ""))
+    with _growth_db() as conn:
+        already_contacted = _contacted_emails(conn, include_staged=True)
 
     # Apply filters
     if source_filter:
@@ -1719,7 +1979,7 @@ def launch_distro_campaign(
         all_buyers = [b for b in all_buyers if sf in (b.get("agency") or "").lower()
                       or sf in (b.get("source") or "").lower()]
 
-    new_buyers = [b for b in all_buyers if b["email"] not in already_contacted]
+    new_buyers = [b for b in all_buyers if b["email"].strip().lower() not in already_contacted]
     new_buyers = new_buyers[:max_contacts]
 
     if not new_buyers:
@@ -1845,10 +2105,8 @@ def launch_distro_campaign(
         staged += 1
 
     # ── Save campaign ──────────────────────────────────────────────────────
-    outreach_data.setdefault("campaigns", []).append(campaign)
-    outreach_data["total_sent"] = outreach_data.get("total_sent", 0) + sent
-    outreach_data["last_distro_campaign"] = campaign_id
-    _save_json(OUTREACH_FILE, outreach_data)
+    with _growth_db() as conn:
+        _insert_campaign(conn, campaign)
 
     # Log to DB activity
     try:
@@ -1885,21 +2143,15 @@ def launch_distro_campaign(
 
 def launch_outreach(max_prospects=50, dry_run=True):
     """Send personalized emails. dry_run=True builds but doesn't send."""
-    prospect_data = _load_json(PROSPECTS_FILE)
-    if not isinstance(prospect_data, dict) or not prospect_data.get("prospects"):
+    prospects = _load_prospects_list()
+    if not prospects:
         return {"ok": False, "error": "No prospects. Run find_category_buyers first."}
 
-    outreach = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach, dict):
-        outreach = {"campaigns": [], "total_sent": 0}
+    with _growth_db() as conn:
+        contacted = _contacted_emails(conn)
 
-    contacted = set()
-    for c in outreach.get("campaigns", []):
-        for o in c.get("outreach", []):
-            if o.get("email_sent"):
-                contacted.add(o.get("email", ""))
-
-    new = [p for p in prospect_data["prospects"] if p.get("buyer_email") and p["buyer_email"] not in contacted][:max_prospects]
+    new = [p for p in prospects if p.get("buyer_email")
+           and p["buyer_email"].strip().lower() not in contacted][:max_prospects]
     if not new:
         return {"ok": True, "message": "All prospects already contacted", "new_to_contact": 0}
 
@@ -1959,9 +2211,8 @@ def launch_outreach(max_prospects=50, dry_run=True):
 
         campaign["outreach"].append(entry)
 
-    outreach.setdefault("campaigns", []).append(campaign)
-    outreach["total_sent"] = outreach.get("total_sent", 0) + sent
-    _save_json(OUTREACH_FILE, outreach)
+    with _growth_db() as conn:
+        _insert_campaign(conn, campaign)
 
     return {
         "ok": True, "campaign_id": campaign["id"], "dry_run": dry_run,
@@ -1981,23 +2232,19 @@ def launch_outreach(max_prospects=50, dry_run=True):
 
 def check_follow_ups():
     """Find prospects who haven't responded after 3-5 business days."""
-    outreach = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach, dict):
-        return {"ok": True, "ready": [], "count": 0}
+    with _growth_db() as conn:
+        sent = _live_sent_entries(conn)
 
     now = datetime.now()
     ready = []
-    for c in outreach.get("campaigns", []):
-        if c.get("dry_run"):
-            continue
-        for o in c.get("outreach", []):
-            if o.get("email_sent") and not o.get("response_received") and not o.get("voice_called"):
-                try:
-                    fdate = datetime.fromisoformat(o.get("voice_follow_up_date", ""))
-                    if now >= fdate:
-                        ready.append({"prospect_id": o["prospect_id"], "email": o["email"], "agency": o.get("agency", ""), "categories": o.get("categories", [])})
-                except Exception as _e:
-                    log.debug("suppressed: %s", _e)
+    for o in sent:
+        if not o.get("response_received") and not o.get("voice_called"):
+            try:
+                fdate = datetime.fromisoformat(o.get("voice_follow_up_date", ""))
+                if now >= fdate:
+                    ready.append({"prospect_id": o["prospect_id"], "email": o["email"], "agency": o.get("agency", ""), "categories": o.get("categories", [])})
+            except Exception as _e:
+                log.debug("suppressed: %s", _e)
 
     return {"ok": True, "ready": ready, "count": len(ready)}
 
@@ -2008,15 +2255,10 @@ def launch_voice_follow_up(max_calls=10):
     if not fu.get("ready"):
         return {"ok": True, "message": "No follow-ups due", "calls_made": 0}
 
-    prospect_data = _load_json(PROSPECTS_FILE)
-    pmap = {}
-    if isinstance(prospect_data, dict):
-        for p in prospect_data.get("prospects", []):
-            pmap[p["id"]] = p
-
     calls = 0
     for target in fu["ready"][:max_calls]:
-        prospect = pmap.get(target["prospect_id"], {})
+        with _growth_db() as conn:
+            prospect = _get_prospect(conn, target["prospect_id"]) or {}
         phone = prospect.get("buyer_phone", "")
         if not phone:
             continue
@@ -2036,15 +2278,9 @@ def launch_voice_follow_up(max_calls=10):
 
 
 def _mark_called(prospect_id):
-    outreach = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach, dict):
-        return
-    for c in outreach.get("campaigns", []):
-        for o in c.get("outreach", []):
-            if o.get("prospect_id") == prospect_id:
-                o["voice_called"] = True
-                o["voice_called_at"] = datetime.now().isoformat()
-    _save_json(OUTREACH_FILE, outreach)
+    with _growth_db() as conn:
+        _update_outreach_entries(conn, "prospect_id", prospect_id, {
+            "voice_called": True, "voice_called_at": datetime.now().isoformat()})
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -2054,18 +2290,19 @@ def _mark_called(prospect_id):
 def get_growth_status():
     history = _load_json(HISTORY_FILE)
     cats = _load_json(CATEGORIES_FILE)
-    prospects = _load_json(PROSPECTS_FILE)
-    outreach = _load_json(OUTREACH_FILE)
     h = history if isinstance(history, dict) else {}
     c = cats if isinstance(cats, dict) else {}
-    p = prospects if isinstance(prospects, dict) else {}
-    o = outreach if isinstance(outreach, dict) else {}
+    with _growth_db() as conn:
+        total_prospects = conn.execute("SELECT COUNT(*) FROM growth_prospects").fetchone()[0]
+        campaigns = conn.execute("SELECT COUNT(*) FROM growth_outreach").fetchone()[0]
+        total_sent = conn.execute(
+            "SELECT COUNT(*) FROM growth_outreach_entries WHERE email_sent = 1").fetchone()[0]
     return {
         "ok": True,
         "history": {"total_pos": h.get("total_pos", 0), "total_items": h.get("total_items", 0), "pulled_at": h.get("pulled_at")},
         "categories": {"total": c.get("total_categories", 0), "names": list(c.get("categories", {}).keys())[:7]},
-        "prospects": {"total": p.get("total_prospects", 0), "generated_at": p.get("generated_at")},
-        "outreach": {"total_sent": o.get("total_sent", 0), "campaigns": len(o.get("campaigns", []))},
+        "prospects": {"total": total_prospects, "generated_at": _prospects_meta().get("generated_at")},
+        "outreach": {"total_sent": total_sent, "campaigns": campaigns},
         "pull_status": PULL_STATUS,
         "buyer_status": BUYER_STATUS,
     }
@@ -2079,30 +2316,26 @@ def lead_funnel():
 # PROSPECT CRM — Contact Management + Timeline
 # ═══════════════════════════════════════════════════════════════════════
 
-TIMELINE_FILE = os.path.join(DATA_DIR, "growth_timeline.json")
-
 # Status flow: new → emailed → follow_up_due → called → responded | bounced | dead
 VALID_STATUSES = ["new", "emailed", "follow_up_due", "called", "responded", "bounced", "dead", "won"]
 
-def _load_timeline() -> dict:
-    """Load timeline events keyed by prospect_id."""
-    data = _load_json(TIMELINE_FILE)
-    return data if isinstance(data, dict) else {}
-
-def _save_timeline(data: dict):
-    _save_json(TIMELINE_FILE, data)
+def _load_timeline(prospect_id: str) -> list:
+    """A prospect's timeline events, newest first."""
+    with _growth_db() as conn:
+        rows = conn.execute(
+            "SELECT type, detail, timestamp, metadata FROM growth_timeline "
+            "WHERE prospect_id=? ORDER BY timestamp DESC, id DESC", (prospect_id,)).fetchall()
+    return [{"type": r["type"], "detail": r["detail"], "timestamp": r["timestamp"],
+             "metadata": json.loads(r["metadata"] or "{}")} for r in rows]
 
 def _add_event(prospect_id: str, event_type: str, detail: str = "", metadata: dict = None):
     """Add a timeline event for a prospect."""
-    timeline = _load_timeline()
-    events = timeline.setdefault(prospect_id, [])
-    events.append({
-        "type": event_type,
-        "detail": detail,
-        "timestamp": datetime.now().isoformat(),
-        "metadata": metadata or {},
-    })
-    _save_timeline(timeline)
+    with _growth_db() as conn:
+        conn.execute(
+            "INSERT INTO growth_timeline (prospect_id, type, detail, timestamp, metadata) "
+            "VALUES (?,?,?,?,?)",
+            (prospect_id, event_type, detail, datetime.now().isoformat(),
+             json.dumps(metadata or {}, default=str)))
 
 
 def _log_email_to_crm(prospect_id: str, email: str, subject: str, body: str, agency: str = ""):
@@ -2154,64 +2387,53 @@ def _log_email_to_crm(prospect_id: str, email: str, subject: str, body: str, age
 
 
 def _update_prospect_status(prospect_id: str, new_status: str):
-    """Update a prospect's outreach_status in the prospects file."""
-    data = _load_json(PROSPECTS_FILE)
-    if not isinstance(data, dict):
-        return
-    for p in data.get("prospects", []):
-        if p.get("id") == prospect_id:
-            old = p.get("outreach_status", "new")
-            p["outreach_status"] = new_status
-            p["status_updated_at"] = datetime.now().isoformat()
-            _save_json(PROSPECTS_FILE, data)
-            _add_event(prospect_id, "status_change", f"{old} → {new_status}")
+    """Update a prospect's outreach_status (one row)."""
+    with _growth_db() as conn:
+        p = _get_prospect(conn, prospect_id)
+        if p is None:
+            log.warning(f"Prospect {prospect_id} not found for status update")
             return
-    log.warning(f"Prospect {prospect_id} not found for status update")
+        old = p.get("outreach_status", "new")
+        p["outreach_status"] = new_status
+        p["status_updated_at"] = datetime.now().isoformat()
+        _put_prospect(conn, prospect_id, p)
+    _add_event(prospect_id, "status_change", f"{old} → {new_status}")
 
 
 def get_prospect(prospect_id: str) -> dict:
     """Get a single prospect with full timeline."""
-    data = _load_json(PROSPECTS_FILE)
-    if not isinstance(data, dict):
-        return {"ok": False, "error": "No prospects data"}
-    for p in data.get("prospects", []):
-        if p.get("id") == prospect_id:
-            timeline = _load_timeline().get(prospect_id, [])
-            # Also pull outreach records
-            outreach = _load_json(OUTREACH_FILE)
-            outreach_records = []
-            if isinstance(outreach, dict):
-                for c in outreach.get("campaigns", []):
-                    for o in c.get("outreach", []):
-                        if o.get("prospect_id") == prospect_id:
-                            outreach_records.append(o)
-            return {
-                "ok": True, "prospect": p,
-                "timeline": sorted(timeline, key=lambda e: e.get("timestamp", ""), reverse=True),
-                "outreach_records": outreach_records,
-            }
-    return {"ok": False, "error": "Prospect not found"}
+    with _growth_db() as conn:
+        p = _get_prospect(conn, prospect_id)
+        if p is None:
+            return {"ok": False, "error": "Prospect not found"}
+        outreach_records = [json.loads(r[0]) for r in conn.execute(
+            "SELECT data_json FROM growth_outreach_entries WHERE prospect_id=? ORDER BY id",
+            (prospect_id,))]
+    return {
+        "ok": True, "prospect": p,
+        "timeline": _load_timeline(prospect_id),
+        "outreach_records": outreach_records,
+    }
 
 
 def update_prospect(prospect_id: str, updates: dict) -> dict:
     """Update prospect fields (name, phone, email, status, notes)."""
-    data = _load_json(PROSPECTS_FILE)
-    if not isinstance(data, dict):
-        return {"ok": False, "error": "No prospects data"}
-    for p in data.get("prospects", []):
-        if p.get("id") == prospect_id:
-            changed = []
-            for key in ["buyer_name", "buyer_phone", "buyer_email", "outreach_status", "notes"]:
-                if key in updates and updates[key] != p.get(key):
-                    old_val = p.get(key, "")
-                    p[key] = updates[key]
-                    changed.append(f"{key}: {old_val} → {updates[key]}")
-            if changed:
-                p["updated_at"] = datetime.now().isoformat()
-                _save_json(PROSPECTS_FILE, data)
-                _add_event(prospect_id, "updated", "; ".join(changed))
-            return {"ok": True, "changed": changed}
-    return {"ok": False, "error": "Prospect not found"}
+    with _growth_db() as conn:
+        p = _get_prospect(conn, prospect_id)
+        if p is None:
+            return {"ok": False, "error": "Prospect not found"}
+        changed = []
+        for key in ["buyer_name", "buyer_phone", "buyer_email", "outreach_status", "notes"]:
+            if key in updates and updates[key] != p.get(key):
+                old_val = p.get(key, "")
+                p[key] = updates[key]
+                changed.append(f"{key}: {old_val} → {updates[key]}")
+        if changed:
+            p["updated_at"] = datetime.now().isoformat()
+            _put_prospect(conn, prospect_id, p)
+    if changed:
+        _add_event(prospect_id, "updated", "; ".join(changed))
+    return {"ok": True, "changed": changed}
 
 
 def add_prospect_note(prospect_id: str, note: str) -> dict:
@@ -2227,15 +2449,10 @@ def mark_responded(prospect_id: str, response_type: str = "email_reply", detail:
     _update_prospect_status(prospect_id, "responded")
     _add_event(prospect_id, "response_received", detail or response_type, {"response_type": response_type})
     # Update outreach records
-    outreach = _load_json(OUTREACH_FILE)
-    if isinstance(outreach, dict):
-        for c in outreach.get("campaigns", []):
-            for o in c.get("outreach", []):
-                if o.get("prospect_id") == prospect_id:
-                    o["response_received"] = True
-                    o["response_at"] = datetime.now().isoformat()
-                    o["response_type"] = response_type
-        _save_json(OUTREACH_FILE, outreach)
+    with _growth_db() as conn:
+        _update_outreach_entries(conn, "prospect_id", prospect_id, {
+            "response_received": True, "response_at": datetime.now().isoformat(),
+            "response_type": response_type})
     return {"ok": True}
 
 
@@ -2286,38 +2503,25 @@ def detect_bounceback(subject: str, body: str, sender: str = "") -> dict:
 
 def process_bounceback(email_address: str, reason: str = "") -> dict:
     """Mark a prospect as bounced and exclude from future outreach."""
-    data = _load_json(PROSPECTS_FILE)
-    if not isinstance(data, dict):
-        return {"ok": False, "error": "No prospects data"}
-
-    found = None
-    for p in data.get("prospects", []):
-        if p.get("buyer_email", "").lower() == email_address.lower():
-            found = p
-            break
-
-    if not found:
-        return {"ok": False, "error": f"No prospect with email {email_address}"}
-
-    found["outreach_status"] = "bounced"
-    found["bounced_at"] = datetime.now().isoformat()
-    found["bounce_reason"] = reason
-    _save_json(PROSPECTS_FILE, data)
-
-    _add_event(found["id"], "email_bounced", reason or f"Bounce: {email_address}")
-
-    # Mark in outreach campaigns too
-    outreach = _load_json(OUTREACH_FILE)
-    if isinstance(outreach, dict):
-        for c in outreach.get("campaigns", []):
-            for o in c.get("outreach", []):
-                if o.get("email", "").lower() == email_address.lower():
-                    o["bounced"] = True
-                    o["bounce_reason"] = reason
-        _save_json(OUTREACH_FILE, outreach)
+    email_lc = (email_address or "").strip().lower()
+    with _growth_db() as conn:
+        row = conn.execute(
+            "SELECT id, data_json FROM growth_prospects WHERE buyer_email=? ORDER BY seq LIMIT 1",
+            (email_lc,)).fetchone()
+        if not row:
+            return {"ok": False, "error": f"No prospect with email {email_address}"}
+        found = json.loads(row["data_json"])
+        found["outreach_status"] = "bounced"
+        found["bounced_at"] = datetime.now().isoformat()
+        found["bounce_reason"] = reason
+        _put_prospect(conn, row["id"], found)
+        # Mark in outreach campaigns too
+        _update_outreach_entries(conn, "email", email_lc, {"bounced": True, "bounce_reason": reason})
+
+    _add_event(row["id"], "email_bounced", reason or f"Bounce: {email_address}")
 
     log.info(f"Bounce processed: {email_address} ({reason})")
-    return {"ok": True, "prospect_id": found["id"], "agency": found.get("agency")}
+    return {"ok": True, "prospect_id": row["id"], "agency": found.get("agency")}
 
 
 def scan_inbox_for_bounces() -> dict:
@@ -2391,26 +2595,22 @@ def _scheduler_loop():
                 log.info(f"Scheduler: {bounce_result['bounces_found']} bounces processed")
 
             # 2. Update statuses for follow-up-due prospects
-            outreach = _load_json(OUTREACH_FILE)
+            with _growth_db() as conn:
+                sent = _live_sent_entries(conn)
             now = datetime.now()
             due_count = 0
-            if isinstance(outreach, dict):
-                for c in outreach.get("campaigns", []):
-                    if c.get("dry_run"):
-                        continue
-                    for o in c.get("outreach", []):
-                        if (o.get("email_sent")
-                            and not o.get("response_received")
-                            and not o.get("voice_called")
-                            and not o.get("bounced")
-                            and o.get("voice_follow_up_date")):
-                            try:
-                                fdate = datetime.fromisoformat(o["voice_follow_up_date"])
-                                if now >= fdate:
-                                    due_count += 1
-                                    _update_prospect_status(o["prospect_id"], "follow_up_due")
-                            except Exception as _e:
-                                log.debug("suppressed: %s", _e)
+            for o in sent:
+                if (not o.get("response_received")
+                    and not o.get("voice_called")
+                    and not o.get("bounced")
+                    and o.get("voice_follow_up_date")):
+                    try:
+                        fdate = datetime.fromisoformat(o["voice_follow_up_date"])
+                        if now >= fdate:
+                            due_count += 1
+                            _update_prospect_status(o["prospect_id"], "follow_up_due")
+                    except Exception as _e:
+                        log.debug("suppressed: %s", _e)
 
             if due_count > 0:
                 log.info(f"Scheduler: {due_count} prospects now due for voice follow-up")
@@ -2443,20 +2643,13 @@ def start_scheduler():
 
 def get_campaign_dashboard() -> dict:
     """Campaign management overview with full metrics."""
-    outreach = _load_json(OUTREACH_FILE)
-    if not isinstance(outreach, dict):
-        return {"ok": True, "campaigns": [], "totals": {}}
-
-    prospects_data = _load_json(PROSPECTS_FILE)
-    prospect_map = {}
-    if isinstance(prospects_data, dict):
-        for p in prospects_data.get("prospects", []):
-            prospect_map[p["id"]] = p
+    outreach = load_outreach_data()
 
     # Per-status counts
-    status_counts = defaultdict(int)
-    for p in prospect_map.values():
-        status_counts[p.get("outreach_status", "new")] += 1
+    with _growth_db() as conn:
+        status_counts = {r[0]: r[1] for r in conn.execute(
+            "SELECT outreach_status, COUNT(*) FROM growth_prospects GROUP BY outreach_status")}
+    total_prospects = sum(status_counts.values())
 
     campaigns = []
     total_sent = 0
@@ -2513,9 +2706,9 @@ def get_campaign_dashboard() -> dict:
             "responded": total_responded,
             "called": total_called,
             "pending_follow_up": total_pending,
-            "total_prospects": len(prospect_map),
+            "total_prospects": total_prospects,
         },
-        "status_breakdown": dict(status_counts),
+        "status_breakdown": status_counts,
     }
 
 
@@ -2654,11 +2847,8 @@ def get_plain_english_brief() -> str:
 
 def get_growth_kpis() -> dict:
     """Compute real-time KPI metrics for the growth dashboard."""
-    prospect_data = _load_json(PROSPECTS_FILE) or []
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
-    outreach = _load_json(OUTREACH_FILE) or []
-    if isinstance(outreach, dict):
-        outreach = outreach.get("campaigns", [])
+    prospects = _load_prospects_list()
+    outreach = load_outreach_data()["campaigns"]
     creds = get_reytech_credentials()
     cohorts = get_follow_up_cohorts()
 
@@ -3206,54 +3396,48 @@ def get_workflow_queue() -> list:
 
 def assign_workflow(prospect_id: str, workflow_id: str = "standard_outreach") -> dict:
     """Assign a workflow sequence to a prospect."""
-    _pdata = _load_json(PROSPECTS_FILE) or {}
-    prospects = _pdata.get("prospects", []) if isinstance(_pdata, dict) else _pdata
-    for p in prospects:
-        if p.get("id") == prospect_id:
-            p["workflow"] = {
-                "workflow_id": workflow_id,
-                "active": True,
-                "current_step": 0,
-                "started_at": datetime.now().isoformat(),
-                "history": [],
-            }
-            if isinstance(_pdata, dict):
-                _pdata["prospects"] = prospects
-            _save_json(PROSPECTS_FILE, _pdata if isinstance(_pdata, dict) else prospects)
-            log_growth_action("workflow_assigned", f"Workflow '{workflow_id}' assigned to {prospect_id}")
-            return {"ok": True, "prospect_id": prospect_id, "workflow_id": workflow_id}
-    return {"ok": False, "error": "Prospect not found"}
+    with _growth_db() as conn:
+        p = _get_prospect(conn, prospect_id)
+        if p is None:
+            return {"ok": False, "error": "Prospect not found"}
+        p["workflow"] = {
+            "workflow_id": workflow_id,
+            "active": True,
+            "current_step": 0,
+            "started_at": datetime.now().isoformat(),
+            "history": [],
+        }
+        _put_prospect(conn, prospect_id, p)
+    log_growth_action("workflow_assigned", f"Workflow '{workflow_id}' assigned to {prospect_id}")
+    return {"ok": True, "prospect_id": prospect_id, "workflow_id": workflow_id}
 
 
 def advance_workflow_step(prospect_id: str, result: str = "completed") -> dict:
     """Advance a prospect to the next workflow step."""
-    _pdata = _load_json(PROSPECTS_FILE) or {}
-    prospects = _pdata.get("prospects", []) if isinstance(_pdata, dict) else _pdata
-    for p in prospects:
-        if p.get("id") == prospect_id:
-            wf = p.get("workflow", {})
-            if not wf.get("active"):
-                return {"ok": False, "error": "No active workflow"}
-            step = wf.get("current_step", 0)
-            wf.setdefault("history", []).append({
-                "step": step,
-                "result": result,
-                "completed_at": datetime.now().isoformat(),
-            })
-            wf["current_step"] = step + 1
+    workflows = get_workflows()
+    with _growth_db() as conn:
+        p = _get_prospect(conn, prospect_id)
+        if p is None:
+            return {"ok": False, "error": "Prospect not found"}
+        wf = p.get("workflow", {})
+        if not wf.get("active"):
+            return {"ok": False, "error": "No active workflow"}
+        step = wf.get("current_step", 0)
+        wf.setdefault("history", []).append({
+            "step": step,
+            "result": result,
+            "completed_at": datetime.now().isoformat(),
+        })
+        wf["current_step"] = step + 1
 
-            workflows = get_workflows()
-            wf_def = workflows.get(wf.get("workflow_id", ""), {})
-            if wf["current_step"] >= len(wf_def.get("steps", [])):
-                wf["active"] = False
-                wf["completed_at"] = datetime.now().isoformat()
+        wf_def = workflows.get(wf.get("workflow_id", ""), {})
+        if wf["current_step"] >= len(wf_def.get("steps", [])):
+            wf["active"] = False
+            wf["completed_at"] = datetime.now().isoformat()
 
-            if isinstance(_pdata, dict):
-                _pdata["prospects"] = prospects
-            _save_json(PROSPECTS_FILE, _pdata if isinstance(_pdata, dict) else prospects)
-            log_growth_action("workflow_step_advanced", f"Step {step+1} completed for {prospect_id}")
-            return {"ok": True, "new_step": wf["current_step"], "active": wf["active"]}
-    return {"ok": False, "error": "Prospect not found"}
+        _put_prospect(conn, prospect_id, p)
+    log_growth_action("workflow_step_advanced", f"Step {step+1} completed for {prospect_id}")
+    return {"ok": True, "new_step": wf["current_step"], "active": wf["active"]}
 
 
 # ── SMS Outreach via Twilio ────────────────────────────────────────
@@ -3528,9 +3712,7 @@ def export_growth_pdf() -> dict:
 
     creds = get_reytech_credentials()
     kpis = get_growth_kpis()
-    prospects = _load_json(PROSPECTS_FILE) or []
-    if isinstance(prospects, dict):
-        prospects = prospects.get("prospects", [])
+    prospects = _load_prospects_list()
 
     filepath = os.path.join(DATA_DIR, "growth_report.pdf")
     doc = SimpleDocTemplate(filepath, pagesize=letter)
@@ -3616,9 +3798,7 @@ def export_growth_excel() -> dict:
 
     creds = get_reytech_credentials()
     kpis = get_growth_kpis()
-    prospects = _load_json(PROSPECTS_FILE) or []
-    if isinstance(prospects, dict):
-        prospects = prospects.get("prospects", [])
+    prospects = _load_prospects_list()
 
     wb = openpyxl.Workbook()
 
@@ -3958,14 +4138,11 @@ def growth_startup_check() -> dict:
     issues = []
     warnings = []
 
-    # Check data files exist
-    required_files = [
-        (PROSPECTS_FILE, "prospects"),
-        (OUTREACH_FILE, "outreach"),
-    ]
-    for fpath, label in required_files:
-        if not os.path.exists(fpath):
-            warnings.append(f"{label} file not found: {fpath} (will be created on first use)")
+    # Check the prospect / outreach tables are reachable
+    try:
+        _load_prospects_list()
+    except Exception as e:
+        issues.append(f"growth prospect store unavailable: {e}")
 
     # Check SCPRS connectivity
     try:
@@ -4015,8 +4192,7 @@ def growth_startup_check() -> dict:
 # -- 1. Prospect Kanban Board --
 def get_kanban_board():
     """Group prospects into Kanban columns for visual pipeline view."""
-    prospect_data = _load_json(PROSPECTS_FILE) or []
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
+    prospects = _load_prospects_list()
     creds = get_reytech_credentials()
     columns = {
         "new": {"label": "New", "color": "#4f8cff", "items": []},
@@ -4049,8 +4225,7 @@ def get_kanban_board():
 # -- 2. Outreach Funnel Analytics --
 def get_outreach_funnel():
     """Conversion funnel: prospects > emailed > responded > won."""
-    prospect_data = _load_json(PROSPECTS_FILE) or []
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
+    prospects = _load_prospects_list()
     total = len(prospects)
     emailed = sum(1 for p in prospects if p.get("status") in ("emailed", "follow_up", "second_follow_up", "responded", "won"))
     responded = sum(1 for p in prospects if p.get("status") in ("responded", "won"))
@@ -4067,8 +4242,7 @@ def get_outreach_funnel():
 # -- 3. Agency Intelligence Map --
 def get_agency_intelligence():
     """Rank agencies by opportunity value and engagement level."""
-    prospect_data = _load_json(PROSPECTS_FILE) or []
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
+    prospects = _load_prospects_list()
     agencies = {}
     for p in prospects:
         agency = p.get("agency") or p.get("institution", "Unknown")
@@ -4105,18 +4279,18 @@ def batch_assign_workflow(prospect_ids, workflow_id="standard_outreach"):
 # -- 5. Prospect Timeline --
 def get_prospect_timeline(prospect_id):
     """Unified activity timeline for a prospect."""
-    timeline = _load_json(os.path.join(DATA_DIR, "growth_timeline.json")) or {}
-    events = list(timeline.get(prospect_id, []))
+    events = _load_timeline(prospect_id)
     audit = _load_json(_AUDIT_FILE) or []
     for entry in audit:
         if prospect_id in entry.get("detail", ""):
             events.append({"type": "audit", "event": entry.get("action", ""), "detail": entry.get("detail", ""), "timestamp": entry.get("timestamp", "")})
-    outreach_data = _load_json(OUTREACH_FILE) or {}
-    campaigns = outreach_data.get("campaigns", []) if isinstance(outreach_data, dict) else []
-    for c in campaigns:
-        for o in c.get("outreach", []):
-            if o.get("prospect_id") == prospect_id:
-                events.append({"type": "outreach", "event": "email_sent" if o.get("email_sent") else "queued", "detail": "Campaign: %s" % c.get("campaign_id", ""), "timestamp": o.get("sent_at", "")})
+    with _growth_db() as conn:
+        entries = conn.execute(
+            "SELECT campaign_id, data_json FROM growth_outreach_entries WHERE prospect_id=?",
+            (prospect_id,)).fetchall()
+    for r in entries:
+        o = json.loads(r["data_json"])
+        events.append({"type": "outreach", "event": "email_sent" if o.get("email_sent") else "queued", "detail": "Campaign: %s" % r["campaign_id"], "timestamp": o.get("sent_at", "")})
     events.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
     return events[:50]
 
@@ -4124,8 +4298,7 @@ def get_prospect_timeline(prospect_id):
 # -- 6. Quick-Win Identifier --
 def get_quick_wins(max_results=10):
     """Surface prospects with highest win probability + recent activity."""
-    prospect_data = _load_json(PROSPECTS_FILE) or []
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
+    prospects = _load_prospects_list()
     creds = get_reytech_credentials()
     scored = []
     for p in prospects:
@@ -4159,8 +4332,7 @@ def get_quick_wins(max_results=10):
 # -- 7. Campaign Performance Dashboard --
 def get_campaign_performance():
     """Per-campaign stats: sent, responded, bounced, conversion rate."""
-    outreach_data = _load_json(OUTREACH_FILE) or {}
-    campaigns = outreach_data.get("campaigns", []) if isinstance(outreach_data, dict) else []
+    campaigns = load_outreach_data()["campaigns"]
     results = []
     for c in campaigns:
         ol = c.get("outreach", [])
@@ -4215,37 +4387,35 @@ def bulk_import_prospects(csv_text):
     import csv as _csv
     import io as _io
     reader = _csv.DictReader(_io.StringIO(csv_text))
-    prospect_data = _load_json(PROSPECTS_FILE) or {}
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
-    existing_emails = {p.get("email", "").lower() for p in prospects if p.get("email")}
+    prospects = []
+    existing_emails = set()
     imported = 0
     skipped = 0
     errors = []
-    for row in reader:
-        try:
-            email = (row.get("email") or "").strip().lower()
-            if email in existing_emails:
-                skipped += 1
-                continue
-            new_p = {
-                "id": "imp_%s_%d" % (datetime.now().strftime("%Y%m%d%H%M%S"), imported),
-                "agency": (row.get("agency") or row.get("institution") or "").strip(),
-                "buyer_name": (row.get("buyer_name") or row.get("name") or row.get("buyer") or "").strip(),
-                "email": email, "phone": (row.get("phone") or "").strip(),
-                "annual_spend": float(row.get("spend") or row.get("annual_spend") or 0),
-                "status": "new", "source": "csv_import",
-                "imported_at": datetime.now().isoformat(), "categories": [], "notes": row.get("notes", ""),
-            }
-            prospects.append(new_p)
-            existing_emails.add(email)
-            imported += 1
-        except Exception as e:
-            errors.append(str(e))
-    if isinstance(prospect_data, dict):
-        prospect_data["prospects"] = prospects
-    else:
-        prospect_data = {"prospects": prospects}
-    _save_json(PROSPECTS_FILE, prospect_data)
+    with _growth_db() as conn:
+        for row in reader:
+            try:
+                email = (row.get("email") or "").strip().lower()
+                if email and (email in existing_emails or conn.execute(
+                        "SELECT 1 FROM growth_prospects WHERE buyer_email=? LIMIT 1",
+                        (email,)).fetchone()):
+                    skipped += 1
+                    continue
+                new_p = {
+                    "id": "imp_%s_%d" % (datetime.now().strftime("%Y%m%d%H%M%S"), imported),
+                    "agency": (row.get("agency") or row.get("institution") or "").strip(),
+                    "buyer_name": (row.get("buyer_name") or row.get("name") or row.get("buyer") or "").strip(),
+                    "email": email, "phone": (row.get("phone") or "").strip(),
+                    "annual_spend": float(row.get("spend") or row.get("annual_spend") or 0),
+                    "status": "new", "source": "csv_import",
+                    "imported_at": datetime.now().isoformat(), "categories": [], "notes": row.get("notes", ""),
+                }
+                prospects.append(new_p)
+                existing_emails.add(email)
+                imported += 1
+            except Exception as e:
+                errors.append(str(e))
+        _append_prospects(conn, prospects)
     log_growth_action("bulk_import", "Imported %d prospects, skipped %d dupes" % (imported, skipped))
     return {"ok": True, "imported": imported, "skipped": skipped, "errors": errors[:5]}
 
@@ -4253,9 +4423,8 @@ def bulk_import_prospects(csv_text):
 # -- 10. Auto-Tagging Engine --
 def auto_tag_prospects():
     """Automatically tag prospects by spend tier, engagement, and category."""
-    prospect_data = _load_json(PROSPECTS_FILE) or {}
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
-    tagged = 0
+    prospects = _load_prospects_list()
+    changed = []
     for p in prospects:
         tags = set(p.get("tags", []))
         spend = float(p.get("annual_spend", 0) or 0)
@@ -4287,10 +4456,11 @@ def auto_tag_prospects():
         new_tags = list(tags)
         if set(new_tags) != set(p.get("tags", [])):
             p["tags"] = new_tags
-            tagged += 1
-    if isinstance(prospect_data, dict):
-        prospect_data["prospects"] = prospects
-    _save_json(PROSPECTS_FILE, prospect_data)
+            changed.append(p)
+    with _growth_db() as conn:
+        for p in changed:
+            _put_prospect(conn, p.get("id"), p)
+    tagged = len(changed)
     log_growth_action("auto_tag", "Tagged %d prospects" % tagged)
     return {"ok": True, "tagged": tagged, "total": len(prospects)}
 
@@ -4327,8 +4497,7 @@ def compare_pricing(item_description):
 # -- 12. Smart Prospect Deduplication --
 def find_duplicate_prospects():
     """Find potential duplicate prospects by email or name+agency."""
-    prospect_data = _load_json(PROSPECTS_FILE) or {}
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
+    prospects = _load_prospects_list()
     email_groups = {}
     for p in prospects:
         email = (p.get("email") or "").strip().lower()
@@ -4354,31 +4523,24 @@ def find_duplicate_prospects():
 
 def merge_prospects(keep_id, remove_ids):
     """Merge duplicate prospects, keeping one and removing others."""
-    prospect_data = _load_json(PROSPECTS_FILE) or {}
-    prospects = prospect_data.get("prospects", []) if isinstance(prospect_data, dict) else prospect_data
-    keep = None
-    for p in prospects:
-        if p.get("id") == keep_id:
-            keep = p
-            break
-    if not keep:
-        return {"ok": False, "error": "Keep prospect not found"}
-    removed = 0
-    for rid in remove_ids:
-        for i, p in enumerate(prospects):
-            if p.get("id") == rid:
-                if p.get("notes"):
-                    keep["notes"] = (keep.get("notes", "") + "\n[Merged] " + p["notes"]).strip()
-                if float(p.get("annual_spend", 0) or 0) > float(keep.get("annual_spend", 0) or 0):
-                    keep["annual_spend"] = p["annual_spend"]
-                existing_tags = set(keep.get("tags", []))
-                existing_tags.update(p.get("tags", []))
-                keep["tags"] = list(existing_tags)
-                prospects.pop(i)
-                removed += 1
-                break
-    if isinstance(prospect_data, dict):
-        prospect_data["prospects"] = prospects
-    _save_json(PROSPECTS_FILE, prospect_data)
+    with _growth_db() as conn:
+        keep = _get_prospect(conn, keep_id)
+        if not keep:
+            return {"ok": False, "error": "Keep prospect not found"}
+        removed = 0
+        for rid in remove_ids:
+            p = _get_prospect(conn, rid) if rid != keep_id else None
+            if p is None:
+                continue
+            if p.get("notes"):
+                keep["notes"] = (keep.get("notes", "") + "\n[Merged] " + p["notes"]).strip()
+            if float(p.get("annual_spend", 0) or 0) > float(keep.get("annual_spend", 0) or 0):
+                keep["annual_spend"] = p["annual_spend"]
+            existing_tags = set(keep.get("tags", []))
+            existing_tags.update(p.get("tags", []))
+            keep["tags"] = list(existing_tags)
+            conn.execute("DELETE FROM growth_prospects WHERE id=?", (rid,))
+            removed += 1
+        _put_prospect(conn, keep_id, keep)
     log_growth_action("merge_prospects", "Merged %d duplicates into %s" % (removed, keep_id))
     return {"ok": True, "kept": keep_id, "removed": removed}
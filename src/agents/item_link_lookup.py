@@ -2237,7 +2237,25 @@ def _stamp_ref_identifier(desc: str, asin: str = "", upc: str = "") -> str:
     return desc
 
 
-def lookup_from_url(url: str) -> dict:
+# ─── Scrape-result cache ──────────────────────────────────────────────────────
+# Successful lookups are cached per URL in the shared research_cache table
+# (namespace "url_scrape") so re-pasting the same link, or enriching the
+# same item from several PCs, doesn't re-scrape / re-spend a Claude call.
+# Supplier prices move daily, so positives live one day. Failed scrapes
+# (bot wall, no title/price) are cached briefly as negatives so a batch
+# enrichment pass doesn't hammer a blocking supplier once per row.
+SCRAPE_CACHE_TTL_DAYS = 1
+SCRAPE_NEGATIVE_TTL_DAYS = 30 / 1440   # 30 minutes
+SCRAPE_CACHE_MAX = 5000
+
+from src.core.research_cache import ResearchCache  # noqa: E402
+
+_SCRAPE_CACHE = ResearchCache("url_scrape", ttl_days=SCRAPE_CACHE_TTL_DAYS,
+                              max_entries=SCRAPE_CACHE_MAX,
+                              negative_ttl_days=SCRAPE_NEGATIVE_TTL_DAYS)
+
+
+def lookup_from_url(url: str, use_cache: bool = True) -> dict:
     """
     Given any supplier product URL, return structured product data.
 
@@ -2257,6 +2275,26 @@ def lookup_from_url(url: str) -> dict:
         error:        str | None,
       }
     """
+    key = (url or "").strip()
+    if use_cache and key:
+        cached = _SCRAPE_CACHE.get(key)
+        if cached is not None:
+            cached["from_cache"] = True
+            return cached
+    result = _lookup_from_url(url)
+    # Login-required and exception results depend on credentials / the
+    # network at this moment — never cache those.
+    if (key and result.get("supplier") and not result.get("login_required")
+            and not _is_login_required(result.get("url") or key)):
+        if result.get("ok"):
+            _SCRAPE_CACHE.put(key, result)
+        elif "exception" not in result:
+            _SCRAPE_CACHE.put(key, result, negative=True)
+    return result
+
+
+def _lookup_from_url(url: str) -> dict:
+    """Uncached body of `lookup_from_url`."""
     url = url.strip()
     if not url:
         return {"error": "No URL provided"}
@@ -2460,4 +2498,5 @@ def lookup_from_url(url: str) -> dict:
 
     except Exception as e:
         log.error("lookup_from_url %s: %s", url[:80], e)
-        return {"ok": False, "error": str(e), "supplier": supplier, "url": url}
+        return {"ok": False, "error": str(e), "supplier": supplier, "url": url,
+                "exception": True}
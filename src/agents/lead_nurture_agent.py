@@ -436,12 +436,8 @@ def get_unified_pipeline() -> dict:
 
     # Also pull growth prospects
     try:
-        with open(os.path.join(DATA_DIR, "growth_prospects.json")) as f:
-            prospects_data = json.load(f)
-            if isinstance(prospects_data, dict):
-                prospects = list(prospects_data.values()) if not isinstance(list(prospects_data.values())[0] if prospects_data else {}, list) else []
-            else:
-                prospects = prospects_data
+        from src.agents.growth_agent import load_prospects_data
+        prospects = load_prospects_data()["prospects"]
     except Exception:
         prospects = []
 
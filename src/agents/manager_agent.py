@@ -196,16 +196,15 @@ def _get_pending_approvals() -> list:
 
     # 6. Growth bounced emails
     try:
-        prospects = _load_json("growth_prospects.json", {})
-        if isinstance(prospects, dict):
-            bounced = [p for p in prospects.get("prospects", []) if p.get("outreach_status") == "bounced"]
-            if bounced:
-                approvals.append({
-                    "type": "growth_bounced", "icon": "⛔",
-                    "title": f"{len(bounced)} prospect email{'s' if len(bounced)!=1 else ''} bounced",
-                    "detail": "Need alternate contacts",
-                    "age": "", "action_url": "/growth", "action_label": "Fix Contacts",
-                })
+        from src.agents.growth_agent import prospect_status_counts
+        bounced = prospect_status_counts().get("bounced", 0)
+        if bounced:
+            approvals.append({
+                "type": "growth_bounced", "icon": "⛔",
+                "title": f"{bounced} prospect email{'s' if bounced!=1 else ''} bounced",
+                "detail": "Need alternate contacts",
+                "age": "", "action_url": "/growth", "action_label": "Fix Contacts",
+            })
     except Exception as _e:
         log.debug("suppressed: %s", _e)
 
@@ -493,11 +492,12 @@ def _get_pipeline_summary() -> dict:
     pipeline_value = sum(q.get("total", 0) for q in live_quotes if q.get("status") in ("pending", "sent"))
 
     # Growth prospects
-    prospects = _load_json("growth_prospects.json", {})
-    p_list = prospects.get("prospects", []) if isinstance(prospects, dict) else []
     growth_stats = defaultdict(int)
-    for p in p_list:
-        growth_stats[p.get("outreach_status", "new")] += 1
+    try:
+        from src.agents.growth_agent import prospect_status_counts
+        growth_stats.update(prospect_status_counts())
+    except Exception as _e:
+        log.debug("suppressed: %s", _e)
 
     # RFQs — live from rfqs.json
     rfq_by_status = defaultdict(int)
@@ -552,7 +552,7 @@ def _get_pipeline_summary() -> dict:
             "approved": sum(1 for e in outbox if e.get("status") == "approved"),
         },
         "growth": {
-            "total_prospects": len(p_list),
+            "total_prospects": sum(growth_stats.values()),
             "by_status": dict(growth_stats),
         },
     }
@@ -732,20 +732,14 @@ def generate_brief() -> dict:
     # Growth campaign status
     growth_campaign = {}
     try:
-        import json, os
-        from src.core.paths import DATA_DIR
-        outreach_path = os.path.join(DATA_DIR, "growth_outreach.json")
-        if os.path.exists(outreach_path):
-            with open(outreach_path) as f:
-                od = json.load(f)
-            if isinstance(od, dict):
-                campaigns = od.get("campaigns", [])
-                distro = [c for c in campaigns if c.get("type") == "distro_list_phase1"]
-                growth_campaign = {
-                    "distro_campaigns": len(distro),
-                    "total_sent": od.get("total_sent", 0),
-                    "last_campaign": distro[-1]["id"] if distro else None,
-                }
+        from src.agents.growth_agent import load_outreach_data
+        od = load_outreach_data()
+        distro = [c for c in od["campaigns"] if c.get("type") == "distro_list_phase1"]
+        growth_campaign = {
+            "distro_campaigns": len(distro),
+            "total_sent": od.get("total_sent", 0),
+            "last_campaign": distro[-1]["id"] if distro else None,
+        }
     except Exception as _e:
         log.debug("suppressed: %s", _e)
 
@@ -11,6 +11,7 @@ Called in a background daemon thread after PC creation (email, upload, split).
 Never overwrites user-entered data.
 """
 
+import collections
 import logging
 import os
 import re
@@ -33,6 +34,64 @@ ENRICHMENT_STATUS = {}
 _LOCK = threading.Lock()
 _MAX_STATUS_AGE_SECS = 3600  # evict completed entries after 1 hour
 
+# Concurrent external lookups per step. Pacing is src.core.throttle's job
+# (per-provider / per-host token buckets); this only bounds threads.
+try:
+    ENRICH_WORKERS = max(1, int(os.environ.get("ENRICH_WORKERS", "4")))
+except ValueError:
+    ENRICH_WORKERS = 4
+_COUNTER_LOCK = threading.Lock()
+_END = object()
+
+
+def _fan_out(jobs, fn, window=None):
+    """Run `fn(job)` for each job on a bounded pool, yielding
+    `(job, result, error)` in job order as results come in.
+
+    At most ENRICH_WORKERS calls are in flight — fewer if `window()`
+    says so. Steps capped on successful lookups pass the number they
+    still need, so the pool never spends calls past the cap. Breaking
+    out of the loop cancels anything not yet started.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from src.core.db import close_thread_db
+
+    def _run(job):
+        try:
+            return fn(job)
+        finally:
+            close_thread_db()
+
+    jobs = iter(jobs)
+    pending = collections.deque()
+    pool = ThreadPoolExecutor(max_workers=ENRICH_WORKERS, thread_name_prefix="enrich")
+    try:
+        while True:
+            cap = ENRICH_WORKERS if window is None else min(ENRICH_WORKERS, window())
+            while len(pending) < cap:
+                job = next(jobs, _END)
+                if job is _END:
+                    break
+                pending.append((job, pool.submit(_run, job)))
+            if not pending:
+                return
+            job, fut = pending.popleft()
+            try:
+                result, error = fut.result(), None
+            except Exception as e:
+                result, error = None, e
+            yield job, result, error
+    finally:
+        for _job, fut in pending:
+            fut.cancel()
+        pool.shutdown(wait=True)
+
+
+def _bump(counters: dict, key: str, n: int = 1):
+    """Counter increment that is safe from _fan_out worker threads."""
+    with _COUNTER_LOCK:
+        counters[key] = counters.get(key, 0) + n
+
 
 def _evict_stale_entries():
     """Remove completed/failed entries older than _MAX_STATUS_AGE_SECS. Call inside _LOCK."""
@@ -325,23 +384,34 @@ def _run_pipeline(pc_id: str, force: bool):
     _UPC_LIMIT = 3  # max lookups per PC
     try:
         from src.agents.product_validator import validate_product
-        for i, it in enumerate(items):
+        from src.core.throttle import acquire
+
+        def _upc_lookup(job):
+            _i, it = job
+            acquire("grok")
+            return validate_product(
+                description=it.get("description", ""),
+                upc=it.get("upc", ""),
+                mfg_number=it.get("mfg_number", ""),
+                qty=it.get("qty", 1),
+                uom=it.get("uom", "EA"),
+                qty_per_uom=it.get("qty_per_uom", 1),
+            )
+
+        _upc_jobs = [
+            (i, it) for i, it in enumerate(items)
+            if it.get("upc", "")
+            # already resolved
+            and not (it["pricing"].get("amazon_asin") and it["pricing"].get("amazon_price"))
+        ]
+        for (i, it), result, _err in _fan_out(_upc_jobs, _upc_lookup,
+                                              window=lambda: _UPC_LIMIT - _upc_lookups):
             if _upc_lookups >= _UPC_LIMIT:
                 break
             _upc = it.get("upc", "")
-            if not _upc:
-                continue
-            if it["pricing"].get("amazon_asin") and it["pricing"].get("amazon_price"):
-                continue  # already resolved
             try:
-                result = validate_product(
-                    description=it.get("description", ""),
-                    upc=_upc,
-                    mfg_number=it.get("mfg_number", ""),
-                    qty=it.get("qty", 1),
-                    uom=it.get("uom", "EA"),
-                    qty_per_uom=it.get("qty_per_uom", 1),
-                )
+                if _err:
+                    raise _err
                 if result.get("ok") and result.get("price", 0) > 0 and result.get("confidence", 0) >= 0.60:
                     _price = result["price"]
                     _asin = result.get("asin", "")
@@ -388,7 +458,6 @@ def _run_pipeline(pc_id: str, force: bool):
                         except Exception as _e:
                             log.debug('suppressed in _run_pipeline: %s', _e)
                     _upc_lookups += 1
-                    time.sleep(0.5)  # rate limit
             except Exception as e:
                 log.debug("ENRICH %s: UPC resolution error for %s: %s", pc_id, _upc, e)
     except ImportError as _e:
@@ -406,31 +475,12 @@ def _run_pipeline(pc_id: str, force: bool):
     try:
         from src.agents.product_catalog import find_by_supplier_sku
         from src.agents.sku_url_resolver import resolve_sku_url
-        for i, it in enumerate(items):
-            if _ssww_lookups >= _SSWW_LIMIT:
-                break
-            _sup_skus = it.get("supplier_skus") or {}
-            _is_ssww = _sup_skus.get("ssww") or _sup_skus.get("ssww_item")
-            # Also detect S&S from item_link, description, or MFG# pattern
-            _link = it.get("item_link", "")
-            _desc = it.get("description", "")
-            _mfg = it.get("mfg_number", "") or it.get("item_number", "") or ""
-            if not _is_ssww and "ssww.com" in _link:
-                _is_ssww = True
-            if not _is_ssww and ("S&S" in _desc or "S & S" in _desc):
-                _is_ssww = True
-            # Auto-detect S&S from MFG# pattern via SKU resolver
-            if not _is_ssww and _mfg:
-                _resolved = resolve_sku_url(_mfg)
-                if _resolved.get("supplier") == "S&S Worldwide":
-                    _is_ssww = True
-                    _sup_skus["ssww"] = _mfg.upper()
-            if not _is_ssww:
-                continue
-            # Skip if already has pricing
-            if it["pricing"].get("unit_cost") and float(it["pricing"].get("unit_cost", 0)) > 0:
-                continue
+        from src.core.throttle import acquire, acquire_host
 
+        # Each S&S item's lookups touch only that item; run them on the
+        # pool and keep the cap on items actually resolved.
+        def _ssww_item(job):
+            i, it, _sup_skus, _desc, _mfg = job
             _ssww_sku = _sup_skus.get("ssww", "") or _mfg
             _priced = False
 
@@ -448,8 +498,7 @@ def _run_pipeline(pc_id: str, force: bool):
                             it["pricing"]["unit_cost"] = it["pricing"]["catalog_cost"]
                             it["pricing"]["price_source"] = "ssww_catalog"
                             _priced = True
-                        counters.setdefault("ssww_catalog_hit", 0)
-                        counters["ssww_catalog_hit"] += 1
+                        _bump(counters, "ssww_catalog_hit")
                 except Exception as _e:
                     log.debug('suppressed in _run_pipeline: %s', _e)
 
@@ -458,6 +507,7 @@ def _run_pipeline(pc_id: str, force: bool):
                 try:
                     _ssww_url = f"https://www.ssww.com/item/{_ssww_sku}/"
                     from src.agents.item_link_lookup import _lookup_ssww
+                    acquire_host(_ssww_url)
                     _ssww_result = _lookup_ssww(_ssww_url)
                     if _ssww_result.get("ok") and _ssww_result.get("price", 0) > 0:
                         _price = _ssww_result["price"]
@@ -481,8 +531,7 @@ def _run_pipeline(pc_id: str, force: bool):
                         if _ssww_result.get("shipping_note"):
                             it["pricing"]["shipping_note"] = _ssww_result["shipping_note"]
                         _priced = True
-                        counters.setdefault("ssww_direct_priced", 0)
-                        counters["ssww_direct_priced"] += 1
+                        _bump(counters, "ssww_direct_priced")
                         log.info("ENRICH %s: S&S %s → $%.2f (list=$%s sale=$%s)",
                                  pc_id, _ssww_sku, _price,
                                  _ssww_result.get("list_price", "?"),
@@ -498,6 +547,7 @@ def _run_pipeline(pc_id: str, force: bool):
             if not _priced and _desc and len(_desc) >= 8:
                 try:
                     from src.agents.product_validator import validate_product as _vp_ssww
+                    acquire("grok")
                     _vr = _vp_ssww(
                         description=_desc[:100],
                         upc=it.get("upc", ""),
@@ -521,16 +571,47 @@ def _run_pipeline(pc_id: str, force: bool):
                         if _ssww_sku:
                             it["pricing"]["ssww_sku"] = _ssww_sku
                             it["pricing"]["source_note"] = f"S&S #{_ssww_sku} → Amazon ref"
-                        counters.setdefault("ssww_amazon_resolved", 0)
-                        counters["ssww_amazon_resolved"] += 1
+                        _bump(counters, "ssww_amazon_resolved")
                         log.info("ENRICH %s: S&S item %d → Grok %s $%.2f",
                                  pc_id, i+1, _amz_asin, _vr_price)
                 except Exception as e:
                     log.debug("ENRICH %s: S&S→Grok error item %d: %s", pc_id, i+1, e)
 
-            if _priced or it.get("item_link"):
+            return bool(_priced or it.get("item_link"))
+
+        _ssww_jobs = []
+        for i, it in enumerate(items):
+            _sup_skus = it.get("supplier_skus") or {}
+            _is_ssww = _sup_skus.get("ssww") or _sup_skus.get("ssww_item")
+            # Also detect S&S from item_link, description, or MFG# pattern
+            _link = it.get("item_link", "")
+            _desc = it.get("description", "")
+            _mfg = it.get("mfg_number", "") or it.get("item_number", "") or ""
+            if not _is_ssww and "ssww.com" in _link:
+                _is_ssww = True
+            if not _is_ssww and ("S&S" in _desc or "S & S" in _desc):
+                _is_ssww = True
+            # Auto-detect S&S from MFG# pattern via SKU resolver
+            if not _is_ssww and _mfg:
+                _resolved = resolve_sku_url(_mfg)
+                if _resolved.get("supplier") == "S&S Worldwide":
+                    _is_ssww = True
+                    _sup_skus["ssww"] = _mfg.upper()
+            if not _is_ssww:
+                continue
+            # Skip if already has pricing
+            if it["pricing"].get("unit_cost") and float(it["pricing"].get("unit_cost", 0)) > 0:
+                continue
+            _ssww_jobs.append((i, it, _sup_skus, _desc, _mfg))
+
+        for _job, _resolved_one, _err in _fan_out(_ssww_jobs, _ssww_item,
+                                                  window=lambda: _SSWW_LIMIT - _ssww_lookups):
+            if _err:
+                log.debug("ENRICH %s: S&S item %d error: %s", pc_id, _job[0] + 1, _err)
+            elif _resolved_one:
                 _ssww_lookups += 1
-                time.sleep(0.5)
+            if _ssww_lookups >= _SSWW_LIMIT:
+                break
     except ImportError as _e:
         log.debug("suppressed: %s", _e)
     except Exception as e:
@@ -679,9 +760,45 @@ def _run_pipeline(pc_id: str, force: bool):
         from src.agents.product_catalog import (
             add_to_catalog, enrich_catalog_product, add_supplier_price, match_item as _cat_match
         )
-        _fp_calls = 0
+        from src.core.throttle import acquire
+
+        def _fp_lookup(job):
+            """Grok call + semantic check for one line (network only —
+            the apply loop below owns every write to the item)."""
+            _i, it, desc, _best_conf, _cat_conf = job
+            p = it.get("pricing", {})
+            # Pass best match info for context (merged from old Step 5c)
+            _bm_title = p.get("catalog_match") or p.get("amazon_title") or ""
+            _bm_price = float(p.get("unit_cost") or p.get("catalog_cost") or p.get("amazon_price") or 0)
+            _bm_source = p.get("price_source") or ("catalog" if _cat_conf else "none")
+            acquire("grok")
+            result = validate_product(
+                description=desc,
+                upc=it.get("upc", ""),
+                mfg_number=it.get("mfg_number", ""),
+                qty=it.get("qty", 1),
+                uom=it.get("uom", "EA"),
+                qty_per_uom=it.get("qty_per_uom", 1),
+                best_match_title=_bm_title,
+                best_match_price=_bm_price,
+                best_match_confidence=_best_conf,
+                best_match_source=_bm_source,
+            )
+            _sem = None
+            _prod_name = result.get("product_name", "")[:200]
+            if (result.get("ok") and result.get("price", 0) > 0
+                    and result.get("confidence", 0) >= 0.70 and _prod_name and desc):
+                try:
+                    from src.agents.item_link_lookup import claude_semantic_match
+                    acquire("claude")
+                    _sem = claude_semantic_match(desc, _prod_name, result["price"])
+                except Exception as _e:
+                    log.debug("suppressed (semantic match): %s", _e)
+            return result, _sem
+
+        _fp_jobs = []
         for i, it in enumerate(items):
-            if _fp_calls >= _LLM_FIRST_LIMIT:
+            if len(_fp_jobs) >= _LLM_FIRST_LIMIT:
                 break
             p = it.get("pricing", {})
             _has_cost = bool(p.get("unit_cost") and float(p.get("unit_cost", 0)) > 0)
@@ -696,23 +813,16 @@ def _run_pipeline(pc_id: str, force: bool):
             desc = it.get("description", "")
             if not desc or len(desc) < 5:
                 continue
+            _fp_jobs.append((i, it, desc, _best_conf, _cat_conf))
+
+        _fp_calls = 0
+        for (i, it, desc, _best_conf, _cat_conf), _fetched, _err in _fan_out(_fp_jobs, _fp_lookup):
+            p = it.get("pricing", {})
+            _has_cost = bool(p.get("unit_cost") and float(p.get("unit_cost", 0)) > 0)
             try:
-                # Pass best match info for context (merged from old Step 5c)
-                _bm_title = p.get("catalog_match") or p.get("amazon_title") or ""
-                _bm_price = float(p.get("unit_cost") or p.get("catalog_cost") or p.get("amazon_price") or 0)
-                _bm_source = p.get("price_source") or ("catalog" if _cat_conf else "none")
-                result = validate_product(
-                    description=desc,
-                    upc=it.get("upc", ""),
-                    mfg_number=it.get("mfg_number", ""),
-                    qty=it.get("qty", 1),
-                    uom=it.get("uom", "EA"),
-                    qty_per_uom=it.get("qty_per_uom", 1),
-                    best_match_title=_bm_title,
-                    best_match_price=_bm_price,
-                    best_match_confidence=_best_conf,
-                    best_match_source=_bm_source,
-                )
+                if _err:
+                    raise _err
+                result, _sem = _fetched
                 _grok_conf = result.get("confidence", 0)
                 if result.get("ok") and result.get("price", 0) > 0 and _grok_conf >= 0.70:
                     _price = result["price"]
@@ -725,30 +835,24 @@ def _run_pipeline(pc_id: str, force: bool):
                     # this gate, Step 4b stamps a URL/cost/manufacturer onto the
                     # wrong line — exactly the cross-contamination shape that
                     # PR #483 closed for one URL surface. Mirror Step 5b's pattern.
+                    # (claude_semantic_match ran in _fp_lookup, off this thread.)
                     _sem_ok = True
-                    if _prod_name and desc:
-                        try:
-                            from src.agents.item_link_lookup import claude_semantic_match
-                            _sem = claude_semantic_match(desc, _prod_name, _price)
-                            if _sem.get("ok") and _sem.get("confidence", 1) < 0.60:
-                                _sem_ok = False
-                                log.info(
-                                    "ENRICH %s: Grok '%s' rejected by semantic match (%.0f%%) for line '%s'",
-                                    pc_id, _prod_name[:40],
-                                    _sem.get("confidence", 0) * 100, desc[:40],
-                                )
-                                p["llm_suggestion"] = _prod_name
-                                p["llm_suggestion_price"] = _price
-                                p["llm_suggestion_url"] = _url
-                                p["llm_suggestion_confidence"] = _sem.get("confidence", 0)
-                                p["_needs_web_search"] = True
-                        except Exception as _e:
-                            log.debug("suppressed (semantic match): %s", _e)
+                    if _sem and _sem.get("ok") and _sem.get("confidence", 1) < 0.60:
+                        _sem_ok = False
+                        log.info(
+                            "ENRICH %s: Grok '%s' rejected by semantic match (%.0f%%) for line '%s'",
+                            pc_id, _prod_name[:40],
+                            _sem.get("confidence", 0) * 100, desc[:40],
+                        )
+                        p["llm_suggestion"] = _prod_name
+                        p["llm_suggestion_price"] = _price
+                        p["llm_suggestion_url"] = _url
+                        p["llm_suggestion_confidence"] = _sem.get("confidence", 0)
+                        p["_needs_web_search"] = True
                     if not _sem_ok:
                         _fp_calls += 1
                         _update_status(pc_id, "llm_first_pass",
                                        f"{_fp_calls}/{_LLM_FIRST_LIMIT} validated")
-                        time.sleep(0.5)
                         continue
                     # Apply to item — but NEVER overwrite operator-typed cost.
                     # Mike P0 2026-05-06: enrichment that fires 3s after URL
@@ -818,7 +922,6 @@ def _run_pipeline(pc_id: str, force: bool):
                     p["_needs_web_search"] = True  # flag for Step 5b
                 _fp_calls += 1
                 _update_status(pc_id, "llm_first_pass", f"{_fp_calls}/{_LLM_FIRST_LIMIT} validated")
-                time.sleep(0.5)
             except Exception as e:
                 log.debug("ENRICH %s: Grok error item %d: %s", pc_id, i+1, e)
     except ImportError:
@@ -832,18 +935,27 @@ def _run_pipeline(pc_id: str, force: bool):
     try:
         from src.agents.item_link_lookup import lookup_from_url
         from src.core.circuit_breaker import get_breaker, CircuitOpenError
+        from src.core.throttle import acquire_host
         _web_breaker = get_breaker("web_search")
         web_count = 0
-        for it in items:
+
+        def _web_lookup(job):
+            _it, url = job
+            acquire_host(url)  # per supplier site — different hosts overlap
+            return _web_breaker.call(lookup_from_url, url)
+
+        _web_jobs = [
+            (it, it.get("item_link", "")) for it in items
+            if (it.get("item_link", "") or "").startswith("http")
+            and not it["pricing"].get("web_price")  # already has web price
+        ]
+        for (it, url), result, _err in _fan_out(_web_jobs, _web_lookup,
+                                                window=lambda: 3 - web_count):
             if web_count >= 3:
-                break  # Rate limit — web lookups are slow
-            url = it.get("item_link", "")
-            if not url or not url.startswith("http"):
-                continue
-            if it["pricing"].get("web_price"):
-                continue  # already has web price
+                break  # Cap — web lookups are slow
             try:
-                result = _web_breaker.call(lookup_from_url, url)
+                if _err:
+                    raise _err
                 if result.get("ok") and result.get("price"):
                     it["pricing"]["web_price"] = result["price"]
                     it["pricing"]["web_source"] = result.get("supplier", "")
@@ -868,7 +980,6 @@ def _run_pipeline(pc_id: str, force: bool):
                         it["pricing"]["amazon_title"] = result.get("title", "")[:200]
                     counters["web_prices_found"] += 1
                     web_count += 1
-                time.sleep(1.0)  # Rate limit between lookups
             except Exception as e:
                 log.debug("ENRICH %s: web lookup error for %s: %s", pc_id, url[:50], e)
     except ImportError:
@@ -884,11 +995,31 @@ def _run_pipeline(pc_id: str, force: bool):
     try:
         from src.agents.web_price_research import search_product_price
         from src.core.circuit_breaker import get_breaker as _gb2, CircuitOpenError as _coe2
+        from src.core.throttle import acquire
         _api_breaker = _gb2("web_search")
         ws_count = 0
+
+        def _ws_lookup(job):
+            it, desc, pn = job
+            acquire("web_search")
+            result = _api_breaker.call(
+                search_product_price,
+                description=desc, part_number=pn,
+                qty=it.get("qty", 1), uom=it.get("uom", "EA"),
+            )
+            _sem = None
+            _found_title = result.get("title", "")
+            if result.get("found") and result.get("price", 0) > 0 and _found_title and desc:
+                try:
+                    from src.agents.item_link_lookup import claude_semantic_match
+                    acquire("claude")
+                    _sem = claude_semantic_match(desc, _found_title, result["price"])
+                except Exception as _e:
+                    log.debug("suppressed: %s", _e)  # Claude unavailable — trust the result
+            return result, _sem
+
+        _ws_jobs = []
         for it in items:
-            if ws_count >= 3:
-                break  # Reduced cap — Grok handles most items now
             # Skip items that already have pricing data
             if it.get("unit_price") and it["unit_price"] > 0:
                 continue
@@ -898,21 +1029,24 @@ def _run_pipeline(pc_id: str, force: bool):
             pn = it.get("mfg_number", "") or it.get("part_number", "")
             if not desc and not pn:
                 continue
+            _ws_jobs.append((it, desc, pn))
+
+        for (it, desc, pn), _fetched, _err in _fan_out(_ws_jobs, _ws_lookup,
+                                                       window=lambda: 3 - ws_count):
+            if ws_count >= 3:
+                break  # Reduced cap — Grok handles most items now
             try:
-                result = _api_breaker.call(
-                    search_product_price,
-                    description=desc, part_number=pn,
-                    qty=it.get("qty", 1), uom=it.get("uom", "EA"),
-                )
+                if _err:
+                    raise _err
+                result, _sem = _fetched
                 if result.get("found") and result.get("price", 0) > 0:
                     _found_title = result.get("title", "")
                     _sem_ok = True  # default: trust the result
 
                     # Semantic validation: is the found product the right one?
-                    if _found_title and desc:
+                    # (claude_semantic_match ran in _ws_lookup, off this thread.)
+                    if _found_title and desc and _sem:
                         try:
-                            from src.agents.item_link_lookup import claude_semantic_match
-                            _sem = claude_semantic_match(desc, _found_title, result["price"])
                             if _sem.get("ok") and _sem.get("confidence", 1) < 0.60:
                                 _sem_ok = False
                                 log.info("ENRICH %s: web search '%s' rejected by semantic match (%.0f%%)",
@@ -944,7 +1078,6 @@ def _run_pipeline(pc_id: str, force: bool):
                         ws_count += 1
                         log.debug("ENRICH %s: web search found %s → $%.2f via %s",
                                   pc_id, desc[:40], result["price"], result.get("source", ""))
-                time.sleep(1.0)  # Rate limit
             except Exception as e:
                 log.debug("ENRICH %s: web search error for '%s': %s", pc_id, desc[:40], e)
     except ImportError:
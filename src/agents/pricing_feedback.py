@@ -18,6 +18,8 @@ import sqlite3
 from datetime import datetime, timedelta
 from typing import Optional
 
+from src.core.rule_engine import KeywordCategorizer
+
 log = logging.getLogger("pricing_feedback")
 
 try:
@@ -791,22 +793,20 @@ def get_win_rate_trends(days: int = 180) -> dict:
 # HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
+_LOSS_CATEGORIES = KeywordCategorizer({
+    "Medical Supplies": ["nitrile", "glove", "syringe", "catheter", "bandage",
+                         "gauze", "wound", "surgical", "gown", "mask", "restraint"],
+    "Janitorial": ["trash", "mop", "disinfect", "cleaner", "soap", "sanitizer"],
+    "Office Supplies": ["pen", "toner", "binder", "staple", "paper", "folder"],
+    "IT & Electronics": ["battery", "cable", "keyboard", "printer", "adapter"],
+    "Safety & PPE": ["safety glass", "hard hat", "vest", "boot"],
+    "Food Service": ["cup", "plate", "napkin", "utensil"],
+}, default="Other", name="loss_categories")
+
+
 def _categorize_item(description: str) -> str:
     """Simple keyword-based categorization for loss patterns."""
-    desc = description.lower()
-    categories = {
-        "Medical Supplies": ["nitrile", "glove", "syringe", "catheter", "bandage",
-                             "gauze", "wound", "surgical", "gown", "mask", "restraint"],
-        "Janitorial": ["trash", "mop", "disinfect", "cleaner", "soap", "sanitizer"],
-        "Office Supplies": ["pen", "toner", "binder", "staple", "paper", "folder"],
-        "IT & Electronics": ["battery", "cable", "keyboard", "printer", "adapter"],
-        "Safety & PPE": ["safety glass", "hard hat", "vest", "boot"],
-        "Food Service": ["cup", "plate", "napkin", "utensil"],
-    }
-    for cat, keywords in categories.items():
-        if any(kw in desc for kw in keywords):
-            return cat
-    return "Other"
+    return _LOSS_CATEGORIES.first(description)
 
 
 def _recommendation_for_class(loss_class: str) -> str:
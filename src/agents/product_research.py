@@ -24,9 +24,11 @@ import time
 import logging
 import hashlib
 import threading
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Optional
 
+from src.core.research_cache import ResearchCache, import_legacy_json
+
 try:
     import requests
     HAS_REQUESTS = True
@@ -68,39 +70,42 @@ _status_lock = threading.Lock()
 
 
 # ─── Cache Layer ─────────────────────────────────────────────────────────────
+# Backed by the shared `research_cache` table (src/core/research_cache.py):
+# per-key reads/writes instead of loading and rewriting the whole JSON file
+# on every lookup. Query lookups and ASIN lookups live in separate
+# namespaces so ASIN entries (stable keys, recycle detection) can't be
+# LRU-evicted by a burst of free-text searches. CACHE_FILE is only read
+# once, to import a pre-SQLite cache.
+
+NEGATIVE_CACHE_TTL_DAYS = 1
+
+_QUERY_CACHE = ResearchCache("grok", ttl_days=CACHE_TTL_DAYS,
+                             max_entries=MAX_CACHE_ENTRIES,
+                             negative_ttl_days=NEGATIVE_CACHE_TTL_DAYS)
+_ASIN_CACHE = ResearchCache("asin", ttl_days=CACHE_TTL_DAYS,
+                            max_entries=MAX_CACHE_ENTRIES,
+                            negative_ttl_days=NEGATIVE_CACHE_TTL_DAYS)
+
 
 def _ensure_data_dir():
     os.makedirs(DATA_DIR, exist_ok=True)
 
 
-def _load_cache() -> dict:
-    _ensure_data_dir()
-    if not os.path.exists(CACHE_FILE):
-        return {}
-    try:
-        with open(CACHE_FILE, "r") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
-        return {}
+def _is_asin_query(query: str) -> bool:
+    return (query or "").lower().startswith("asin:")
 
 
-def _save_cache(cache: dict):
-    _ensure_data_dir()
-    now = datetime.now(timezone.utc)
-    ttl = timedelta(days=CACHE_TTL_DAYS)
-    valid = {}
-    for key, entry in cache.items():
-        try:
-            cached_at = datetime.fromisoformat(entry.get("cached_at", ""))
-            if now - cached_at < ttl:
-                valid[key] = entry
-        except (ValueError, TypeError):
-            continue
-    if len(valid) > MAX_CACHE_ENTRIES:
-        sorted_entries = sorted(valid.items(), key=lambda x: x[1].get("cached_at", ""), reverse=True)
-        valid = dict(sorted_entries[:MAX_CACHE_ENTRIES])
-    with open(CACHE_FILE, "w") as f:
-        json.dump(valid, f, indent=2, default=str)
+def _cache_for(query: str) -> ResearchCache:
+    _import_legacy_cache()
+    return _ASIN_CACHE if _is_asin_query(query) else _QUERY_CACHE
+
+
+def _import_legacy_cache():
+    """Move entries from the old product_research_cache.json (runs once)."""
+    def route(key, entry):
+        cache = _ASIN_CACHE if _is_asin_query(entry.get("query", "")) else _QUERY_CACHE
+        return cache, key, not entry.get("found")
+    import_legacy_json(CACHE_FILE, route)
 
 
 def _cache_key(query: str) -> str:
@@ -110,18 +115,7 @@ def _cache_key(query: str) -> str:
 
 
 def _cache_lookup(query: str) -> Optional[dict]:
-    cache = _load_cache()
-    key = _cache_key(query)
-    entry = cache.get(key)
-    if not entry:
-        return None
-    try:
-        cached_at = datetime.fromisoformat(entry["cached_at"])
-        if datetime.now(timezone.utc) - cached_at > timedelta(days=CACHE_TTL_DAYS):
-            return None
-    except (ValueError, TypeError):
-        return None
-    return entry
+    return _cache_for(query).get(_cache_key(query))
 
 
 _TITLE_TOKEN_RE = re.compile(r"[a-z0-9]+")
@@ -162,15 +156,15 @@ def _cache_store(query: str, result: dict):
     that flag and emits a warning when any PC item references a recycled
     ASIN — operator decides whether to keep the old description or refresh.
     """
-    cache = _load_cache()
+    cache = _cache_for(query)
     key = _cache_key(query)
 
     recycled_suspected = False
     previous_title = ""
-    if key.startswith("asin:") or query.lower().startswith("asin:"):
+    if _is_asin_query(query):
         # ASIN-keyed lookups have stable cache keys (the ASIN itself), so
         # a divergent title between old and new entries is the recycle signal.
-        prior = cache.get(key) or {}
+        prior = cache.peek(key) or {}
         prior_title = (prior.get("title") or "").strip()
         new_title = (result.get("title") or "").strip()
         if prior_title and new_title:
@@ -191,8 +185,7 @@ def _cache_store(query: str, result: dict):
         result["recycled_suspected"] = True
         result["previous_title"] = previous_title
         result["recycled_at"] = result["cached_at"]
-    cache[key] = result
-    _save_cache(cache)
+    cache.put(key, result, negative=not result.get("found", True))
 
 
 def _cache_evict(query: str) -> bool:
@@ -204,20 +197,7 @@ def _cache_evict(query: str) -> bool:
     the next lookup to re-fetch from upstream, which gives `_cache_store`
     a chance to compare new vs. old and set `recycled_suspected`.
     """
-    try:
-        cache = _load_cache()
-    except Exception:
-        return False
-    key = _cache_key(query)
-    if key in cache:
-        del cache[key]
-        try:
-            _save_cache(cache)
-        except Exception as _e:
-            log.warning("cache evict save failed for %s: %s", query, _e)
-            return False
-        return True
-    return False
+    return _cache_for(query).delete(_cache_key(query))
 
 
 def is_asin_cache_recycled(asin: str) -> dict:
@@ -230,11 +210,8 @@ def is_asin_cache_recycled(asin: str) -> dict:
     """
     if not asin:
         return {}
-    try:
-        cache = _load_cache()
-    except Exception:
-        return {}
-    entry = cache.get(_cache_key(f"asin:{asin}")) or {}
+    query = f"asin:{asin}"
+    entry = _cache_for(query).peek(_cache_key(query)) or {}
     if not entry.get("recycled_suspected"):
         return {}
     return {
@@ -676,7 +653,9 @@ def research_product(
         "alternatives": [], "searched": query,
         "note": "No results found. Manual cost entry required.",
     }
-    not_found["cached_at"] = (datetime.now(timezone.utc) - timedelta(days=CACHE_TTL_DAYS - 1)).isoformat()
+    # Cached as a negative entry (NEGATIVE_CACHE_TTL_DAYS) — cache hits
+    # only short-circuit on found=True, but this keeps the miss visible
+    # in the stats and lets a re-search overwrite it.
     _cache_store(query, not_found)
     return not_found
 
@@ -852,19 +831,22 @@ def quick_lookup(query: str) -> dict:
 # ─── Cache Stats ─────────────────────────────────────────────────────────────
 
 def get_research_cache_stats() -> dict:
-    cache = _load_cache()
-    if not cache:
-        return {"total_entries": 0, "found": 0, "not_found": 0, "sources": {}}
-    found = sum(1 for e in cache.values() if e.get("found"))
+    _import_legacy_cache()
+    total = found = 0
     sources = {}
-    for e in cache.values():
-        s = e.get("source", "unknown")
-        sources[s] = sources.get(s, 0) + 1
+    for cache in (_QUERY_CACHE, _ASIN_CACHE):
+        for e in cache.values():
+            total += 1
+            if e.get("found"):
+                found += 1
+            s = e.get("source", "unknown")
+            sources[s] = sources.get(s, 0) + 1
     return {
-        "total_entries": len(cache),
+        "total_entries": total,
         "found": found,
-        "not_found": len(cache) - found,
+        "not_found": total - found,
         "sources": sources,
+        "namespaces": {c.namespace: c.stats() for c in (_QUERY_CACHE, _ASIN_CACHE)},
     }
 
 
@@ -437,6 +437,68 @@ def scan_python_source(filepath: str) -> dict:
     return findings
 
 
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _list_py_files(src_dir: str) -> dict:
+    """{relative path: (absolute path, mtime_ns, size)} for every .py file."""
+    out = {}
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for f in files:
+            if f.endswith(".py"):
+                fp = os.path.join(root, f)
+                try:
+                    st = os.stat(fp)
+                except OSError:
+                    continue
+                out[os.path.relpath(fp, src_dir)] = (fp, st.st_mtime_ns, st.st_size)
+    return out
+
+
+def scan_sources(src_dir: str = None) -> dict:
+    """`scan_python_source` over every .py file under src/, incrementally.
+
+    Results are cached in qa_intelligence.db keyed by (path, mtime, size);
+    only new or modified files are read and rescanned, and rows for
+    deleted files are dropped. Also records each file's line count for
+    `_check_code_metrics`.
+
+    Returns {"files": {rel_path: {"result": ..., "lines": N}},
+             "rescanned": N}, files in sorted path order.
+    """
+    src_dir = src_dir or SRC_DIR
+    on_disk = _list_py_files(src_dir)
+    conn = _qa_db()
+    try:
+        cached = {r["path"]: r for r in conn.execute(
+            "SELECT path, mtime_ns, size, lines, result_json FROM qa_source_scan")}
+        files, fresh = {}, []
+        for rel in sorted(on_disk):
+            fp, mtime_ns, size = on_disk[rel]
+            row = cached.get(rel)
+            if row is not None and row["mtime_ns"] == mtime_ns and row["size"] == size:
+                files[rel] = {"result": json.loads(row["result_json"]), "lines": row["lines"]}
+                continue
+            result = scan_python_source(fp)
+            with open(fp) as fh:
+                lines = sum(1 for _ in fh)
+            files[rel] = {"result": result, "lines": lines}
+            fresh.append((rel, mtime_ns, size, lines, json.dumps(result)))
+        gone = [(p,) for p in cached if p not in on_disk]
+        if fresh or gone:
+            conn.executemany(
+                "INSERT OR REPLACE INTO qa_source_scan "
+                "(path, mtime_ns, size, lines, result_json) VALUES (?,?,?,?,?)", fresh)
+            conn.executemany("DELETE FROM qa_source_scan WHERE path=?", gone)
+            conn.commit()
+    finally:
+        conn.close()
+    if fresh:
+        log.debug("QA source scan: %d of %d files rescanned", len(fresh), len(files))
+    return {"files": files, "rescanned": len(fresh)}
+
+
 def full_scan(app=None) -> dict:
     """Run full QA scan across all pages and source files.
     
@@ -452,22 +514,15 @@ def full_scan(app=None) -> dict:
         "summary": {},
     }
     
-    # ─── Source file scan ─────────────────────────────────────────────
-    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-        os.path.abspath(__file__)))), "src")
-    
-    py_files = []
-    for root, dirs, files in os.walk(src_dir):
-        for f in files:
-            if f.endswith('.py'):
-                py_files.append(os.path.join(root, f))
-    
+    # ─── Source file scan (unchanged files come from the cache) ───────
+    sources = scan_sources()
+    py_files = sources["files"]
+
     total_critical = 0
     total_warning = 0
-    
-    for filepath in sorted(py_files):
-        rel_path = os.path.relpath(filepath, src_dir)
-        result = scan_python_source(filepath)
+
+    for rel_path, entry in py_files.items():
+        result = entry["result"]
         report["source"][rel_path] = result
         total_critical += result["stats"]["critical_count"]
         total_warning += result["stats"]["warning_count"]
@@ -504,6 +559,7 @@ def full_scan(app=None) -> dict:
         "total_critical": total_critical,
         "total_warnings": total_warning,
         "source_files_scanned": len(py_files),
+        "source_files_rescanned": sources["rescanned"],
         "pages_scanned": len(report["pages"]),
         "pass": total_critical == 0,
         "grade": "A" if total_critical == 0 and total_warning < 5 else
@@ -563,6 +619,12 @@ except ImportError:
 # ─────────────────────────────────────────────────────────────────────────────
 QA_REPORT_FILE = os.path.join(DATA_DIR, "qa_reports.json")
 QA_INTERVAL = 1800  # 30 minutes (was 300s/5min — too frequent, heavy operation)
+# Monitor cycles run in a child process so the check suite (imports,
+# file walks, JSON/DB scans) doesn't compete with requests for the web
+# process's GIL. QA_CHILD_NICE lowers its CPU priority; a cycle that
+# exceeds QA_CHILD_TIMEOUT is killed.
+QA_CHILD_NICE = int(os.environ.get("QA_CHILD_NICE", "10"))
+QA_CHILD_TIMEOUT = int(os.environ.get("QA_CHILD_TIMEOUT", "600"))
 
 
 def _check_route_integrity() -> list:
@@ -694,21 +756,15 @@ def _check_env_config() -> list:
 def _check_code_metrics() -> list:
     """Code size and bloat metrics."""
     results = []
-    src_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     total_lines = 0
     total_files = 0
     big_files = []
-    for root, dirs, files in os.walk(src_root):
-        dirs[:] = [d for d in dirs if d not in ("__pycache__",)]
-        for f in files:
-            if f.endswith(".py"):
-                total_files += 1
-                fp = os.path.join(root, f)
-                with open(fp) as fh:
-                    lines = len(fh.readlines())
-                total_lines += lines
-                if lines > 2000:
-                    big_files.append((os.path.relpath(fp, src_root), lines))
+    for fp, entry in scan_sources()["files"].items():
+        total_files += 1
+        lines = entry["lines"]
+        total_lines += lines
+        if lines > 2000:
+            big_files.append((fp, lines))
     results.append({"check": "codebase", "status": "info",
                     "message": f"{total_files} files, {total_lines:,} lines"})
     for fp, lines in sorted(big_files, key=lambda x: -x[1]):
@@ -1569,10 +1625,33 @@ def _check_email_pipeline_traces() -> list:
     return results
 
 
-def run_health_check(checks: list = None) -> dict:
-    """Run full health check suite. Returns report with score and recommendations."""
+# Checks that read this process's memory (the trace ring buffer in
+# src/api/trace.py, the SCPRS scheduler state). A QA child process starts
+# with those empty, so the monitor runs these in the parent and hands the
+# results to the child with `precomputed`.
+_IN_PROCESS_CHECKS = {
+    "trace_health": _check_trace_health,
+    "email_pipeline_traces": _check_email_pipeline_traces,
+    "scprs_scheduler": _check_scprs_scheduler,
+}
+
+
+def _run_check(name: str, func) -> list:
+    try:
+        return func()
+    except Exception as e:
+        return [{"check": name, "status": "fail", "message": str(e)}]
+
+
+def run_health_check(checks: list = None, precomputed: dict = None) -> dict:
+    """Run full health check suite. Returns report with score and recommendations.
+
+    `precomputed` maps check name -> results already collected elsewhere
+    (see _IN_PROCESS_CHECKS); those checks are not re-run.
+    """
     start = time.time()
     all_results = []
+    precomputed = precomputed or {}
 
     check_map = {
         "routes": _check_route_integrity,
@@ -1629,11 +1708,10 @@ def run_health_check(checks: list = None) -> dict:
     }
 
     for name in (checks or list(check_map.keys())):
-        if name in check_map:
-            try:
-                all_results.extend(check_map[name]())
-            except Exception as e:
-                all_results.append({"check": name, "status": "fail", "message": str(e)})
+        if name in precomputed:
+            all_results.extend(precomputed[name])
+        elif name in check_map:
+            all_results.extend(_run_check(name, check_map[name]))
 
     duration = time.time() - start
     total = len(all_results)
@@ -1712,6 +1790,72 @@ def get_health_trend() -> dict:
 
 # ─── Background Monitor ─────────────────────────────────────────────────────
 
+def _qa_child_init():
+    # The child imports route modules (routes check); they must not start
+    # their own background agents — including another QA monitor.
+    os.environ["ENABLE_BACKGROUND_AGENTS"] = "false"
+    try:
+        os.nice(QA_CHILD_NICE)
+    except (OSError, AttributeError) as e:
+        log.debug("QA child: nice unavailable: %s", e)
+
+
+_qa_pool = None
+_qa_pool_lock = threading.Lock()
+
+
+def _qa_child_pool():
+    """The monitor's one-process pool, started on first use and kept.
+    Each task still gets a fresh child (maxtasksperchild=1), forked from
+    the shared forkserver rather than the web process."""
+    global _qa_pool
+    if _qa_pool is None:
+        import atexit
+        from src.core.forkserver import context
+        try:
+            _qa_pool = context().Pool(processes=1, initializer=_qa_child_init,
+                                      maxtasksperchild=1)
+        except (OSError, NotImplementedError) as e:
+            raise RuntimeError(f"QA child process unavailable: {e}") from e
+        atexit.register(_close_qa_pool)
+    return _qa_pool
+
+
+def _close_qa_pool():
+    global _qa_pool
+    with _qa_pool_lock:
+        pool, _qa_pool = _qa_pool, None
+    if pool is not None:
+        pool.terminate()
+        pool.join()
+
+
+def _run_isolated(func, *args, timeout: float = None):
+    """Run `func(*args)` in a fresh low-priority child process and return
+    its result. Raises RuntimeError if no child process can be started,
+    multiprocessing.TimeoutError (after killing the child) on timeout.
+    One call at a time; the pool is replaced after a timeout.
+    """
+    import multiprocessing
+    with _qa_pool_lock:
+        pool = _qa_child_pool()
+        try:
+            return pool.apply_async(func, args).get(timeout or QA_CHILD_TIMEOUT)
+        except multiprocessing.TimeoutError:
+            global _qa_pool
+            _qa_pool = None
+            pool.terminate()
+            pool.join()
+            raise
+
+
+def _run_monitor_checks(checks: list = None, precomputed: dict = None) -> dict:
+    """One monitor cycle's checks + persistence (runs in the child)."""
+    report = run_health_check(checks=checks, precomputed=precomputed)
+    save_qa_run_to_db(report)
+    return report
+
+
 class QAMonitor:
     def __init__(self, interval=QA_INTERVAL):
         self.interval = interval
@@ -1729,6 +1873,26 @@ class QAMonitor:
     def stop(self):
         self._running = False
 
+    def _run_cycle(self, checks):
+        """Run (and persist) one cycle's checks out of process; inline
+        only if a child process can't be started at all. Checks that read
+        this process's memory run here first (_IN_PROCESS_CHECKS).
+        Returns None if the child timed out."""
+        precomputed = {name: _run_check(name, func)
+                       for name, func in _IN_PROCESS_CHECKS.items()
+                       if checks is None or name in checks}
+        import multiprocessing
+        try:
+            return _run_isolated(_run_monitor_checks, checks, precomputed)
+        except multiprocessing.TimeoutError:
+            # Not retried in-process: whatever hung the child would hang us.
+            log.warning("QA Monitor: checks timed out after %ds — child killed, "
+                        "cycle skipped", QA_CHILD_TIMEOUT)
+            return None
+        except RuntimeError as e:
+            log.warning("QA Monitor: %s — running checks in-process", e)
+            return _run_monitor_checks(checks, precomputed)
+
     def _loop(self):
         time.sleep(30)  # Let app boot
         full_check_cycle = 0
@@ -1738,25 +1902,23 @@ class QAMonitor:
                 full_check_cycle += 1
                 if full_check_cycle % 5 == 0:
                     # Full A+ suite every 5th cycle
-                    report = run_health_check()
-                    log.info("QA Full scan: %d/100 %s (%d pass, %d warn, %d fail)",
-                             report["health_score"], report["grade"],
-                             report["summary"].get("passed", 0),
-                             report["summary"].get("warned", 0),
-                             report["summary"].get("failed", 0))
+                    report = self._run_cycle(None)
+                    if report:
+                        log.info("QA Full scan: %d/100 %s (%d pass, %d warn, %d fail)",
+                                 report["health_score"], report["grade"],
+                                 report["summary"].get("passed", 0),
+                                 report["summary"].get("warned", 0),
+                                 report["summary"].get("failed", 0))
                 else:
                     # Fast: structural + critical checks only
-                    report = run_health_check(checks=[
+                    report = self._run_cycle([
                         "routes", "data", "agents", "db_schema",
                         "route_coverage", "data_files",
                         "trace_health", "email_pipeline_traces"
                     ])
 
-                # Always persist to intelligence DB
-                save_qa_run_to_db(report)
-
                 # Alert on score drop or failures
-                if report["health_score"] < 75:
+                if report and report["health_score"] < 75:
                     log.warning("QA ALERT: score=%d — %s",
                                 report["health_score"],
                                 "; ".join(report["recommendations"][:3]))
@@ -2146,6 +2308,13 @@ def _qa_db():
             last_seen    TEXT,
             category     TEXT
         );
+        CREATE TABLE IF NOT EXISTS qa_source_scan (
+            path         TEXT PRIMARY KEY,
+            mtime_ns     INTEGER NOT NULL,
+            size         INTEGER NOT NULL,
+            lines        INTEGER NOT NULL,
+            result_json  TEXT NOT NULL
+        );
         CREATE INDEX IF NOT EXISTS idx_qa_runs_at ON qa_runs(run_at);
         CREATE INDEX IF NOT EXISTS idx_qa_issues_check ON qa_issues(check_name, status);
         CREATE INDEX IF NOT EXISTS idx_qa_issues_hash ON qa_issues(pattern_hash);
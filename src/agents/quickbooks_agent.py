@@ -7,6 +7,9 @@ Connects Reytech's pipeline to QuickBooks Online for:
   2. PO creation — when a quote is won, auto-create a Purchase Order in QB
   3. Invoice sync — track which quotes became invoices
 
+Vendors, customers and invoices are mirrored into SQLite and synced
+incrementally (see "Local Mirror" below); fetch_* / find_* read the mirror.
+
 OAuth2 flow:
   - Uses refresh token (long-lived, set as QB_REFRESH_TOKEN env var)
   - Auto-refreshes access token when expired
@@ -27,8 +30,10 @@ import re
 import time
 import logging
 import base64
+import threading
 from datetime import datetime, timedelta
 from typing import Optional
+from urllib.parse import quote
 
 log = logging.getLogger("quickbooks")
 
@@ -62,8 +67,17 @@ except ImportError:
 # ─── Configuration ───────────────────────────────────────────────────────────
 
 TOKEN_FILE = os.path.join(DATA_DIR, "qb_tokens.json")
-VENDOR_CACHE_FILE = os.path.join(DATA_DIR, "qb_vendors.json")
-VENDOR_CACHE_TTL_HOURS = 24
+
+# Seconds between "anything changed since the cursor?" queries, per mirrored
+# entity (see _sync_entity). force_refresh=True on fetch_* skips the wait.
+QB_SYNC_INTERVALS = {
+    "Vendor": 24 * 3600,
+    "Customer": 4 * 3600,
+    "Invoice": 3600,
+}
+QB_SYNC_RETRY_SECONDS = 300   # after a failed sync, try again this soon
+QB_FULL_SYNC_SECONDS = 7 * 24 * 3600   # re-read everything to catch deletions
+QB_PAGE_SIZE = 1000           # QB's MAXRESULTS ceiling
 
 # Use centralized secrets
 try:
@@ -369,85 +383,295 @@ def _qb_query(query: str) -> list:
     return []
 
 
+# ─── Local Mirror ────────────────────────────────────────────────────────────
+#
+# Vendors, customers and invoices are mirrored into SQLite (qb_vendors,
+# qb_customers, qb_invoices — see db.py) instead of being refetched whole
+# into a JSON file per TTL. A sync asks QB only for rows whose
+# MetaData.LastUpdatedTime is at or past the entity's cursor, paging until a
+# short page comes back, so a quiet interval costs one query per entity and
+# a large company file is no longer cut off at MAXRESULTS 200/500.
+#
+# Paging is keyset on LastUpdatedTime (each page starts at the last row's
+# timestamp) rather than a bare STARTPOSITION walk, so a row edited while a
+# sync is in flight moves to a later page instead of shifting an unseen row
+# off the one being read. STARTPOSITION is only used to step through a full
+# page of rows that share one timestamp (bulk imports).
+#
+# A query can't report deletions; a full pass (force_refresh=True, or once
+# QB_FULL_SYNC_SECONDS have passed since the last one) re-reads everything
+# and drops local rows QB no longer returns.
+#
+# Name-list entities (Vendor, Customer) are implicitly filtered to
+# Active = true unless the query says otherwise, so a deactivation would
+# never reach the mirror — ask for both explicitly.
+_NAME_LIST_ENTITIES = ("Vendor", "Customer")
+
+class _QBSyncError(Exception):
+    """A query page failed — the entity's cursor must not advance."""
+
+
+def _qb_query_pages(entity: str, cursor: str = ""):
+    """Yield pages of raw `entity` rows updated at or after `cursor` (all
+    rows when empty), oldest change first. Raises _QBSyncError on a failed
+    page."""
+    offset = 1
+    active = ["Active IN (true,false)"] if entity in _NAME_LIST_ENTITIES else []
+    while True:
+        conds = active + ([f"MetaData.LastUpdatedTime >= '{cursor}'"] if cursor else [])
+        where = f" WHERE {' AND '.join(conds)}" if conds else ""
+        query = (f"SELECT * FROM {entity}{where} ORDERBY MetaData.LastUpdatedTime"
+                 f" STARTPOSITION {offset} MAXRESULTS {QB_PAGE_SIZE}")
+        result = _qb_request("GET", f"query?query={quote(query)}&minorversion=73")
+        if not result or "Fault" in result:
+            raise _QBSyncError(f"{entity} query failed at {cursor or 'start'}"
+                               f" (position {offset})")
+        page = result.get("QueryResponse", {}).get(entity, [])
+        yield page
+        if len(page) < QB_PAGE_SIZE:
+            return
+        last = page[-1].get("MetaData", {}).get("LastUpdatedTime", "")
+        if not last:
+            raise _QBSyncError(f"{entity} rows carry no LastUpdatedTime")
+        if last == cursor:
+            offset += QB_PAGE_SIZE      # a whole page shares this timestamp
+        else:
+            cursor, offset = last, 1
+
+
+def _updated_at(raw: dict) -> str:
+    return raw.get("MetaData", {}).get("LastUpdatedTime", "")
+
+
+def _vendor_row(v: dict) -> tuple:
+    vendor = {
+        "qb_id": v.get("Id"),
+        "name": v.get("DisplayName", ""),
+        "company": v.get("CompanyName", ""),
+        "email": "",
+        "phone": "",
+        "balance": v.get("Balance", 0),
+        "active": v.get("Active", True),
+        "currency": v.get("CurrencyRef", {}).get("value", "USD"),
+    }
+    # Extract contact info
+    if v.get("PrimaryEmailAddr"):
+        vendor["email"] = v["PrimaryEmailAddr"].get("Address", "")
+    if v.get("PrimaryPhone"):
+        vendor["phone"] = v["PrimaryPhone"].get("FreeFormNumber", "")
+    if v.get("BillAddr"):
+        addr = v["BillAddr"]
+        vendor["address"] = {
+            "line1": addr.get("Line1", ""),
+            "city": addr.get("City", ""),
+            "state": addr.get("CountrySubDivisionCode", ""),
+            "zip": addr.get("PostalCode", ""),
+        }
+    name = vendor["name"] or vendor["company"]
+    return (str(v.get("Id")), name.lower(), vendor["company"].lower(),
+            1 if vendor["active"] else 0, _updated_at(v), json.dumps(vendor))
+
+
+def _customer_row(c: dict) -> tuple:
+    addr = c.get("BillAddr", {})
+    customer = {
+        "id": c.get("Id"),
+        "name": c.get("DisplayName", ""),
+        "company": c.get("CompanyName", ""),
+        "email": c.get("PrimaryEmailAddr", {}).get("Address", "") if c.get("PrimaryEmailAddr") else "",
+        "phone": c.get("PrimaryPhone", {}).get("FreeFormNumber", "") if c.get("PrimaryPhone") else "",
+        "balance": float(c.get("Balance", 0)),
+        "active": c.get("Active", True),
+        "address": addr.get("Line1", ""),
+        "city": addr.get("City", ""),
+        "state": addr.get("CountrySubDivisionCode", ""),
+        "zip": addr.get("PostalCode", ""),
+        "notes": c.get("Notes", ""),
+        "created": c.get("MetaData", {}).get("CreateTime", ""),
+    }
+    return (str(c.get("Id")), customer["name"].lower(), customer["company"].lower(),
+            1 if customer["active"] else 0, _updated_at(c), json.dumps(customer))
+
+
+def _invoice_row(inv: dict) -> tuple:
+    # Parse line items
+    lines = []
+    for line in inv.get("Line", []):
+        if line.get("DetailType") == "SalesItemLineDetail":
+            detail = line.get("SalesItemLineDetail", {})
+            lines.append({
+                "description": line.get("Description", ""),
+                "qty": detail.get("Qty", 0),
+                "unit_price": float(detail.get("UnitPrice", 0)),
+                "amount": float(line.get("Amount", 0)),
+                "item_ref": detail.get("ItemRef", {}).get("name", ""),
+            })
+
+    # "status" is left out: overdue depends on today, see _invoice_status.
+    invoice = {
+        "id": inv.get("Id"),
+        "doc_number": inv.get("DocNumber", ""),
+        "customer_name": inv.get("CustomerRef", {}).get("name", ""),
+        "customer_id": inv.get("CustomerRef", {}).get("value", ""),
+        "txn_date": inv.get("TxnDate", ""),
+        "due_date": inv.get("DueDate", ""),
+        "total": float(inv.get("TotalAmt", 0)),
+        "balance": float(inv.get("Balance", 0)),
+        "email_status": inv.get("EmailStatus", ""),
+        "line_items": lines,
+        "po_number": inv.get("CustomField", [{}])[0].get("StringValue", "") if inv.get("CustomField") else "",
+        "memo": inv.get("CustomerMemo", {}).get("value", "") if inv.get("CustomerMemo") else "",
+    }
+    return (str(inv.get("Id")), invoice["doc_number"], invoice["customer_id"],
+            invoice["txn_date"], invoice["due_date"], invoice["balance"],
+            _updated_at(inv), json.dumps(invoice))
+
+
+_MIRRORS = {
+    "Vendor": ("qb_vendors", ("qb_id", "name_lc", "company_lc", "active",
+                              "updated_at", "data_json"), _vendor_row),
+    "Customer": ("qb_customers", ("qb_id", "name_lc", "company_lc", "active",
+                                  "updated_at", "data_json"), _customer_row),
+    "Invoice": ("qb_invoices", ("qb_id", "doc_number", "customer_id", "txn_date",
+                                "due_date", "balance", "updated_at", "data_json"),
+                _invoice_row),
+}
+
+# Held only for mirror writes; the network paging runs outside it. An
+# entity already being synced by another thread is skipped, not queued.
+_sync_lock = threading.Lock()
+_syncing: set = set()
+
+
+def _store_entities(entity: str, raw_rows: list) -> int:
+    """Upsert raw QB `entity` dicts into the mirror. Returns rows written."""
+    from src.core.db import get_db
+    table, cols, row_fn = _MIRRORS[entity]
+    rows = [row_fn(r) for r in raw_rows if r.get("Id") is not None]
+    if rows:
+        with get_db() as conn:
+            conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(cols)}) "
+                f"VALUES ({', '.join('?' * len(cols))})", rows)
+    return len(rows)
+
+
+def _sync_state(conn, entity: str) -> dict:
+    row = conn.execute(
+        "SELECT cursor, synced_at, full_synced_at, last_changed "
+        "FROM qb_sync_state WHERE entity = ?", (entity,)).fetchone()
+    if not row:
+        return {"cursor": "", "synced_at": 0.0, "full_synced_at": 0.0, "last_changed": 0}
+    return {"cursor": row[0] or "", "synced_at": row[1] or 0.0,
+            "full_synced_at": row[2] or 0.0, "last_changed": row[3] or 0}
+
+
+def _sync_entity(entity: str, force: bool = False) -> int:
+    """Bring the local `entity` mirror up to date if its sync interval has
+    passed (or `force`). Returns the number of rows written; 0 when the
+    sync was skipped or failed — the mirror keeps serving either way."""
+    from src.core.db import get_db
+    if not is_configured():
+        return 0
+    with _sync_lock:
+        with get_db() as conn:
+            state = _sync_state(conn, entity)
+        started = time.time()
+        if entity in _syncing or (
+                not force and started - state["synced_at"] < QB_SYNC_INTERVALS[entity]):
+            return 0
+        _syncing.add(entity)
+
+    try:
+        full = (force or not state["cursor"]
+                or started - state["full_synced_at"] >= QB_FULL_SYNC_SECONDS)
+        cursor = "" if full else state["cursor"]
+        written, seen = 0, set()
+        try:
+            for page in _qb_query_pages(entity, cursor):
+                with _sync_lock:
+                    written += _store_entities(entity, page)
+                seen.update(str(r.get("Id")) for r in page)
+                cursor = max([cursor] + [_updated_at(r) for r in page])
+        except _QBSyncError as e:
+            log.warning("QB %s sync incomplete, keeping cursor %r: %s",
+                        entity, state["cursor"], e)
+            with _sync_lock, get_db() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO qb_sync_state "
+                    "(entity, cursor, synced_at, full_synced_at, last_changed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (entity, state["cursor"],
+                     started - QB_SYNC_INTERVALS[entity] + QB_SYNC_RETRY_SECONDS,
+                     state["full_synced_at"], state["last_changed"]))
+            return 0
+
+        table = _MIRRORS[entity][0]
+        with _sync_lock, get_db() as conn:
+            if full:
+                gone = [(i,) for (i,) in conn.execute(f"SELECT qb_id FROM {table}")
+                        if i not in seen]
+                conn.executemany(f"DELETE FROM {table} WHERE qb_id = ?", gone)
+            conn.execute(
+                "INSERT OR REPLACE INTO qb_sync_state "
+                "(entity, cursor, synced_at, full_synced_at, last_changed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (entity, cursor, started,
+                 started if full else state["full_synced_at"], written))
+    finally:
+        with _sync_lock:
+            _syncing.discard(entity)
+    log.info("QB %s %s sync: %d rows", entity, "full" if full else "incremental", written)
+    return written
+
+
+def _mirror_rows(sql: str, params: tuple = ()) -> list:
+    """data_json dicts for `sql`, which must select data_json first."""
+    from src.core.db import get_db
+    with get_db() as conn:
+        return [json.loads(r[0]) for r in conn.execute(sql, params)]
+
+
+def _mirror_first(sql: str, params: tuple = ()) -> Optional[dict]:
+    from src.core.db import get_db
+    with get_db() as conn:
+        row = conn.execute(sql, params).fetchone()
+    return json.loads(row[0]) if row else None
+
+
 # ─── Vendor Operations ──────────────────────────────────────────────────────
 
 def fetch_vendors(force_refresh: bool = False) -> list:
     """
-    Fetch vendors from QuickBooks.
-    Caches locally for VENDOR_CACHE_TTL_HOURS.
+    Fetch active vendors from the local QuickBooks mirror, syncing changes
+    first when QB_SYNC_INTERVALS["Vendor"] has passed.
 
     Returns list of vendor dicts:
-    [{"id": "...", "name": "...", "email": "...", "phone": "...", 
+    [{"qb_id": "...", "name": "...", "email": "...", "phone": "...",
       "balance": 0, "active": True}]
     """
-    # Check cache
-    if not force_refresh:
-        try:
-            with open(VENDOR_CACHE_FILE) as f:
-                cache = json.load(f)
-            if time.time() - cache.get("fetched_at", 0) < VENDOR_CACHE_TTL_HOURS * 3600:
-                return cache.get("vendors", [])
-        except (FileNotFoundError, json.JSONDecodeError) as _e:
-            log.debug("suppressed: %s", _e)
-
     if not is_configured():
         log.debug("QuickBooks not configured — returning empty vendor list")
         return []
-
-    # Fetch from QB
-    raw = _qb_query("SELECT * FROM Vendor WHERE Active = true MAXRESULTS 500")
-    vendors = []
-    for v in raw:
-        vendor = {
-            "qb_id": v.get("Id"),
-            "name": v.get("DisplayName", ""),
-            "company": v.get("CompanyName", ""),
-            "email": "",
-            "phone": "",
-            "balance": v.get("Balance", 0),
-            "active": v.get("Active", True),
-            "currency": v.get("CurrencyRef", {}).get("value", "USD"),
-        }
-        # Extract contact info
-        if v.get("PrimaryEmailAddr"):
-            vendor["email"] = v["PrimaryEmailAddr"].get("Address", "")
-        if v.get("PrimaryPhone"):
-            vendor["phone"] = v["PrimaryPhone"].get("FreeFormNumber", "")
-        if v.get("BillAddr"):
-            addr = v["BillAddr"]
-            vendor["address"] = {
-                "line1": addr.get("Line1", ""),
-                "city": addr.get("City", ""),
-                "state": addr.get("CountrySubDivisionCode", ""),
-                "zip": addr.get("PostalCode", ""),
-            }
-        vendors.append(vendor)
-
-    # Cache
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(VENDOR_CACHE_FILE, "w") as f:
-        json.dump({"vendors": vendors, "fetched_at": time.time(),
-                    "count": len(vendors)}, f, indent=2)
-
-    log.info("Fetched %d vendors from QuickBooks", len(vendors))
-    return vendors
+    _sync_entity("Vendor", force=force_refresh)
+    return _mirror_rows(
+        "SELECT data_json FROM qb_vendors WHERE active = 1 ORDER BY name_lc")
 
 
 def find_vendor(name: str) -> Optional[dict]:
-    """Find a vendor by name (fuzzy match)."""
-    vendors = fetch_vendors()
+    """Find an active vendor by name — exact (case-insensitive) first, then
+    the first whose name contains, or is contained in, `name`."""
+    if not name or not is_configured():
+        return None
+    _sync_entity("Vendor")
     name_lower = name.lower()
-    # Exact match first
-    for v in vendors:
-        vn = (v.get("name") or v.get("CompanyName") or v.get("DisplayName") or "").lower()
-        if vn == name_lower:
-            return v
-    # Partial match
-    for v in vendors:
-        vn = (v.get("name") or v.get("CompanyName") or v.get("DisplayName") or "").lower()
-        if name_lower in vn or vn in name_lower:
-            return v
-    return None
+    return (_mirror_first(
+                "SELECT data_json FROM qb_vendors WHERE name_lc = ? AND active = 1",
+                (name_lower,))
+            or _mirror_first(
+                "SELECT data_json FROM qb_vendors WHERE active = 1 AND name_lc != '' "
+                "AND (instr(name_lc, ?) > 0 OR instr(?, name_lc) > 0) "
+                "ORDER BY name_lc LIMIT 1", (name_lower, name_lower)))
 
 
 def create_vendor(name: str, email: str = "", phone: str = "") -> Optional[dict]:
@@ -473,9 +697,9 @@ def create_vendor(name: str, email: str = "", phone: str = "") -> Optional[dict]
     if result and "Vendor" in result:
         v = result["Vendor"]
         log.info("Created QB vendor: %s (ID: %s)", name, v.get("Id"))
-        # Clear cache so new vendor shows in dropdowns
+        # Mirror it now so it shows in dropdowns before the next sync
         try:
-            os.remove(VENDOR_CACHE_FILE)
+            _store_entities("Vendor", [v])
         except Exception as _e:
             log.debug("suppressed: %s", _e)
         return {
@@ -602,93 +826,39 @@ def get_vendor_pricing(description: str) -> list:
 
 # ─── Invoice Operations ────────────────────────────────────────────────────
 
-INVOICE_CACHE_FILE = os.path.join(DATA_DIR, "qb_invoices_cache.json")
-CUSTOMER_CACHE_FILE = os.path.join(DATA_DIR, "qb_customers_cache.json")
-
 def fetch_invoices(status: str = "all", days_back: int = 90,
                     force_refresh: bool = False) -> list:
     """
-    Fetch invoices from QuickBooks.
+    Fetch invoices from the local QuickBooks mirror, syncing changes first
+    when QB_SYNC_INTERVALS["Invoice"] has passed.
 
     Args:
         status: "all", "open" (unpaid), "overdue", "paid"
-        days_back: how far back to look
-        force_refresh: bypass cache
+        days_back: how far back to look (by TxnDate)
+        force_refresh: full resync before reading
 
-    Returns list of invoice dicts with line items.
+    Returns list of invoice dicts with line items, newest first.
     """
     if not is_configured():
         return []
-
-    # Cache check
-    if not force_refresh:
-        try:
-            with open(INVOICE_CACHE_FILE) as f:
-                cache = json.load(f)
-            if time.time() - cache.get("fetched_at", 0) < 3600:  # 1hr cache
-                invoices = cache.get("invoices", [])
-                return _filter_invoices(invoices, status)
-        except (FileNotFoundError, json.JSONDecodeError) as _e:
-            log.debug("suppressed: %s", _e)
+    _sync_entity("Invoice", force=force_refresh)
 
     cutoff = (datetime.now() - timedelta(days=days_back)).strftime("%Y-%m-%d")
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", cutoff):
-        log.error("Invalid date format for QB Invoice query: %s", cutoff)
-        return []
-    query = f"SELECT * FROM Invoice WHERE TxnDate >= '{cutoff}' ORDERBY TxnDate DESC MAXRESULTS 200"
-    raw = _qb_query(query)
-
-    invoices = []
-    for inv in raw:
-        due_date = inv.get("DueDate", "")
-        balance = float(inv.get("Balance", 0))
-        total = float(inv.get("TotalAmt", 0))
-
-        # Determine status
-        if balance == 0:
-            inv_status = "paid"
-        elif due_date and due_date < datetime.now().strftime("%Y-%m-%d") and balance > 0:
-            inv_status = "overdue"
-        else:
-            inv_status = "open"
-
-        # Parse line items
-        lines = []
-        for line in inv.get("Line", []):
-            if line.get("DetailType") == "SalesItemLineDetail":
-                detail = line.get("SalesItemLineDetail", {})
-                lines.append({
-                    "description": line.get("Description", ""),
-                    "qty": detail.get("Qty", 0),
-                    "unit_price": float(detail.get("UnitPrice", 0)),
-                    "amount": float(line.get("Amount", 0)),
-                    "item_ref": detail.get("ItemRef", {}).get("name", ""),
-                })
-
-        customer_name = inv.get("CustomerRef", {}).get("name", "")
-        invoices.append({
-            "id": inv.get("Id"),
-            "doc_number": inv.get("DocNumber", ""),
-            "customer_name": customer_name,
-            "customer_id": inv.get("CustomerRef", {}).get("value", ""),
-            "txn_date": inv.get("TxnDate", ""),
-            "due_date": due_date,
-            "total": total,
-            "balance": balance,
-            "status": inv_status,
-            "email_status": inv.get("EmailStatus", ""),
-            "line_items": lines,
-            "po_number": inv.get("CustomField", [{}])[0].get("StringValue", "") if inv.get("CustomField") else "",
-            "memo": inv.get("CustomerMemo", {}).get("value", "") if inv.get("CustomerMemo") else "",
-        })
+    today = datetime.now().strftime("%Y-%m-%d")
+    invoices = _mirror_rows(
+        "SELECT data_json FROM qb_invoices WHERE txn_date >= ? "
+        "ORDER BY txn_date DESC", (cutoff,))
+    for inv in invoices:
+        inv["status"] = _invoice_status(inv["balance"], inv["due_date"], today)
+    return _filter_invoices(invoices, status)
 
-    # Cache
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(INVOICE_CACHE_FILE, "w") as f:
-        json.dump({"invoices": invoices, "fetched_at": time.time(), "count": len(invoices)}, f, indent=2)
 
-    log.info("Fetched %d invoices from QB", len(invoices))
-    return _filter_invoices(invoices, status)
+def _invoice_status(balance: float, due_date: str, today: str) -> str:
+    if balance == 0:
+        return "paid"
+    if due_date and due_date < today and balance > 0:
+        return "overdue"
+    return "open"
 
 
 def _filter_invoices(invoices: list, status: str) -> list:
@@ -865,60 +1035,27 @@ def get_invoice_pdf(invoice_id: str) -> Optional[bytes]:
     return None
 
 def fetch_customers(force_refresh: bool = False) -> list:
-    """Fetch customers from QuickBooks with balances."""
+    """Fetch customers (with balances) from the local QuickBooks mirror,
+    syncing changes first when QB_SYNC_INTERVALS["Customer"] has passed."""
     if not is_configured():
         return []
-
-    if not force_refresh:
-        try:
-            with open(CUSTOMER_CACHE_FILE) as f:
-                cache = json.load(f)
-            if time.time() - cache.get("fetched_at", 0) < 3600 * 4:  # 4hr cache
-                return cache.get("customers", [])
-        except (FileNotFoundError, json.JSONDecodeError) as _e:
-            log.debug("suppressed: %s", _e)
-
-    raw = _qb_query("SELECT * FROM Customer MAXRESULTS 500")
-    customers = []
-    for c in raw:
-        addr = c.get("BillAddr", {})
-        customers.append({
-            "id": c.get("Id"),
-            "name": c.get("DisplayName", ""),
-            "company": c.get("CompanyName", ""),
-            "email": c.get("PrimaryEmailAddr", {}).get("Address", "") if c.get("PrimaryEmailAddr") else "",
-            "phone": c.get("PrimaryPhone", {}).get("FreeFormNumber", "") if c.get("PrimaryPhone") else "",
-            "balance": float(c.get("Balance", 0)),
-            "active": c.get("Active", True),
-            "address": addr.get("Line1", ""),
-            "city": addr.get("City", ""),
-            "state": addr.get("CountrySubDivisionCode", ""),
-            "zip": addr.get("PostalCode", ""),
-            "notes": c.get("Notes", ""),
-            "created": c.get("MetaData", {}).get("CreateTime", ""),
-        })
-
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(CUSTOMER_CACHE_FILE, "w") as f:
-        json.dump({"customers": customers, "fetched_at": time.time(), "count": len(customers)}, f, indent=2)
-
-    log.info("Fetched %d customers from QB", len(customers))
-    return customers
+    _sync_entity("Customer", force=force_refresh)
+    return _mirror_rows("SELECT data_json FROM qb_customers ORDER BY name_lc")
 
 
 def find_customer(name: str) -> Optional[dict]:
-    """Find a customer by name (fuzzy match)."""
-    customers = fetch_customers()
+    """Find a customer by name — exact (case-insensitive) first, then the
+    first whose name or company contains `name`."""
+    if not name or not is_configured():
+        return None
+    _sync_entity("Customer")
     name_lower = name.lower()
-    # Exact match first
-    for c in customers:
-        if c["name"].lower() == name_lower:
-            return c
-    # Partial match
-    for c in customers:
-        if name_lower in c["name"].lower() or name_lower in c.get("company", "").lower():
-            return c
-    return None
+    return (_mirror_first(
+                "SELECT data_json FROM qb_customers WHERE name_lc = ?", (name_lower,))
+            or _mirror_first(
+                "SELECT data_json FROM qb_customers "
+                "WHERE instr(name_lc, ?) > 0 OR instr(company_lc, ?) > 0 "
+                "ORDER BY name_lc LIMIT 1", (name_lower, name_lower)))
 
 
 
@@ -948,9 +1085,8 @@ def create_customer(name: str, email: str = "", phone: str = "",
     if result and "Customer" in result:
         c = result["Customer"]
         log.info("Created QB customer: %s (ID: %s)", name, c.get("Id"))
-        # Clear cache
         try:
-            os.remove(CUSTOMER_CACHE_FILE)
+            _store_entities("Customer", [c])
         except Exception as _e:
             log.debug("suppressed: %s", _e)
         return {
@@ -1075,28 +1211,15 @@ def get_agent_status() -> dict:
         time.time() < tokens.get("expires_at", 0)
     )
 
-    vendor_count = 0
-    try:
-        with open(VENDOR_CACHE_FILE) as f:
-            cache = json.load(f)
-            vendor_count = cache.get("count", 0)
-    except (FileNotFoundError, json.JSONDecodeError) as _e:
-        log.debug("suppressed: %s", _e)
-
-    invoice_count = 0
-    try:
-        with open(INVOICE_CACHE_FILE) as f:
-            cache = json.load(f)
-            invoice_count = cache.get("count", 0)
-    except (FileNotFoundError, json.JSONDecodeError) as _e:
-        log.debug("suppressed: %s", _e)
-
-    customer_count = 0
+    counts, sync = {}, {}
     try:
-        with open(CUSTOMER_CACHE_FILE) as f:
-            cache = json.load(f)
-            customer_count = cache.get("count", 0)
-    except (FileNotFoundError, json.JSONDecodeError) as _e:
+        from src.core.db import get_db
+        with get_db() as conn:
+            for entity, (table, _cols, _fn) in _MIRRORS.items():
+                counts[entity] = conn.execute(
+                    f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                sync[entity] = _sync_state(conn, entity)
+    except Exception as _e:
         log.debug("suppressed: %s", _e)
 
     return {
@@ -1108,9 +1231,10 @@ def get_agent_status() -> dict:
         "token_expires": tokens.get("expires_at"),
         "realm_id_set": bool(_get_realm_id()),
         "realm_id": _get_realm_id()[:4] + "..." if _get_realm_id() else "",
-        "cached_vendors": vendor_count,
-        "cached_invoices": invoice_count,
-        "cached_customers": customer_count,
+        "cached_vendors": counts.get("Vendor", 0),
+        "cached_invoices": counts.get("Invoice", 0),
+        "cached_customers": counts.get("Customer", 0),
+        "sync": sync,
     }
 
 
@@ -71,7 +71,8 @@ except ImportError:
 try:
     from src.agents.growth_agent import (
         categorize_item, CATEGORY_KEYWORDS, _load_json, _save_json,
-        PROSPECTS_FILE, OUTREACH_FILE, HISTORY_FILE,
+        load_prospects_data, load_outreach_data, add_prospects, prospect_emails,
+        HISTORY_FILE,
     )
     HAS_GROWTH = True
 except ImportError:
@@ -634,7 +635,7 @@ def update_revenue_tracker() -> dict:
         pipeline = 0
 
     # Growth prospects pipeline
-    prospects_data = _load_json(PROSPECTS_FILE) if HAS_GROWTH else {}
+    prospects_data = load_prospects_data() if HAS_GROWTH else {}
     growth_pipeline = 0
     if isinstance(prospects_data, dict):
         for p in prospects_data.get("prospects", []):
@@ -1009,17 +1010,13 @@ def get_priority_queue(limit=25) -> dict:
     # Load existing growth prospects to avoid duplicates
     contacted = set()
     if HAS_GROWTH:
-        prospects = _load_json(PROSPECTS_FILE)
-        if isinstance(prospects, dict):
-            for p in prospects.get("prospects", []):
-                if p.get("buyer_email"):
-                    contacted.add(p["buyer_email"].lower())
-        outreach = _load_json(OUTREACH_FILE)
-        if isinstance(outreach, dict):
-            for c in outreach.get("campaigns", []):
-                for o in c.get("outreach", []):
-                    if o.get("email"):
-                        contacted.add(o["email"].lower())
+        for p in load_prospects_data()["prospects"]:
+            if p.get("buyer_email"):
+                contacted.add(p["buyer_email"].lower())
+        for c in load_outreach_data()["campaigns"]:
+            for o in c.get("outreach", []):
+                if o.get("email"):
+                    contacted.add(o["email"].lower())
 
     queue = []
     for b in buyers_data.get("buyers", []):
@@ -1066,25 +1063,18 @@ def push_to_growth_prospects(buyer_ids: list = None, top_n: int = 50) -> dict:
     if not HAS_GROWTH:
         return {"ok": False, "error": "Growth agent not available"}
 
-    from src.agents.growth_agent import _save_json as save_prospects
-
     buyers_data = _load_json(BUYERS_FILE)
     if not isinstance(buyers_data, dict):
         return {"ok": False, "error": "No buyer data"}
 
-    # Load existing prospects
-    prospects_data = _load_json(PROSPECTS_FILE)
-    if not isinstance(prospects_data, dict):
-        prospects_data = {"prospects": [], "generated_at": datetime.now().isoformat(), "total_prospects": 0}
-    existing_emails = {p.get("buyer_email", "").lower() for p in prospects_data.get("prospects", [])}
-
-    added = 0
+    existing_emails = prospect_emails()
+    new_prospects = []
     buyers = buyers_data.get("buyers", [])
 
     for b in buyers:
         if buyer_ids and b.get("id") not in buyer_ids:
             continue
-        if not buyer_ids and added >= top_n:
+        if not buyer_ids and len(new_prospects) >= top_n:
             break
 
         email = (b.get("email") or "").lower()
@@ -1106,14 +1096,13 @@ def push_to_growth_prospects(buyer_ids: list = None, top_n: int = 50) -> dict:
             "source": "sales_intel",
             "opportunity_score": b.get("opportunity_score", 0),
         }
-        prospects_data["prospects"].append(prospect)
+        new_prospects.append(prospect)
         existing_emails.add(email)
-        added += 1
 
-    prospects_data["total_prospects"] = len(prospects_data["prospects"])
-    save_prospects(PROSPECTS_FILE, prospects_data)
+    added = add_prospects(new_prospects)
 
-    return {"ok": True, "added": added, "total_prospects": prospects_data["total_prospects"]}
+    return {"ok": True, "added": added,
+            "total_prospects": load_prospects_data()["total_prospects"]}
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -635,6 +635,8 @@ def _store_results(batch, seen_pos):
 
     log.info("Stored: %d POs, %d lines -> DB | %d -> Won Quotes | %d -> Catalog",
              stored_pos, stored_lines, won_quotes, catalog_items)
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("scprs_po_master", "scprs_po_lines", "won_quotes")
 
     # Refresh buyer profiles after storing new data
     try:
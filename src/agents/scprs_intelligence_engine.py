@@ -366,6 +366,8 @@ def pull_agency(agency_key: str, search_terms: list = None,
     """, (now, f"FULL:{agency_key}", agency_key, total_lines, total_lines, total_pos, duration))
     conn.commit()
     conn.close()
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("scprs_po_master", "scprs_po_lines")
 
     result = {
         "ok": True, "agency": agency_key,
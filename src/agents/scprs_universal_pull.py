@@ -505,6 +505,8 @@ def run_universal_pull(priority: str = "P0") -> dict:
     close_result = check_quotes_against_scprs()
 
     conn.close()
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("scprs_po_master", "scprs_po_lines")
 
     result = {
         "ok": True,
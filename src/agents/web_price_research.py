@@ -21,9 +21,11 @@ import re
 import time
 import logging
 import hashlib
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import Optional, List, Dict
 
+from src.core.research_cache import ResearchCache, import_legacy_json
+
 log = logging.getLogger("web_price")
 
 try:
@@ -91,30 +93,22 @@ def _get_api_key() -> str:
 
 # ── Cache ────────────────────────────────────────────────────────────────────
 
-def _load_cache() -> dict:
-    try:
-        if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE) as f:
-                return json.load(f)
-    except Exception as _e:
-        log.debug("suppressed: %s", _e)
-    return {}
-
-def _save_cache(cache: dict):
-    try:
-        os.makedirs(DATA_DIR, exist_ok=True)
-        # Evict expired + trim
-        now = datetime.now(timezone.utc).isoformat()
-        cutoff = (datetime.now(timezone.utc) - timedelta(days=CACHE_TTL_DAYS)).isoformat()
-        cache = {k: v for k, v in cache.items()
-                 if v.get("cached_at", "") > cutoff}
-        if len(cache) > MAX_CACHE:
-            items = sorted(cache.items(), key=lambda x: x[1].get("cached_at",""))
-            cache = dict(items[-MAX_CACHE:])
-        with open(CACHE_FILE, "w") as f:
-            json.dump(cache, f, indent=1)
-    except Exception as e:
-        log.debug("Cache save error: %s", e)
+# One row per (description, part_number) in the shared research_cache
+# table — see src/core/research_cache.py. Not-found answers are cached for
+# NEGATIVE_CACHE_TTL_DAYS so the same dead description doesn't burn a
+# web_search call on every enrichment pass; API errors are never cached.
+
+NEGATIVE_CACHE_TTL_DAYS = 1
+
+_CACHE = ResearchCache("web_price", ttl_days=CACHE_TTL_DAYS,
+                       max_entries=MAX_CACHE,
+                       negative_ttl_days=NEGATIVE_CACHE_TTL_DAYS)
+
+
+def _get_cache() -> ResearchCache:
+    """The web_price namespace, after a one-time import of CACHE_FILE."""
+    import_legacy_json(CACHE_FILE, lambda key, entry: (_CACHE, key, False))
+    return _CACHE
 
 def _cache_key(description: str, part_number: str = "") -> str:
     raw = f"{description.lower().strip()}|{part_number.lower().strip()}"
@@ -153,9 +147,9 @@ def search_product_price(
     
     # Check cache first
     ck = _cache_key(description, part_number)
-    cache = _load_cache()
-    if ck in cache:
-        cached = cache[ck]
+    cache = _get_cache()
+    cached = cache.get(ck)
+    if cached is not None:
         cached["cached"] = True
         return cached
     
@@ -292,13 +286,13 @@ We need the price per 1 {uom} (matching the buyer's unit of measure).
         # Parse JSON from response
         result = _parse_price_response(full_text, description)
         
-        # Cache if found
-        if result.get("found"):
-            result["cached"] = False
-            result["cached_at"] = datetime.now(timezone.utc).isoformat()
-            result["query"] = search_query[:80]
-            cache[ck] = result
-            _save_cache(cache)
+        # Cache the answer — found for CACHE_TTL_DAYS, not-found as a
+        # short-lived negative. HTTP/API failures returned above and are
+        # never cached, so the next call retries them.
+        result["cached"] = False
+        result["cached_at"] = datetime.now(timezone.utc).isoformat()
+        result["query"] = search_query[:80]
+        cache.put(ck, result, negative=not result.get("found"))
         
         return result
         
@@ -607,15 +601,15 @@ def web_search_for_pc(pc_id: str) -> dict:
 
 def get_status() -> dict:
     """Return status for diagnostics page."""
-    cache = _load_cache()
+    cache_stats = _get_cache().stats()
     api_key = _get_api_key()
     return {
         "available": bool(api_key) and HAS_REQUESTS,
         "api_key_set": bool(api_key),
         "api_key_source": "AGENT_PRICING_KEY" if os.environ.get("AGENT_PRICING_KEY") else (
             "ANTHROPIC_API_KEY" if os.environ.get("ANTHROPIC_API_KEY") else "none"),
-        "cache_entries": len(cache),
-        "cache_file": CACHE_FILE,
+        "cache_entries": cache_stats["entries"],
+        "cache": cache_stats,
         "requests_available": HAS_REQUESTS,
         "model": "claude-haiku-4-5-20251001",
         "cost_per_search": "~$0.001-0.003",
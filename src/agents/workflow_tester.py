@@ -584,13 +584,13 @@ def test_growth_data_integrity() -> list:
     results = []
     try:
         from src.agents.growth_agent import (
-            _load_json, PROSPECTS_FILE, OUTREACH_FILE, CATEGORIES_FILE,
+            _load_json, load_prospects_data, load_outreach_data, CATEGORIES_FILE,
             HISTORY_FILE, get_growth_status,
         )
 
         status = get_growth_status()
-        prospects_data = _load_json(PROSPECTS_FILE)
-        outreach_data = _load_json(OUTREACH_FILE)
+        prospects_data = load_prospects_data()
+        outreach_data = load_outreach_data()
 
         # ── Test 1: Prospect data integrity ──
         if isinstance(prospects_data, dict) and prospects_data.get("prospects"):
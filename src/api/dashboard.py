@@ -939,15 +939,6 @@ def log_email_sent_db(direction: str, sender: str, recipient: str, subject: str,
     return 0
 
 
-# ═══════════════════════════════════════════════════════════════════════
-# Price Check JSON helpers
-# ═══════════════════════════════════════════════════════════════════════ (defined here to avoid import from routes_rfq
-# which can't be imported directly because bp isn't defined at import time)
-# ═══════════════════════════════════════════════════════════════════════
-
-_pc_cache = None
-_pc_cache_time = 0
-
 # ═══════════════════════════════════════════════════════════════════════
 # Email Polling Thread
 # ═══════════════════════════════════════════════════════════════════════
@@ -5991,6 +5982,36 @@ from src.api.config import (INTEL_AVAILABLE, PREDICT_AVAILABLE, QB_AVAILABLE, GR
     LEADGEN_AVAILABLE, ITEM_ID_AVAILABLE, REPLY_ANALYZER_AVAILABLE, QA_AVAILABLE,
     MANAGER_AVAILABLE, CATALOG_AVAILABLE, _WF_AVAILABLE)
 
+# Per-module load profile (wall ms, symbols exported, modules newly pulled
+# into sys.modules). Read by route_load_profile() → /api/health and
+# scripts/profile_route_imports.py.
+_ROUTE_LOAD_STATS = []
+
+# How dashboard globals reach route modules:
+#   copy      — (default) copy every dashboard global into each module's
+#               __dict__ before exec, copy new symbols back after.
+#   namespace — one shared namespace, installed as each module's
+#               __builtins__; modules resolve bp/auth_required/... through
+#               it and only their *new* symbols are published back, so the
+#               per-module cost no longer grows with the global count.
+#               Injected names are not attributes of the route module in
+#               this mode (monkeypatch.setattr(routes_x, "bp", ...) fails),
+#               hence opt-in.
+_ROUTE_INJECT_MODE = os.environ.get("ROUTE_MODULE_INJECT", "copy").strip().lower()
+_route_namespace = None
+
+
+def _route_shared_namespace() -> dict:
+    global _route_namespace
+    if _route_namespace is None:
+        import builtins as _builtins
+        _route_namespace = dict(_builtins.__dict__)
+        _route_namespace.update((k, v) for k, v in globals().items()
+                                if not k.startswith('_load_route_module')
+                                and not k.startswith('__'))
+    return _route_namespace
+
+
 def _load_route_module(module_name: str):
     """
     Load a route module using importlib (not exec).
@@ -5998,32 +6019,59 @@ def _load_route_module(module_name: str):
     Route registrations (@bp.route) happen during exec_module.
     """
     import importlib.util
+    import sys as _sys
+    _t0 = _time.perf_counter()
+    _mods_before = set(_sys.modules)
     module_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules", f"{module_name}.py")
     spec = importlib.util.spec_from_file_location(
         f"src.api.modules.{module_name}", module_path)
     mod = importlib.util.module_from_spec(spec)
-    # Inject shared dashboard globals into module (preserves existing behavior)
-    _shared = {k: v for k, v in globals().items()
-               if not k.startswith('_load_route_module')}
-    # Save module identity before injection (Python 3.12+ checks name match)
-    _saved_name = mod.__name__
-    _saved_spec = mod.__spec__
-    _saved_file = getattr(mod, '__file__', None)
-    mod.__dict__.update(_shared)
-    # Restore identity so loader can find the right module
-    mod.__name__ = _saved_name
-    mod.__spec__ = _saved_spec
-    if _saved_file:
-        mod.__file__ = _saved_file
-    import sys as _sys
+    if _ROUTE_INJECT_MODE == "namespace":
+        _shared = _route_shared_namespace()
+        mod.__dict__["__builtins__"] = _shared
+    else:
+        # Inject shared dashboard globals into module (preserves existing behavior)
+        _shared = {k: v for k, v in globals().items()
+                   if not k.startswith('_load_route_module')}
+        # Save module identity before injection (Python 3.12+ checks name match)
+        _saved_name = mod.__name__
+        _saved_spec = mod.__spec__
+        _saved_file = getattr(mod, '__file__', None)
+        mod.__dict__.update(_shared)
+        # Restore identity so loader can find the right module
+        mod.__name__ = _saved_name
+        mod.__spec__ = _saved_spec
+        if _saved_file:
+            mod.__file__ = _saved_file
     spec.loader.exec_module(mod)
     _sys.modules[spec.name] = mod  # Cache AFTER exec so regular imports don't re-execute and double-register routes
     # Copy new definitions back so later modules can reference them
-    for k, v in mod.__dict__.items():
-        if not k.startswith('__') and k not in _shared:
-            globals()[k] = v
-    log.debug("Route module loaded: %s (%d new symbols)", module_name,
-              sum(1 for k in mod.__dict__ if not k.startswith('__') and k not in _shared))
+    _new = {k: v for k, v in mod.__dict__.items()
+            if not k.startswith('__') and k not in _shared}
+    globals().update(_new)
+    if _ROUTE_INJECT_MODE == "namespace":
+        _shared.update(_new)
+    _pulled = sorted(m for m in set(_sys.modules) - _mods_before if m != spec.name)
+    _ROUTE_LOAD_STATS.append({
+        "module": module_name,
+        "ms": round((_time.perf_counter() - _t0) * 1000, 1),
+        "new_symbols": len(_new),
+        "new_imports": len(_pulled),
+        "packages": sorted({m.split(".")[0] for m in _pulled}),
+    })
+    log.debug("Route module loaded: %s (%d new symbols, %d new imports)",
+              module_name, len(_new), len(_pulled))
+
+
+def route_load_profile(top: int = 0) -> dict:
+    """Route-module boot cost for this worker, slowest first."""
+    mods = sorted(_ROUTE_LOAD_STATS, key=lambda r: r["ms"], reverse=True)
+    return {
+        "mode": _ROUTE_INJECT_MODE,
+        "loaded": len(_ROUTE_LOAD_STATS),
+        "total_ms": round(sum(r["ms"] for r in _ROUTE_LOAD_STATS), 1),
+        "modules": mods[:top] if top else mods,
+    }
 
 
 _ROUTE_MODULES = [
@@ -6083,6 +6131,7 @@ _ROUTE_MODULES = [
     "routes_admin_drive_replay",   # 2026-05-25: backfill Drive forms-archive from Gmail SENT
     "routes_telegram",             # 2026-05-25: Telegram webhook + [✓ Got it] ack/24h auto-delete
     "routes_notifications",        # 2026-05-26 PR-C: grouped /notifications view + /api/notifications/grouped
+    "routes_live",                 # One SSE stream per browser session: bell, deadlines, quoting pulse
 ]
 
 for _mod in _ROUTE_MODULES:
@@ -6092,7 +6141,9 @@ for _mod in _ROUTE_MODULES:
         log.error(f"Failed to load route module {_mod}: {_e}")
         import traceback; traceback.print_exc()
 
-log.info(f"Dashboard: {len(_ROUTE_MODULES)} route modules loaded, {len([r for r in bp.deferred_functions])} deferred fns")
+log.info(f"Dashboard: {len(_ROUTE_MODULES)} route modules loaded in "
+         f"{route_load_profile()['total_ms']:.0f}ms ({_ROUTE_INJECT_MODE} inject), "
+         f"{len([r for r in bp.deferred_functions])} deferred fns")
 
 
 def _audit_route_module_registration():
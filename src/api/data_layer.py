@@ -28,6 +28,7 @@ log = logging.getLogger("reytech.data_layer")
 
 # ── Path constants (from config.py — no dashboard dependency) ────────────────
 from src.api.config import DATA_DIR, UPLOAD_DIR, OUTPUT_DIR, BASE_DIR
+from src.core.flight_cache import FlightCache
 
 # ── Thread locks (owned by this module, shared with dashboard) ───────────────
 _json_cache_lock = threading.Lock()
@@ -171,9 +172,14 @@ def _get_dashboard_fn(name):
 # DATA ACCESS — Real implementations (migrated from dashboard.py)
 # ═══════════════════════════════════════════════════════════════════════════════
 
-# ── PC cache (module-level globals) ──
-_pc_cache = None
-_pc_cache_time = 0
+# ── PC cache ──
+# Single-flight: when it goes cold, one thread rebuilds and concurrent
+# callers share the result. Memory only — decoding a persisted blob of
+# every PC costs about as much as _build_price_checks() and would add a
+# multi-MB write to reytech.db on each rebuild. Over 500 PCs the load is
+# returned but not held.
+_pc_cache = FlightCache("price_checks", ttl=30,
+                        cacheable=lambda d: len(d) < 500)
 
 
 def _normalize_rfq_fields(rfqs: dict) -> dict:
@@ -236,6 +242,41 @@ def migrate_legacy_rfqs_json_if_present():
         return {}
 
 
+def _decode_row(d, column_wins):
+    """Turn one `rfqs` / `price_checks` row dict into the record dict.
+
+    The `data_json` blob is the full record; the listed columns are
+    written independently (status flips, quote numbers) and win when set.
+    Rows without a usable blob fall back to the columns with `items`
+    JSON-decoded. `d` is consumed (its `data_json` key is popped).
+    """
+    blob = d.pop("data_json", None)
+    if blob:
+        try:
+            full = json.loads(blob)
+            for key in column_wins:
+                if d.get(key) and d[key] != full.get(key):
+                    full[key] = d[key]
+            return full
+        except (json.JSONDecodeError, TypeError) as _e:
+            log.debug("suppressed: %s", _e)
+    items_raw = d.get("items", "[]")
+    if isinstance(items_raw, str):
+        try:
+            d["items"] = json.loads(items_raw)
+        except Exception:
+            d["items"] = []
+    return d
+
+
+def _decode_rfq_row(d):
+    return _decode_row(d, ("status", "updated_at", "reytech_quote_number"))
+
+
+def _decode_pc_row(d):
+    return _decode_row(d, ("status", "quote_number"))
+
+
 def load_rfqs():
     """Load RFQs from SQLite (single source of truth).
 
@@ -266,30 +307,23 @@ def load_rfqs():
                 rid = d.get("id", "")
                 if not rid:
                     continue
-                blob = d.pop("data_json", None)
-                if blob:
-                    try:
-                        full = json.loads(blob)
-                        for key in ("status", "updated_at", "reytech_quote_number"):
-                            if d.get(key) and d[key] != full.get(key):
-                                full[key] = d[key]
-                        result[rid] = full
-                        continue
-                    except (json.JSONDecodeError, TypeError) as _e:
-                        log.debug("suppressed: %s", _e)
-                items_raw = d.get("items", "[]")
-                if isinstance(items_raw, str):
-                    try:
-                        d["items"] = json.loads(items_raw)
-                    except Exception:
-                        d["items"] = []
-                result[rid] = d
+                result[rid] = _decode_rfq_row(d)
             return _normalize_rfq_fields(result)
     except Exception as e:
         log.warning("load_rfqs failed: %s", str(e)[:200])
     return _normalize_rfq_fields({})
 
 
+def _sync_deadline_index():
+    """Re-index the deadlines a committed PC / RFQ write touched, so
+    /api/deadlines reads stay current without syncing on the GET."""
+    try:
+        from src.core import deadline_index
+        deadline_index.on_write()
+    except Exception as _e:
+        log.debug("deadline index sync suppressed: %s", _e)
+
+
 def _save_single_rfq(rfq_id, r, raise_on_error=False):
     """Save a SINGLE RFQ to SQLite.
 
@@ -377,6 +411,7 @@ def _save_single_rfq(rfq_id, r, raise_on_error=False):
             log.error("DB save_single_rfq failed for %s: %s", rfq_id, e)
             if raise_on_error:
                 raise
+    _sync_deadline_index()
 
 
 def save_rfqs(rfqs, raise_on_error=False):
@@ -440,16 +475,17 @@ def save_rfqs(rfqs, raise_on_error=False):
             log.error("SQLite write failed for rfqs: %s", str(e)[:200])
             if raise_on_error:
                 raise
+    _sync_deadline_index()
 
 
 def _load_price_checks(include_items=True):
     """Load price checks from SQLite (single source of truth)."""
-    global _pc_cache, _pc_cache_time
-    import time as _t
-    now = _t.time()
-    if include_items and _pc_cache is not None and (now - _pc_cache_time) < 30:
-        return _pc_cache
+    if include_items:
+        return _pc_cache.get("all", _build_price_checks)
+    return _build_price_checks()
+
 
+def _build_price_checks():
     data = {}
     try:
         from src.core.db import get_db
@@ -462,24 +498,7 @@ def _load_price_checks(include_items=True):
                 pcid = d.get("id", "")
                 if not pcid:
                     continue
-                blob = d.pop("data_json", None)
-                if blob:
-                    try:
-                        full = json.loads(blob)
-                        for key in ("status", "quote_number"):
-                            if d.get(key) and d[key] != full.get(key):
-                                full[key] = d[key]
-                        data[pcid] = full
-                        continue
-                    except (json.JSONDecodeError, TypeError) as _e:
-                        log.debug("suppressed: %s", _e)
-                items_raw = d.get("items", "[]")
-                if isinstance(items_raw, str):
-                    try:
-                        d["items"] = json.loads(items_raw)
-                    except Exception:
-                        d["items"] = []
-                data[pcid] = d
+                data[pcid] = _decode_pc_row(d)
     except Exception as e:
         log.warning("SQLite load_pcs failed: %s", str(e)[:200])
 
@@ -517,13 +536,8 @@ def _load_price_checks(include_items=True):
         elif "line_items" in pc:
             pc["items"] = list(pc["line_items"])
 
-    if include_items and len(data) < 500:
-        _pc_cache = data
-        _pc_cache_time = _t.time()
-    elif include_items:
+    if len(data) >= 500:
         log.warning("PC cache skipped: %d records exceeds 500 limit", len(data))
-        _pc_cache = None
-        _pc_cache_time = 0
     return data
 
 
@@ -573,7 +587,6 @@ def _save_single_pc(pc_id, pc, raise_on_error=False):
         pc["items"] = list(pc["line_items"])
 
     with _save_pcs_lock:
-        global _pc_cache, _pc_cache_time
 
         def _do():
             from src.core.db import get_db
@@ -644,8 +657,7 @@ def _save_single_pc(pc_id, pc, raise_on_error=False):
             # concurrent reader populate the cache with pre-write state and
             # serve stale data for 30s — banner-missing race seen in prod
             # smoke 2026-04-19.
-            _pc_cache = None
-            _pc_cache_time = 0
+            _pc_cache.invalidate()
             # Also invalidate the home page combined-init cache. 2026-05-06
             # incident: Mike marked a PC as duplicate but "Ready to Review"
             # stayed at 2 for the full 90s cache window because /api/dashboard/init
@@ -654,10 +666,10 @@ def _save_single_pc(pc_id, pc, raise_on_error=False):
             try:
                 from src.api.modules import routes_prd28 as _rprd
                 if hasattr(_rprd, "_dash_init_cache"):
-                    _rprd._dash_init_cache["data"] = None
-                    _rprd._dash_init_cache["ts"] = 0
+                    _rprd._dash_init_cache.invalidate()
             except Exception as _e:
                 log.debug("dash_init_cache invalidation suppressed: %s", _e)
+    _sync_deadline_index()
 
 
 def _save_price_checks(pcs, raise_on_error=False):
@@ -668,7 +680,6 @@ def _save_price_checks(pcs, raise_on_error=False):
     callers.
     """
     with _save_pcs_lock:
-        global _pc_cache, _pc_cache_time
         try:
             from src.core.db import get_db
             with get_db() as conn:
@@ -726,15 +737,14 @@ def _save_price_checks(pcs, raise_on_error=False):
                 raise
         finally:
             # Invalidate AFTER write commits (see _save_single_pc note).
-            _pc_cache = None
-            _pc_cache_time = 0
+            _pc_cache.invalidate()
             try:
                 from src.api.modules import routes_prd28 as _rprd
                 if hasattr(_rprd, "_dash_init_cache"):
-                    _rprd._dash_init_cache["data"] = None
-                    _rprd._dash_init_cache["ts"] = 0
+                    _rprd._dash_init_cache.invalidate()
             except Exception as _e:
                 log.debug("dash_init_cache invalidation suppressed: %s", _e)
+    _sync_deadline_index()
 
 
 def _merge_save_pc(pc_id: str, pc_data: dict):
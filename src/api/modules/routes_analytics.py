@@ -5152,19 +5152,15 @@ def api_webhook_inbound():
 
 def _webhook_pipeline_status(payload, actor):
     """Return current pipeline summary."""
-    rfqs = {}
+    statuses = {}
     try:
-        rfqs_path = os.path.join(DATA_DIR, "rfqs.json")
-        if os.path.exists(rfqs_path):
-            with open(rfqs_path) as f:
-                rfqs = json.load(f)
+        from src.core.dal import count_rfqs_by_status
+        for s, n in count_rfqs_by_status().items():
+            s = (s or "unknown").lower()
+            statuses[s] = statuses.get(s, 0) + n
     except Exception as _e:
         log.debug('suppressed in _webhook_pipeline_status: %s', _e)
-    statuses = {}
-    for r in rfqs.values():
-        s = (r.get("status") or "unknown").lower()
-        statuses[s] = statuses.get(s, 0) + 1
-    return {"total_rfqs": len(rfqs), "by_status": statuses}
+    return {"total_rfqs": sum(statuses.values()), "by_status": statuses}
 
 
 def _webhook_submit_rfq(payload, actor):
@@ -992,6 +992,24 @@ def api_tax_rate():
 def api_health():
     """Comprehensive system health check with path validation."""
     health = {"status": "ok", "build": "v20260220-1005-pdf-v4", "checks": {}}
+    # Deferred-init boot tasks: per-task duration / ran-vs-skipped.
+    try:
+        from src.core.boot_tasks import boot_task_summary
+        health["checks"]["boot_tasks"] = boot_task_summary()
+    except Exception as e:
+        health["checks"]["boot_tasks"] = {"error": str(e)[:200]}
+    # Single-writer queue: batching, lock-wait and queue-wait timings.
+    try:
+        from src.core.db_writer import writer_stats
+        health["checks"]["db_writer"] = writer_stats()
+    except Exception as e:
+        health["checks"]["db_writer"] = {"error": str(e)[:200]}
+    # Route-module import cost for this worker (slowest five).
+    try:
+        from src.api.dashboard import route_load_profile
+        health["checks"]["route_modules"] = route_load_profile(top=5)
+    except Exception as e:
+        health["checks"]["route_modules"] = {"error": str(e)[:200]}
     return jsonify(health)
 
 
@@ -70,8 +70,9 @@ def _now_pst():
     return datetime.now(_PST)
 
 
-def _build_deadline_item(doc_type, doc_id, doc):
-    """Build a deadline dict from a PC or RFQ record."""
+def _deadline_fields(doc_type, doc_id, doc):
+    """The parts of a deadline item that depend only on the record —
+    what `deadline_index` stores. None when there's no usable due date."""
     header = doc.get("header") or {}
     due_date_str = header.get("due_date") or doc.get("due_date") or ""
     due_time_str = header.get("due_time") or doc.get("due_time") or ""
@@ -80,39 +81,6 @@ def _build_deadline_item(doc_type, doc_id, doc):
     if due_dt is None:
         return None
 
-    now = _now_pst()
-    remaining = due_dt - now
-    total_seconds = remaining.total_seconds()
-    hours_left = total_seconds / 3600
-
-    if total_seconds < 0:
-        urgency = "overdue"
-    elif hours_left <= 4:
-        urgency = "critical"
-    elif hours_left <= 24:
-        urgency = "urgent"
-    elif hours_left <= 72:
-        urgency = "soon"
-    else:
-        urgency = "normal"
-
-    # Human-readable countdown
-    if total_seconds < 0:
-        abs_hrs = abs(total_seconds) / 3600
-        if abs_hrs < 1:
-            countdown_text = f"{int(abs(total_seconds) / 60)}m overdue"
-        elif abs_hrs < 24:
-            countdown_text = f"{abs_hrs:.1f}h overdue"
-        else:
-            countdown_text = f"{int(abs_hrs / 24)}d overdue"
-    else:
-        if hours_left < 1:
-            countdown_text = f"{int(total_seconds / 60)}m remaining"
-        elif hours_left < 24:
-            countdown_text = f"{hours_left:.1f}h remaining"
-        else:
-            countdown_text = f"{hours_left / 24:.1f}d remaining"
-
     institution = header.get("institution") or doc.get("institution") or ""
     pc_number = (header.get("pc_number") or doc.get("solicitation_number")
                  or doc.get("rfq_number") or doc.get("pc_number") or doc_id[:8])
@@ -155,10 +123,6 @@ def _build_deadline_item(doc_type, doc_id, doc):
         "due_iso": due_dt.isoformat(),
         "due_date_source": due_date_source,
         "time_explicit": time_explicit,
-        "hours_left": round(hours_left, 2),
-        "total_seconds": round(total_seconds),
-        "countdown_text": countdown_text,
-        "urgency": urgency,
         "status": doc.get("status", ""),
         "item_count": item_count,
         "loe_minutes": loe_minutes,
@@ -167,6 +131,55 @@ def _build_deadline_item(doc_type, doc_id, doc):
     }
 
 
+def _with_countdown(item, now=None):
+    """Add hours_left / countdown_text / urgency to a `_deadline_fields`
+    item, relative to `now` (default: current PST time)."""
+    due_dt = datetime.fromisoformat(item["due_iso"])
+    remaining = due_dt - (now or _now_pst())
+    total_seconds = remaining.total_seconds()
+    hours_left = total_seconds / 3600
+
+    if total_seconds < 0:
+        urgency = "overdue"
+    elif hours_left <= 4:
+        urgency = "critical"
+    elif hours_left <= 24:
+        urgency = "urgent"
+    elif hours_left <= 72:
+        urgency = "soon"
+    else:
+        urgency = "normal"
+
+    # Human-readable countdown
+    if total_seconds < 0:
+        abs_hrs = abs(total_seconds) / 3600
+        if abs_hrs < 1:
+            countdown_text = f"{int(abs(total_seconds) / 60)}m overdue"
+        elif abs_hrs < 24:
+            countdown_text = f"{abs_hrs:.1f}h overdue"
+        else:
+            countdown_text = f"{int(abs_hrs / 24)}d overdue"
+    else:
+        if hours_left < 1:
+            countdown_text = f"{int(total_seconds / 60)}m remaining"
+        elif hours_left < 24:
+            countdown_text = f"{hours_left:.1f}h remaining"
+        else:
+            countdown_text = f"{hours_left / 24:.1f}d remaining"
+
+    item.update(hours_left=round(hours_left, 2),
+                total_seconds=round(total_seconds),
+                countdown_text=countdown_text,
+                urgency=urgency)
+    return item
+
+
+def _build_deadline_item(doc_type, doc_id, doc):
+    """Build a deadline dict from a PC or RFQ record."""
+    item = _deadline_fields(doc_type, doc_id, doc)
+    return _with_countdown(item) if item else None
+
+
 # Mirror of `quote_triage._STALE_OVERDUE_HOURS`. A record more than 72h
 # past its (often default-stamped) due date is no longer actionable —
 # it's either been completed off-app, abandoned, or needs manual
@@ -178,11 +191,63 @@ def _build_deadline_item(doc_type, doc_id, doc):
 _STALE_OVERDUE_HOURS = 72
 
 
+# Furthest-out due time that can still land in each urgency band, so a
+# caller asking for {"overdue", "critical"} only reads rows due within 4h.
+_URGENCY_HORIZON_HOURS = {"overdue": 0, "critical": 4, "urgent": 24, "soon": 72}
+
+
+def _index_fields(doc_type, doc_id, doc):
+    from src.core.ghost_detection import is_quarantined
+    item = _deadline_fields(doc_type, doc_id, doc)
+    return {
+        "due_ts": datetime.fromisoformat(item["due_iso"]).timestamp() if item else None,
+        "status": doc.get("status", ""),
+        "is_test": bool(doc.get("is_test")),
+        "quarantined": is_quarantined(doc),
+        "item": item,
+    }
+
+
+def _index_pc(row):
+    from src.api.data_layer import _decode_pc_row
+    return _index_fields("pc", row["id"], _decode_pc_row(row))
+
+
+def _index_rfq(row):
+    from src.api.data_layer import _decode_rfq_row
+    return _index_fields("rfq", row["id"], _decode_rfq_row(row))
+
+
+_INDEXERS = {"price_checks": _index_pc, "rfqs": _index_rfq}
+
+
+def _register_indexers():
+    from src.core import deadline_index
+    deadline_index.register(_INDEXERS)
+
+
+_register_indexers()
+
+
+def _indexed_deadlines(since=None, until=None, include_quarantined=True):
+    """Unsent, non-test deadline items due in [since, until] (epoch
+    seconds), with countdowns computed now. Reads `deadline_index` —
+    test records (CR-5) and sent statuses are filtered in its query."""
+    from src.core import deadline_index
+    now = _now_pst()
+    items = deadline_index.query(
+        since=since, until=until,
+        exclude_statuses=sorted(_SENT_STATUSES),
+        include_quarantined=include_quarantined)
+    return [_with_countdown(item, now) for item in items]
+
+
 def _scan_deadlines(urgencies=None, include_stale=False):
-    """Scan all active PCs/RFQs and return deadline items.
+    """Active PCs/RFQs with a due date, as deadline items.
 
     Shared by /api/deadlines, /api/deadlines/critical, and the background
-    deadline-escalation watcher in notify_agent.py.
+    deadline-escalation watcher in notify_agent.py. Served as a range
+    query on `deadline_index` rather than a load of every record.
 
     Args:
         urgencies: optional set of urgency levels to include
@@ -192,48 +257,16 @@ def _scan_deadlines(urgencies=None, include_stale=False):
                        as `quote_triage.triage()`. Pass True only for
                        admin views that want to see the full backlog.
     """
-    from src.api.data_layer import _load_price_checks, load_rfqs
-
-    out = []
-
-    def _is_stale(dl):
-        # `hours_left` is negative for past-due rows; staleness is past
-        # due by more than the cutoff.
-        hl = dl.get("hours_left")
-        if hl is None or hl >= 0:
-            return False
-        return abs(hl) > _STALE_OVERDUE_HOURS
-
-    pcs = _load_price_checks()
-    for pcid, pc in pcs.items():
-        if pc.get("status", "") in _SENT_STATUSES:
-            continue
-        if pc.get("is_test"):
-            continue
-        dl = _build_deadline_item("pc", pcid, pc)
-        if not dl:
-            continue
-        if not include_stale and _is_stale(dl):
-            continue
-        if urgencies is None or dl["urgency"] in urgencies:
-            out.append(dl)
-
-    rfqs = load_rfqs()
-    for rid, r in rfqs.items():
-        if r.get("status", "") in _SENT_STATUSES:
-            continue
-        # CR-5: test RFQs inside 4h were triggering the base.html
-        # hard-alert modal. PC loop already filtered is_test; parity it here.
-        if r.get("is_test"):
-            continue
-        dl = _build_deadline_item("rfq", rid, r)
-        if not dl:
-            continue
-        if not include_stale and _is_stale(dl):
-            continue
-        if urgencies is None or dl["urgency"] in urgencies:
-            out.append(dl)
-
+    now_ts = _now_pst().timestamp()
+    since = None if include_stale else now_ts - _STALE_OVERDUE_HOURS * 3600
+    until = None
+    if urgencies is not None and set(urgencies) <= set(_URGENCY_HORIZON_HOURS):
+        until = now_ts + max((_URGENCY_HORIZON_HOURS[u] for u in urgencies),
+                             default=0) * 3600
+
+    out = _indexed_deadlines(since=since, until=until)
+    if urgencies is not None:
+        out = [dl for dl in out if dl["urgency"] in urgencies]
     return out
 
 
@@ -275,38 +308,13 @@ def api_triage():
       }
     """
     try:
-        from src.api.data_layer import _load_price_checks, load_rfqs
         from src.core.quote_triage import triage
 
         # Bundle-2 PR-2c: skip records carrying a ghost-quarantine
         # `hidden_reason`. Marks-not-deletes — the records still exist
         # in storage; they're just out of the operator's main queue.
-        from src.core.ghost_detection import is_quarantined as _is_q
-
-        deadlines = []
-        pcs = _load_price_checks()
-        for pcid, pc in pcs.items():
-            if pc.get("status", "") in _SENT_STATUSES:
-                continue
-            if pc.get("is_test"):
-                continue
-            if _is_q(pc):
-                continue
-            dl = _build_deadline_item("pc", pcid, pc)
-            if dl:
-                deadlines.append(dl)
-
-        rfqs = load_rfqs()
-        for rid, r in rfqs.items():
-            if r.get("status", "") in _SENT_STATUSES:
-                continue
-            if r.get("is_test"):
-                continue
-            if _is_q(r):
-                continue
-            dl = _build_deadline_item("rfq", rid, r)
-            if dl:
-                deadlines.append(dl)
+        # Stale rows stay in: triage() counts them as stale_overdue.
+        deadlines = _indexed_deadlines(include_quarantined=False)
 
         t = triage(deadlines)
         if t["emergency"]:
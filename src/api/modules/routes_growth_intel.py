@@ -868,12 +868,11 @@ def _build_outreach_targets():
     contact_list = contacts.values() if isinstance(contacts, dict) else contacts
 
     # Load growth prospects
-    prospects_path = os.path.join(DATA_DIR, "growth_prospects.json")
     try:
-        with open(prospects_path) as f:
-            pdata = json.load(f)
-        prospects = pdata.get("prospects", []) if isinstance(pdata, dict) else pdata
-    except (FileNotFoundError, json.JSONDecodeError):
+        from src.agents.growth_agent import load_prospects_data
+        prospects = load_prospects_data()["prospects"]
+    except Exception as _e:
+        log.debug("suppressed: %s", _e)
         prospects = []
 
     # Load existing outreach to skip already-emailed
@@ -512,11 +512,9 @@ def api_growth_campaign_status():
     if not GROWTH_AVAILABLE:
         return jsonify({"ok": False, "error": "Growth agent not available"})
     try:
-        from src.agents.growth_agent import get_campaign_dashboard, _load_json, OUTREACH_FILE
+        from src.agents.growth_agent import get_campaign_dashboard, load_outreach_data
         dashboard = get_campaign_dashboard()
-        outreach = _load_json(OUTREACH_FILE)
-        if not isinstance(outreach, dict):
-            outreach = {}
+        outreach = load_outreach_data()
         campaigns = outreach.get("campaigns", [])
         distro_campaigns = [c for c in campaigns if c.get("type") == "distro_list_phase1"]
         total_distro_staged = sum(len(c.get("outreach", [])) for c in distro_campaigns)
@@ -1540,6 +1540,8 @@ def _save_crm_contacts(contacts: dict):
             c_copy = dict(c)
             c_copy["id"] = cid
             upsert_contact(c_copy)
+        from src.core.dashboard_snapshot import mark_dirty
+        mark_dirty("contacts")
     except Exception as _e:
         log.debug("Suppressed: %s", _e)
 
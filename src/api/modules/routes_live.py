@@ -0,0 +1,101 @@
+"""Live updates — one server-sent-events stream per browser session.
+
+Routes:
+    GET /api/live/stream  — SSE: `bell`, `deadlines`, `pulse` events, each
+                            sent only when its data changed (see
+                            src/core/live_events.py)
+    GET /api/live/stats   — open streams, slot limit, event counters
+
+The payloads match what the polled endpoints return, so base.html,
+header.js and home.html render pushed and polled data through the same
+functions:
+    bell       — /api/notifications/bell-count + /api/outbox/pending-count
+    deadlines  — /api/deadlines
+    pulse      — /api/quoting/status outcome counts (last 50 quotes)
+"""
+import logging
+import re
+
+from flask import Response, jsonify, request
+
+from src.api.shared import bp, auth_required
+from src.core import live_events
+
+log = logging.getLogger(__name__)
+
+_SID_RE = re.compile(r"^[A-Za-z0-9_-]{8,64}$")
+_URGENCY_ORDER = {"overdue": 0, "critical": 1, "urgent": 2, "soon": 3, "normal": 4}
+
+
+def _bell_payload():
+    from src.agents.notify_agent import get_unread_count
+    from src.core.metrics import get_pending_drafts
+    try:
+        from src.agents.cs_agent import get_cs_drafts
+        cs_pending = len(get_cs_drafts())
+    except Exception as e:
+        log.debug("live bell: cs drafts unavailable: %s", e)
+        cs_pending = 0
+    unread = get_unread_count()
+    drafts = get_pending_drafts()["total"]
+    return {"unread": unread, "cs_drafts": cs_pending, "drafts": drafts,
+            "total_badge": unread + cs_pending, "badge": unread + cs_pending + drafts}
+
+
+def _deadlines_payload():
+    from src.api.modules.routes_deadlines import _scan_deadlines
+    deadlines = _scan_deadlines()
+    deadlines.sort(key=lambda d: (_URGENCY_ORDER.get(d["urgency"], 5), d["hours_left"]))
+    return {
+        "ok": True,
+        "deadlines": deadlines,
+        "count": len(deadlines),
+        "critical_count": sum(1 for d in deadlines if d["urgency"] in ("overdue", "critical")),
+    }
+
+
+def _deadlines_fingerprint(payload):
+    # hours_left / total_seconds move every second; countdown_text is what
+    # the strip and the alert modal actually show.
+    return [{k: v for k, v in d.items() if k not in ("hours_left", "total_seconds")}
+            for d in payload["deadlines"]]
+
+
+def _pulse_payload():
+    from src.api.modules.routes_quoting_status import _fetch_recent_summary
+    counts = {}
+    for r in _fetch_recent_summary(limit=50):
+        counts[r["outcome"]] = counts.get(r["outcome"], 0) + 1
+    return {"ok": True, "outcome_counts": counts}
+
+
+live_events.register("bell", _bell_payload, ttl=10)
+live_events.register("deadlines", _deadlines_payload,
+                     fingerprint=_deadlines_fingerprint, ttl=15)
+live_events.register("pulse", _pulse_payload, ttl=10)
+
+
+@bp.route("/api/live/stream")
+@auth_required
+def api_live_stream():
+    """Multiplexed SSE stream. `?sid=` identifies the browser session (one
+    stream each); `?channels=bell,deadlines` narrows the channel set."""
+    sid = request.args.get("sid", "")
+    if not _SID_RE.match(sid):
+        sid = f"addr-{request.remote_addr}"
+    names = [c for c in (request.args.get("channels") or "").split(",") if c] or None
+    try:
+        stream = live_events.open_stream(
+            sid, names, last_event_id=request.headers.get("Last-Event-ID", ""))
+    except live_events.StreamBusy as e:
+        return jsonify({"ok": False, "error": str(e), "fallback": "poll"}), 503
+    resp = Response(stream.events(), mimetype="text/event-stream",
+                    headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+    resp.call_on_close(stream.close)
+    return resp
+
+
+@bp.route("/api/live/stats")
+@auth_required
+def api_live_stats():
+    return jsonify({"ok": True, **live_events.live_stats()})
@@ -9,6 +9,7 @@ log = logging.getLogger("reytech")
 from flask import redirect
 
 from datetime import datetime as _dt, timezone as _tz
+from src.core.flight_cache import FlightCache
 
 # ══════════════════════════════════════════════════════════════════════════════
 # Work Item 1: Quote Lifecycle APIs
@@ -704,23 +705,44 @@ loadRevenue();
 """
 
 
-_dash_init_cache = {"data": None, "ts": 0}
-
-@bp.route("/api/dashboard/init")
-@auth_required
-@safe_route
-def api_dashboard_init():
-    """Combined endpoint — returns ALL home page widget data in one call.
-    Replaces 6 separate fetch() calls that each loaded the same JSON files."""
-    import time as _time
-    t0 = _time.time()
-    # 90-second cache — this is the most expensive home page call
-    global _dash_init_cache
-    if _dash_init_cache["data"] and (_time.time() - _dash_init_cache["ts"]) < 90:
-        return jsonify(_dash_init_cache["data"])
-    result = {"ok": True}
-
-    # ── 1. Actions (urgent / action_needed / progress) ──
+# Short single-flight memo in front of the snapshot: absorbs a burst of
+# home-page loads with one assembly. The PC save paths in data_layer
+# still clear it, and the snapshot itself is kept current by write
+# triggers (src/core/dashboard_snapshot.py), so this doesn't bound
+# staleness.
+_DASH_INIT_MEMO_S = 5
+_dash_init_cache = FlightCache("dashboard_init", ttl=_DASH_INIT_MEMO_S)
+
+# status → funnel bucket, per record kind
+_PC_FUNNEL = {"parsed": "inbox", "new": "inbox", "parse_error": "inbox",
+              "priced": "priced", "ready": "priced", "auto_drafted": "priced",
+              "quoted": "quoted", "generated": "quoted",
+              "sent": "sent", "completed": "sent"}
+_RFQ_FUNNEL = {"new": "inbox", "pending": "inbox", "parsed": "inbox",
+               "priced": "priced", "ready": "priced",
+               "generated": "quoted", "quoted": "quoted",
+               "sent": "sent"}
+
+
+def _pc_funnel_bucket(row):
+    from src.api.data_layer import _decode_pc_row, _is_user_facing_pc
+    pc = _decode_pc_row(row)
+    if not _is_user_facing_pc(pc):
+        return None
+    return _PC_FUNNEL.get(pc.get("status"))
+
+
+def _rfq_funnel_bucket(row):
+    from src.api.data_layer import _decode_rfq_row
+    r = _decode_rfq_row(row)
+    if r.get("is_test"):
+        return None
+    return _RFQ_FUNNEL.get(r.get("status"))
+
+
+def _dash_actions():
+    """Urgent / action_needed / progress — the lightweight parts of
+    api_dashboard_actions."""
     try:
         # Inline the lightweight parts of api_dashboard_actions
         urgent = []
@@ -789,101 +811,54 @@ def api_dashboard_init():
         except Exception as _e:
             log.debug("suppressed: %s", _e)
 
-        result["actions"] = {"ok": True, "urgent": urgent, "action_needed": action_needed, "progress": progress_items}
+        return {"ok": True, "urgent": urgent, "action_needed": action_needed, "progress": progress_items}
     except Exception as e:
-        result["actions"] = {"ok": False, "error": str(e), "urgent": [], "action_needed": [], "progress": []}
+        return {"ok": False, "error": str(e), "urgent": [], "action_needed": [], "progress": []}
+
+
+def _dash_unified_metrics():
+    """Unified metrics (P0.12 fix — single source of truth) shared by the
+    funnel and manager-metrics widgets."""
+    from src.core.metrics import get_win_rate, get_pipeline_value, get_active_orders
+    _wr = get_win_rate()
+    _pv = get_pipeline_value()
+    _ao = get_active_orders()
+    won_value = _wr["won_total"]
+    # Include orders revenue if it exceeds won-quote revenue
+    # (POs may arrive without a corresponding won-quote record)
+    if _ao["total_value"] > won_value:
+        won_value = _ao["total_value"]
+    return {
+        "ok": True,
+        "won": _wr["won"], "won_value": won_value,
+        "orders": _ao["total"], "pipeline_value": _pv["pipeline_value"],
+        "total_quotes": _wr["total"],
+    }
 
-    # ── 2. Funnel stats ──
-    try:
-        from src.api.dashboard import _load_price_checks, load_rfqs, _is_user_facing_pc
-        all_pcs = _load_price_checks()
-        user_pcs = {pid: pc for pid, pc in all_pcs.items() if _is_user_facing_pc(pc)}
-        rfqs = load_rfqs()
-        rfqs_nt = {k: v for k, v in rfqs.items() if not v.get("is_test")}
-
-        inbox = sum(1 for pc in user_pcs.values() if pc.get("status") in ("parsed","new","parse_error")) + \
-                sum(1 for r in rfqs_nt.values() if r.get("status") in ("new","pending","parsed"))
-        priced = sum(1 for pc in user_pcs.values() if pc.get("status") in ("priced","ready","auto_drafted")) + \
-                 sum(1 for r in rfqs_nt.values() if r.get("status") in ("priced","ready"))
-        quoted = sum(1 for pc in user_pcs.values() if pc.get("status") in ("quoted","generated")) + \
-                 sum(1 for r in rfqs_nt.values() if r.get("status") in ("generated","quoted"))
-        sent = sum(1 for pc in user_pcs.values() if pc.get("status") in ("sent","completed")) + \
-               sum(1 for r in rfqs_nt.values() if r.get("status") == "sent")
-
-        # Unified metrics (P0.12 fix — single source of truth)
-        from src.core.metrics import get_win_rate, get_pipeline_value, get_active_orders
-        _wr = get_win_rate()
-        _pv = get_pipeline_value()
-        _ao = get_active_orders()
-        won_count = _wr["won"]
-        won_value = _wr["won_total"]
-        # Include orders revenue if it exceeds won-quote revenue
-        # (POs may arrive without a corresponding won-quote record)
-        if _ao["total_value"] > won_value:
-            won_value = _ao["total_value"]
-        orders_count = _ao["total"]
-        pipeline_val = _pv["pipeline_value"]
 
-        result["funnel"] = {
-            "ok": True, "inbox": inbox, "priced": priced, "quoted": quoted,
-            "sent": sent, "won": won_count, "won_value": won_value,
-            "orders": orders_count, "pipeline_value": pipeline_val,
-        }
-    except Exception as e:
-        result["funnel"] = {"ok": False, "error": str(e)}
-
-    # ── 3. Revenue ──
+def _dash_revenue():
     try:
         from src.agents.sales_intel import update_revenue_tracker
-        result["revenue"] = update_revenue_tracker()
+        return update_revenue_tracker()
     except Exception as e:
-        result["revenue"] = {"ok": False, "error": str(e)}
+        return {"ok": False, "error": str(e)}
 
-    # ── 4. QA workflow (lightweight) ──
-    try:
-        from src.core.db import get_db
-        with get_db() as conn:
-            row = conn.execute("SELECT * FROM workflow_runs ORDER BY id DESC LIMIT 1").fetchone()
-            result["qa"] = dict(row) if row else {"status": "none"}
-    except Exception:
-        result["qa"] = {"status": "none"}
-
-    # ── 5. Manager metrics (unified — same source as funnel above) ──
-    try:
-        # Reuse the same _wr / _pv / _ao computed above if still in scope,
-        # otherwise re-fetch (defensive — they're cheap cached queries).
-        try:
-            _wr_m = _wr
-            _pv_m = _pv
-            _ao_m = _ao
-        except NameError:
-            from src.core.metrics import get_win_rate, get_pipeline_value, get_active_orders
-            _wr_m = get_win_rate()
-            _pv_m = get_pipeline_value()
-            _ao_m = get_active_orders()
-        total_quotes = _wr_m["total"]
-        total_revenue = _wr_m["won_total"]
-        if _ao_m["total_value"] > total_revenue:
-            total_revenue = _ao_m["total_value"]
-        pipeline = _pv_m["pipeline_value"]
-        result["metrics"] = {"ok": True, "total_quotes": total_quotes, "total_revenue": total_revenue, "pipeline": pipeline}
-    except Exception as e:
-        result["metrics"] = {"ok": False, "error": str(e)}
 
-    # ── 6. Order health (progress board data) ──
+def _dash_order_health():
     try:
         from src.agents.order_digest import get_order_health
-        result["order_health"] = get_order_health()
+        return get_order_health()
     except Exception as e:
-        result["order_health"] = {"ok": False, "error": str(e)}
+        return {"ok": False, "error": str(e)}
+
 
-    # ── 7. Growth Engine summary ──
+def _dash_growth():
     try:
         from src.agents.growth_agent import get_growth_kpis, get_quick_wins, generate_daily_brief
         growth_kpis = get_growth_kpis()
         quick_wins = get_quick_wins(max_results=3)
         brief = generate_daily_brief()
-        result["growth"] = {
+        return {
             "ok": True,
             "kpis": growth_kpis,
             "quick_wins": quick_wins,
@@ -892,9 +867,10 @@ def api_dashboard_init():
             "critical_count": sum(1 for p in brief.get("priorities", []) if p.get("level") == "critical"),
         }
     except Exception as e:
-        result["growth"] = {"ok": False, "error": str(e)}
+        return {"ok": False, "error": str(e)}
+
 
-    # ── 8. Award Intel (SCPRS monitoring) ──
+def _dash_award_intel():
     try:
         from src.core.db import get_db
         with get_db() as conn:
@@ -907,15 +883,18 @@ def api_dashboard_init():
             recent_losses = conn.execute("SELECT COUNT(*) FROM award_tracker_log WHERE outcome='lost' AND checked_at > datetime('now', '-30 days')").fetchone()[0]
             # SCPRS freshness
             freshness = conn.execute("SELECT agency_key, last_pull FROM scprs_pull_schedule ORDER BY last_pull DESC").fetchall()
-        result["award_intel"] = {
+        return {
             "po_count": po_count, "line_count": line_count, "wq_count": wq_count,
             "recent_wins": recent_wins, "recent_losses": recent_losses,
             "scprs_freshness": [{"agency": r[0], "last_pull": r[1]} for r in freshness] if freshness else [],
         }
     except Exception:
-        result["award_intel"] = {}
+        return {}
 
-    # ── 9. Parse error count (last 48h) ──
+
+def _dash_pc_counts():
+    """48h parse-error count plus the morning summary."""
+    out = {"parse_errors": 0, "morning": {}}
     try:
         from src.core.db import get_db
         with get_db() as conn:
@@ -923,11 +902,9 @@ def api_dashboard_init():
                 SELECT COUNT(*) FROM price_checks
                 WHERE status='parse_error' AND created_at >= datetime('now', '-2 days')
             """).fetchone()[0]
-        result["parse_errors"] = parse_errors
-    except Exception:
-        result["parse_errors"] = 0
-
-    # ── Morning Summary ──
+        out["parse_errors"] = parse_errors
+    except Exception as _e:
+        log.debug("parse error count: %s", _e)
     try:
         from src.core.db import get_db
         morning = {}
@@ -962,15 +939,97 @@ def api_dashboard_init():
             """).fetchone()[0]
             morning["open_pcs"] = open_pcs
 
-        result["morning"] = morning
+        out["morning"] = morning
     except Exception as e:
         log.debug("morning summary: %s", e)
-        result["morning"] = {}
+    return out
+
+
+# section → (builder, ttl seconds, tables whose writes make it stale).
+# Every table a builder reads is listed, so a write is reflected on the
+# next read. The TTL (a synchronous rebuild, never stale-served) covers
+# what no write signals: the rolling 24h/48h/3-day/30-day windows, the
+# growth calendar file and scprs_po_lines, which a pull fills alongside
+# scprs_po_master / scprs_pull_schedule.
+_DASH_SECTIONS = {
+    "actions": (_dash_actions, 300, ("orders", "quotes", "email_outbox",
+                                     "revenue_log", "contacts")),
+    "metrics": (_dash_unified_metrics, 600, ("quotes", "orders", "price_checks", "rfqs")),
+    "revenue": (_dash_revenue, 300, ("orders", "quotes")),
+    "order_health": (_dash_order_health, 300, ("orders",)),
+    "growth": (_dash_growth, 900, ("growth_prospects", "growth_outreach",
+                                   "growth_outreach_entries", "quotes")),
+    "award_intel": (_dash_award_intel, 900, ("won_quotes", "scprs_po_master", "scprs_po_lines",
+                                             "scprs_pull_schedule", "award_tracker_log")),
+    "pc_counts": (_dash_pc_counts, 300, ("price_checks",)),
+}
+
+
+@bp.route("/api/dashboard/init")
+@auth_required
+@safe_route
+def api_dashboard_init():
+    """Combined endpoint — returns ALL home page widget data in one call.
+    Replaces 6 separate fetch() calls that each loaded the same JSON files.
+
+    Widgets come from the persistent dashboard snapshot, which PC / RFQ /
+    order / quote writes keep current; only sections a write has touched
+    are rebuilt, and the funnel reclassifies only the changed records."""
+    return jsonify(_dash_init_cache.get("init", _build_dashboard_init))
+
+
+def _build_dashboard_init():
+    import time as _time
+    t0 = _time.time()
+    from src.core import dashboard_snapshot as _snap
+    result = {"ok": True}
+    sections = _snap.read_sections(_DASH_SECTIONS)
+
+    result["actions"] = sections["actions"]
+
+    # ── Funnel stats ──
+    m = sections["metrics"]
+    try:
+        counts = _snap.funnel_counts({"price_checks": _pc_funnel_bucket,
+                                      "rfqs": _rfq_funnel_bucket})
+        if not m.get("ok"):
+            raise RuntimeError(m.get("error", "metrics unavailable"))
+        result["funnel"] = {
+            "ok": True, "inbox": counts.get("inbox", 0), "priced": counts.get("priced", 0),
+            "quoted": counts.get("quoted", 0), "sent": counts.get("sent", 0),
+            "won": m["won"], "won_value": m["won_value"],
+            "orders": m["orders"], "pipeline_value": m["pipeline_value"],
+        }
+    except Exception as e:
+        result["funnel"] = {"ok": False, "error": str(e)}
+
+    result["revenue"] = sections["revenue"]
+
+    # ── QA workflow (lightweight, always live) ──
+    try:
+        from src.core.db import get_db
+        with get_db() as conn:
+            row = conn.execute("SELECT * FROM workflow_runs ORDER BY id DESC LIMIT 1").fetchone()
+            result["qa"] = dict(row) if row else {"status": "none"}
+    except Exception:
+        result["qa"] = {"status": "none"}
+
+    # ── Manager metrics (unified — same source as funnel above) ──
+    if m.get("ok"):
+        result["metrics"] = {"ok": True, "total_quotes": m["total_quotes"],
+                             "total_revenue": m["won_value"], "pipeline": m["pipeline_value"]}
+    else:
+        result["metrics"] = m
+
+    result["order_health"] = sections["order_health"]
+    result["growth"] = sections["growth"]
+    result["award_intel"] = sections["award_intel"]
+    pc_counts = sections["pc_counts"]
+    result["parse_errors"] = pc_counts.get("parse_errors", 0)
+    result["morning"] = pc_counts.get("morning", {})
 
     result["_ms"] = round((_time.time() - t0) * 1000)
-    _dash_init_cache["data"] = result
-    _dash_init_cache["ts"] = _time.time()
-    return jsonify(result)
+    return result
 
 
 # ── Activity Feed: unified recent events across the system ──────────
@@ -1081,23 +1140,17 @@ def api_activity_feed():
 
     # 4) Growth outreach
     try:
-        from src.core.paths import DATA_DIR
-        import json
-        import pathlib
-        gp = pathlib.Path(DATA_DIR) / "growth_outreach.json"
-        if gp.exists():
-            outreach = json.loads(gp.read_text())
-            if isinstance(outreach, list):
-                for out in sorted(outreach, key=lambda x: x.get("sent_at", ""), reverse=True)[:limit]:
-                    events.append({
-                        "ts": out.get("sent_at", ""),
-                        "type": "outreach",
-                        "icon": "🚀",
-                        "title": f"Outreach → {out.get('agency', '?')}",
-                        "detail": (out.get("buyer_name") or out.get("to", ""))[:80],
-                        "link": f"/growth/prospect/{out.get('prospect_id', '')}" if out.get("prospect_id") else None,
-                        "source": "growth",
-                    })
+        from src.agents.growth_agent import recent_sent_outreach
+        for out in recent_sent_outreach(limit):
+            events.append({
+                "ts": out.get("email_sent_at") or "",
+                "type": "outreach",
+                "icon": "🚀",
+                "title": f"Outreach → {out.get('agency') or '?'}",
+                "detail": (out.get("name") or out.get("buyer_name") or out.get("email", ""))[:80],
+                "link": f"/growth/prospect/{out['prospect_id']}" if out.get("prospect_id") else None,
+                "source": "growth",
+            })
     except Exception as _e:
         log.debug("suppressed: %s", _e)
 
@@ -2779,11 +2779,7 @@ def _pricecheck_reparse_locked(pcid):
                     except Exception as _e:
                         log.debug("Suppressed: %s", _e)
                 if row and row["data"]:
-                    restore_dir = os.path.join(DATA_DIR, "pc_pdfs")
-                    os.makedirs(restore_dir, exist_ok=True)
-                    source_pdf = os.path.join(restore_dir, row["filename"] or f"{pcid}.pdf")
-                    with open(source_pdf, "wb") as _fw:
-                        _fw.write(row["data"])
+                    source_pdf = _restore_source_pdf(pcid, row)
                     pc["source_pdf"] = source_pdf
                     recovered = True
                     log.info("REPARSE %s: recovered PDF from DB (%d bytes)", pcid, len(row["data"]))
@@ -3343,11 +3339,56 @@ def pricecheck_generate(pcid):
         return jsonify({"ok": False, "error": f"Server error: {e}"})
 
 
+import threading as _threading_gen
+_GEN_LOCKS = {}
+_GEN_LOCKS_GUARD = _threading_gen.Lock()
+
+
+def _pc_gen_lock(pcid):
+    """One lock per PC id. Bundle generation fills PCs on a thread pool,
+    and a retry or a second tab can ask for the same PC at the same time;
+    each generate loads, mutates and saves the whole PC record."""
+    with _GEN_LOCKS_GUARD:
+        lock = _GEN_LOCKS.get(pcid)
+        if lock is None:
+            lock = _GEN_LOCKS[pcid] = _threading_gen.Lock()
+        return lock
+
+
+def _restore_source_pdf(pcid, row):
+    """Write a source PDF recovered from the DB into pc_pdfs/ and return
+    its path. Bundle PCs share one combined file, so parallel fills can
+    restore the same path: write a temp file and rename it into place so
+    no reader ever sees a half-written PDF."""
+    import tempfile
+    restore_dir = os.path.join(DATA_DIR, "pc_pdfs")
+    os.makedirs(restore_dir, exist_ok=True)
+    path = os.path.join(restore_dir, row["filename"] or f"{pcid}.pdf")
+    fd, tmp = tempfile.mkstemp(dir=restore_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as _fw:
+            _fw.write(row["data"])
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return path
+
+
 def _generate_pc_pdf(pcid):
     """Core PC PDF generation logic. Returns dict (not Flask response).
     Used by both the HTTP route wrapper and the bundle generate route.
+    Serialized per PC id (see _pc_gen_lock); different PCs run in parallel.
     Returns: {"ok": True, "output_path": "...", "summary": {...}} or {"ok": False, "error": "..."}
     """
+    with _pc_gen_lock(pcid):
+        return _generate_pc_pdf_locked(pcid)
+
+
+def _generate_pc_pdf_locked(pcid):
     if not PRICE_CHECK_AVAILABLE:
         return {"ok": False, "error": "price_check.py not available"}
     pcs = _load_price_checks()
@@ -3467,11 +3508,7 @@ def _generate_pc_pdf(pcid):
                             "schema drift) — %s", pcid, _ea_e,
                         )
                 if row and row["data"]:
-                    restore_dir = os.path.join(DATA_DIR, "pc_pdfs")
-                    os.makedirs(restore_dir, exist_ok=True)
-                    source_pdf = os.path.join(restore_dir, row["filename"] or f"{pcid}.pdf")
-                    with open(source_pdf, "wb") as _fw:
-                        _fw.write(row["data"])
+                    source_pdf = _restore_source_pdf(pcid, row)
                     pc["source_pdf"] = source_pdf
                     _save_single_pc(pcid, pc)
                     recovered = True
@@ -3828,11 +3865,7 @@ def _do_generate_original_locked(pcid):
                             "schema drift) — %s", pcid, _ea_e,
                         )
                 if row and row["data"]:
-                    restore_dir = os.path.join(DATA_DIR, "pc_pdfs")
-                    os.makedirs(restore_dir, exist_ok=True)
-                    source_pdf = os.path.join(restore_dir, row["filename"] or f"{pcid}.pdf")
-                    with open(source_pdf, "wb") as _fw:
-                        _fw.write(row["data"])
+                    source_pdf = _restore_source_pdf(pcid, row)
                     pc["source_pdf"] = source_pdf
                     _save_single_pc(pcid, pc)
                     recovered = True
@@ -4235,7 +4235,7 @@ def api_item_link_lookup():
                             "vs row desc %r → cache cleared, retrying lookup",
                             _asin, result.get("title", "")[:60], _pc_desc[:60],
                         )
-                        result = lookup_from_url(url)
+                        result = lookup_from_url(url, use_cache=False)
                 except Exception as _ev_e:
                     log.debug("recycle-evict retry failed: %s", _ev_e)
 
@@ -61,25 +61,28 @@ def api_bundle_generate(bundle_id):
                 "message": f"{len(ready)} of {len(bundle_pcs)} PCs fully priced. Send force=true to generate anyway.",
             })
 
-        # Generate each PC's individual PDF
-        pc_outputs = []
-        errors = []
-        for pc in bundle_pcs:
-            pcid = pc["id"]
-            result = _generate_pc_pdf(pcid)
-            if result.get("ok"):
-                pc_outputs.append({
-                    "pc_id": pcid,
-                    "page_start": int(pc.get("page_start", 0)),
-                    "page_end": int(pc.get("page_end", 0)),
-                    "output_pdf": result["output_path"],
-                    "summary": result.get("summary", {}),
-                })
-            else:
-                errors.append({"pc_id": pcid, "error": result.get("error", "Unknown")})
-                log.error("BUNDLE %s: PC %s generate failed: %s", bundle_id, pcid, result.get("error"))
+        # Generate each PC's individual PDF — bounded pool, progress per PC
+        # on /api/progress/<progress_task> (same file-backed channel as
+        # the analytics auto-price job, so any worker can answer the poll).
+        from src.forms.price_check import generate_bundle_parts
+        from src.api.modules.routes_analytics import _emit_progress
+        progress_task = re.sub(r"[^A-Za-z0-9_-]", "_", str(
+            request.args.get("task_id")
+            or (request.get_json(force=True, silent=True) or {}).get("task_id")
+            or f"bundle_{bundle_id}"))[:80]
+
+        def _progress(done, total, pcid, ok, error):
+            detail = f"{done}/{total} — {pcid} " + ("filled" if ok else f"failed: {str(error)[:80]}")
+            _emit_progress(progress_task, "pc_done" if ok else "pc_error", detail)
+
+        _emit_progress(progress_task, "start", f"Generating {len(bundle_pcs)} PCs")
+        pc_outputs, errors = generate_bundle_parts(bundle_pcs, _generate_pc_pdf,
+                                                   on_progress=_progress)
+        for err in errors:
+            log.error("BUNDLE %s: PC %s generate failed: %s", bundle_id, err["pc_id"], err["error"])
 
         if not pc_outputs:
+            _emit_progress(progress_task, "failed", "All PC generations failed", done=True)
             return jsonify({"ok": False, "error": "All PC generations failed", "errors": errors})
 
         # Merge into combined PDF
@@ -95,7 +98,9 @@ def api_bundle_generate(bundle_id):
         merge_result = merge_bundle_pdfs(source_pdf, pc_outputs, non_pc_pages, bundle_output)
 
         if not merge_result.get("ok"):
+            _emit_progress(progress_task, "failed", merge_result.get("error", "Merge failed"), done=True)
             return jsonify({"ok": False, "error": merge_result.get("error", "Merge failed")})
+        _emit_progress(progress_task, "merged", f"{merge_result.get('page_count', 0)} pages", done=True)
 
         # Store bundle output path on each PC
         for pc in bundle_pcs:
@@ -118,6 +123,7 @@ def api_bundle_generate(bundle_id):
             "pcs_generated": len(pc_outputs),
             "pcs_failed": len(errors),
             "page_count": merge_result.get("page_count", 0),
+            "progress_task": progress_task,
             "summary": {
                 "items_total": total_items,
                 "items_priced": total_priced,
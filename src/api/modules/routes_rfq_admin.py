@@ -3704,7 +3704,7 @@ def _api_rfq_refill_form_locked(rid, form_id):
 def api_rfq_timeline(rid):
     """Get the full lifecycle timeline for an RFQ."""
     from src.core.dal import get_lifecycle_events
-    events = get_lifecycle_events("rfq", rid, limit=200)
+    events = get_lifecycle_events("rfq", rid, limit=200, include_archive=True)
     return jsonify({"ok": True, "events": events, "count": len(events)})
 
 
@@ -72,20 +72,14 @@ def api_v1_pipeline():
     Auth: X-API-Key or Basic Auth.
     """
     try:
-        from src.core.dal import list_rfqs, list_pcs, list_orders
-        from collections import Counter
-
-        # RFQ status counts
-        rfqs = list_rfqs(limit=10000)
-        rfq_counts = dict(Counter(r.get("status", "unknown") for r in rfqs))
-
-        # PC status counts
-        pcs = list_pcs(limit=10000)
-        pc_counts = dict(Counter(p.get("status", "unknown") for p in pcs))
+        from src.core.dal import (
+            count_rfqs_by_status, count_pcs_by_status, count_orders_by_status,
+        )
 
-        # Order status counts
-        orders = list_orders(limit=10000)
-        order_counts = dict(Counter(o.get("status", "unknown") for o in orders))
+        # Status counts — grouped queries on the status indexes
+        rfq_counts = count_rfqs_by_status()
+        pc_counts = count_pcs_by_status()
+        order_counts = count_orders_by_status()
 
         # Agent status from scheduler
         agents = {}
@@ -101,9 +95,9 @@ def api_v1_pipeline():
             log.debug('suppressed in api_v1_pipeline: %s', _e)
 
         return api_response({
-            "rfqs": {"total": len(rfqs), "by_status": rfq_counts},
-            "pcs": {"total": len(pcs), "by_status": pc_counts},
-            "orders": {"total": len(orders), "by_status": order_counts},
+            "rfqs": {"total": sum(rfq_counts.values()), "by_status": rfq_counts},
+            "pcs": {"total": sum(pc_counts.values()), "by_status": pc_counts},
+            "orders": {"total": sum(order_counts.values()), "by_status": order_counts},
             "agents": agents,
         })
     except Exception as e:
@@ -111,6 +105,61 @@ def api_v1_pipeline():
         return api_response(error=str(e), status=500)
 
 
+def _v1_page(pager):
+    """Shared handler for the cursor-paginated list endpoints.
+
+    Query params: status (comma-separated), agency, updated_since (epoch
+    seconds or ISO datetime, UTC when naive), cursor (next_cursor from the
+    previous page), limit (default 100, max 500). Records come in change
+    order; keep polling with the last next_cursor to get only new changes.
+    """
+    from src.core.change_feed import parse_since
+    try:
+        since = request.args.get("updated_since", "").strip()
+        statuses = [s.strip() for s in request.args.get("status", "").split(",") if s.strip()]
+        page = pager(
+            statuses=statuses or None,
+            agency=request.args.get("agency", "").strip(),
+            updated_since=parse_since(since) if since else None,
+            cursor=request.args.get("cursor", "").strip(),
+            limit=int(request.args.get("limit", "100")),
+        )
+    except ValueError as e:
+        return api_response(error=str(e), status=400)
+    page["count"] = len(page["items"])
+    return api_response(page)
+
+
+@bp.route("/api/v1/rfqs")
+@auth_required
+@safe_route
+def api_v1_list_rfqs():
+    """RFQs, cursor-paginated in change order — see _v1_page.
+    Returns: api_response({items, next_cursor, has_more, count})
+    Auth: X-API-Key or Basic Auth.
+    """
+    from src.core.dal import page_rfqs
+    return _v1_page(page_rfqs)
+
+
+@bp.route("/api/v1/pcs")
+@auth_required
+@safe_route
+def api_v1_list_pcs():
+    """Price checks, cursor-paginated in change order — see _v1_page."""
+    from src.core.dal import page_pcs
+    return _v1_page(page_pcs)
+
+
+@bp.route("/api/v1/orders")
+@auth_required
+@safe_route
+def api_v1_list_orders():
+    """Orders, cursor-paginated in change order — see _v1_page."""
+    from src.core.dal import page_orders
+    return _v1_page(page_orders)
+
+
 @bp.route("/rfq/new")
 @auth_required
 @safe_page
@@ -341,10 +390,13 @@ def api_v1_health():
         # Queue depths from DAL
         queues = {"rfqs_new": 0, "pcs_new": 0, "orders_active": 0}
         try:
-            from src.core.dal import list_rfqs, list_pcs, list_orders
-            queues["rfqs_new"] = len(list_rfqs(status="new"))
-            queues["pcs_new"] = len(list_pcs(status="parsed"))
-            queues["orders_active"] = len(list_orders(status="new")) + len(list_orders(status="active"))
+            from src.core.dal import (
+                count_rfqs_by_status, count_pcs_by_status, count_orders_by_status,
+            )
+            order_counts = count_orders_by_status()
+            queues["rfqs_new"] = count_rfqs_by_status().get("new", 0)
+            queues["pcs_new"] = count_pcs_by_status().get("parsed", 0)
+            queues["orders_active"] = order_counts.get("new", 0) + order_counts.get("active", 0)
         except Exception as _e:
             log.debug('suppressed in api_v1_health: %s', _e)
 
@@ -2064,10 +2116,11 @@ def api_v1_populate_catalog():
 @auth_required
 @safe_route
 def api_v1_buyers_refresh():
-    """Rebuild all buyer profiles from FI$Cal data."""
+    """Refresh buyer profiles whose FI$Cal POs changed (?full=true: all)."""
     from src.agents.buyer_intelligence import refresh_buyer_profiles
-    count = refresh_buyer_profiles()
-    return api_response({"buyers_updated": count})
+    full = request.args.get("full", "false").lower() == "true"
+    count = refresh_buyer_profiles(full=full)
+    return api_response({"buyers_updated": count, "full": full})
 
 
 @bp.route("/api/v1/buyers/prospects")
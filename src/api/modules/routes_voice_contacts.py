@@ -754,9 +754,8 @@ def contacts_page():
     # Also pull from growth prospects if contacts store is empty
     if not contacts_dict and GROWTH_AVAILABLE:
         try:
-            from src.agents.growth_agent import _load_json, PROSPECTS_FILE
-            pd = _load_json(PROSPECTS_FILE)
-            prospects = pd.get("prospects",[]) if isinstance(pd,dict) else []
+            from src.agents.growth_agent import load_prospects_data
+            prospects = load_prospects_data()["prospects"]
             for p in prospects[:200]:
                 cid = p.get("id","")
                 if cid:
@@ -777,18 +777,17 @@ def system_health_check() -> dict:
     else:
         health["components"]["won_quotes_kb"] = {"status": "empty"}
 
-    # Check research cache
-    cache_file = os.path.join(DATA_DIR, "product_research_cache.json")
-    if os.path.exists(cache_file):
-        try:
-            with open(cache_file) as f:
-                cache = json.load(f)
-            health["components"]["research_cache"] = {
-                "entries": len(cache),
-                "status": "ok",
-            }
-        except Exception:
-            health["components"]["research_cache"] = {"status": "corrupt"}
+    # Check research cache (research_cache table, all namespaces)
+    try:
+        from src.core.research_cache import all_stats
+        namespaces = all_stats()
+        health["components"]["research_cache"] = {
+            "entries": sum(n["entries"] for n in namespaces.values()),
+            "namespaces": namespaces,
+            "status": "ok",
+        }
+    except Exception:
+        health["components"]["research_cache"] = {"status": "error"}
 
     # Audit stats
     health["processing_stats"] = get_audit_stats()
@@ -0,0 +1,346 @@
+"""boot_tasks.py — watermark ledger for deferred-init maintenance jobs.
+
+`app._deferred_init` runs a list of full-table backfills on every deploy
+and on every gunicorn `--max-requests` worker recycle: PC dedup, the
+quotes/PC JSON↔SQLite syncs, the catalog junk-pn / placeholder-ASIN
+scrubs, the SCPRS price-stats rollup and the CS-draft purges. After their
+first run they are idempotent no-ops, but each still scans its table (or
+json.loads a multi-MB file) and competes for the write lock while the
+site is warming up.
+
+This module records, per task, a watermark of the task's inputs taken
+at the end of the boot pass it last ran (or was skipped) in:
+
+    table_source("quotes")          COUNT(*), MAX(rowid), MAX(updated_at)
+    file_source("price_checks.json")  mtime + size, sha1 when those moved
+    daily_source()                  today's date (age-based purges)
+
+On the next boot the task is skipped when every source still reads the
+same. Marks are taken after the whole pass, not after each task, so one
+task rewriting another's inputs (dedup rewrites the PCs the sync reads)
+doesn't make that task re-run next boot. A task with no sources always runs; bumping a task's `version`
+forces one re-run (do that when the task's logic changes).
+
+Only one process runs the ledger at a time: an in-process lock plus a
+lease row in SQLite, so two workers booting together don't both scan.
+Per-task duration, outcome and skip counts land in `boot_task_ledger`
+and are surfaced on `/api/health`.
+
+Usage:
+    from src.core.boot_tasks import BootTask, file_source, table_source, run_boot_tasks
+
+    run_boot_tasks([
+        BootTask("boot_sync_pcs", _boot_sync_pcs,
+                 sources=(file_source("price_checks.json"), table_source("price_checks"))),
+    ])
+
+Env:
+    BOOT_TASKS_FORCE=1 — ignore watermarks and run everything.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Sequence
+
+log = logging.getLogger("reytech.boot_tasks")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS boot_task_ledger (
+    name            TEXT PRIMARY KEY,
+    version         TEXT,
+    watermark       TEXT,
+    status          TEXT,
+    last_run_at     TEXT,
+    last_checked_at TEXT,
+    duration_ms     INTEGER DEFAULT 0,
+    runs            INTEGER DEFAULT 0,
+    skips           INTEGER DEFAULT 0,
+    last_error      TEXT
+);
+CREATE TABLE IF NOT EXISTS boot_task_lease (
+    id          INTEGER PRIMARY KEY CHECK (id = 1),
+    holder      TEXT,
+    expires_at  REAL
+);
+"""
+
+# A crashed worker's lease expires so the next boot isn't locked out.
+LEASE_SECONDS = 30 * 60
+
+_run_lock = threading.Lock()
+_last_pass: dict = {}
+
+
+# ── Watermark sources ───────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class Source:
+    """One input of a boot task. `read(prev)` returns a JSON-able mark;
+    `prev` is the mark stored last time (lets file sources skip hashing)."""
+    label: str
+    read: Callable[[Optional[dict]], dict]
+
+
+def _data_path(name: str) -> str:
+    if os.path.isabs(name):
+        return name
+    from src.core.paths import DATA_DIR
+    return os.path.join(DATA_DIR, name)
+
+
+def file_source(name: str) -> Source:
+    """mtime/size fast path; sha1 only when either moved, so a rewrite with
+    identical content (save-on-load, `touch`) still counts as unchanged."""
+    def read(prev):
+        path = _data_path(name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return {"exists": False}
+        mark = {"exists": True, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+        if prev and prev.get("mtime_ns") == st.st_mtime_ns and prev.get("size") == st.st_size:
+            mark["sha1"] = prev.get("sha1", "")
+            return mark
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        mark["sha1"] = h.hexdigest()
+        return mark
+    return Source(f"file:{name}", read)
+
+
+def table_source(table: str, updated_col: str = "updated_at") -> Source:
+    """Row count + max rowid catch inserts/deletes; MAX(updated_col), when
+    the table has it, catches in-place updates."""
+    def read(prev):
+        from src.core.db import get_db
+        with get_db() as conn:
+            cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+            if not cols:
+                return {"exists": False}
+            upd = f", MAX({updated_col})" if updated_col in cols else ""
+            row = conn.execute(f"SELECT COUNT(*), MAX(rowid){upd} FROM {table}").fetchone()
+        mark = {"exists": True, "count": row[0], "max_rowid": row[1]}
+        if upd:
+            mark["max_updated"] = row[2]
+        return mark
+    return Source(f"table:{table}", read)
+
+
+def daily_source() -> Source:
+    """Changes once per UTC day — for purges keyed on row age."""
+    return Source("day", lambda prev: {"day": datetime.now(timezone.utc).date().isoformat()})
+
+
+def _file_unchanged(prev: dict, cur: dict) -> bool:
+    return prev.get("exists") == cur.get("exists") and prev.get("sha1") == cur.get("sha1")
+
+
+# ── Tasks ───────────────────────────────────────────────────────────────────
+
+@dataclass
+class BootTask:
+    """A deferred-init job. `sources=()` means "always run"."""
+    name: str
+    fn: Callable[[], object]
+    sources: Sequence[Source] = field(default_factory=tuple)
+    version: str = "1"
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _ensure_schema(conn) -> None:
+    conn.executescript(_SCHEMA)
+
+
+def _read_marks(task: BootTask, prev: dict) -> dict:
+    return {s.label: s.read((prev or {}).get(s.label)) for s in task.sources}
+
+
+def _unchanged(prev: dict, cur: dict) -> bool:
+    if set(prev) != set(cur):
+        return False
+    for label, mark in cur.items():
+        old = prev[label]
+        if label.startswith("file:"):
+            if not _file_unchanged(old, mark):
+                return False
+        elif old != mark:
+            return False
+    return True
+
+
+def _acquire_lease(holder: str) -> bool:
+    from src.core.db import get_db
+    now = time.time()
+    with get_db() as conn:
+        _ensure_schema(conn)
+        conn.execute("INSERT OR IGNORE INTO boot_task_lease (id, holder, expires_at) "
+                     "VALUES (1, '', 0)")
+        cur = conn.execute(
+            "UPDATE boot_task_lease SET holder=?, expires_at=? "
+            "WHERE id=1 AND (expires_at < ? OR holder=?)",
+            (holder, now + LEASE_SECONDS, now, holder))
+        return cur.rowcount == 1
+
+
+def _release_lease(holder: str) -> None:
+    from src.core.db import get_db
+    try:
+        with get_db() as conn:
+            conn.execute("UPDATE boot_task_lease SET expires_at=0 WHERE id=1 AND holder=?",
+                         (holder,))
+    except Exception as e:
+        log.debug("boot lease release: %s", e)
+
+
+def _load_ledger(name: str) -> Optional[dict]:
+    from src.core.db import get_db
+    with get_db() as conn:
+        row = conn.execute("SELECT * FROM boot_task_ledger WHERE name=?", (name,)).fetchone()
+    return dict(row) if row else None
+
+
+def _record(name: str, **cols) -> None:
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("INSERT OR IGNORE INTO boot_task_ledger (name) VALUES (?)", (name,))
+        sets = ", ".join(f"{k}=?" for k in cols)
+        conn.execute(f"UPDATE boot_task_ledger SET {sets} WHERE name=?",
+                     (*cols.values(), name))
+
+
+def _run_one(task: BootTask, force: bool):
+    """Skip or run `task`; return (result, prev watermark). The new
+    watermark is written later by _stamp, once the whole pass is done."""
+    entry = _load_ledger(task.name) or {}
+    prev = {}
+    if entry.get("watermark") and entry.get("version") == task.version:
+        try:
+            prev = json.loads(entry["watermark"])
+        except (TypeError, ValueError):
+            prev = {}
+
+    if task.sources and prev and not force:
+        try:
+            before = _read_marks(task, prev)
+        except Exception as e:
+            log.debug("boot task %s: watermark read failed, running: %s", task.name, e)
+            before = None
+        if before is not None and _unchanged(prev, before):
+            _record(task.name, status="skipped", last_checked_at=_now_iso(),
+                    skips=(entry.get("skips") or 0) + 1)
+            return {"name": task.name, "status": "skipped", "duration_ms": 0}, prev
+
+    t0 = time.monotonic()
+    status, error = "ok", None
+    try:
+        task.fn()
+    except Exception as e:
+        status, error = "error", str(e)[:500]
+        log.warning("Boot task %s failed: %s", task.name, e)
+    duration_ms = int((time.monotonic() - t0) * 1000)
+
+    _record(task.name, status=status, version=task.version, last_run_at=_now_iso(),
+            last_checked_at=_now_iso(), duration_ms=duration_ms,
+            runs=(entry.get("runs") or 0) + 1, last_error=error)
+    log.info("Boot task %s: %s in %dms", task.name, status, duration_ms)
+    return {"name": task.name, "status": status, "duration_ms": duration_ms}, prev
+
+
+def _stamp(task: BootTask, prev: dict) -> None:
+    """Store the task's watermark as of the end of the pass. The tasks
+    may rewrite their own (and each other's) inputs — dedup rewrites
+    price_checks.json — and that settled state is what the next boot must
+    compare against. Failed runs are not stamped, so they retry."""
+    try:
+        mark = json.dumps(_read_marks(task, prev), default=str)
+    except Exception as e:
+        log.debug("boot task %s: end-of-pass watermark failed: %s", task.name, e)
+        mark = None
+    _record(task.name, watermark=mark, version=task.version)
+
+
+def run_boot_tasks(tasks: List[BootTask], force: Optional[bool] = None) -> dict:
+    """Run `tasks` in order, skipping those whose inputs are unchanged.
+
+    Returns {"ran": [...], "skipped": [...], "failed": [...],
+    "duration_ms": int} — or {"locked": True} when another thread or
+    process holds the ledger.
+    """
+    if force is None:
+        force = os.environ.get("BOOT_TASKS_FORCE", "").lower() in ("1", "true", "yes")
+    if not _run_lock.acquire(blocking=False):
+        log.info("Boot tasks already running in this process — skipping")
+        return {"locked": True}
+    holder = f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+    try:
+        try:
+            if not _acquire_lease(holder):
+                log.info("Boot tasks held by another worker — skipping")
+                return {"locked": True}
+        except Exception as e:
+            log.warning("Boot task lease unavailable (%s) — running unguarded", e)
+        t0 = time.monotonic()
+        summary = {"ran": [], "skipped": [], "failed": [], "results": []}
+        settled = []        # (task, prev watermark) to stamp after the pass
+        for task in tasks:
+            try:
+                res, prev = _run_one(task, force)
+                if res["status"] in ("ok", "skipped") and task.sources:
+                    settled.append((task, prev))
+            except Exception as e:
+                # Ledger itself broken (DB unavailable) — still run the task.
+                log.warning("Boot ledger error for %s (%s) — running directly", task.name, e)
+                try:
+                    task.fn()
+                    res = {"name": task.name, "status": "ok", "duration_ms": None}
+                except Exception as te:
+                    log.warning("Boot task %s failed: %s", task.name, te)
+                    res = {"name": task.name, "status": "error", "duration_ms": None}
+            summary["results"].append(res)
+            bucket = {"ok": "ran", "skipped": "skipped"}.get(res["status"], "failed")
+            summary[bucket].append(task.name)
+        for task, prev in settled:
+            try:
+                _stamp(task, prev)
+            except Exception as e:
+                log.warning("Boot ledger error stamping %s: %s", task.name, e)
+        summary["duration_ms"] = int((time.monotonic() - t0) * 1000)
+        summary["finished_at"] = _now_iso()
+        _last_pass.clear()
+        _last_pass.update(summary)
+        log.info("Boot tasks: %d ran, %d skipped, %d failed in %dms",
+                 len(summary["ran"]), len(summary["skipped"]),
+                 len(summary["failed"]), summary["duration_ms"])
+        return summary
+    finally:
+        _release_lease(holder)
+        _run_lock.release()
+
+
+def boot_task_summary() -> dict:
+    """Ledger rows + this process's last pass, for `/api/health`."""
+    out = {"last_pass": {k: v for k, v in _last_pass.items() if k != "results"},
+           "tasks": []}
+    try:
+        from src.core.db import get_db
+        with get_db() as conn:
+            _ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT name, status, last_run_at, last_checked_at, duration_ms, "
+                "runs, skips, last_error FROM boot_task_ledger ORDER BY name").fetchall()
+        out["tasks"] = [dict(r) for r in rows]
+    except Exception as e:
+        out["error"] = str(e)[:200]
+    return out
@@ -0,0 +1,255 @@
+"""change_feed.py — keyset (cursor) pagination in change order over rfqs,
+price_checks and orders, for the /api/v1 list endpoints and the MCP tools.
+
+External agents used to see these collections only through handlers that
+load everything and filter in memory, so a large collection timed out and
+"what changed since I last looked?" meant refetching it all. Instead every
+write to a record table stamps one row in `record_changes` (kind, id,
+changed_at — epoch seconds, UTC) from AFTER INSERT / UPDATE / DELETE
+triggers — so every writer, including raw `UPDATE ... SET status` calls,
+moves the record — and (kind, changed_at, id) is indexed.
+
+The stamp lives beside the record rather than in it: a trigger that
+updated its own row would re-fire every other AFTER UPDATE trigger on the
+table (the dashboard snapshot's among them). A delete leaves its row
+behind as a tombstone.
+
+A page is one range read on that index joined back to the record:
+
+    WHERE kind = :table AND (changed_at, id) > (:cursor_ts, :cursor_id)
+          [AND filters]
+    ORDER BY changed_at, id LIMIT :n
+
+Ordering by change rather than by creation means a record edited while a
+client is paging moves past the client's position and shows up again on a
+later page instead of being skipped, and the cursor from the last page
+stays valid: polling with it returns only records written since.
+
+The same stamps feed tables derived from the records (the dashboard
+funnel, the deadline index): `drain()` hands a consumer every record
+changed since its mark in `record_consumers`, so each derived table
+re-reads only what was written since it last looked, without triggers of
+its own.
+
+The schema is installed by db.init_db (`install_schema`).
+
+Usage:
+    from src.core import change_feed
+
+    with get_db() as conn:
+        rows, next_cursor, has_more = change_feed.page(
+            conn, "rfqs", statuses=["new"], updated_since=ts, cursor=c)
+"""
+
+import base64
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple
+
+log = logging.getLogger("reytech.change_feed")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+_NOW_SQL = "((julianday('now') - 2440587.5) * 86400.0)"
+
+# table -> timestamp expression used to backfill record_changes on install
+TABLES = {
+    "rfqs": "COALESCE(updated_at, received_at)",
+    "price_checks": "created_at",
+    "orders": "COALESCE(updated_at, created_at)",
+}
+
+# Guard for a write derived from a drained record, params (kind, id,
+# changed_at): it lands only while that stamp is still the record's
+# latest, so a drain that read an older version — in another worker, or
+# before a racing write — can't overwrite a newer one or revive a delete.
+CURRENT_SQL = ("EXISTS (SELECT 1 FROM record_changes "
+               "WHERE kind = ? AND id = ? AND changed_at = ?)")
+
+
+def _stamp_sql(table: str, ref: str, cond: str = "") -> str:
+    # Strictly increasing per table (writes are serialized by SQLite), so a
+    # record that moves never lands on a tie behind an issued cursor — even
+    # two writes in the same millisecond, or a clock that steps back.
+    where = f"{ref}.id IS NOT NULL" + (f" AND {cond}" if cond else "")
+    return (
+        "INSERT INTO record_changes(kind, id, changed_at) "
+        f"SELECT '{table}', {ref}.id, MAX({_NOW_SQL}, COALESCE(("
+        f"SELECT MAX(changed_at) FROM record_changes WHERE kind = '{table}'), 0)"
+        f" + 0.000001) WHERE {where} "
+        "ON CONFLICT(kind, id) DO UPDATE SET changed_at = excluded.changed_at;")
+
+
+def _triggers_sql(table: str) -> List[Tuple[str, str]]:
+    """(name, CREATE TRIGGER sql) for `table`."""
+    # An id rename stamps the old id too, so consumers drop it.
+    rename = _stamp_sql(table, "OLD", "OLD.id IS NOT NEW.id")
+    return [
+        (f"cf_{table}_ai", f"CREATE TRIGGER cf_{table}_ai AFTER INSERT ON {table} "
+                           f"BEGIN {_stamp_sql(table, 'NEW')} END"),
+        (f"cf_{table}_au", f"CREATE TRIGGER cf_{table}_au AFTER UPDATE ON {table} "
+                           f"BEGIN {rename} {_stamp_sql(table, 'NEW')} END"),
+        (f"cf_{table}_ad", f"CREATE TRIGGER cf_{table}_ad AFTER DELETE ON {table} "
+                           f"BEGIN {_stamp_sql(table, 'OLD')} END"),
+    ]
+
+
+def install_schema(conn) -> None:
+    """Create (or update) the record_changes triggers — called by init_db
+    after the record_changes table exists.
+
+    A trigger is recreated only when its SQL differs from what's
+    installed; each (re)created table is backfilled from its rows' own
+    timestamps, keeping the stamp of rows already tracked. Databases
+    from the earlier design (a changed_at column on the record table,
+    stamped by a self-UPDATE) keep their stamps and lose the column.
+    """
+    for table, basis in TABLES.items():
+        cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+        if not cols:
+            log.debug("change feed on %s deferred: no table", table)
+            continue
+        installed = {r[0]: r[1] for r in conn.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type='trigger' "
+            "AND tbl_name=? AND name LIKE 'cf\\_%' ESCAPE '\\'", (table,))}
+        wanted = _triggers_sql(table)
+        if all(installed.get(name) == sql for name, sql in wanted):
+            continue
+        for name in installed:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for _name, sql in wanted:
+            conn.execute(sql)
+        if "changed_at" in cols:
+            basis = "NULL"
+            conn.execute(
+                "INSERT OR IGNORE INTO record_changes(kind, id, changed_at) "
+                f"SELECT '{table}', id, changed_at FROM {table} "
+                "WHERE id IS NOT NULL AND changed_at IS NOT NULL")
+        conn.execute(
+            "INSERT OR IGNORE INTO record_changes(kind, id, changed_at) "
+            f"SELECT '{table}', id, COALESCE((julianday({basis}) - 2440587.5) "
+            f"* 86400.0, 0) FROM {table} WHERE id IS NOT NULL")
+        if "changed_at" in cols:
+            conn.execute(f"DROP INDEX IF EXISTS idx_{table}_changed")
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN changed_at")
+        log.info("change feed triggers installed on %s", table)
+
+
+def encode_cursor(changed_at: float, record_id: str) -> str:
+    raw = json.dumps([changed_at, record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Inverse of encode_cursor. Raises ValueError on anything else."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        ts, record_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(ts), str(record_id)
+    except Exception as e:
+        raise ValueError(f"invalid cursor: {cursor[:40]!r}") from e
+
+
+def parse_since(value: str) -> float:
+    """`updated_since` as epoch seconds: a number, or an ISO date/datetime
+    (naive values are taken as UTC). Raises ValueError."""
+    value = (value or "").strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def page(conn, table: str, statuses: Optional[List[str]] = None,
+         agency: str = "", updated_since: Optional[float] = None,
+         cursor: str = "", limit: int = DEFAULT_LIMIT):
+    """One page of raw `table` rows in (changed_at, id) order.
+
+    Returns (rows, next_cursor, has_more). next_cursor points at the last
+    row returned (or echoes `cursor` for an empty page), so a client that
+    has drained the feed can keep polling with it for new changes.
+    Raises ValueError for an unknown table or a malformed cursor.
+    """
+    if table not in TABLES:
+        raise ValueError(f"no change feed for {table}")
+    limit = max(1, min(int(limit or DEFAULT_LIMIT), MAX_LIMIT))
+    where, params = ["c.kind = ?"], [table]
+    if cursor:
+        where.append("(c.changed_at, c.id) > (?, ?)")
+        params.extend(decode_cursor(cursor))
+    if updated_since is not None:
+        where.append("c.changed_at >= ?")
+        params.append(updated_since)
+    if statuses:
+        where.append(f"t.status IN ({','.join('?' * len(statuses))})")
+        params.extend(statuses)
+    if agency:
+        where.append("t.agency = ? COLLATE NOCASE")
+        params.append(agency)
+    # CROSS JOIN pins record_changes as the outer loop, so the page walks
+    # idx_record_changes_at in order instead of sorting a status match.
+    sql = (f"SELECT t.*, c.changed_at AS changed_at FROM record_changes c "
+           f"CROSS JOIN {table} t ON t.id = c.id "
+           f"WHERE {' AND '.join(where)} ORDER BY c.changed_at, c.id LIMIT ?")
+    rows = conn.execute(sql, params + [limit + 1]).fetchall()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    if rows:
+        cursor = encode_cursor(rows[-1]["changed_at"], rows[-1]["id"])
+    return rows, cursor, has_more
+
+
+def _seen_at(conn, consumer: str, table: str) -> float:
+    row = conn.execute(
+        "SELECT seen_at FROM record_consumers WHERE consumer=? AND kind=?",
+        (consumer, table)).fetchone()
+    return row[0] if row else -1.0
+
+
+def drain(conn, consumer: str, table: str,
+          handle: Callable[[str, float, Optional[dict]], None]) -> int:
+    """Call `handle(id, changed_at, row)` for every `table` record written
+    since `consumer` last drained, oldest first, then advance its mark.
+
+    `row` is the raw record as a dict, or None once it was deleted (or
+    renamed away). Writes made from `handle` should be guarded with
+    CURRENT_SQL. A record written while this runs is stamped past the
+    last one handled, so the next drain picks it up. Returns how many
+    records were handled.
+    """
+    if table not in TABLES:
+        raise ValueError(f"no change feed for {table}")
+    rows = conn.execute(
+        "SELECT c.id AS _cf_id, c.changed_at AS _cf_at, t.* FROM record_changes c "
+        f"LEFT JOIN {table} t ON t.id = c.id "
+        "WHERE c.kind = ? AND c.changed_at > ? ORDER BY c.changed_at",
+        (table, _seen_at(conn, consumer, table))).fetchall()
+    for r in rows:
+        d = dict(r)
+        rid, at = d.pop("_cf_id"), d.pop("_cf_at")
+        handle(rid, at, d if d.get("id") is not None else None)
+    if rows:
+        conn.execute(
+            "INSERT INTO record_consumers(consumer, kind, seen_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(consumer, kind) DO UPDATE SET "
+            "seen_at = MAX(seen_at, excluded.seen_at)",
+            (consumer, table, rows[-1]["_cf_at"]))
+    return len(rows)
+
+
+def pending(conn, consumer: str, table: str) -> int:
+    """How many `table` records `consumer` has yet to drain."""
+    return conn.execute(
+        "SELECT COUNT(*) FROM record_changes WHERE kind = ? AND changed_at > ?",
+        (table, _seen_at(conn, consumer, table))).fetchone()[0]
+
+
+def reset(conn, consumer: str) -> None:
+    """Forget `consumer`'s marks so its next drain revisits every record."""
+    conn.execute("DELETE FROM record_consumers WHERE consumer=?", (consumer,))
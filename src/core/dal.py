@@ -695,6 +695,14 @@ def _safe_json(raw, default=None):
         return default if default is not None else raw
 
 
+def _count_by_status(conn, table: str, where: str = "") -> dict:
+    """{status: n} for `table` — GROUP BY on the status index, no row decode."""
+    sql = f"SELECT status, COUNT(*) FROM {table}"
+    if where:
+        sql += f" WHERE {where}"
+    return {r[0]: r[1] for r in conn.execute(sql + " GROUP BY status")}
+
+
 def _get_actor() -> str:
     """Resolve the current actor for audit trail entries."""
     try:
@@ -770,17 +778,32 @@ def list_rfqs(status: str = None, limit: int = 500) -> list[dict]:
                 rows = conn.execute(
                     "SELECT * FROM rfqs ORDER BY received_at DESC LIMIT ?",
                     (limit,)).fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                d["items"] = _safe_json(d.get("items"), [])
-                result.append(d)
-            return result
+            return [_rfq_row(r) for r in rows]
     except Exception as e:
         log.error("list_rfqs(status=%s) failed: %s", status, e, exc_info=True)
         raise
 
 
+def _rfq_row(r) -> dict:
+    d = dict(r)
+    d["items"] = _safe_json(d.get("items"), [])
+    return d
+
+
+def count_rfqs_by_status() -> dict[str, int]:
+    """Count RFQs per status with one grouped query on idx_rfqs_status.
+    Input: none
+    Output: {status: count} over every row (no limit).
+    Side effects: None.
+    """
+    try:
+        with get_db() as conn:
+            return _count_by_status(conn, "rfqs")
+    except Exception as e:
+        log.error("count_rfqs_by_status failed: %s", e, exc_info=True)
+        raise
+
+
 # save_rfq() deleted 2026-04-30 (V1 DAL audit drift #1). It wrote a 12-col
 # subset of rfqs and silently dropped solicitation_number / due_date /
 # form_type / body_text on rollback. Canonical writer lives in
@@ -883,29 +906,55 @@ def list_pcs(status: str = None, limit: int = 500) -> list[dict]:
                 rows = conn.execute(
                     "SELECT * FROM price_checks ORDER BY created_at DESC LIMIT ?",
                     (limit,)).fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                d["items"] = _safe_json(d.get("items"), [])
-                # Unpack pc_data blob into top-level dict
-                pc_blob = d.get("pc_data", "")
-                if pc_blob and isinstance(pc_blob, str):
-                    try:
-                        import json as _json
-                        pc_data = _json.loads(pc_blob)
-                        if isinstance(pc_data, dict):
-                            for k, v in pc_data.items():
-                                if k not in d or not d[k]:
-                                    d[k] = v
-                    except (json.JSONDecodeError, TypeError) as _e:
-                        log.debug("suppressed: %s", _e)
-                result.append(d)
-            return result
+            return [_pc_row(r) for r in rows]
     except Exception as e:
         log.error("list_pcs(status=%s) failed: %s", status, e, exc_info=True)
         raise
 
 
+def _pc_row(r) -> dict:
+    d = dict(r)
+    d["items"] = _safe_json(d.get("items"), [])
+    # Unpack pc_data blob into top-level dict
+    pc_blob = d.get("pc_data", "")
+    if pc_blob and isinstance(pc_blob, str):
+        try:
+            pc_data = json.loads(pc_blob)
+            if isinstance(pc_data, dict):
+                for k, v in pc_data.items():
+                    if k not in d or not d[k]:
+                        d[k] = v
+        except (json.JSONDecodeError, TypeError) as _e:
+            log.debug("suppressed: %s", _e)
+    return d
+
+
+def count_pcs_by_status() -> dict[str, int]:
+    """Count price checks per status with one grouped query on idx_pc_status.
+    Input: none
+    Output: {status: count} over every row (no limit).
+    Side effects: None.
+
+    Matches list_pcs: a row whose status column is empty counts under the
+    status in its pc_data blob. Only those rows are decoded, in SQL.
+    """
+    try:
+        with get_db() as conn:
+            counts = _count_by_status(conn, "price_checks",
+                                      "status IS NOT NULL AND status != ''")
+            for r in conn.execute(
+                    "SELECT CASE WHEN json_valid(pc_data) "
+                    "THEN json_extract(pc_data, '$.status') END, status, COUNT(*) "
+                    "FROM price_checks WHERE status IS NULL OR status = '' "
+                    "GROUP BY 1, 2"):
+                key = r[0] if r[0] is not None else r[1]
+                counts[key] = counts.get(key, 0) + r[2]
+            return counts
+    except Exception as e:
+        log.error("count_pcs_by_status failed: %s", e, exc_info=True)
+        raise
+
+
 # save_pc() deleted 2026-04-30 (V1 DAL audit drift #1). 16-col subset writer
 # replaced by canonical src/api/data_layer.py:_save_single_pc.
 
@@ -982,22 +1031,36 @@ def list_orders(status: str = None, limit: int = 500) -> list[dict]:
                 rows = conn.execute(
                     "SELECT * FROM orders ORDER BY created_at DESC LIMIT ?",
                     (limit,)).fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                oid = d.get("id", "")
-                # Orders V2 phase 4: see get_order() above — read from
-                # normalized `items` column, not the data_json blob.
-                d.pop("data_json", None)
-                d["items"] = _safe_json(d.get("items"), [])
-                d["order_id"] = oid
-                result.append(d)
-            return result
+            return [_order_row(r) for r in rows]
     except Exception as e:
         log.error("list_orders(status=%s) failed: %s", status, e, exc_info=True)
         raise
 
 
+def _order_row(r) -> dict:
+    d = dict(r)
+    # Orders V2 phase 4: see get_order() above — read from
+    # normalized `items` column, not the data_json blob.
+    d.pop("data_json", None)
+    d["items"] = _safe_json(d.get("items"), [])
+    d["order_id"] = d.get("id", "")
+    return d
+
+
+def count_orders_by_status() -> dict[str, int]:
+    """Count orders per status with one grouped query on idx_orders_status.
+    Input: none
+    Output: {status: count} over every row (no limit).
+    Side effects: None.
+    """
+    try:
+        with get_db() as conn:
+            return _count_by_status(conn, "orders")
+    except Exception as e:
+        log.error("count_orders_by_status failed: %s", e, exc_info=True)
+        raise
+
+
 # save_order() deleted 2026-04-30 (V1 DAL audit drift #1). 13-col subset
 # writer replaced by src/core/order_dal.py:save_order (20-col canonical
 # writer with the PR #664 ensure_quote_won_for_order hook).
@@ -1037,6 +1100,46 @@ def update_order_status(order_id: str, status: str, actor: str = "system") -> bo
         raise
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# Change-ordered pages (/api/v1/rfqs, /pcs, /orders — see core/change_feed.py)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _page(table: str, decode, statuses=None, agency: str = "",
+          updated_since: float = None, cursor: str = "", limit: int = 100) -> dict:
+    from src.core import change_feed
+    with get_db() as conn:
+        rows, next_cursor, has_more = change_feed.page(
+            conn, table, statuses=statuses, agency=agency,
+            updated_since=updated_since, cursor=cursor, limit=limit)
+    return {"items": [decode(r) for r in rows],
+            "next_cursor": next_cursor, "has_more": has_more}
+
+
+def page_rfqs(statuses: list = None, agency: str = "", updated_since: float = None,
+              cursor: str = "", limit: int = 100) -> dict:
+    """One page of RFQs in change order (oldest change first).
+    Input: statuses (list), agency (case-insensitive), updated_since (epoch
+           seconds), cursor (from a previous page), limit (max 500)
+    Output: {"items": [rfq dicts as list_rfqs], "next_cursor": str, "has_more": bool}
+    Side effects: None. Raises ValueError on a malformed cursor.
+    """
+    return _page("rfqs", _rfq_row, statuses, agency, updated_since, cursor, limit)
+
+
+def page_pcs(statuses: list = None, agency: str = "", updated_since: float = None,
+             cursor: str = "", limit: int = 100) -> dict:
+    """One page of price checks in change order — see page_rfqs.
+    Output items are shaped as list_pcs (pc_data merged in)."""
+    return _page("price_checks", _pc_row, statuses, agency, updated_since, cursor, limit)
+
+
+def page_orders(statuses: list = None, agency: str = "", updated_since: float = None,
+                cursor: str = "", limit: int = 100) -> dict:
+    """One page of orders in change order — see page_rfqs.
+    Output items are shaped as list_orders."""
+    return _page("orders", _order_row, statuses, agency, updated_since, cursor, limit)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # LineItem Entity
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1687,30 +1790,46 @@ def log_lifecycle_event(entity_type, entity_id, event_type, summary,
         return False
 
 
-def get_lifecycle_events(entity_type, entity_id, limit=100):
-    """Get lifecycle events for an entity, newest first."""
+def get_lifecycle_events(entity_type, entity_id, limit=100,
+                         include_archive=False):
+    """Get lifecycle events for an entity, newest first.
+
+    include_archive=True also reads the monthly archive files that
+    db_retention's archive mode moved old events into (full audit views).
+    """
     try:
         with get_db() as conn:
+            if include_archive:
+                from src.core.db_retention import archive_files, query_archives, _archive_dir
+                if archive_files(_archive_dir(conn, None)):
+                    rows = query_archives(conn, "lifecycle_events", """
+                        SELECT * FROM {view}
+                        WHERE entity_type = ? AND entity_id = ?
+                        ORDER BY occurred_at DESC LIMIT ?
+                    """, (entity_type, entity_id, limit))
+                    rows.sort(key=lambda r: r["occurred_at"] or "", reverse=True)
+                    return [_decode_lifecycle_row(r) for r in rows[:limit]]
             rows = conn.execute("""
                 SELECT * FROM lifecycle_events
                 WHERE entity_type = ? AND entity_id = ?
                 ORDER BY occurred_at DESC LIMIT ?
             """, (entity_type, entity_id, limit)).fetchall()
-            result = []
-            for r in rows:
-                d = dict(r)
-                if d.get("detail_json"):
-                    try:
-                        d["detail"] = json.loads(d["detail_json"])
-                    except Exception:
-                        d["detail"] = d["detail_json"]
-                result.append(d)
-            return result
+            return [_decode_lifecycle_row(r) for r in rows]
     except Exception as e:
         log.error("get_lifecycle_events failed: %s", e)
         return []
 
 
+def _decode_lifecycle_row(r):
+    d = dict(r)
+    if d.get("detail_json"):
+        try:
+            d["detail"] = json.loads(d["detail_json"])
+        except Exception:
+            d["detail"] = d["detail_json"]
+    return d
+
+
 def get_qa_effectiveness_metrics(days=90):
     """Aggregate QA effectiveness metrics from lifecycle_events.
 
@@ -0,0 +1,312 @@
+"""dashboard_snapshot.py — incrementally maintained home-dashboard sections.
+
+`/api/dashboard/init` used to rebuild every widget from scratch —
+load_rfqs, _load_price_checks, orders, quotes — and hold the result in a
+process-local dict for 90s. Every deploy and `--max-requests` recycle
+threw that away, the first request after expiry paid the full rebuild,
+and for up to 90s after a write the home page showed old numbers.
+
+The snapshot lives in reytech.db instead, kept current by the writes
+themselves:
+
+    dashboard_snapshot  — one row per widget section: cached JSON, the
+                          source tables it reads, and a `version` that
+                          SQL triggers on those tables bump on every
+                          INSERT/UPDATE/DELETE. A section whose
+                          `built_version` trails `version` is stale.
+    dash_record_state   — one row per PC / RFQ with the funnel bucket it
+                          last classified into, drained from the change
+                          feed (core/change_feed.py), so the funnel counts
+                          are a GROUP BY over a small table plus a
+                          reclassify of whatever changed since the last
+                          read — never a full load of every record.
+
+Because the triggers fire inside the writer's own transaction, every
+write path (data_layer, order_dal, raw SQL in scripts) invalidates
+exactly what it touched, and the snapshot survives restarts.
+
+Triggers sit only on SOURCE_TABLES — the record, order/quote, outbox,
+revenue, growth and SCPRS pull-schedule tables the sections read. The
+bulk-ingest tables (BULK_TABLES: SCPRS POs, won quotes, contacts, the
+award-check log) take hundreds to tens of thousands of rows per run, so
+they carry no trigger; their harvesters call `mark_dirty()` once a run
+has committed. A TTL covers what no write can signal (rolling "last 24h"
+windows, JSON-file fallbacks, one-off contact edits): past it the section
+is rebuilt before responding, exactly like a version bump, so a read
+never returns data older than the section's TTL.
+
+The tables live in db.SCHEMA; init_db installs the triggers
+(`install_schema`).
+
+Usage:
+    from src.core import dashboard_snapshot as snap
+
+    sections = snap.read_sections({
+        "metrics": (build_metrics, 600, ("quotes", "orders")),
+    })
+    counts = snap.funnel_counts({"price_checks": classify_pc,
+                                 "rfqs": classify_rfq})
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core import change_feed
+
+log = logging.getLogger("reytech.dashboard_snapshot")
+
+# Tables whose writes bump section versions (all created by init_db).
+SOURCE_TABLES = (
+    "price_checks", "rfqs", "orders", "quotes",
+    "email_outbox", "revenue_log",
+    "growth_prospects", "growth_outreach", "growth_outreach_entries",
+    "scprs_pull_schedule",
+)
+# Section sources without triggers — invalidated by mark_dirty().
+BULK_TABLES = ("scprs_po_master", "scprs_po_lines", "won_quotes", "contacts",
+               "award_tracker_log")
+
+_BUMP = ("UPDATE dashboard_snapshot SET version = version + 1 "
+         "WHERE instr(sources, ',{t},') > 0;")
+FUNNEL = "dashboard_funnel"      # change-feed consumer name
+
+_section_locks: Dict[str, threading.Lock] = {}
+_section_locks_guard = threading.Lock()
+
+_stats_lock = threading.Lock()
+_counters = {"reads": 0, "rebuilds": 0, "expired": 0, "reclassified": 0}
+
+Builder = Tuple[Callable[[], object], float, tuple]
+
+
+def _conn():
+    from src.core.db import get_db
+    return get_db()
+
+
+def _bump(field: str, n: int = 1) -> None:
+    with _stats_lock:
+        _counters[field] += n
+
+
+def _triggers_sql(table: str) -> List[Tuple[str, str]]:
+    """(name, CREATE TRIGGER sql) for `table`."""
+    bump = _BUMP.format(t=table)
+    return [
+        (f"dash_{table}_{suffix}", f"CREATE TRIGGER dash_{table}_{suffix} "
+                                   f"AFTER {event} ON {table} BEGIN {bump} END")
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+    ]
+
+
+def install_schema(conn) -> None:
+    """Create (or update) the source-table triggers — called by init_db
+    after the snapshot tables exist.
+
+    A trigger is recreated only when its SQL differs from what's
+    installed, and tables no longer in SOURCE_TABLES lose theirs; any
+    (re)installed table bumps the sections that read it. A funnel table
+    from the earlier per-row ver/built_ver design loses those columns.
+    """
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(dash_record_state)")}
+    if "ver" in cols:
+        conn.execute("DROP INDEX IF EXISTS idx_dash_record_dirty")
+        conn.execute("ALTER TABLE dash_record_state DROP COLUMN ver")
+        conn.execute("ALTER TABLE dash_record_state DROP COLUMN built_ver")
+    installed: Dict[str, Dict[str, str]] = {}
+    for r in conn.execute(
+            "SELECT name, tbl_name, sql FROM sqlite_master WHERE type='trigger' "
+            "AND name LIKE 'dash\\_%' ESCAPE '\\'").fetchall():
+        installed.setdefault(r[1], {})[r[0]] = r[2]
+    for table in set(installed) - set(SOURCE_TABLES):
+        for name in installed[table]:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        log.info("dashboard triggers removed from %s", table)
+    for table in SOURCE_TABLES:
+        if not conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' "
+                            "AND name=?", (table,)).fetchone():
+            log.debug("dashboard triggers on %s deferred: no table", table)
+            continue
+        have = installed.get(table, {})
+        wanted = _triggers_sql(table)
+        if all(have.get(name) == sql for name, sql in wanted):
+            continue
+        for name in have:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for _name, sql in wanted:
+            conn.execute(sql)
+        conn.execute(_BUMP.format(t=table))
+        log.info("dashboard triggers installed on %s", table)
+
+
+def _section_lock(name: str) -> threading.Lock:
+    with _section_locks_guard:
+        return _section_locks.setdefault(name, threading.Lock())
+
+
+def _register(conn, name: str, sources: tuple) -> None:
+    src = "," + ",".join(sources) + ","
+    conn.execute(
+        "INSERT INTO dashboard_snapshot(section, sources) VALUES (?, ?) "
+        "ON CONFLICT(section) DO UPDATE SET sources = excluded.sources, "
+        "version = version + (sources != excluded.sources)",
+        (name, src))
+
+
+def _rebuild(name: str, builder: Builder) -> object:
+    """Build one section and store it under the version read beforehand,
+    so a write that lands mid-build leaves the section dirty."""
+    fn, _ttl, sources = builder
+    with _conn() as conn:
+        _register(conn, name, sources)
+        version = conn.execute(
+            "SELECT version FROM dashboard_snapshot WHERE section=?",
+            (name,)).fetchone()[0]
+    t0 = time.time()
+    data = fn()
+    ms = round((time.time() - t0) * 1000)
+    with _conn() as conn:
+        conn.execute(
+            "UPDATE dashboard_snapshot SET data_json=?, built_version=?, "
+            "built_at=?, build_ms=? WHERE section=?",
+            (json.dumps(data, default=str), version, time.time(), ms, name))
+    _bump("rebuilds")
+    log.debug("dashboard section %s rebuilt in %dms (v%d)", name, ms, version)
+    return data
+
+
+def _current(row, src: str, ttl: float) -> bool:
+    """True if a snapshot row can be served: built, at its latest version,
+    for the same sources, and younger than `ttl` (0 = no expiry)."""
+    return (row is not None and row["data_json"] is not None
+            and row["version"] == row["built_version"]
+            and row["sources"] == src
+            and not (ttl and time.time() - row["built_at"] > ttl))
+
+
+def read_sections(builders: Dict[str, Builder]) -> Dict[str, object]:
+    """Return {section: data} for every builder, from the snapshot.
+
+    `builders` maps section name → (build_fn, ttl_seconds, source_tables).
+    Missing, version-stale and TTL-expired sections are rebuilt before
+    returning (one builder at a time per section across threads). A
+    builder that raises yields `{"ok": False, "error": ...}` for that
+    section only.
+    """
+    _bump("reads")
+    with _conn() as conn:
+        rows = {r["section"]: r for r in conn.execute(
+            "SELECT section, sources, data_json, version, built_version, "
+            "built_at FROM dashboard_snapshot").fetchall()}
+    out = {}
+    for name, builder in builders.items():
+        _fn, ttl, sources = builder
+        row = rows.get(name)
+        src = "," + ",".join(sources) + ","
+        if _current(row, src, ttl):
+            out[name] = json.loads(row["data_json"])
+            continue
+        try:
+            with _section_lock(name):
+                with _conn() as conn:
+                    again = conn.execute(
+                        "SELECT sources, data_json, version, built_version, built_at "
+                        "FROM dashboard_snapshot WHERE section=?",
+                        (name,)).fetchone()
+                if _current(again, src, ttl):
+                    # Another request rebuilt it while we waited.
+                    out[name] = json.loads(again["data_json"])
+                else:
+                    if _current(again, src, 0):
+                        _bump("expired")
+                    out[name] = _rebuild(name, builder)
+        except Exception as e:
+            log.warning("dashboard section %s rebuild failed: %s", name, e)
+            out[name] = {"ok": False, "error": str(e)}
+    return out
+
+
+def funnel_counts(classifiers: Dict[str, Callable[[dict], Optional[str]]]) -> Dict[str, int]:
+    """Reclassify changed PC / RFQ rows, then return {bucket: count}.
+
+    `classifiers` maps a record table to `fn(row_dict) -> bucket or None`
+    (None = not counted). Only rows written since the last call are read
+    from the source table (change_feed.drain); rows whose source is gone
+    are dropped.
+    """
+    def apply(conn, table, classify):
+        def handle(rid, at, row):
+            current = (table, rid, at)
+            if row is None:
+                conn.execute("DELETE FROM dash_record_state WHERE kind=? AND id=? "
+                             f"AND {change_feed.CURRENT_SQL}", (table, rid) + current)
+                return
+            try:
+                bucket = classify(row)
+            except Exception as e:
+                log.debug("funnel classify %s/%s: %s", table, rid, e)
+                bucket = None
+            conn.execute(
+                "INSERT INTO dash_record_state(kind, id, bucket) SELECT ?, ?, ? "
+                f"WHERE {change_feed.CURRENT_SQL} "
+                "ON CONFLICT(kind, id) DO UPDATE SET bucket = excluded.bucket",
+                (table, rid, bucket) + current)
+        return handle
+
+    with _conn() as conn:
+        for table, classify in classifiers.items():
+            n = change_feed.drain(conn, FUNNEL, table, apply(conn, table, classify))
+            if n:
+                _bump("reclassified", n)
+        rows = conn.execute(
+            "SELECT bucket, COUNT(*) AS n FROM dash_record_state "
+            "WHERE bucket IS NOT NULL GROUP BY bucket").fetchall()
+    return {r["bucket"]: r["n"] for r in rows}
+
+
+def mark_dirty(*tables: str) -> None:
+    """Bump every section that reads one of `tables` — for BULK_TABLES,
+    whose harvesters call this once a run has committed instead of paying
+    a trigger per ingested row. Best-effort: a failure only leaves the
+    sections to their TTL."""
+    try:
+        with _conn() as conn:
+            for table in tables:
+                conn.execute("UPDATE dashboard_snapshot SET version = version + 1 "
+                             "WHERE instr(sources, ?) > 0", (f",{table},",))
+    except Exception as e:
+        log.debug("dashboard mark_dirty %s: %s", tables, e)
+
+
+def invalidate(section: Optional[str] = None) -> None:
+    """Force a rebuild of one section (or all) on the next read."""
+    with _conn() as conn:
+        if section:
+            conn.execute("UPDATE dashboard_snapshot SET version = version + 1 "
+                         "WHERE section=?", (section,))
+        else:
+            conn.execute("UPDATE dashboard_snapshot SET version = version + 1")
+            change_feed.reset(conn, FUNNEL)
+
+
+def snapshot_stats() -> dict:
+    """Per-section freshness and build cost, plus read/rebuild counters."""
+    with _stats_lock:
+        counters = dict(_counters)
+    try:
+        with _conn() as conn:
+            sections = {
+                r["section"]: {"stale": r["version"] != r["built_version"],
+                               "age_s": round(time.time() - r["built_at"]) if r["built_at"] else None,
+                               "build_ms": r["build_ms"]}
+                for r in conn.execute(
+                    "SELECT section, version, built_version, built_at, build_ms "
+                    "FROM dashboard_snapshot").fetchall()}
+            records = conn.execute(
+                "SELECT COUNT(*) FROM dash_record_state").fetchone()[0]
+    except Exception as e:
+        return {"error": str(e), **counters}
+    return {"sections": sections, "records": records, **counters}
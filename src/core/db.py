@@ -140,6 +140,9 @@ _db_lock = threading.RLock()   # RLock: allows same-thread reentry (boot sync 
 # ── Thread-local connection pool ─────────────────────────────────────────────
 _local = threading.local()
 
+# Single-writer queue + read-only pool (opt-in via DB_WRITE_QUEUE=1)
+from src.core.db_writer import write, read_db
+
 
 def _make_connection():
     """Create and configure a new SQLite connection."""
@@ -161,6 +164,8 @@ def close_thread_db():
         except Exception as _e:
             log.debug("suppressed: %s", _e)
         _local.conn = None
+    from src.core.db_writer import close_thread_writer
+    close_thread_writer()
 
 
 # ── Connection factory ────────────────────────────────────────────────────────
@@ -211,13 +216,18 @@ def db_retry(fn, max_retries=3, delay=1.0):
     from src.core.external_call import with_retry
 
     def _is_lock_error(e: BaseException) -> bool:
-        return "database is locked" in str(e)
+        locked = "database is locked" in str(e)
+        if locked:
+            from src.core.db_writer import note_lock_error
+            note_lock_error(e)
+        return locked
 
     def _alert(exc: BaseException, attempts: int) -> None:
         # Only the locked-out path fired the original webhook. Any other
         # exception that reaches here got through `_is_lock_error` so
         # this is always a lock timeout in practice — but stay defensive.
-        if not _is_lock_error(exc):
+        # (Plain check: the error was already counted on its attempt.)
+        if "database is locked" not in str(exc):
             return
         try:
             from src.core.webhooks import fire_event
@@ -664,6 +674,51 @@ CREATE TABLE IF NOT EXISTS growth_outreach (
 CREATE INDEX IF NOT EXISTS idx_growth_outreach_status ON growth_outreach(status);
 CREATE INDEX IF NOT EXISTS idx_growth_outreach_created ON growth_outreach(created_at);
 
+-- One row per recipient of a growth_outreach campaign, so a bounce, reply
+-- or call flips one indexed row instead of rewriting every campaign.
+-- email is lowercased for lookups; data_json holds the entry as built.
+CREATE TABLE IF NOT EXISTS growth_outreach_entries (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id     TEXT NOT NULL,
+    prospect_id     TEXT DEFAULT '',
+    email           TEXT DEFAULT '',
+    email_sent      INTEGER DEFAULT 0,
+    staged          INTEGER DEFAULT 0,
+    data_json       TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_growth_entries_campaign ON growth_outreach_entries(campaign_id);
+CREATE INDEX IF NOT EXISTS idx_growth_entries_prospect ON growth_outreach_entries(prospect_id);
+CREATE INDEX IF NOT EXISTS idx_growth_entries_email ON growth_outreach_entries(email);
+
+-- growth_agent prospects (was growth_prospects.json). seq keeps list order;
+-- buyer_email is lowercased for dedupe and bounce lookups.
+CREATE TABLE IF NOT EXISTS growth_prospects (
+    id              TEXT PRIMARY KEY,
+    seq             INTEGER NOT NULL DEFAULT 0,
+    buyer_email     TEXT DEFAULT '',
+    agency          TEXT DEFAULT '',
+    outreach_status TEXT DEFAULT 'new',
+    updated_at      TEXT,
+    data_json       TEXT NOT NULL DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_growth_prospects_seq ON growth_prospects(seq);
+CREATE INDEX IF NOT EXISTS idx_growth_prospects_email ON growth_prospects(buyer_email);
+CREATE INDEX IF NOT EXISTS idx_growth_prospects_status ON growth_prospects(outreach_status);
+
+-- Per-prospect CRM timeline (was growth_timeline.json).
+CREATE TABLE IF NOT EXISTS growth_timeline (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    prospect_id     TEXT NOT NULL,
+    type            TEXT DEFAULT '',
+    detail          TEXT DEFAULT '',
+    timestamp       TEXT,
+    metadata        TEXT DEFAULT '{}'
+);
+
+CREATE INDEX IF NOT EXISTS idx_growth_timeline_prospect ON growth_timeline(prospect_id, timestamp);
+
 CREATE TABLE IF NOT EXISTS workflow_runs (
     id                INTEGER PRIMARY KEY AUTOINCREMENT,
     started_at        TEXT,
@@ -1022,7 +1077,10 @@ CREATE TABLE IF NOT EXISTS scprs_po_master (
     buyer_email     TEXT,
     buyer_phone     TEXT,
     search_term     TEXT,
-    agency_key      TEXT
+    agency_key      TEXT,
+    -- grand_total parsed ("$1,234.56" text is common); see _SCPRS_SPEND_SQL
+    grand_total_num REAL GENERATED ALWAYS AS
+        (CAST(REPLACE(REPLACE(grand_total,'$',''),',','') AS REAL)) VIRTUAL
 );
 CREATE INDEX IF NOT EXISTS idx_po_institution ON scprs_po_master(institution);
 CREATE INDEX IF NOT EXISTS idx_po_buyer ON scprs_po_master(buyer_email);
@@ -1209,6 +1267,19 @@ CREATE TABLE IF NOT EXISTS scprs_buyers (
     updated_at          TEXT DEFAULT ''
 );
 
+-- Buyer profile refresh (agents/buyer_intelligence.py). New POs and PO
+-- lines are found by id past scprs_buyer_marks.seen_id, so bulk pulls
+-- write nothing extra; edits and deletes mark the buyer in
+-- scprs_buyer_dirty by trigger (_install_buyer_refresh).
+CREATE TABLE IF NOT EXISTS scprs_buyer_marks (
+    source          TEXT PRIMARY KEY,       -- scprs_po_master | scprs_po_lines
+    seen_id         INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS scprs_buyer_dirty (
+    buyer_email     TEXT PRIMARY KEY,
+    ver             INTEGER NOT NULL DEFAULT 1
+);
+
 CREATE TABLE IF NOT EXISTS scprs_buyer_items (
     id              INTEGER PRIMARY KEY AUTOINCREMENT,
     buyer_email     TEXT NOT NULL,
@@ -1647,6 +1718,118 @@ CREATE TABLE IF NOT EXISTS agency_rules (
 );
 CREATE INDEX IF NOT EXISTS idx_agency_rules_agency ON agency_rules(agency, active);
 CREATE INDEX IF NOT EXISTS idx_agency_rules_type ON agency_rules(rule_type);
+
+-- ═════════════════════════════════════════════════════════════════════
+-- QuickBooks mirror (quickbooks_agent._sync_entity)
+-- Vendors, customers and invoices synced incrementally by
+-- MetaData.LastUpdatedTime; qb_sync_state holds each entity's cursor.
+-- data_json is the shaped dict fetch_* return; the other columns are
+-- what find_* / fetch_invoices filter on.
+-- ═════════════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS qb_vendors (
+    qb_id TEXT PRIMARY KEY,
+    name_lc TEXT DEFAULT '',
+    company_lc TEXT DEFAULT '',
+    active INTEGER DEFAULT 1,
+    updated_at TEXT DEFAULT '',
+    data_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qb_vendors_name ON qb_vendors(name_lc);
+CREATE TABLE IF NOT EXISTS qb_customers (
+    qb_id TEXT PRIMARY KEY,
+    name_lc TEXT DEFAULT '',
+    company_lc TEXT DEFAULT '',
+    active INTEGER DEFAULT 1,
+    updated_at TEXT DEFAULT '',
+    data_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qb_customers_name ON qb_customers(name_lc);
+CREATE TABLE IF NOT EXISTS qb_invoices (
+    qb_id TEXT PRIMARY KEY,
+    doc_number TEXT DEFAULT '',
+    customer_id TEXT DEFAULT '',
+    txn_date TEXT DEFAULT '',
+    due_date TEXT DEFAULT '',
+    balance REAL DEFAULT 0,
+    updated_at TEXT DEFAULT '',
+    data_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_qb_invoices_txn ON qb_invoices(txn_date);
+CREATE INDEX IF NOT EXISTS idx_qb_invoices_customer ON qb_invoices(customer_id);
+CREATE TABLE IF NOT EXISTS qb_sync_state (
+    entity TEXT PRIMARY KEY,
+    cursor TEXT DEFAULT '',
+    synced_at REAL DEFAULT 0,
+    full_synced_at REAL DEFAULT 0,
+    last_changed INTEGER DEFAULT 0
+);
+
+-- ═════════════════════════════════════════════════════════════════════
+-- Change feed (core/change_feed.py)
+-- One row per rfq / price_check / order, stamped by triggers with a
+-- strictly increasing changed_at on every write; a delete leaves a
+-- tombstone. Backs the /api/v1 keyset pages. Triggers are installed by
+-- _install_triggers() once the record tables exist.
+-- ═════════════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS record_changes (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    changed_at REAL NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_record_changes_at
+    ON record_changes(kind, changed_at, id);
+-- How far each derived table (dashboard funnel, deadline index) has
+-- drained record_changes, per record kind.
+CREATE TABLE IF NOT EXISTS record_consumers (
+    consumer TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (consumer, kind)
+);
+
+-- ═════════════════════════════════════════════════════════════════════
+-- Dashboard snapshot (core/dashboard_snapshot.py)
+-- Cached home-dashboard sections with a version that source-table
+-- triggers bump, plus the per-PC / per-RFQ funnel bucket (drained from
+-- record_changes). Triggers are installed by _install_triggers().
+-- ═════════════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS dashboard_snapshot (
+    section        TEXT PRIMARY KEY,
+    sources        TEXT NOT NULL DEFAULT ',',
+    data_json      TEXT,
+    version        INTEGER NOT NULL DEFAULT 1,
+    built_version  INTEGER NOT NULL DEFAULT 0,
+    built_at       REAL NOT NULL DEFAULT 0,
+    build_ms       INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS dash_record_state (
+    kind       TEXT NOT NULL,
+    id         TEXT NOT NULL,
+    bucket     TEXT,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_dash_record_bucket
+    ON dash_record_state(bucket);
+
+-- ═════════════════════════════════════════════════════════════════════
+-- Deadline index (core/deadline_index.py)
+-- One row per PC / RFQ with its parsed due date and the pre-rendered
+-- deadline item, drained from record_changes; /api/deadlines is a range
+-- read on due_ts.
+-- ═════════════════════════════════════════════════════════════════════
+CREATE TABLE IF NOT EXISTS deadline_index (
+    kind         TEXT NOT NULL,
+    id           TEXT NOT NULL,
+    due_ts       REAL,
+    status       TEXT NOT NULL DEFAULT '',
+    is_test      INTEGER NOT NULL DEFAULT 0,
+    quarantined  INTEGER NOT NULL DEFAULT 0,
+    item_json    TEXT,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_deadline_index_due
+    ON deadline_index(due_ts) WHERE is_test = 0 AND due_ts IS NOT NULL;
 """
 
 def init_db():
@@ -1658,6 +1841,7 @@ def init_db():
         conn.executescript(SCHEMA)
     print("[BOOT:DB] init_db: migrating columns...", flush=True)
     _migrate_columns()
+    _install_triggers()
     _migrate_feature_flags_from_app_settings()
     _seed_supplier_profiles()
     # Usage tracking
@@ -1672,6 +1856,86 @@ def init_db():
     return True
 
 
+def _install_triggers():
+    """Install the write triggers core modules keep derived tables with
+    (and retire ones an earlier design left behind). Runs after
+    _migrate_columns so every table they watch exists; each installer is
+    idempotent and only rewrites a trigger whose SQL changed."""
+    from src.core import change_feed, dashboard_snapshot, deadline_index
+    for name, install in (("change feed", change_feed.install_schema),
+                          ("dashboard snapshot", dashboard_snapshot.install_schema),
+                          ("deadline index", deadline_index.install_schema),
+                          ("buyer refresh", _install_buyer_refresh)):
+        try:
+            with get_db() as conn:
+                install(conn)
+        except Exception as e:
+            log.warning("%s triggers: %s", name, e)
+
+
+_SCPRS_SPEND_SQL = "CAST(REPLACE(REPLACE(grand_total,'$',''),',','') AS REAL)"
+
+_BUYER_MARK_SQL = ("INSERT INTO scprs_buyer_dirty(buyer_email) {select} "
+                   "ON CONFLICT(buyer_email) DO UPDATE SET ver = ver + 1;")
+_BUYER_MARK_PO = _BUYER_MARK_SQL.format(
+    select="SELECT NEW.buyer_email WHERE NEW.buyer_email LIKE '%@%'")
+_BUYER_MARK_OLD_PO = _BUYER_MARK_SQL.format(
+    select="SELECT OLD.buyer_email WHERE OLD.buyer_email LIKE '%@%' "
+           "AND OLD.buyer_email IS NOT NEW.buyer_email")
+_BUYER_MARK_LINE = _BUYER_MARK_SQL.format(
+    select="SELECT buyer_email FROM scprs_po_master "
+           "WHERE po_number = {ref}.po_number AND buyer_email LIKE '%@%'")
+
+# Edits and deletes only — inserts are picked up by id (scprs_buyer_marks).
+_BUYER_REFRESH_TRIGGERS = {
+    "scprs_po_master_bp_au": f"""CREATE TRIGGER scprs_po_master_bp_au AFTER UPDATE OF
+    po_number, buyer_email, buyer_name, dept_name, dept_code,
+    supplier, start_date, grand_total ON scprs_po_master BEGIN
+    {_BUYER_MARK_PO}
+    {_BUYER_MARK_OLD_PO}
+END""",
+    "scprs_po_master_bp_ad": f"""CREATE TRIGGER scprs_po_master_bp_ad AFTER DELETE ON scprs_po_master BEGIN
+    {_BUYER_MARK_SQL.format(select="SELECT OLD.buyer_email WHERE OLD.buyer_email LIKE '%@%'")}
+END""",
+    "scprs_po_lines_bp_au": f"""CREATE TRIGGER scprs_po_lines_bp_au AFTER UPDATE OF
+    po_number, description, unit_price, quantity ON scprs_po_lines BEGIN
+    {_BUYER_MARK_LINE.format(ref="NEW")}
+    {_BUYER_MARK_LINE.format(ref="OLD")}
+END""",
+    "scprs_po_lines_bp_ad": f"""CREATE TRIGGER scprs_po_lines_bp_ad AFTER DELETE ON scprs_po_lines BEGIN
+    {_BUYER_MARK_LINE.format(ref="OLD")}
+END""",
+}
+
+
+def _install_buyer_refresh(conn) -> None:
+    """Make scprs_po_master.grand_total_num the generated column and
+    install the buyer-refresh edit/delete triggers. An earlier design kept
+    grand_total_num as a plain column filled by AFTER INSERT/UPDATE
+    triggers; those triggers and the column are replaced here."""
+    xinfo = {r[1]: r[6] for r in conn.execute("PRAGMA table_xinfo(scprs_po_master)")}
+    if not xinfo:
+        return
+    installed = {r[0]: r[1] for r in conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type='trigger' "
+        "AND name LIKE 'scprs\\_po\\_%\\_bp\\_%' ESCAPE '\\'")}
+    if xinfo.get("grand_total_num") not in (2, 3):        # 2/3 = generated
+        for name in installed:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+        installed = {}
+        if "grand_total_num" in xinfo:
+            conn.execute("ALTER TABLE scprs_po_master DROP COLUMN grand_total_num")
+        conn.execute("ALTER TABLE scprs_po_master ADD COLUMN grand_total_num REAL "
+                     f"GENERATED ALWAYS AS ({_SCPRS_SPEND_SQL}) VIRTUAL")
+        log.info("scprs_po_master.grand_total_num is now a generated column")
+    for name in set(installed) - set(_BUYER_REFRESH_TRIGGERS):
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    for name, sql in _BUYER_REFRESH_TRIGGERS.items():
+        if installed.get(name) != sql:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(sql)
+
+
 def init_db_deferred():
     """Run deferred DB init tasks (DAL migration). Called from background thread."""
     try:
@@ -2027,6 +2291,12 @@ def _migrate_columns():
             # screen. Moved here so they run AFTER the column migrations.
             "CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_trail(timestamp)",
             "CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_trail(action)",
+            # dal.count_*_by_status (/api/v1/pipeline). Also created by
+            # migration 16; repeated here so a DB that never ran the
+            # migrations still answers the GROUP BY from the index.
+            "CREATE INDEX IF NOT EXISTS idx_rfqs_status ON rfqs(status)",
+            "CREATE INDEX IF NOT EXISTS idx_pc_status ON price_checks(status)",
+            "CREATE INDEX IF NOT EXISTS idx_orders_status ON orders(status)",
         ]:
             try:
                 conn.execute(_idx_sql)
@@ -2073,6 +2343,10 @@ def _migrate_columns():
             "CREATE INDEX IF NOT EXISTS idx_po_lines_cat ON scprs_po_lines(category)",
             "CREATE INDEX IF NOT EXISTS idx_po_master_start ON scprs_po_master(start_date)",
             "CREATE INDEX IF NOT EXISTS idx_po_master_supplier_lc ON scprs_po_master(LOWER(supplier))",
+            # award_tracker's local mirror lookup: POs pulled since a quote
+            # went out, then their lines by po_number.
+            "CREATE INDEX IF NOT EXISTS idx_po_master_pulled ON scprs_po_master(pulled_at)",
+            "CREATE INDEX IF NOT EXISTS idx_scprs_po_lines_po ON scprs_po_lines(po_number)",
         ]:
             try:
                 conn.execute(_idx_sql)
@@ -2639,22 +2913,25 @@ def record_price(description: str, unit_price: float, source: str,
     """Record a price observation. Called every time a price is found."""
     if not description or not unit_price or unit_price <= 0:
         return None
+    def _insert(conn):
+        cur = conn.execute("""
+            INSERT INTO price_history
+              (found_at, description, part_number, manufacturer, quantity,
+               unit_price, source, source_url, source_id, agency,
+               quote_number, price_check_id, notes)
+            VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
+        """, (
+            datetime.now().isoformat(),
+            description[:500], part_number[:100], manufacturer[:200],
+            quantity, unit_price, source, source_url[:500],
+            source_id[:100], agency, quote_number, price_check_id,
+            notes[:500],
+        ))
+        return cur.lastrowid
+
     def _do():
-        with get_db() as conn:
-            cur = conn.execute("""
-                INSERT INTO price_history
-                  (found_at, description, part_number, manufacturer, quantity,
-                   unit_price, source, source_url, source_id, agency,
-                   quote_number, price_check_id, notes)
-                VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?)
-            """, (
-                datetime.now().isoformat(),
-                description[:500], part_number[:100], manufacturer[:200],
-                quantity, unit_price, source, source_url[:500],
-                source_id[:100], agency, quote_number, price_check_id,
-                notes[:500],
-            ))
-            return cur.lastrowid
+        # Background lane of the single-writer queue (inline when disabled).
+        return write(_insert)
     try:
         return db_retry(_do)
     except Exception as e:
@@ -3015,6 +3292,8 @@ def migrate_json_to_db() -> dict:
             c["id"] = cid
             if upsert_contact(c):
                 counts["contacts"] += 1
+        from src.core.dashboard_snapshot import mark_dirty
+        mark_dirty("contacts")
 
     # Revenue entries
     rev = _try_load("intel_revenue.json")
@@ -3800,10 +4079,9 @@ def upsert_vendor(v: dict) -> bool:
 
 def get_all_price_checks(include_test: bool = False) -> dict:
     """Return {pc_id: pc_dict} matching the old price_checks.json format."""
-    conn = _make_connection(); conn.row_factory = sqlite3.Row
     q = "SELECT * FROM price_checks ORDER BY created_at DESC"
-    rows = conn.execute(q).fetchall()
-    conn.close()
+    with read_db() as conn:
+        rows = conn.execute(q).fetchall()
     result = {}
     for r in rows:
         d = dict(r)
@@ -3818,9 +4096,9 @@ def get_all_price_checks(include_test: bool = False) -> dict:
 
 
 def upsert_price_check(pc_id: str, pc: dict) -> bool:
-    conn = _make_connection()
     now = datetime.now(timezone.utc).isoformat()
-    try:
+
+    def _upsert(conn):
         conn.execute("""
             INSERT INTO price_checks
               (id, created_at, pc_number, requestor, agency, institution, due_date,
@@ -3840,19 +4118,19 @@ def upsert_price_check(pc_id: str, pc: dict) -> bool:
               len(pc.get('items',[])), pc.get('status','parsed'),
               _jd(pc.get('status_history',[])), 1 if pc.get('parsed') else 0,
               pc.get('reytech_quote_number',''), 1 if pc.get('is_test') else 0, now))
-        conn.commit()
+
+    try:
+        # User-facing save — priority lane of the single-writer queue.
+        write(_upsert, priority=True)
         return True
     except Exception as e:
         log.error("upsert_price_check %s: %s", pc_id, e)
         return False
-    finally:
-        conn.close()
 
 
 def get_price_check(pc_id: str) -> dict:
-    conn = _make_connection(); conn.row_factory = sqlite3.Row
-    row = conn.execute("SELECT * FROM price_checks WHERE id=?", (pc_id,)).fetchone()
-    conn.close()
+    with read_db() as conn:
+        row = conn.execute("SELECT * FROM price_checks WHERE id=?", (pc_id,)).fetchone()
     if not row:
         return {}
     d = dict(row)
@@ -4127,18 +4405,25 @@ def get_growth_outreach() -> dict:
     conn = _make_connection(); conn.row_factory = sqlite3.Row
     rows = conn.execute("SELECT * FROM growth_outreach ORDER BY created_at DESC").fetchall()
     conn.close()
-    campaigns = []
-    for r in rows:
-        d = dict(r)
-        d['context_summary'] = _jl(d.pop('context', None), {})
-        meta = _jl(d.pop('metadata', None), {})
-        d.update({k: v for k, v in meta.items() if k not in d})
-        campaigns.append(d)
+    campaigns = [growth_campaign_row(r) for r in rows]
     return {'campaigns': campaigns, 'total_sent': sum(c.get('sent_count',0) for c in campaigns)}
 
 
-def save_growth_campaign(camp: dict) -> bool:
-    conn = _make_connection()
+def growth_campaign_row(r) -> dict:
+    """Decode a growth_outreach row back into the campaign dict it was saved from."""
+    d = dict(r)
+    d['context_summary'] = _jl(d.pop('context', None), {})
+    meta = _jl(d.pop('metadata', None), {})
+    d.update({k: v for k, v in meta.items() if k not in d})
+    return d
+
+
+def save_growth_campaign(camp: dict, conn=None) -> bool:
+    """Upsert a campaign header. Pass `conn` to write inside the caller's
+    transaction (it is then neither committed nor closed here)."""
+    own = conn is None
+    if own:
+        conn = _make_connection()
     now = datetime.now(timezone.utc).isoformat()
     cid = camp.get('id') or f"camp-{__import__('uuid').uuid4().hex[:8]}"
     try:
@@ -4156,13 +4441,17 @@ def save_growth_campaign(camp: dict) -> bool:
               _jd({k: v for k, v in camp.items()
                    if k not in ('id','created_at','type','dry_run','template',
                                 'context_summary','context','status','outreach')})))
-        conn.commit()
+        if own:
+            conn.commit()
         return True
     except Exception as e:
         log.error("save_growth_campaign: %s", e)
+        if not own:
+            raise
         return False
     finally:
-        conn.close()
+        if own:
+            conn.close()
 
 
 # ── JSON COMPATIBILITY SHIMS ──────────────────────────────────────────────────
@@ -39,13 +39,32 @@ Design choices:
     yesterday's `would_delete`; live runs log both.
   * Cutoff is computed as `datetime('now', '-N days')` in SQLite —
     avoids tz-vs-UTC drift between Python and SQLite clocks.
+
+Archival mode (`archive_older_than`, `DB_RETENTION_MODE=archive`):
+  * Instead of deleting, rows past the cutoff MOVE into per-month
+    files `<db dir>/archive/reytech_archive_YYYY_MM.db` (month of the
+    row's date column). The hot DB stays small, so scans and backups
+    get faster, and nothing is lost — so compliance tables may be
+    archived without `force_compliance_table`.
+  * Each batch copies rows (keeping their rowid, so a re-run after a
+    crash overwrites instead of duplicating) and deletes them from the
+    hot table inside one transaction across the ATTACHed file.
+  * Reads: `attach_archives(conn, table)` ATTACHes the archive months
+    and exposes a `temp.<table>_all` view (hot UNION ALL archives).
+    One connection can only ATTACH SQLITE_LIMIT_ATTACHED (default 10)
+    files, so audit queries that must see every month use
+    `query_archives`, which runs the query over batches of months and
+    concatenates the rows, e.g. `get_lifecycle_events(...,
+    include_archive=True)`.
 """
 from __future__ import annotations
 
 import logging
 import os
+import re
 import sqlite3
-from typing import Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 log = logging.getLogger(__name__)
 
@@ -338,15 +357,322 @@ def purge_older_than(
                 log.debug("db_retention: ctx exit suppressed: %s", e)
 
 
+# ─── Archival ─────────────────────────────────────────────────────
+
+_ARCHIVE_PREFIX = "reytech_archive_"
+_ARCHIVE_RE = re.compile(r"^reytech_archive_(\d{4})_(\d{2})\.db$")
+
+
+def _archive_dir(conn: sqlite3.Connection, archive_dir: Optional[str]) -> str:
+    """`archive_dir` if given, else `archive/` next to the main DB file."""
+    if archive_dir:
+        return archive_dir
+    for row in conn.execute("PRAGMA database_list").fetchall():
+        if row[1] == "main" and row[2]:
+            return os.path.join(os.path.dirname(row[2]), "archive")
+    raise RetentionError(
+        "main DB has no file path (in-memory?) — pass archive_dir")
+
+
+def archive_files(archive_dir: str) -> List[Tuple[str, str]]:
+    """(YYYY_MM, path) for every monthly archive file, oldest first."""
+    if not os.path.isdir(archive_dir):
+        return []
+    out = []
+    for name in sorted(os.listdir(archive_dir)):
+        m = _ARCHIVE_RE.match(name)
+        if m:
+            out.append((f"{m.group(1)}_{m.group(2)}",
+                        os.path.join(archive_dir, name)))
+    return out
+
+
+def _columns(conn: sqlite3.Connection, schema: str, table: str) -> List[str]:
+    return [r[1] for r in conn.execute(
+        f"PRAGMA {schema}.table_info({table})").fetchall()]
+
+
+def _ensure_archive_table(conn: sqlite3.Connection, table: str,
+                          date_col: str) -> List[str]:
+    """Create/extend `arc.<table>` to match the hot table's columns.
+    Returns the column list to copy."""
+    cols = _columns(conn, "main", table)
+    have = _columns(conn, "arc", table)
+    if not have:
+        conn.execute(
+            f"CREATE TABLE arc.{table} AS SELECT * FROM main.{table} WHERE 0")
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS arc.idx_{table}_{date_col} "
+            f"ON {table}({date_col})")
+    else:
+        # Hot table grew a column since this month was archived.
+        for c in cols:
+            if c not in have:
+                conn.execute(f'ALTER TABLE arc.{table} ADD COLUMN "{c}"')
+    return cols
+
+
+def archive_older_than(
+    table: str,
+    days: int,
+    *,
+    dry_run: bool = True,
+    batch_size: int = 1000,
+    conn: Optional[sqlite3.Connection] = None,
+    archive_dir: Optional[str] = None,
+) -> Dict:
+    """Move rows older than `days` from `table` into monthly archive DBs.
+
+    Same gates and result shape as `purge_older_than`, plus
+    `archived` (rows moved) and `months` ({"YYYY_MM": rows}). Any
+    allowlisted table may be archived — compliance tables included,
+    since archiving keeps every row.
+
+    Raises:
+      RetentionError on bad table / bad days / no archive location.
+    """
+    if days < 1:
+        raise RetentionError(
+            f"days must be >= 1, got {days} — refusing to archive "
+            f"the entire table by accident")
+    if (table not in AUTO_PURGE_ALLOWLIST
+            and table not in COMPLIANCE_OPT_IN_ALLOWLIST):
+        raise RetentionError(
+            f"table {table!r} is not in db_retention allowlist. "
+            f"Allowed: {sorted(AUTO_PURGE_ALLOWLIST | COMPLIANCE_OPT_IN_ALLOWLIST)}")
+
+    date_col = _DATE_COLUMN[table]
+    cutoff_expr = f"datetime('now', '-{int(days)} days')"
+    month_expr = f"replace(substr({date_col}, 1, 7), '-', '_')"
+
+    own_conn = False
+    if conn is None:
+        try:
+            from src.core.db import get_db
+        except Exception as e:
+            raise RetentionError(f"db.get_db unavailable: {e}")
+        ctx = get_db()
+        conn = ctx.__enter__()
+        own_conn = True
+
+    result = {
+        "table": table,
+        "days": days,
+        "cutoff": "",
+        "would_delete": 0,
+        "deleted": 0,
+        "archived": 0,
+        "batches": 0,
+        "months": {},
+        "dry_run": dry_run,
+    }
+    try:
+        row = conn.execute(f"SELECT {cutoff_expr} as c").fetchone()
+        result["cutoff"] = row[0]
+        months = {
+            r[0]: int(r[1]) for r in conn.execute(
+                f"SELECT {month_expr} AS m, COUNT(*) FROM {table} "
+                f"WHERE {date_col} < {cutoff_expr} GROUP BY m ORDER BY m"
+            ).fetchall()
+        }
+        result["would_delete"] = sum(months.values())
+        if dry_run or not months:
+            result["months"] = months
+            log.info(
+                "db_retention: %s archive dry_run=%s would_archive=%d "
+                "months=%d (cutoff=%s, days=%d)",
+                table, dry_run, result["would_delete"], len(months),
+                result["cutoff"], days)
+            return result
+
+        adir = _archive_dir(conn, archive_dir)
+        os.makedirs(adir, exist_ok=True)
+        conn.commit()  # ATTACH is refused inside an open transaction
+        for month in months:
+            if not re.fullmatch(r"\d{4}_\d{2}", month or ""):
+                log.warning("db_retention: %s has %d rows with unparseable "
+                            "%s — left in place", table, months[month], date_col)
+                continue
+            path = os.path.join(adir, f"{_ARCHIVE_PREFIX}{month}.db")
+            conn.execute("ATTACH DATABASE ? AS arc", (path,))
+            try:
+                cols = _ensure_archive_table(conn, table, date_col)
+                col_sql = ", ".join(f'"{c}"' for c in cols)
+                pick = (f"SELECT rowid FROM main.{table} "
+                        f"WHERE {date_col} < {cutoff_expr} "
+                        f"AND {month_expr} = ? LIMIT {int(batch_size)}")
+                moved = 0
+                while True:
+                    conn.execute("BEGIN IMMEDIATE")
+                    try:
+                        rowids = [r[0] for r in conn.execute(pick, (month,)).fetchall()]
+                        if rowids:
+                            marks = ",".join("?" * len(rowids))
+                            conn.execute(
+                                f"INSERT OR REPLACE INTO arc.{table} (rowid, {col_sql}) "
+                                f"SELECT rowid, {col_sql} FROM main.{table} "
+                                f"WHERE rowid IN ({marks})", rowids)
+                            conn.execute(
+                                f"DELETE FROM main.{table} WHERE rowid IN ({marks})",
+                                rowids)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+                    result["batches"] += 1
+                    moved += len(rowids)
+                    if len(rowids) < batch_size:
+                        break
+                result["months"][month] = moved
+                result["archived"] += moved
+            finally:
+                conn.execute("DETACH DATABASE arc")
+
+        result["deleted"] = result["archived"]
+        log.info(
+            "db_retention: %s archived=%d months=%s batches=%d "
+            "(cutoff=%s, days=%d)",
+            table, result["archived"], sorted(result["months"]),
+            result["batches"], result["cutoff"], days)
+        return result
+    finally:
+        if own_conn:
+            try:
+                ctx.__exit__(None, None, None)
+            except Exception as e:
+                log.debug("db_retention: ctx exit suppressed: %s", e)
+
+
+def _archive_months(conn: sqlite3.Connection, table: str,
+                    since_month: Optional[str],
+                    archive_dir: Optional[str]) -> Tuple[List[Tuple[str, str]], int]:
+    """(archive files at or after `since_month`, free ATTACH slots)."""
+    if table not in _DATE_COLUMN:
+        raise RetentionError(f"table {table!r} has no retention entry")
+    files = [(m, p) for m, p in archive_files(_archive_dir(conn, archive_dir))
+             if not since_month or m >= since_month]
+    already = sum(1 for r in conn.execute("PRAGMA database_list").fetchall()
+                  if r[1] not in ("main", "temp"))
+    limit = conn.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) - already
+    if limit < 1:
+        raise RetentionError("no free ATTACH slots on this connection")
+    return files, limit
+
+
+@contextmanager
+def attach_archives(
+    conn: sqlite3.Connection,
+    table: str,
+    *,
+    since_month: Optional[str] = None,
+    archive_dir: Optional[str] = None,
+) -> Iterator[str]:
+    """ATTACH the monthly archives holding `table` and yield the name of
+    a temp view unioning the hot table with them.
+
+        with attach_archives(conn, "lifecycle_events") as view:
+            conn.execute(f"SELECT * FROM {view} WHERE entity_id=?", (rid,))
+
+    `since_month` ("YYYY_MM") skips older files. If there are more
+    months than SQLite's ATTACH limit allows, the newest are used and
+    a warning is logged — use `query_archives` to read every month.
+    Detaches and drops the view on exit.
+    """
+    files, limit = _archive_months(conn, table, since_month, archive_dir)
+    if len(files) > limit:
+        log.warning("attach_archives: %d %s months exceed ATTACH limit %d; "
+                    "querying the newest %d", len(files), table, limit, limit)
+        files = files[-limit:]
+    with _union_view(conn, table, files, include_hot=True) as view:
+        yield view
+
+
+def query_archives(
+    conn: sqlite3.Connection,
+    table: str,
+    sql: str,
+    params: tuple = (),
+    *,
+    since_month: Optional[str] = None,
+    archive_dir: Optional[str] = None,
+) -> list:
+    """Run `sql` over the hot `table` and every archive month, returning
+    the rows of all runs concatenated.
+
+    `sql` names its source as `{view}`:
+
+        query_archives(conn, "lifecycle_events",
+                       "SELECT * FROM {view} WHERE entity_id=? LIMIT 50", (rid,))
+
+    Months are ATTACHed in batches of at most the free ATTACH slots, so
+    nothing is dropped however many there are; `sql` runs once per batch
+    (hot table in the newest batch), so ORDER BY / LIMIT apply per batch
+    and the caller merges.
+    """
+    files, limit = _archive_months(conn, table, since_month, archive_dir)
+    batches = [files[max(0, end - limit):end]
+               for end in range(len(files), 0, -limit)] or [[]]
+    rows = []
+    for i, batch in enumerate(batches):
+        with _union_view(conn, table, batch, include_hot=(i == 0)) as view:
+            if view:
+                rows.extend(conn.execute(sql.format(view=view), params).fetchall())
+    return rows
+
+
+@contextmanager
+def _union_view(conn: sqlite3.Connection, table: str,
+                files: List[Tuple[str, str]], include_hot: bool) -> Iterator[str]:
+    """ATTACH `files` and yield a temp view over their `table` (plus the
+    hot one if `include_hot`); None when none of them holds the table."""
+    view = f"{table}_all"
+    attached = []
+    try:
+        selects = [f"SELECT * FROM main.{table}"] if include_hot else []
+        cols = _columns(conn, "main", table)
+        col_sql = ", ".join(f'"{c}"' for c in cols)
+        for month, path in files:
+            alias = f"arc_{month}"
+            conn.execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+            attached.append(alias)
+            have = set(_columns(conn, alias, table))
+            if not have:
+                continue
+            picked = ", ".join(f'"{c}"' if c in have else f'NULL AS "{c}"'
+                               for c in cols)
+            selects.append(f"SELECT {picked} FROM {alias}.{table}")
+        conn.execute(f"DROP VIEW IF EXISTS temp.{view}")
+        if not selects:
+            yield None
+            return
+        conn.execute(
+            f"CREATE TEMP VIEW {view} ({col_sql}) AS "
+            + " UNION ALL ".join(selects))
+        yield view
+    finally:
+        try:
+            conn.execute(f"DROP VIEW IF EXISTS temp.{view}")
+        except sqlite3.Error as e:
+            log.debug("attach_archives: drop view suppressed: %s", e)
+        for alias in attached:
+            try:
+                conn.execute(f"DETACH DATABASE {alias}")
+            except sqlite3.Error as e:
+                log.debug("attach_archives: detach %s suppressed: %s", alias, e)
+
+
 def run_daily_purge(
     *,
     dry_run: Optional[bool] = None,
     conn: Optional[sqlite3.Connection] = None,
+    mode: Optional[str] = None,
 ) -> Dict:
     """Daily cron entrypoint — purges every table in `AUTO_PURGE_ALLOWLIST`
     using `RETENTION_POLICY` defaults.
 
-    `lifecycle_events` is intentionally skipped (compliance opt-in).
+    `lifecycle_events` is intentionally skipped (compliance opt-in) in
+    delete mode. In archive mode every table is moved to the monthly
+    archive files instead, lifecycle_events included.
 
     Args:
       dry_run: when None (default), reads `DB_RETENTION_DRY_RUN` env var
@@ -357,32 +683,45 @@ def run_daily_purge(
                for a day, then flip the env var to "0" without re-deploy.
       conn: optional sqlite3.Connection; one is acquired per table when
             None so a stuck table can't block the others.
+      mode: "delete" or "archive"; when None reads `DB_RETENTION_MODE`
+            (default "delete").
 
     Returns:
       {
         "dry_run": bool,
+        "mode": str,
         "tables": [<purge_older_than result>, ...],
         "total_would_delete": int,
         "total_deleted": int,
+        "total_archived": int,   # archive mode only
         "errors": [{"table": str, "error": str}, ...],
       }
     """
     if dry_run is None:
         dry_run = os.environ.get("DB_RETENTION_DRY_RUN", "0").lower() in (
             "1", "true", "yes", "on")
+    mode = (mode or os.environ.get("DB_RETENTION_MODE", "delete")).lower()
+    archive = mode == "archive"
+    tables = AUTO_PURGE_ALLOWLIST | COMPLIANCE_OPT_IN_ALLOWLIST if archive \
+        else AUTO_PURGE_ALLOWLIST
 
     summary: Dict = {
         "dry_run": dry_run,
+        "mode": "archive" if archive else "delete",
         "tables": [],
         "total_would_delete": 0,
         "total_deleted": 0,
+        "total_archived": 0,
         "errors": [],
     }
 
-    for tbl in sorted(AUTO_PURGE_ALLOWLIST):
+    for tbl in sorted(tables):
         days = RETENTION_POLICY[tbl]
         try:
-            r = purge_older_than(tbl, days, dry_run=dry_run, conn=conn)
+            if archive:
+                r = archive_older_than(tbl, days, dry_run=dry_run, conn=conn)
+            else:
+                r = purge_older_than(tbl, days, dry_run=dry_run, conn=conn)
         except Exception as e:
             log.error("run_daily_purge: %s failed: %s", tbl, e)
             summary["errors"].append({"table": tbl, "error": str(e)})
@@ -390,11 +729,14 @@ def run_daily_purge(
         summary["tables"].append(r)
         summary["total_would_delete"] += r.get("would_delete", 0)
         summary["total_deleted"] += r.get("deleted", 0)
+        summary["total_archived"] += r.get("archived", 0)
 
     log.info(
-        "run_daily_purge: dry_run=%s would_delete=%d deleted=%d errors=%d",
-        summary["dry_run"], summary["total_would_delete"],
-        summary["total_deleted"], len(summary["errors"]))
+        "run_daily_purge: mode=%s dry_run=%s would_delete=%d deleted=%d "
+        "archived=%d errors=%d",
+        summary["mode"], summary["dry_run"], summary["total_would_delete"],
+        summary["total_deleted"], summary["total_archived"],
+        len(summary["errors"]))
     return summary
 
 
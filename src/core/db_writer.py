@@ -0,0 +1,464 @@
+"""db_writer.py — single-writer queue and read-only pool for reytech.db.
+
+Writes reach reytech.db from request threads, the per-module
+`sqlite3.connect(DB_PATH)` helpers and 40+ daemon threads. Under load
+they collide on SQLite's single write lock; `db_retry` then sleeps a
+linear 1s, 2s, ... and the request that was saving a PC waits behind a
+background scraper.
+
+With DB_WRITE_QUEUE=1 each process gets one writer thread that owns one
+connection. Callers hand it a closure `fn(conn)`; the writer drains the
+queue into grouped transactions (one BEGIN IMMEDIATE / COMMIT per batch,
+a SAVEPOINT per closure so one failing write doesn't undo its
+neighbours) and resolves a Future per closure after the commit. User-
+facing saves go in the priority lane and are taken before any queued
+background write.
+
+Without the flag, `write()` runs the closure inline on the caller's
+thread, in its own transaction on a per-thread write connection kept
+apart from get_db()'s — same metrics, no thread. (A caller already inside
+a get_db() write transaction has the closure join it, since a second
+connection would wait on that caller's own lock.)
+
+Reads that used to open a fresh connection per call use `read_db()`: a
+small pool of read-only connections (`mode=ro`, `PRAGMA query_only`)
+with a larger prepared-statement cache.
+
+Lock wait — time spent in BEGIN IMMEDIATE waiting for SQLite's write
+lock — is recorded for every write that goes through here, alongside
+queue wait and the `db_retry` lock-error count. `writer_stats()` feeds
+`/api/health`.
+
+Usage:
+    from src.core.db_writer import write, submit, read_db
+
+    rowid = write(lambda conn: conn.execute(sql, params).lastrowid)
+    write(_save_pc, priority=True)          # user-facing save
+    fut = submit(_log_event)                # fire-and-forget, Future
+    with read_db() as conn:
+        row = conn.execute("SELECT ...").fetchone()
+
+Env:
+    DB_WRITE_QUEUE=1            — enable the writer thread (default off)
+    DB_WRITE_BATCH_MAX=50       — closures per transaction
+    DB_WRITE_BATCH_WINDOW_MS=5  — how long the writer waits to fill a batch
+    DB_READ_POOL_SIZE=8         — idle read-only connections kept per DB
+"""
+
+import collections
+import itertools
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+import urllib.parse
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+log = logging.getLogger("reytech.db_writer")
+
+PRIORITY_USER = 0
+PRIORITY_BACKGROUND = 1
+
+READ_STATEMENT_CACHE = 256
+_SAMPLES = 500
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def enabled() -> bool:
+    return os.environ.get("DB_WRITE_QUEUE", "").lower() in ("1", "true", "yes", "on")
+
+
+# ── Metrics ─────────────────────────────────────────────────────────────────
+
+_metrics_lock = threading.Lock()
+_lock_wait_ms = collections.deque(maxlen=_SAMPLES)
+_queue_wait_ms = collections.deque(maxlen=_SAMPLES)
+_counters = collections.Counter()
+
+
+def _observe(samples: collections.deque, ms: float) -> None:
+    with _metrics_lock:
+        samples.append(ms)
+
+
+def _bump(name: str, n: int = 1) -> None:
+    with _metrics_lock:
+        _counters[name] += n
+
+
+def note_lock_error(exc: Optional[BaseException] = None) -> None:
+    """Called by `db.db_retry` for every "database is locked" it sees.
+    Pass the exception so one error seen twice (the retry predicate and
+    the final-failure hook, or nested retries) is counted once."""
+    if exc is not None:
+        if getattr(exc, "_reytech_lock_counted", False):
+            return
+        try:
+            exc._reytech_lock_counted = True
+        except AttributeError:
+            pass
+    _bump("lock_errors")
+
+
+def _summary(samples) -> dict:
+    vals = sorted(samples)
+    if not vals:
+        return {"samples": 0, "avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "samples": len(vals),
+        "avg_ms": round(sum(vals) / len(vals), 2),
+        "p95_ms": round(vals[min(len(vals) - 1, int(len(vals) * 0.95))], 2),
+        "max_ms": round(vals[-1], 2),
+    }
+
+
+def _begin_immediate(conn) -> None:
+    """Take the write lock up front and time how long SQLite made us wait."""
+    t0 = time.perf_counter()
+    conn.execute("BEGIN IMMEDIATE")
+    _observe(_lock_wait_ms, (time.perf_counter() - t0) * 1000)
+
+
+# ── Writer thread ───────────────────────────────────────────────────────────
+
+class _Job:
+    __slots__ = ("fn", "future", "enqueued")
+
+    def __init__(self, fn):
+        self.fn = fn
+        self.future = Future()
+        self.enqueued = time.perf_counter()
+
+
+class _Writer:
+    def __init__(self):
+        self._q = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._conn = None
+        self._conn_path = None
+        self._stop = False
+
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def on_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self.running():
+                return
+            self._stop = False
+            self._thread = threading.Thread(target=self._loop, name="db-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Drain what's queued, then stop. For tests and clean shutdown.
+        If the drain outlasts `timeout` the thread is left running (it
+        still owns its connection) and stops once the queue is empty."""
+        if not self.running():
+            return
+        self._stop = True
+        self._q.put((PRIORITY_BACKGROUND + 1, next(self._seq), None))
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            log.warning("db writer still draining after %.1fs; left running", timeout)
+            return
+        self._thread = None
+        self._close()
+
+    def submit(self, fn, priority: int) -> Future:
+        job = _Job(fn)
+        self._q.put((priority, next(self._seq), job))
+        self.start()
+        return job.future
+
+    def depth(self) -> int:
+        return self._q.qsize()
+
+    def _connection(self):
+        from src.core import db
+        if self._conn is None or self._conn_path != db.DB_PATH:
+            self._close()
+            self._conn = db._make_connection()
+            self._conn_path = db.DB_PATH
+        return self._conn
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception as e:
+                log.debug("writer close: %s", e)
+        self._conn = None
+        self._conn_path = None
+
+    def _next_batch(self) -> list:
+        _prio, _seq, first = self._q.get()
+        if first is None:
+            return []
+        batch = [first]
+        limit = _env_int("DB_WRITE_BATCH_MAX", 50)
+        deadline = time.perf_counter() + _env_int("DB_WRITE_BATCH_WINDOW_MS", 5) / 1000
+        while len(batch) < limit:
+            timeout = deadline - time.perf_counter()
+            try:
+                item = self._q.get(timeout=timeout) if timeout > 0 else self._q.get_nowait()
+            except queue.Empty:
+                break
+            if item[2] is None:
+                # Stop sentinel: finish this batch, leave the sentinel for the loop.
+                self._q.put(item)
+                break
+            batch.append(item[2])
+        return batch
+
+    def _loop(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                if self._stop and self._q.empty():
+                    self._close()
+                    return
+                continue
+            try:
+                self._run_batch(batch)
+            except Exception as e:
+                log.error("db writer batch failed: %s", e)
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                self._close()
+
+    def _run_batch(self, batch: list) -> None:
+        conn = self._connection()
+        conn.row_factory = sqlite3.Row
+        started = time.perf_counter()
+        for job in batch:
+            _observe(_queue_wait_ms, (started - job.enqueued) * 1000)
+        _begin_immediate(conn)
+        results = []
+        for i, job in enumerate(batch):
+            sp = f"w{i}"
+            conn.execute(f"SAVEPOINT {sp}")
+            try:
+                results.append((job, True, job.fn(conn)))
+                conn.execute(f"RELEASE {sp}")
+            except Exception as e:
+                conn.execute(f"ROLLBACK TO {sp}")
+                conn.execute(f"RELEASE {sp}")
+                results.append((job, False, e))
+        conn.commit()
+        _bump("batches")
+        _bump("jobs", len(batch))
+        # Futures resolve only once the data is durable.
+        for job, ok, value in results:
+            if ok:
+                job.future.set_result(value)
+            else:
+                _bump("job_errors")
+                job.future.set_exception(value)
+
+
+_writer = _Writer()
+
+
+# ── Public write API ────────────────────────────────────────────────────────
+
+_inline = threading.local()
+
+
+def _inline_connection():
+    from src.core import db
+    conn = getattr(_inline, "conn", None)
+    if conn is None or getattr(_inline, "path", None) != db.DB_PATH:
+        close_thread_writer()
+        conn = _inline.conn = db._make_connection()
+        _inline.path = db.DB_PATH
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def close_thread_writer() -> None:
+    """Close this thread's inline write connection (db.close_thread_db
+    calls this too)."""
+    conn = getattr(_inline, "conn", None)
+    _inline.conn = None
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception as e:
+            log.debug("inline writer close: %s", e)
+
+
+def _run_inline(fn: Callable):
+    from src.core import db
+    if _writer.on_writer_thread():
+        # write() from inside a queued closure: already in the batch.
+        _bump("inline_jobs")
+        return fn(_writer._conn)
+    t0 = time.perf_counter()
+    shared = getattr(db._local, "conn", None)
+    if shared is not None and shared.in_transaction:
+        # Caller is mid-transaction on get_db(): join it.
+        with db.get_db() as conn:
+            _observe(_queue_wait_ms, (time.perf_counter() - t0) * 1000)
+            result = fn(conn)
+        _bump("inline_jobs")
+        return result
+    conn = _inline_connection()
+    _observe(_queue_wait_ms, (time.perf_counter() - t0) * 1000)
+    try:
+        _begin_immediate(conn)
+        result = fn(conn)
+        conn.commit()
+    except Exception:
+        try:
+            conn.rollback()
+        except Exception:
+            close_thread_writer()
+        raise
+    _bump("inline_jobs")
+    return result
+
+
+def submit(fn: Callable, priority: bool = False) -> Future:
+    """Queue `fn(conn)` for the writer; returns a Future for its result.
+
+    With the queue disabled — or when called from the writer thread
+    itself — `fn` runs immediately and the Future is already done.
+    """
+    if enabled() and not _writer.on_writer_thread():
+        return _writer.submit(fn, PRIORITY_USER if priority else PRIORITY_BACKGROUND)
+    fut = Future()
+    try:
+        fut.set_result(_run_inline(fn))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+
+def write(fn: Callable, priority: bool = False, timeout: Optional[float] = 120):
+    """Run `fn(conn)` in a write transaction and return its result.
+
+    Exceptions raised by `fn` propagate to the caller; the rest of its
+    batch still commits.
+    """
+    if not enabled() or _writer.on_writer_thread():
+        return _run_inline(fn)
+    return submit(fn, priority=priority).result(timeout)
+
+
+def stop_writer(timeout: float = 5.0) -> None:
+    _writer.stop(timeout)
+
+
+# ── Read-only pool ──────────────────────────────────────────────────────────
+
+_pool_lock = threading.Lock()
+_pools: dict = {}
+
+
+def _open_readonly(path: str):
+    uri = "file:" + urllib.parse.quote(path) + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, timeout=30, check_same_thread=False,
+                           cached_statements=READ_STATEMENT_CACHE)
+    conn.execute("PRAGMA query_only=1")
+    return conn
+
+
+@contextmanager
+def read_db():
+    """Borrow a pooled read-only connection (sqlite3.Row rows).
+
+    Falls back to an ordinary connection when the file can't be opened
+    read-only (fresh install before init_db created it).
+    """
+    from src.core import db
+    path = db.DB_PATH
+    stale = []
+    with _pool_lock:
+        if path not in _pools:
+            # DB_PATH moved (tests repoint it per case) — drop idle
+            # connections to the old file rather than hoarding them.
+            for other in list(_pools):
+                stale.extend(_pools.pop(other))
+        idle = _pools.setdefault(path, [])
+        conn = idle.pop() if idle else None
+    for old in stale:
+        old.close()
+    pooled = True
+    if conn is None:
+        try:
+            conn = _open_readonly(path)
+            _bump("read_opens")
+        except sqlite3.OperationalError as e:
+            log.debug("read-only open failed (%s) — using a writable connection", e)
+            conn = db._make_connection()
+            pooled = False
+    conn.row_factory = sqlite3.Row
+    try:
+        yield conn
+    finally:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            pooled = False
+        with _pool_lock:
+            idle = _pools.setdefault(path, [])
+            keep = pooled and len(idle) < _env_int("DB_READ_POOL_SIZE", 8)
+            if keep:
+                idle.append(conn)
+        if not keep:
+            conn.close()
+
+
+def close_read_pool() -> None:
+    with _pool_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for idle in pools:
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception as e:
+                log.debug("read pool close: %s", e)
+
+
+def writer_stats() -> dict:
+    """Queue depth, batching and lock-wait numbers for `/api/health`."""
+    with _metrics_lock:
+        counters = dict(_counters)
+        lock_wait = _summary(_lock_wait_ms)
+        queue_wait = _summary(_queue_wait_ms)
+    with _pool_lock:
+        idle = sum(len(v) for v in _pools.values())
+    batches = counters.get("batches", 0)
+    return {
+        "enabled": enabled(),
+        "running": _writer.running(),
+        "queue_depth": _writer.depth(),
+        "batches": batches,
+        "jobs": counters.get("jobs", 0),
+        "inline_jobs": counters.get("inline_jobs", 0),
+        "job_errors": counters.get("job_errors", 0),
+        "avg_batch": round(counters.get("jobs", 0) / batches, 2) if batches else 0.0,
+        "lock_errors": counters.get("lock_errors", 0),
+        "lock_wait": lock_wait,
+        "queue_wait": queue_wait,
+        "read_pool_idle": idle,
+        "read_opens": counters.get("read_opens", 0),
+    }
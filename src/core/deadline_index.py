@@ -0,0 +1,224 @@
+"""deadline_index.py — incrementally maintained due-date index over PCs and RFQs.
+
+`routes_deadlines._scan_deadlines` used to load every price check and
+every RFQ, decode each blob and parse its due date — on every 60-second
+`/api/deadlines` poll from every open tab, on `/api/deadlines/critical`,
+and in notify_agent's hourly deadline watcher. The cost grew with
+records × tabs even though only a handful of records are ever inside
+the window those callers care about.
+
+This module keeps one small row per PC / RFQ in `deadline_index`:
+
+    due_ts        epoch seconds of the parsed deadline (NULL = no usable
+                  due date, never returned)
+    status        record status, so "already sent" rows are filtered in SQL
+    is_test       test-record flag (CR-5: never alert on test records)
+    quarantined   ghost-quarantine flag (hidden from the triage queue)
+    item_json     the static part of the deadline item, pre-rendered
+
+Rows are re-indexed from the change feed (core/change_feed.py, the same
+drain the dashboard funnel uses), so only records written since the last
+sync are read. data_layer's save paths sync right after they commit; a
+read never syncs — if some other writer (a raw status UPDATE, a script)
+left changes pending, it answers from the index and starts one
+background refresh. Time-dependent fields (countdown, urgency) are
+computed by the caller on the few rows returned.
+
+The table lives in db.SCHEMA. routes_deadlines registers the indexers.
+
+Usage:
+    from src.core import deadline_index
+
+    deadline_index.register({"price_checks": index_pc, "rfqs": index_rfq})
+    items = deadline_index.query(
+        since=time.time() - 72 * 3600,
+        exclude_statuses=("sent", "won", "lost"))
+"""
+
+import json
+import logging
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.core import change_feed
+
+log = logging.getLogger("reytech.deadline_index")
+
+CONSUMER = "deadline_index"     # change-feed consumer name
+
+# fn(raw_row_dict) -> {"due_ts", "status", "is_test", "quarantined", "item"}
+Indexer = Callable[[dict], Optional[dict]]
+
+_indexers: Dict[str, Indexer] = {}
+
+_sync_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+_refresher: Optional[threading.Thread] = None
+
+_stats_lock = threading.Lock()
+_counters = {"queries": 0, "reindexed": 0, "refreshes": 0}
+
+
+def _conn():
+    from src.core.db import get_db
+    return get_db()
+
+
+def install_schema(conn) -> None:
+    """Drop what the earlier trigger-kept design left on an existing DB
+    (the dl_ triggers and the per-row ver/built_ver columns) — called by
+    init_db. The next sync re-indexes every record."""
+    for (name,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' "
+            "AND name LIKE 'dl\\_%' ESCAPE '\\'").fetchall():
+        conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+    cols = {r[1] for r in conn.execute("PRAGMA table_info(deadline_index)")}
+    if "ver" in cols:
+        conn.execute("DROP INDEX IF EXISTS idx_deadline_index_dirty")
+        conn.execute("ALTER TABLE deadline_index DROP COLUMN ver")
+        conn.execute("ALTER TABLE deadline_index DROP COLUMN built_ver")
+        change_feed.reset(conn, CONSUMER)
+        log.info("deadline index migrated off ver/built_ver")
+
+
+def register(indexers: Dict[str, Indexer]) -> None:
+    """Set the indexer per record table: `fn(row_dict)` returning the
+    index fields for that raw row (None = no usable due date)."""
+    _indexers.update(indexers)
+
+
+def sync(indexers: Optional[Dict[str, Indexer]] = None) -> int:
+    """Re-index rows written since the last sync; return how many.
+
+    Uses the registered indexers unless `indexers` is given. Rows whose
+    source is gone are dropped.
+    """
+    indexers = indexers or dict(_indexers)
+    n = 0
+    with _sync_lock, _conn() as conn:
+        for table, index in indexers.items():
+            def handle(rid, at, row, table=table, index=index):
+                current = (table, rid, at)
+                if row is None:
+                    conn.execute("DELETE FROM deadline_index WHERE kind=? AND id=? "
+                                 f"AND {change_feed.CURRENT_SQL}", (table, rid) + current)
+                    return
+                try:
+                    fields = index(row) or {}
+                except Exception as e:
+                    log.debug("deadline index %s/%s: %s", table, rid, e)
+                    fields = {}
+                item = fields.get("item")
+                conn.execute(
+                    "INSERT INTO deadline_index(kind, id, due_ts, status, is_test, "
+                    "quarantined, item_json) SELECT ?, ?, ?, ?, ?, ?, ? "
+                    f"WHERE {change_feed.CURRENT_SQL} "
+                    "ON CONFLICT(kind, id) DO UPDATE SET due_ts=excluded.due_ts, "
+                    "status=excluded.status, is_test=excluded.is_test, "
+                    "quarantined=excluded.quarantined, item_json=excluded.item_json",
+                    (table, rid,
+                     fields.get("due_ts") if item else None,
+                     fields.get("status") or "",
+                     1 if fields.get("is_test") else 0,
+                     1 if fields.get("quarantined") else 0,
+                     json.dumps(item, default=str) if item else None) + current)
+            n += change_feed.drain(conn, CONSUMER, table, handle)
+    if n:
+        with _stats_lock:
+            _counters["reindexed"] += n
+    return n
+
+
+def on_write() -> None:
+    """Sync after a record write has committed (data_layer save paths).
+    No-op until the indexers are registered."""
+    if not _indexers:
+        return
+    try:
+        sync()
+    except Exception as e:
+        log.debug("deadline index sync after write: %s", e)
+
+
+def _pending() -> int:
+    with _conn() as conn:
+        return sum(change_feed.pending(conn, CONSUMER, t) for t in _indexers)
+
+
+def _refresh() -> None:
+    global _refresher
+    try:
+        sync()
+        with _stats_lock:
+            _counters["refreshes"] += 1
+    except Exception as e:
+        log.warning("deadline index refresh failed: %s", e)
+    finally:
+        from src.core.db import close_thread_db
+        close_thread_db()
+        with _refresh_lock:
+            _refresher = None
+
+
+def refresh_in_background() -> Optional[threading.Thread]:
+    """Start one background sync unless one is already running; return
+    the running thread."""
+    global _refresher
+    with _refresh_lock:
+        if _refresher is None and _indexers:
+            _refresher = threading.Thread(target=_refresh, daemon=True,
+                                          name="deadline-index-refresh")
+            _refresher.start()
+        return _refresher
+
+
+def query(since: Optional[float] = None, until: Optional[float] = None,
+          exclude_statuses: Iterable[str] = (),
+          include_quarantined: bool = True) -> List[dict]:
+    """Return the stored items due in [since, until], oldest first. Test
+    records and rows without a due date are never returned. Changes not
+    yet indexed are picked up by a background refresh, not by this read."""
+    sql = ("SELECT item_json FROM deadline_index "
+           "WHERE is_test = 0 AND due_ts IS NOT NULL")
+    args: list = []
+    if since is not None:
+        sql += " AND due_ts >= ?"
+        args.append(since)
+    if until is not None:
+        sql += " AND due_ts <= ?"
+        args.append(until)
+    statuses = list(exclude_statuses)
+    if statuses:
+        sql += f" AND status NOT IN ({','.join('?' * len(statuses))})"
+        args.extend(statuses)
+    if not include_quarantined:
+        sql += " AND quarantined = 0"
+    with _conn() as conn:
+        rows = conn.execute(sql + " ORDER BY due_ts", args).fetchall()
+    if _indexers and _pending():
+        refresh_in_background()
+    with _stats_lock:
+        _counters["queries"] += 1
+    return [json.loads(r["item_json"]) for r in rows]
+
+
+def invalidate() -> None:
+    """Re-index every row on the next sync (e.g. after the
+    deadline-parsing rules change)."""
+    with _conn() as conn:
+        change_feed.reset(conn, CONSUMER)
+    refresh_in_background()
+
+
+def index_stats() -> dict:
+    with _stats_lock:
+        counters = dict(_counters)
+    try:
+        with _conn() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*), SUM(due_ts IS NOT NULL) FROM deadline_index").fetchone()
+        dirty = _pending()
+    except Exception as e:
+        return {"error": str(e), **counters}
+    return {"records": row[0], "with_due": row[1] or 0, "dirty": dirty,
+            **counters}
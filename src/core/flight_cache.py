@@ -0,0 +1,295 @@
+"""flight_cache.py — single-flight TTL cache with an optional SQLite tier.
+
+Module-level caches such as `_load_price_checks`' 30-second PC cache and
+`/api/dashboard/init`'s memo were plain globals checked and refilled
+without a lock. When one went cold, each gunicorn request thread (plus
+any agent thread) started its own identical full rebuild, all fighting
+over the GIL and the SQLite connection — and every `--max-requests`
+worker recycle emptied them again.
+
+`FlightCache` fixes both:
+
+  * single-flight — per key, one caller (the leader) runs the builder;
+    concurrent callers wait for and share its result (or its exception).
+  * invalidation-safe — `invalidate()` bumps a generation; a build that
+    started before the invalidation still answers the callers that were
+    waiting on it, but its result is never stored, and callers arriving
+    after the invalidation start a fresh build.
+  * persistent tier (persist=True) — fresh builds are written to the
+    `flight_cache` table in reytech.db. A memory miss first looks there,
+    so a recycled worker (or a sibling worker) starts warm. Rows honour
+    the same TTL from their original build time; `invalidate()` deletes
+    them. Values must be JSON-serializable. Only worth it when the build
+    costs far more than decoding its output: a cache whose builder is
+    itself a SQLite read (the PC load) just adds write churn.
+
+The memory tier hands every caller the same object, like the globals it
+replaces — callers must not mutate cached values in place.
+
+Usage:
+    from src.core.flight_cache import FlightCache
+
+    _PC_CACHE = FlightCache("price_checks", ttl=30,
+                            cacheable=lambda d: len(d) < 500)
+    data = _PC_CACHE.get("all", _build_price_checks)
+    _PC_CACHE.invalidate()       # after a write commits
+    _PC_CACHE.stats()            # {"hits": ..., "builds": ..., "waits": ...}
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+log = logging.getLogger("reytech.flight_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS flight_cache (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    built_at    REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+_schema_lock = threading.Lock()
+_schema_ready: set = set()      # DB paths whose table exists
+
+_registry_lock = threading.Lock()
+_registry: Dict[str, "FlightCache"] = {}
+
+_MISS = object()
+
+
+def _db_path() -> str:
+    from src.core.db import DB_PATH
+    return DB_PATH
+
+
+def _ensure_schema(conn) -> None:
+    path = _db_path()
+    if path in _schema_ready:
+        return
+    with _schema_lock:
+        if path not in _schema_ready:
+            conn.executescript(_SCHEMA)
+            _schema_ready.add(path)
+
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class FlightCache:
+    """One named cache. See module docstring.
+
+    Args:
+        namespace: name for stats and the persistent tier's partition.
+        ttl: seconds a built value stays fresh.
+        persist: also keep values in the `flight_cache` table.
+        cacheable: predicate on a built value; False means "return it but
+            don't keep it" (e.g. too large to hold in memory).
+        wait_timeout: seconds a follower waits on the leader before
+            building for itself (a wedged builder must not hang requests).
+    """
+
+    def __init__(self, namespace: str, ttl: float, persist: bool = False,
+                 cacheable: Optional[Callable[[Any], bool]] = None,
+                 wait_timeout: float = 120.0):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.persist = persist
+        self.cacheable = cacheable
+        self.wait_timeout = wait_timeout
+        self._lock = threading.Lock()
+        self._persist_lock = threading.Lock()
+        self._entries: Dict[Hashable, tuple] = {}      # key → (value, built_at)
+        self._flights: Dict[tuple, _Flight] = {}      # (key, gen) → flight
+        self._epoch = 0
+        self._gens: Dict[Hashable, int] = {}
+        self._stats = {"hits": 0, "warm_loads": 0, "builds": 0,
+                       "waits": 0, "wait_timeouts": 0, "errors": 0,
+                       "invalidations": 0}
+        with _registry_lock:
+            _registry[namespace] = self
+
+    def __repr__(self) -> str:
+        return (f"<FlightCache {self.namespace} ttl={self.ttl}s "
+                f"persist={self.persist}>")
+
+    def _gen(self, key) -> tuple:
+        return (self._epoch, self._gens.get(key, 0))
+
+    # ── reads ────────────────────────────────────────────────────────────
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Return the fresh value for `key`, building it at most once
+        across concurrent callers."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                self._stats["hits"] += 1
+                return entry[0]
+            gen = self._gen(key)
+            flight = self._flights.get((key, gen))
+            leader = flight is None
+            if leader:
+                flight = self._flights[(key, gen)] = _Flight()
+            else:
+                self._stats["waits"] += 1
+
+        if not leader:
+            if not flight.done.wait(self.wait_timeout):
+                with self._lock:
+                    self._stats["wait_timeouts"] += 1
+                log.warning("flight_cache %s/%s: leader still building after "
+                            "%.0fs — building independently",
+                            self.namespace, key, self.wait_timeout)
+                return build()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        fresh = False
+        built_at = time.time()
+        try:
+            value = self._load_persisted(key) if self.persist else _MISS
+            if value is _MISS:
+                value = build()
+                built_at, fresh = time.time(), True
+            else:
+                value, built_at = value
+            flight.value = value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            keep = False
+            with self._lock:
+                self._flights.pop((key, gen), None)
+                if flight.error is not None:
+                    self._stats["errors"] += 1
+                else:
+                    self._stats["builds" if fresh else "warm_loads"] += 1
+                    keep = self.cacheable is None or bool(self.cacheable(flight.value))
+                    if gen == self._gen(key):
+                        if keep:
+                            self._entries[key] = (flight.value, built_at)
+                        else:
+                            self._entries.pop(key, None)
+            flight.done.set()
+
+        if fresh and keep and self.persist:
+            self._store_persisted(key, gen, value, built_at)
+        return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Fresh in-memory value or None; never builds (diagnostics)."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and time.time() - entry[1] < self.ttl:
+            return entry[0]
+        return None
+
+    # ── invalidation ─────────────────────────────────────────────────────
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """Drop `key` (or everything) from both tiers. Builds already in
+        flight finish for their waiters but are not stored."""
+        with self._lock:
+            self._stats["invalidations"] += 1
+            if key is None:
+                self._epoch += 1
+                self._gens.clear()
+                self._entries.clear()
+            else:
+                self._gens[key] = self._gens.get(key, 0) + 1
+                self._entries.pop(key, None)
+        if not self.persist:
+            return
+        with self._persist_lock:
+            try:
+                from src.core.db import get_db
+                with get_db() as conn:
+                    _ensure_schema(conn)
+                    if key is None:
+                        conn.execute("DELETE FROM flight_cache WHERE namespace=?",
+                                     (self.namespace,))
+                    else:
+                        conn.execute("DELETE FROM flight_cache WHERE namespace=? AND key=?",
+                                     (self.namespace, str(key)))
+            except Exception as e:
+                log.warning("flight_cache %s invalidate (persistent) failed: %s",
+                            self.namespace, e)
+
+    # ── persistent tier ──────────────────────────────────────────────────
+
+    def _load_persisted(self, key):
+        try:
+            from src.core.db import get_db
+            with get_db() as conn:
+                _ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT value, built_at FROM flight_cache "
+                    "WHERE namespace=? AND key=? AND built_at>?",
+                    (self.namespace, str(key), time.time() - self.ttl)).fetchone()
+            if row is None:
+                return _MISS
+            return json.loads(row["value"]), row["built_at"]
+        except Exception as e:
+            log.debug("flight_cache %s/%s persistent read failed: %s",
+                      self.namespace, key, e)
+            return _MISS
+
+    def _store_persisted(self, key, gen, value, built_at) -> None:
+        # Checked under _persist_lock so an invalidate() that raced this
+        # build either stops the write or deletes it right after.
+        with self._persist_lock:
+            with self._lock:
+                if gen != self._gen(key):
+                    return
+            try:
+                payload = json.dumps(value, default=str)
+                from src.core.db import get_db
+                with get_db() as conn:
+                    _ensure_schema(conn)
+                    conn.execute(
+                        "INSERT OR REPLACE INTO flight_cache "
+                        "(namespace, key, value, built_at) VALUES (?,?,?,?)",
+                        (self.namespace, str(key), payload, built_at))
+            except Exception as e:
+                log.warning("flight_cache %s/%s persistent write failed: %s",
+                            self.namespace, key, e)
+
+    # ── metrics ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        with self._lock:
+            out = dict(self._stats)
+            out["entries"] = len(self._entries)
+            out["in_flight"] = len(self._flights)
+        out.update(namespace=self.namespace, ttl=self.ttl, persist=self.persist)
+        return out
+
+
+def all_stats() -> Dict[str, dict]:
+    """Stats for every FlightCache constructed in this process."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    return {c.namespace: c.stats() for c in caches}
+
+
+def invalidate_all() -> None:
+    """Invalidate every FlightCache in this process (e.g. after the DB
+    path changes underneath them)."""
+    with _registry_lock:
+        caches = list(_registry.values())
+    for c in caches:
+        c.invalidate()
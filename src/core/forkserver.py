@@ -0,0 +1,46 @@
+"""forkserver.py — the one multiprocessing context for child processes.
+
+Child processes (parse_multi_pc's page pool, the QA monitor's isolated
+cycle) come from a forkserver rather than a fork of the web process:
+forking a process with live request and scheduler threads can copy a
+held lock into the child.
+
+A process has a single forkserver, and its preload list only takes
+effect if it is set before the server starts. Each caller used to set
+its own list, so whichever ran first decided what the other's children
+had imported. The list is now set here, once, for every caller.
+
+Usage:
+    from src.core.forkserver import context
+
+    ProcessPoolExecutor(max_workers=4, mp_context=context())
+"""
+
+import logging
+import multiprocessing
+import threading
+
+log = logging.getLogger("reytech.forkserver")
+
+# Imported once in the forkserver, so children start warm. A module that
+# fails to import is skipped by multiprocessing, not fatal.
+PRELOAD = ("src.forms.price_check", "src.agents.qa_agent")
+
+_lock = threading.Lock()
+_ctx = None
+
+
+def context():
+    """The shared forkserver context (the platform default where
+    forkserver is unavailable)."""
+    global _ctx
+    with _lock:
+        if _ctx is None:
+            try:
+                ctx = multiprocessing.get_context("forkserver")
+                ctx.set_forkserver_preload(list(PRELOAD))
+            except ValueError:
+                log.info("forkserver unavailable — using the default start method")
+                ctx = multiprocessing.get_context()
+            _ctx = ctx
+        return _ctx
@@ -0,0 +1,91 @@
+"""lazy_import.py — defer heavy third-party imports to first use.
+
+`src.api.dashboard` imports the form fillers and the RFQ parser at module
+top, and every gunicorn worker (re)boot therefore paid for pypdf and
+Pillow before a single request was served — even though only the
+PDF-generation routes ever touch them.
+
+`lazy_attr("pypdf", "PdfReader")` returns a stand-in bound to a module
+global. The first call or attribute access imports the real object and
+every later use goes straight to it:
+
+    PdfReader = lazy_attr("pypdf", "PdfReader")
+    PdfReader(path)               # imports pypdf here, not at module load
+    Image = lazy_attr("PIL", "Image")
+    Image.open(buf)
+
+The stand-in is not the real class, so don't use it with isinstance()
+or as a base class — import the name directly where that's needed.
+
+Usage:
+    from src.core.lazy_import import lazy_attr, lazy_module, resolved
+"""
+
+import importlib
+import threading
+
+_lock = threading.Lock()
+
+
+class _LazyTarget:
+    """Resolves `module[:attr]` on first use and forwards everything."""
+
+    __slots__ = ("_lazy_module", "_lazy_attr", "_lazy_obj")
+
+    def __init__(self, module: str, attr: str = ""):
+        object.__setattr__(self, "_lazy_module", module)
+        object.__setattr__(self, "_lazy_attr", attr)
+        object.__setattr__(self, "_lazy_obj", None)
+
+    def _resolve(self):
+        obj = object.__getattribute__(self, "_lazy_obj")
+        if obj is not None:
+            return obj
+        with _lock:
+            obj = object.__getattribute__(self, "_lazy_obj")
+            if obj is None:
+                module = object.__getattribute__(self, "_lazy_module")
+                attr = object.__getattribute__(self, "_lazy_attr")
+                obj = importlib.import_module(module)
+                if attr:
+                    try:
+                        obj = getattr(obj, attr)
+                    except AttributeError:
+                        # `from PIL import Image`: a submodule that nothing
+                        # has imported yet isn't an attribute of the package
+                        obj = importlib.import_module(f"{module}.{attr}")
+                object.__setattr__(self, "_lazy_obj", obj)
+        return obj
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._resolve(), name, value)
+
+    def __repr__(self):
+        target = object.__getattribute__(self, "_lazy_module")
+        attr = object.__getattribute__(self, "_lazy_attr")
+        state = "resolved" if object.__getattribute__(self, "_lazy_obj") is not None else "pending"
+        return f"<lazy {target}{'.' + attr if attr else ''} ({state})>"
+
+
+def lazy_module(module: str):
+    """Stand-in for `import module` that imports on first attribute access."""
+    return _LazyTarget(module)
+
+
+def lazy_attr(module: str, attr: str):
+    """Stand-in for `from module import attr` that imports on first use."""
+    return _LazyTarget(module, attr)
+
+
+def resolved(obj) -> bool:
+    """True once a lazy stand-in has imported its target (always True for
+    ordinary objects). For tests and the boot profiler."""
+    if isinstance(obj, _LazyTarget):
+        return object.__getattribute__(obj, "_lazy_obj") is not None
+    return True
@@ -0,0 +1,229 @@
+"""live_events.py — one multiplexed server-sent-events stream for the
+always-on page widgets (nav bell, deadline strip, quoting pulse).
+
+Every open tab used to run its own `setInterval` pollers against
+`/api/notifications/bell-count`, `/api/outbox/pending-count`,
+`/api/deadlines` and `/api/quoting/status` — mostly answering "nothing
+changed" while holding one of the single gunicorn worker's 4 request
+threads. Instead a browser opens one `/api/live/stream` (base.html elects
+a leader tab via the Web Locks API and fans events out to the others
+over a BroadcastChannel), and the server pushes a channel's payload only
+when its fingerprint changes.
+
+Server-side cost doesn't grow with the number of streams: each channel's
+payload comes from a `FlightCache` with a short TTL, so N streams ticking
+at once share one build per TTL window.
+
+A stream occupies a request thread while it is open, so:
+
+  * streams are keyed by a browser session id — a second stream for the
+    same sid supersedes the first (a `bye` event tells it not to
+    reconnect);
+  * at most LIVE_MAX_STREAMS are open process-wide; past that
+    `open_stream` raises StreamBusy and the caller answers 503, and the
+    page keeps polling as before;
+  * a stream ends after LIVE_STREAM_MAX_SECONDS and the browser
+    reconnects (SSE `retry:`), sending `Last-Event-ID` — which encodes
+    the fingerprints it already has, so only channels that changed in
+    between are re-sent.
+
+Usage:
+    from src.core import live_events
+
+    live_events.register("bell", build_bell_payload, ttl=10)
+    stream = live_events.open_stream(sid, last_event_id=header_value)
+    for chunk in stream.events():     # SSE-framed strings
+        ...
+
+Env:
+    LIVE_MAX_STREAMS         concurrent streams per process (default 2)
+    LIVE_STREAM_MAX_SECONDS  stream lifetime before reconnect (default 300)
+    LIVE_TICK_SECONDS        how often a stream checks for changes (default 5)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from src.core.flight_cache import FlightCache
+
+log = logging.getLogger("reytech.live_events")
+
+MAX_STREAMS = int(os.environ.get("LIVE_MAX_STREAMS", "2"))
+STREAM_MAX_SECONDS = float(os.environ.get("LIVE_STREAM_MAX_SECONDS", "300"))
+TICK_SECONDS = float(os.environ.get("LIVE_TICK_SECONDS", "5"))
+HEARTBEAT_SECONDS = 25.0
+RETRY_MS = 3000
+
+
+class StreamBusy(Exception):
+    """Every stream slot is taken — fall back to polling."""
+
+
+class _Channel:
+    __slots__ = ("name", "produce", "fingerprint", "cache")
+
+    def __init__(self, name, produce, fingerprint, ttl):
+        self.name = name
+        self.produce = produce
+        self.fingerprint = fingerprint
+        self.cache = FlightCache(f"live_{name}", ttl=ttl)
+
+    def snapshot(self) -> tuple:
+        """(payload, fingerprint), shared by every stream within the TTL."""
+        return self.cache.get("current", self._build)
+
+    def _build(self) -> tuple:
+        payload = self.produce()
+        basis = self.fingerprint(payload) if self.fingerprint else payload
+        digest = hashlib.sha1(
+            json.dumps(basis, sort_keys=True, default=str).encode()).hexdigest()
+        return payload, digest[:12]
+
+
+_channels: Dict[str, _Channel] = {}
+_channels_lock = threading.Lock()
+
+_streams: Dict[str, "LiveStream"] = {}
+_streams_lock = threading.Lock()
+
+_stats_lock = threading.Lock()
+_counters = {"opened": 0, "superseded": 0, "busy": 0, "events": 0}
+
+
+def register(name: str, produce: Callable[[], Any],
+             fingerprint: Optional[Callable[[Any], Any]] = None,
+             ttl: float = 10.0) -> None:
+    """Add (or replace) a channel. `produce()` returns a JSON-able payload;
+    `fingerprint(payload)` picks the part whose change is worth pushing
+    (default: the whole payload)."""
+    with _channels_lock:
+        _channels[name] = _Channel(name, produce, fingerprint, ttl)
+
+
+def channels() -> List[str]:
+    with _channels_lock:
+        return list(_channels)
+
+
+def _bump(field: str, n: int = 1) -> None:
+    with _stats_lock:
+        _counters[field] += n
+
+
+def _format_id(fps: Dict[str, str]) -> str:
+    return ";".join(f"{k}={v}" for k, v in sorted(fps.items()))
+
+
+def _parse_id(raw: str) -> Dict[str, str]:
+    out = {}
+    for part in (raw or "").split(";"):
+        name, sep, fp = part.partition("=")
+        if sep and name and fp:
+            out[name.strip()] = fp.strip()
+    return out
+
+
+def _frame(event: str, data: Any, event_id: str = "") -> str:
+    head = f"id: {event_id}\n" if event_id else ""
+    return f"{head}event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+class LiveStream:
+    """One open SSE stream. Create with `open_stream`."""
+
+    def __init__(self, sid: str, names: List[str], last_event_id: str = ""):
+        self.sid = sid
+        self.names = names
+        self.sent = {k: v for k, v in _parse_id(last_event_id).items() if k in names}
+        self.reason = ""
+        self._stop = threading.Event()
+
+    def stop(self, reason: str) -> None:
+        self.reason = self.reason or reason
+        self._stop.set()
+
+    def close(self) -> None:
+        """Release the stream slot (idempotent)."""
+        with _streams_lock:
+            if _streams.get(self.sid) is self:
+                del _streams[self.sid]
+        self._stop.set()
+
+    def _changes(self) -> Iterator[str]:
+        for name in self.names:
+            with _channels_lock:
+                ch = _channels.get(name)
+            if ch is None:
+                continue
+            try:
+                payload, fp = ch.snapshot()
+            except Exception as e:
+                log.debug("live channel %s failed: %s", name, e)
+                continue
+            if self.sent.get(name) == fp:
+                continue
+            self.sent[name] = fp
+            _bump("events")
+            yield _frame(name, payload, _format_id(self.sent))
+
+    def events(self, max_seconds: Optional[float] = None,
+               tick: Optional[float] = None) -> Iterator[str]:
+        """SSE chunks until the lifetime runs out, the stream is
+        superseded, or the client goes away (GeneratorExit on yield)."""
+        max_seconds = STREAM_MAX_SECONDS if max_seconds is None else max_seconds
+        tick = TICK_SECONDS if tick is None else tick
+        started = last_write = time.monotonic()
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while True:
+                wrote = False
+                for chunk in self._changes():
+                    wrote = True
+                    yield chunk
+                now = time.monotonic()
+                if wrote:
+                    last_write = now
+                elif now - last_write >= HEARTBEAT_SECONDS:
+                    last_write = now
+                    yield _frame("ping", {"t": round(time.time())})
+                if now - started >= max_seconds:
+                    self.stop("expired")
+                if self._stop.wait(tick):
+                    break
+            yield _frame("bye", {"reason": self.reason or "closed"})
+        finally:
+            self.close()
+
+
+def open_stream(sid: str, names: Optional[List[str]] = None,
+                last_event_id: str = "") -> LiveStream:
+    """Claim a stream slot for `sid`, superseding its previous stream.
+    Raises StreamBusy when every slot belongs to other sessions."""
+    known = channels()
+    names = [n for n in (names or known) if n in known]
+    stream = LiveStream(sid, names, last_event_id)
+    with _streams_lock:
+        old = _streams.get(sid)
+        if old is None and len(_streams) >= MAX_STREAMS:
+            _bump("busy")
+            raise StreamBusy(f"{len(_streams)} live streams already open")
+        _streams[sid] = stream
+    if old is not None:
+        old.stop("superseded")
+        _bump("superseded")
+    _bump("opened")
+    return stream
+
+
+def live_stats() -> dict:
+    with _stats_lock:
+        out = dict(_counters)
+    with _streams_lock:
+        out["open"] = len(_streams)
+    out.update(max_streams=MAX_STREAMS, channels=channels())
+    return out
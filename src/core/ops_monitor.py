@@ -938,7 +938,9 @@ def start_ops_monitor():
                     # cautious first deploy can stage as dry-run and flip
                     # to live without redeploying. lifecycle_events is
                     # excluded by AUTO_PURGE_ALLOWLIST (compliance audit
-                    # trail — opt-in only).
+                    # trail — opt-in only). DB_RETENTION_MODE=archive moves
+                    # cold rows (lifecycle_events included) to monthly
+                    # archive DBs instead of deleting them.
                     try:
                         from src.core.db_retention import run_daily_purge
                         purge = run_daily_purge()
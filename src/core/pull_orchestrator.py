@@ -276,4 +276,6 @@ def _store_results(conn, results: list, connector_id: str) -> int:
         except Exception as e:
             log.debug("Store: %s", e)
     conn.commit()
+    from src.core.dashboard_snapshot import mark_dirty
+    mark_dirty("scprs_po_master", "scprs_po_lines")
     return count
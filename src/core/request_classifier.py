@@ -33,6 +33,8 @@ import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.rule_engine import RuleSet
+
 log = logging.getLogger("reytech.classifier")
 
 
@@ -238,6 +240,18 @@ INSTITUTION_TO_AGENCY: Dict[str, str] = {
     "VHC-VRV": "calvet",
 }
 
+# Each pattern family is merged into one precompiled alternation
+# (src/core/rule_engine.py) so the corpus is scanned once per family
+# instead of once per pattern. The lists above stay the source of truth.
+_AGENCY_RULES = RuleSet(AGENCY_KEYWORDS, flags=re.IGNORECASE, name="agency_keywords")
+# Institution codes are matched case-sensitively against the uppercased
+# corpus ("CAL" the code, not "cal" in a word).
+_INSTITUTION_RULES = RuleSet(
+    [(rf"\b{re.escape(prefix)}\b", agency_key)
+     for prefix, agency_key in INSTITUTION_TO_AGENCY.items()],
+    name="institution_prefixes",
+)
+
 
 # ── Shape detection signatures ───────────────────────────────────────────
 
@@ -279,16 +293,16 @@ AMS_704_HEADLINE_PATTERNS = [
 DOCUSIGN_PRODUCER = "docusign"
 DOCUSIGN_ENVELOPE_PATTERN = r"Docusign\s*Envelope\s*ID"
 
+_LPA_BODY_RULES = RuleSet(CCHCS_IT_RFQ_BODY_PATTERNS, flags=re.IGNORECASE, name="lpa_body")
+_AMS_704_HEADLINE_RULES = RuleSet(AMS_704_HEADLINE_PATTERNS, flags=re.IGNORECASE, name="ams704_headline")
+
 
 def _has_lpa_body_signal(*text_blobs: str) -> bool:
     """Return True if any blob contains an LPA IT RFQ keyword pattern."""
     corpus = " ".join(t for t in text_blobs if t)
     if not corpus:
         return False
-    for pat in CCHCS_IT_RFQ_BODY_PATTERNS:
-        if re.search(pat, corpus, re.IGNORECASE):
-            return True
-    return False
+    return _LPA_BODY_RULES.any(corpus)
 
 
 # ── Proofpoint SecureMessage detection ────────────────────────────────────
@@ -332,6 +346,10 @@ PROOFPOINT_BODY_PATTERNS = [
     r"Read\s+the\s+Message",  # Proofpoint's primary CTA button text
 ]
 
+_PROOFPOINT_SENDER_RULES = RuleSet(PROOFPOINT_SENDER_PATTERNS, flags=re.IGNORECASE, name="proofpoint_sender")
+_PROOFPOINT_SUBJECT_RULES = RuleSet(PROOFPOINT_SUBJECT_PATTERNS, flags=re.IGNORECASE, name="proofpoint_subject")
+_PROOFPOINT_BODY_RULES = RuleSet(PROOFPOINT_BODY_PATTERNS, flags=re.IGNORECASE, name="proofpoint_body")
+
 
 def _detect_proofpoint_securemessage(
     email_subject: str = "",
@@ -358,27 +376,24 @@ def _detect_proofpoint_securemessage(
     reasons: List[str] = []
     sender = (email_sender or "").lower()
     sender_hit = False
-    for pat in PROOFPOINT_SENDER_PATTERNS:
-        if re.search(pat, sender, re.IGNORECASE):
-            sender_hit = True
-            reasons.append(f"proofpoint sender pattern: {pat}")
-            break
+    rule = _PROOFPOINT_SENDER_RULES.first(sender)
+    if rule:
+        sender_hit = True
+        reasons.append(f"proofpoint sender pattern: {rule.pattern}")
 
     subject_hit = False
     if email_subject:
-        for pat in PROOFPOINT_SUBJECT_PATTERNS:
-            if re.search(pat, email_subject, re.IGNORECASE):
-                subject_hit = True
-                reasons.append(f"proofpoint subject pattern: {pat}")
-                break
+        rule = _PROOFPOINT_SUBJECT_RULES.first(email_subject)
+        if rule:
+            subject_hit = True
+            reasons.append(f"proofpoint subject pattern: {rule.pattern}")
 
     body_hit = False
     if email_body:
-        for pat in PROOFPOINT_BODY_PATTERNS:
-            if re.search(pat, email_body, re.IGNORECASE):
-                body_hit = True
-                reasons.append(f"proofpoint body pattern: {pat}")
-                break
+        rule = _PROOFPOINT_BODY_RULES.first(email_body)
+        if rule:
+            body_hit = True
+            reasons.append(f"proofpoint body pattern: {rule.pattern}")
 
     attachment_hit = False
     if attachments:
@@ -572,15 +587,10 @@ def classify_request(
         corpus_parts.append(os.path.basename(path))
     corpus = " ".join(corpus_parts).upper()
 
-    agency_matches = []
-    for pattern, agency_key in AGENCY_KEYWORDS:
-        if re.search(pattern, corpus, re.IGNORECASE):
-            agency_matches.append(agency_key)
+    agency_matches = [rule.value for rule in _AGENCY_RULES.hits(corpus)]
 
     # Institution prefix scan (handles 2-4 letter codes like CIW, VHC-WLA)
-    for prefix, agency_key in INSTITUTION_TO_AGENCY.items():
-        if re.search(rf"\b{re.escape(prefix)}\b", corpus):
-            agency_matches.append(agency_key)
+    agency_matches.extend(rule.value for rule in _INSTITUTION_RULES.hits(corpus))
 
     # Shape-implies-agency fallback: a CCHCS packet / LPA IT RFQ by definition
     # IS a CCHCS request (no other agency uses these form layouts). Handles
@@ -800,9 +810,7 @@ def _classify_pdf(path: str) -> Tuple[str, Dict[str, Any]]:
         DOCUSIGN_PRODUCER in info["producer"].lower()
         or re.search(DOCUSIGN_ENVELOPE_PATTERN, text_sample, re.IGNORECASE)
     )
-    is_704_by_text = any(
-        re.search(p, text_sample, re.IGNORECASE) for p in AMS_704_HEADLINE_PATTERNS
-    )
+    is_704_by_text = _AMS_704_HEADLINE_RULES.any(text_sample)
 
     if is_docusign and is_704_by_text:
         return SHAPE_PC_704_PDF_DOCUSIGN, info
@@ -850,6 +858,8 @@ _PRICING_PAGE_MARKERS: List[Tuple[str, int]] = [
     (r"\bTOTAL\s+PRICE\b", 1),
 ]
 
+_PRICING_PAGE_RULES = RuleSet(_PRICING_PAGE_MARKERS, flags=re.IGNORECASE, name="pricing_page")
+
 
 def _pricing_page_score(text: str) -> int:
     """Return non-negative integer 'pricing page' confidence score.
@@ -859,14 +869,7 @@ def _pricing_page_score(text: str) -> int:
     """
     if not text:
         return 0
-    score = 0
-    for pat, weight in _PRICING_PAGE_MARKERS:
-        try:
-            if re.search(pat, text, re.IGNORECASE):
-                score += weight
-        except re.error:
-            continue
-    return score
+    return sum(rule.value for rule in _PRICING_PAGE_RULES.hits(text))
 
 
 def _classify_docx(path: str) -> Tuple[str, Dict[str, Any]]:
@@ -886,7 +889,7 @@ def _classify_docx(path: str) -> Tuple[str, Dict[str, Any]]:
         info["text_sample"] = headline
 
         # 704 detection via headline
-        if any(re.search(p, headline, re.IGNORECASE) for p in AMS_704_HEADLINE_PATTERNS):
+        if _AMS_704_HEADLINE_RULES.any(headline):
             return SHAPE_PC_704_DOCX, info
 
         # Table-based 704 detection (if header is in a table, not a paragraph)
@@ -894,7 +897,7 @@ def _classify_docx(path: str) -> Tuple[str, Dict[str, Any]]:
             for row in t.rows[:3]:
                 for cell in row.cells:
                     ct = cell.text.strip()
-                    if any(re.search(p, ct, re.IGNORECASE) for p in AMS_704_HEADLINE_PATTERNS):
+                    if _AMS_704_HEADLINE_RULES.any(ct):
                         info["text_sample"] = info["text_sample"] + " | " + ct[:60]
                         return SHAPE_PC_704_DOCX, info
 
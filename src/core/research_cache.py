@@ -0,0 +1,428 @@
+"""research_cache.py — SQLite-backed TTL/LRU cache for research lookups.
+
+product_research, web_price_research and item_link_lookup each kept a
+JSON file that was read in full on every lookup and rewritten in full
+(with expiry filtering + sorting) on every store. Under concurrent
+enrichment threads that is both slow and a lost-update race: two
+threads load the same dict, each adds one entry, the last writer wins.
+
+`ResearchCache` replaces those files with one `research_cache` table in
+reytech.db, partitioned by namespace:
+
+    grok        — product_research query lookups (Grok web search)
+    asin        — product_research ASIN lookups
+    web_price   — web_price_research Claude web_search results
+    url_scrape  — item_link_lookup supplier-URL scrapes
+
+Every get/put touches one row. TTL and max-entry trimming run
+incrementally inside `put()` (a bounded batch of expired rows, then the
+least-recently-used overflow), so no call ever rewrites the whole cache.
+Not-found results are cached explicitly as negatives with their own,
+shorter TTL, so a miss at the supplier doesn't re-spend an API call on
+every page load but also doesn't stick for a week.
+
+Usage:
+    from src.core.research_cache import ResearchCache
+
+    _CACHE = ResearchCache("web_price", ttl_days=7, max_entries=3000,
+                           negative_ttl_days=1)
+    hit = _CACHE.get(key)
+    if hit is None:
+        result = expensive_lookup()
+        _CACHE.put(key, result, negative=not result.get("found"))
+    _CACHE.stats()  # {"entries": ..., "hits": ..., "hit_rate": ...}
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+log = logging.getLogger("reytech.research_cache")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_cache (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       TEXT NOT NULL,
+    negative    INTEGER NOT NULL DEFAULT 0,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_research_cache_expires
+    ON research_cache(namespace, expires_at);
+CREATE INDEX IF NOT EXISTS idx_research_cache_lru
+    ON research_cache(namespace, accessed_at);
+"""
+
+# Expired rows removed per put(). Small enough that a put never stalls,
+# large enough that steady-state writes outpace expiry.
+EVICT_BATCH = 50
+
+_DAY = 86400.0
+
+_schema_lock = threading.Lock()
+_schema_ready: set = set()      # DB paths whose table exists
+_legacy_done: set = set()       # (DB path, legacy file) already imported
+
+_stats_lock = threading.Lock()
+_counters: Dict[str, Dict[str, int]] = {}
+
+
+def _now() -> float:
+    return time.time()
+
+
+def _db_path() -> str:
+    from src.core.db import DB_PATH
+    return DB_PATH
+
+
+def _ensure_schema(conn) -> None:
+    path = _db_path()
+    if path in _schema_ready:
+        return
+    with _schema_lock:
+        if path not in _schema_ready:
+            conn.executescript(_SCHEMA)
+            _schema_ready.add(path)
+
+
+def _bump(namespace: str, field: str, n: int = 1) -> None:
+    with _stats_lock:
+        c = _counters.setdefault(namespace, {"hits": 0, "misses": 0,
+                                             "negative_hits": 0, "puts": 0,
+                                             "evictions": 0})
+        c[field] += n
+
+
+class ResearchCache:
+    """One namespace of the shared research cache.
+
+    Args:
+        namespace: partition name (see module docstring).
+        ttl_days: lifetime of a positive entry.
+        max_entries: LRU cap for the namespace.
+        negative_ttl_days: lifetime of a not-found entry; defaults to
+            `ttl_days`.
+
+    Values are JSON-serializable dicts. `get()` returns a fresh dict each
+    call, so callers may annotate the result (`cached["source"] = "cache"`)
+    without mutating the stored row.
+    """
+
+    def __init__(self, namespace: str, ttl_days: float, max_entries: int,
+                 negative_ttl_days: Optional[float] = None):
+        self.namespace = namespace
+        self.ttl_days = ttl_days
+        self.max_entries = max_entries
+        self.negative_ttl_days = (ttl_days if negative_ttl_days is None
+                                  else negative_ttl_days)
+
+    def __repr__(self) -> str:
+        return (f"<ResearchCache {self.namespace} ttl={self.ttl_days}d "
+                f"max={self.max_entries}>")
+
+    def _conn(self):
+        from src.core.db import get_db
+        return get_db()
+
+    # ── reads ────────────────────────────────────────────────────────────
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the live value for `key` (positive or negative), or None.
+
+        Counts toward hit-rate metrics and refreshes the LRU position.
+        Negative entries are returned like any other value — callers tell
+        them apart with their own `found` flag, or via `is_negative()`.
+        """
+        now = _now()
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT value, negative FROM research_cache "
+                    "WHERE namespace=? AND key=? AND expires_at>?",
+                    (self.namespace, key, now)).fetchone()
+                if row is None:
+                    _bump(self.namespace, "misses")
+                    return None
+                conn.execute(
+                    "UPDATE research_cache SET accessed_at=?, hits=hits+1 "
+                    "WHERE namespace=? AND key=?",
+                    (now, self.namespace, key))
+        except Exception as e:
+            log.warning("research_cache get %s/%s failed: %s",
+                        self.namespace, key, e)
+            return None
+        _bump(self.namespace, "negative_hits" if row["negative"] else "hits")
+        return json.loads(row["value"])
+
+    def peek(self, key: str) -> Optional[dict]:
+        """Like `get()` but read-only: no LRU touch, no hit accounting.
+
+        For diagnostics and write-time comparisons (ASIN recycle check)
+        that shouldn't skew the metrics or keep an entry alive.
+        """
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT value FROM research_cache "
+                    "WHERE namespace=? AND key=? AND expires_at>?",
+                    (self.namespace, key, _now())).fetchone()
+        except Exception as e:
+            log.debug("research_cache peek %s/%s failed: %s",
+                      self.namespace, key, e)
+            return None
+        return json.loads(row["value"]) if row else None
+
+    def is_negative(self, key: str) -> bool:
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT negative FROM research_cache "
+                    "WHERE namespace=? AND key=? AND expires_at>?",
+                    (self.namespace, key, _now())).fetchone()
+        except Exception:
+            return False
+        return bool(row and row["negative"])
+
+    def values(self) -> Iterator[dict]:
+        """Yield every live value in the namespace (diagnostics only)."""
+        with self._conn() as conn:
+            _ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT value FROM research_cache "
+                "WHERE namespace=? AND expires_at>?",
+                (self.namespace, _now())).fetchall()
+        for row in rows:
+            yield json.loads(row["value"])
+
+    def __len__(self) -> int:
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                return conn.execute(
+                    "SELECT COUNT(*) FROM research_cache "
+                    "WHERE namespace=? AND expires_at>?",
+                    (self.namespace, _now())).fetchone()[0]
+        except Exception:
+            return 0
+
+    # ── writes ───────────────────────────────────────────────────────────
+
+    def put(self, key: str, value: dict, negative: bool = False,
+            ttl_days: Optional[float] = None,
+            created_at: Optional[float] = None) -> bool:
+        """Insert or replace `key`. Returns False if the write failed.
+
+        `ttl_days` overrides the namespace default for this entry;
+        `created_at` (epoch seconds) backdates it — used when importing
+        legacy entries so they keep their original expiry.
+        """
+        now = _now()
+        created = now if created_at is None else created_at
+        if ttl_days is None:
+            ttl_days = self.negative_ttl_days if negative else self.ttl_days
+        expires = created + ttl_days * _DAY
+        if expires <= now:
+            return False
+        try:
+            payload = json.dumps(value, default=str)
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO research_cache "
+                    "(namespace, key, value, negative, created_at, expires_at, "
+                    " accessed_at, hits) VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (self.namespace, key, payload, 1 if negative else 0,
+                     created, expires, now))
+                evicted = self._evict(conn, now)
+        except Exception as e:
+            log.warning("research_cache put %s/%s failed: %s",
+                        self.namespace, key, e)
+            return False
+        _bump(self.namespace, "puts")
+        if evicted:
+            _bump(self.namespace, "evictions", evicted)
+        return True
+
+    def _evict(self, conn, now: float) -> int:
+        """Drop one batch of expired rows, then trim the LRU overflow."""
+        cur = conn.execute(
+            "DELETE FROM research_cache WHERE rowid IN ("
+            " SELECT rowid FROM research_cache"
+            " WHERE namespace=? AND expires_at<=? LIMIT ?)",
+            (self.namespace, now, EVICT_BATCH))
+        evicted = cur.rowcount or 0
+        total = conn.execute(
+            "SELECT COUNT(*) FROM research_cache WHERE namespace=?",
+            (self.namespace,)).fetchone()[0]
+        overflow = total - self.max_entries
+        if overflow > 0:
+            cur = conn.execute(
+                "DELETE FROM research_cache WHERE rowid IN ("
+                " SELECT rowid FROM research_cache WHERE namespace=?"
+                " ORDER BY accessed_at ASC LIMIT ?)",
+                (self.namespace, overflow))
+            evicted += cur.rowcount or 0
+        return evicted
+
+    def delete(self, key: str) -> bool:
+        """Remove `key`. Returns True if a row was deleted."""
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                cur = conn.execute(
+                    "DELETE FROM research_cache WHERE namespace=? AND key=?",
+                    (self.namespace, key))
+                return (cur.rowcount or 0) > 0
+        except Exception as e:
+            log.warning("research_cache delete %s/%s failed: %s",
+                        self.namespace, key, e)
+            return False
+
+    def clear(self) -> int:
+        with self._conn() as conn:
+            _ensure_schema(conn)
+            cur = conn.execute(
+                "DELETE FROM research_cache WHERE namespace=?",
+                (self.namespace,))
+            return cur.rowcount or 0
+
+    # ── metrics ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict:
+        """Entry counts from the table plus in-process hit/miss counters."""
+        entries = negative = 0
+        try:
+            with self._conn() as conn:
+                _ensure_schema(conn)
+                row = conn.execute(
+                    "SELECT COUNT(*) AS n, COALESCE(SUM(negative), 0) AS neg "
+                    "FROM research_cache WHERE namespace=? AND expires_at>?",
+                    (self.namespace, _now())).fetchone()
+                entries, negative = row["n"], row["neg"]
+        except Exception as e:
+            log.debug("research_cache stats %s failed: %s", self.namespace, e)
+        with _stats_lock:
+            c = dict(_counters.get(self.namespace, {}))
+        hits = c.get("hits", 0) + c.get("negative_hits", 0)
+        lookups = hits + c.get("misses", 0)
+        return {
+            "namespace": self.namespace,
+            "entries": entries,
+            "negative_entries": negative,
+            "max_entries": self.max_entries,
+            "ttl_days": self.ttl_days,
+            "negative_ttl_days": self.negative_ttl_days,
+            "hits": c.get("hits", 0),
+            "negative_hits": c.get("negative_hits", 0),
+            "misses": c.get("misses", 0),
+            "puts": c.get("puts", 0),
+            "evictions": c.get("evictions", 0),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+# ── Legacy JSON import ──────────────────────────────────────────────────────
+
+def import_legacy_json(path: str,
+                       route: Callable[[str, dict], Optional[Tuple["ResearchCache", str, bool]]],
+                       ts_field: str = "cached_at") -> int:
+    """One-time import of a pre-SQLite JSON cache file.
+
+    `route(key, entry)` returns `(cache, key, negative)` for entries worth
+    keeping, or None to drop them. Entries keep their original timestamp
+    so already-stale rows expire on schedule (or are skipped outright).
+    The file is renamed to `<path>.migrated` afterwards so the import
+    runs once per deploy; a corrupt file is left in place and skipped.
+
+    Returns the number of entries imported.
+    """
+    marker = (_db_path(), path)
+    if marker in _legacy_done:
+        return 0
+    _legacy_done.add(marker)
+    if not path or not os.path.exists(path):
+        return 0
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, IOError, ValueError) as e:
+        log.warning("research_cache: legacy cache %s unreadable, skipping: %s",
+                    path, e)
+        return 0
+    imported = 0
+    for key, entry in (data or {}).items():
+        if not isinstance(entry, dict):
+            continue
+        target = route(key, entry)
+        if not target:
+            continue
+        cache, new_key, negative = target
+        created = _parse_ts(entry.get(ts_field))
+        if created is None:
+            continue
+        if cache.put(new_key, entry, negative=negative, created_at=created):
+            imported += 1
+    try:
+        os.replace(path, path + ".migrated")
+    except OSError as e:
+        log.debug("research_cache: could not rename %s: %s", path, e)
+    log.info("research_cache: imported %d/%d entries from %s",
+             imported, len(data or {}), os.path.basename(path))
+    return imported
+
+
+def _parse_ts(value) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(str(value))
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def all_stats() -> Dict[str, dict]:
+    """Per-namespace entry counts for every namespace in the table."""
+    out: Dict[str, dict] = {}
+    try:
+        from src.core.db import get_db
+        with get_db() as conn:
+            _ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT namespace, COUNT(*) AS n, SUM(negative) AS neg, "
+                "SUM(hits) AS row_hits FROM research_cache "
+                "WHERE expires_at>? GROUP BY namespace", (_now(),)).fetchall()
+    except Exception as e:
+        log.debug("research_cache all_stats failed: %s", e)
+        return out
+    with _stats_lock:
+        counters = {k: dict(v) for k, v in _counters.items()}
+    for r in rows:
+        c = counters.get(r["namespace"], {})
+        hits = c.get("hits", 0) + c.get("negative_hits", 0)
+        lookups = hits + c.get("misses", 0)
+        out[r["namespace"]] = {
+            "entries": r["n"],
+            "negative_entries": r["neg"] or 0,
+            "lifetime_row_hits": r["row_hits"] or 0,
+            "hits": c.get("hits", 0),
+            "negative_hits": c.get("negative_hits", 0),
+            "misses": c.get("misses", 0),
+            "evictions": c.get("evictions", 0),
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+        }
+    return out
@@ -0,0 +1,353 @@
+"""rule_engine.py — compiled multi-pattern matching for classifier rules.
+
+The classifiers (request_classifier, email_poller) keep their signal
+patterns as plain lists of regex strings so they stay readable and
+reviewable. Scanning them one `re.search` at a time walks the same
+corpus once per pattern. `RuleSet` merges a pattern family into a single
+precompiled alternation with one named group per rule, so the corpus is
+scanned once per family.
+
+Semantics are identical to the per-pattern loop it replaces:
+
+    any(text)    — True iff some rule's `re.search` would match
+    first(text)  — the lowest-index rule that matches (list-order
+                   "first match wins", which is what the `for pat in
+                   PATTERNS: ... break` loops report in their reasons)
+    hits(text)   — every matching rule, in list order
+
+Speed comes from a first-character guard: when every rule's possible
+first characters can be determined from the parsed pattern, the merged
+regex starts with a lookahead on that character class, so positions that
+cannot start any rule are rejected with one class test instead of N
+branch attempts. On the agency-keyword family this is ~3x faster than
+the loop. Short literal keyword lists (`any(kw in s for kw in ...)`) are
+left as substring checks — CPython's `str.__contains__` already beats
+both a flat regex alternation and a pure-Python Aho-Corasick automaton
+there.
+
+`KeywordCategorizer` covers the longer literal families that score item
+descriptions per category (growth_agent.CATEGORY_KEYWORDS,
+won_quotes_db.CATEGORY_KEYWORDS): the keywords are compiled into one
+trie-shaped regex, so each description is one C-level pass instead of
+~100 substring scans, and repeated descriptions (SCPRS lines repeat a
+lot) are answered from an LRU cache.
+
+`naive_hits()` / `naive_scores()` are the reference loops; the parity
+tests and `scripts/bench_classifier_rules.py` compare the two.
+
+Usage:
+    from src.core.rule_engine import KeywordCategorizer, RuleSet
+
+    AGENCY_RULES = RuleSet(AGENCY_KEYWORDS, flags=re.IGNORECASE)
+    agencies = [r.value for r in AGENCY_RULES.hits(corpus)]
+
+    ITEMS = KeywordCategorizer(CATEGORY_KEYWORDS, default="General Supplies")
+    category = ITEMS.best(description)
+"""
+
+import functools
+import logging
+import re
+from collections import namedtuple
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:  # Python 3.11+
+    from re import _constants as _sre_c
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover — Python < 3.11
+    import sre_constants as _sre_c
+    import sre_parse as _sre_parse
+
+log = logging.getLogger("reytech.rule_engine")
+
+Rule = namedtuple("Rule", ["index", "pattern", "value"])
+
+# Numbered/named back-references change meaning once the pattern is
+# embedded in a larger alternation — those families stay on the loop.
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _first_chars(items) -> Optional[list]:
+    """Return the IN-style items (LITERAL/RANGE) a parsed pattern can start
+    with, or None when that can't be determined conservatively."""
+    for op, av in items:
+        if op is _sre_c.AT:
+            continue  # zero-width (\b, ^, $) — look at what follows
+        if op is _sre_c.LITERAL:
+            return [(op, av)]
+        if op is _sre_c.IN:
+            if any(o not in (_sre_c.LITERAL, _sre_c.RANGE) for o, _ in av):
+                return None  # NEGATE / CATEGORY (\w, \s) — too broad
+            return list(av)
+        if op is _sre_c.SUBPATTERN:
+            return _first_chars(list(av[-1]))
+        if op is _sre_c.BRANCH:
+            out = []
+            for branch in av[1]:
+                sub = _first_chars(list(branch))
+                if sub is None:
+                    return None
+                out.extend(sub)
+            return out
+        if op in (_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT) and av[0] >= 1:
+            return _first_chars(list(av[2]))
+        return None
+    return None  # pattern can match the empty string
+
+
+def _guard_class(patterns: Iterable[str], flags: int) -> str:
+    """Character class covering every possible first char, or '' if any
+    rule's first char is unbounded."""
+    parts = set()
+    for pat in patterns:
+        try:
+            chars = _first_chars(list(_sre_parse.parse(pat, flags)))
+        except Exception:
+            return ""
+        if chars is None:
+            return ""
+        for op, av in chars:
+            if op is _sre_c.LITERAL:
+                parts.add(re.escape(chr(av)))
+            else:
+                parts.add(f"{re.escape(chr(av[0]))}-{re.escape(chr(av[1]))}")
+    if not parts:
+        return ""
+    return "[" + "".join(sorted(parts)) + "]"
+
+
+class RuleSet:
+    """A family of regex rules compiled into one alternation.
+
+    Args:
+        rules: iterable of pattern strings, or (pattern, value) pairs.
+               `value` is carried through to the returned `Rule`s
+               (e.g. the agency key for AGENCY_KEYWORDS).
+        flags: re flags shared by the whole family.
+        anchored: use `re.match` semantics (rule must match at position 0)
+                  instead of `re.search`.
+        name: label for logs / benchmarks.
+    """
+
+    def __init__(self, rules, flags: int = 0, anchored: bool = False, name: str = ""):
+        self.rules: List[Rule] = []
+        for i, r in enumerate(rules):
+            if isinstance(r, (tuple, list)):
+                pattern, value = r[0], r[1]
+            else:
+                pattern, value = r, r
+            self.rules.append(Rule(i, pattern, value))
+        self.flags = flags
+        self.anchored = anchored
+        self.name = name
+        self._singles = [re.compile(r.pattern, flags) for r in self.rules]
+        self._full = self._merge()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __repr__(self) -> str:
+        mode = "merged" if self._full is not None else "loop"
+        return f"<RuleSet {self.name or '?'} rules={len(self.rules)} {mode}>"
+
+    # ── compilation ──────────────────────────────────────────────────────
+
+    def _merge(self) -> Optional[re.Pattern]:
+        """Compile the alternation over every rule, or None to stay on the loop."""
+        if not self.rules or any(_BACKREF_RE.search(r.pattern) for r in self.rules):
+            return None
+        alt = "|".join(f"(?P<r{r.index}>{r.pattern})" for r in self.rules)
+        guard = "" if self.anchored else _guard_class(
+            (r.pattern for r in self.rules), self.flags)
+        # Lookahead so matches are zero-width: a rule that starts inside
+        # another rule's match is still seen at its own start position.
+        src = f"(?=(?:{alt}))"
+        if guard:
+            src = f"(?={guard}){src}"
+        try:
+            return re.compile(src, self.flags)
+        except (re.error, RecursionError, OverflowError) as e:
+            log.debug("RuleSet %s: merge failed, using loop: %s", self.name, e)
+            return None
+
+    # ── queries ──────────────────────────────────────────────────────────
+
+    def any(self, text: str) -> bool:
+        """True iff at least one rule matches."""
+        if self._full is None or not text:
+            return any(self._match_one(p, text or "") for p in self._singles)
+        if self.anchored:
+            return self._full.match(text) is not None
+        return self._full.search(text) is not None
+
+    def first(self, text: str) -> Optional[Rule]:
+        """Lowest-index matching rule, or None.
+
+        One pass is enough: at any position the alternation records the
+        lowest-index rule matching there, so the minimum over all recorded
+        positions is the lowest-index rule matching anywhere.
+        """
+        if self._full is None or not text:
+            for r, p in zip(self.rules, self._singles):
+                if self._match_one(p, text or ""):
+                    return r
+            return None
+        if self.anchored:
+            m = self._full.match(text)
+            return self.rules[int(m.lastgroup[1:])] if m else None
+        found = {int(m.lastgroup[1:]) for m in self._full.finditer(text)}
+        return self.rules[min(found)] if found else None
+
+    def hits(self, text: str) -> List[Rule]:
+        """Every matching rule, in rule order.
+
+        The merged pass records the lowest-index rule at every position
+        where *any* rule matches, so a higher-index rule can only be
+        hidden at one of those positions. Those few positions are then
+        re-checked with the individual patterns (`match(text, pos)` keeps
+        `\\b`/lookbehind context), instead of rescanning the whole text.
+        """
+        if self._full is None or self.anchored or not text:
+            return self.naive_hits(text)
+        recorded: Dict[int, int] = {}
+        for m in self._full.finditer(text):
+            recorded[m.start()] = int(m.lastgroup[1:])
+        if not recorded:
+            return []
+        found = set(recorded.values())
+        last = len(self.rules) - 1
+        for pos, idx in recorded.items():
+            for i in range(idx + 1, last + 1):
+                if i not in found and self._singles[i].match(text, pos):
+                    found.add(i)
+        return [self.rules[i] for i in sorted(found)]
+
+    def count(self, text: str) -> int:
+        """Number of distinct rules that match."""
+        return len(self.hits(text))
+
+    def naive_hits(self, text: str) -> List[Rule]:
+        """Reference implementation: one `re.search`/`re.match` per rule."""
+        text = text or ""
+        return [r for r, p in zip(self.rules, self._singles) if self._match_one(p, text)]
+
+    def _match_one(self, compiled: re.Pattern, text: str) -> bool:
+        if self.anchored:
+            return compiled.match(text) is not None
+        return compiled.search(text) is not None
+
+
+# ── literal keyword categories ───────────────────────────────────────────
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex matching any of `words`, shaped as a trie so the engine
+    walks one branch per character instead of trying each word. Optional
+    tails are greedy, so the longest word at a position is the one
+    captured."""
+    root: dict = {}
+    for w in words:
+        node = root
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node: dict) -> str:
+        alts = [re.escape(ch) + emit(sub) for ch, sub in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(root)
+
+
+class KeywordCategorizer:
+    """Case-insensitive substring keywords grouped by category, matched
+    in one pass.
+
+    Semantics are identical to the per-category loop it replaces:
+
+        scores(text) — {category: how many of its keywords occur in
+                       text}, for categories with at least one
+        best(text)   — `max(scores, key=scores.get)`: the most keywords,
+                       ties to the earlier category; `default` if none
+        first(text)  — the first category (in mapping order) with any
+                       keyword; `default` if none
+
+    The compiled pattern is a zero-width lookahead, so every position is
+    tried and keywords that overlap or start inside one another are all
+    seen. At a position it captures the longest keyword; the shorter
+    keywords matching there are exactly that keyword's prefixes in the
+    list, which are precomputed.
+
+    Args:
+        categories: mapping of category -> iterable of keywords.
+        default: returned by best()/first() when nothing matches.
+        cache_size: LRU entries keyed by the raw description (0 disables).
+        name: label for logs / benchmarks.
+    """
+
+    def __init__(self, categories: Mapping[str, Iterable[str]], default: str = "",
+                 cache_size: int = 4096, name: str = ""):
+        self.categories: Dict[str, Tuple[str, ...]] = {
+            cat: tuple(kw.lower() for kw in kws) for cat, kws in categories.items()}
+        self.default = default
+        self.name = name
+        self._order = list(self.categories)
+        owners: Dict[str, List[int]] = {}
+        for ci, kws in enumerate(self.categories.values()):
+            for kw in kws:
+                if kw:
+                    owners.setdefault(kw, []).append(ci)
+        words = sorted(owners)
+        self._owners = {w: tuple(cis) for w, cis in owners.items()}
+        # keyword -> every list keyword it starts with (itself included)
+        self._expand: Dict[str, Tuple[str, ...]] = {
+            w: tuple(p for p in words if w.startswith(p)) for w in words}
+        self._rx = re.compile(f"(?=({_trie_pattern(words)}))") if words else None
+        self._scan = (functools.lru_cache(maxsize=cache_size)(self._scores)
+                      if cache_size else self._scores)
+
+    def __repr__(self) -> str:
+        return (f"<KeywordCategorizer {self.name or '?'} "
+                f"categories={len(self.categories)} keywords={len(self._expand)}>")
+
+    def _scores(self, text: str) -> Tuple[int, ...]:
+        counts = [0] * len(self._order)
+        if self._rx is None or not text:
+            return tuple(counts)
+        found = set()
+        for word in set(self._rx.findall(text.lower())):
+            found.update(self._expand[word])
+        for word in found:
+            for ci in self._owners[word]:
+                counts[ci] += 1
+        return tuple(counts)
+
+    def scores(self, text: str) -> Dict[str, int]:
+        """Matching keywords per category (matching categories only)."""
+        return {self._order[i]: n for i, n in enumerate(self._scan(text or "")) if n}
+
+    def best(self, text: str) -> str:
+        """Category with the most matching keywords; earlier category on ties."""
+        counts = self._scan(text or "")
+        top = max(counts, default=0)
+        return self._order[counts.index(top)] if top else self.default
+
+    def first(self, text: str) -> str:
+        """First category in mapping order with any keyword."""
+        for i, n in enumerate(self._scan(text or "")):
+            if n:
+                return self._order[i]
+        return self.default
+
+    def naive_scores(self, text: str) -> Dict[str, int]:
+        """Reference implementation: one substring check per keyword."""
+        low = (text or "").lower()
+        out = {}
+        for cat, kws in self.categories.items():
+            n = sum(1 for kw in kws if kw and kw in low)
+            if n:
+                out[cat] = n
+        return out
@@ -369,13 +369,25 @@ def _get_data_dir():
             os.path.dirname(os.path.abspath(__file__)))), "data")
 
 
-def run_backup(data_dir: str = None) -> dict:
+def run_backup(data_dir: str = None, mode: str = None) -> dict:
     """
     Create a SQLite backup using .backup API.
     Runs VACUUM first to compact the DB, then backs up.
     Rotates: keep 3 daily + 1 weekly.
+
+    mode="incremental" (or BACKUP_MODE=incremental) ships only the pages
+    changed since the last point instead — see src/core/incremental_backup.
     """
     data_dir = data_dir or _get_data_dir()
+    mode = mode or os.environ.get("BACKUP_MODE", "full")
+    if mode == "incremental":
+        from src.core.incremental_backup import run_incremental_backup
+        result = run_incremental_backup(data_dir)
+        if result.get("ok"):
+            heartbeat("db-backup", success=True)
+        else:
+            heartbeat("db-backup", success=False, error=result.get("error"))
+        return result
     db_path = os.path.join(data_dir, "reytech.db")
     backup_dir = os.path.join(data_dir, "backups")
     os.makedirs(backup_dir, exist_ok=True)
@@ -540,8 +552,20 @@ def list_backups(data_dir: str = None) -> list:
 
 
 def backup_health(data_dir: str = None) -> dict:
-    """Check if backups are healthy (latest < 36h old)."""
+    """Check if backups are healthy (latest < 36h old). Incremental points
+    count — newest first alongside the full snapshots."""
     backups = list_backups(data_dir)
+    try:
+        from src.core.incremental_backup import list_points
+        points = list_points(data_dir or _get_data_dir())
+    except Exception as _e:
+        log.debug("incremental points unavailable: %s", _e)
+        points = []
+    if points:
+        p = points[-1]
+        backups.append({"filename": f"incremental/{p['chain']}/{p['file']}",
+                        "created_at": p["created_at"]})
+        backups.sort(key=lambda b: b["created_at"], reverse=True)
     if not backups:
         return {"healthy": False, "reason": "No backups found", "latest": None}
     latest = backups[0]
@@ -0,0 +1,126 @@
+"""throttle.py — blocking token-bucket limiters per provider and per host.
+
+The enrichment pipeline used to pace external calls with fixed
+`time.sleep(0.5)` / `time.sleep(1.0)` after every lookup. That costs the
+full pause even when the call itself took 3s, and it only works while
+calls are strictly sequential. A token bucket expresses the actual
+constraint — "no more than N calls/sec to Grok", "1/sec to any one
+supplier site" — and holds under concurrent callers, so items can be
+looked up in parallel without tripping 429s or Cloudflare.
+
+`security.RateLimiter` is the non-blocking per-IP variant for inbound
+requests; this one blocks the caller until a token is available.
+
+Usage:
+    from src.core.throttle import acquire, acquire_host
+
+    acquire("grok")                  # before each validate_product call
+    acquire_host(url)                # before fetching a supplier page
+
+Env:
+    THROTTLE_<NAME>=rate[:burst]     — override a bucket, e.g. THROTTLE_GROK=4:4
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+log = logging.getLogger("reytech.throttle")
+
+# name → (tokens per second, burst). The old fixed sleeps were 0.5s after
+# Grok/Claude calls and 1.0s after web lookups; these keep the same
+# sustained rate per provider.
+PROVIDER_RATES = {
+    "grok": (2.0, 2),
+    "claude": (2.0, 2),
+    "web_search": (1.0, 1),
+    "host": (1.0, 2),       # applied per supplier hostname
+    "default": (1.0, 1),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; `acquire()` blocks until a token frees up."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = max(float(rate), 0.001)
+        self.burst = max(int(burst), 1)
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.waited_s = 0.0
+        self.acquired = 0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token. Returns False only if `timeout` ran out first."""
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.acquired += 1
+                    self.waited_s += now - start
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if timeout is not None and now - start + wait > timeout:
+                return False
+            time.sleep(wait)
+
+
+_buckets: dict = {}
+_buckets_lock = threading.Lock()
+
+
+def _config(name: str) -> tuple:
+    kind = "host" if name.startswith("host:") else name
+    raw = os.environ.get(f"THROTTLE_{kind.upper()}", "")
+    if raw:
+        try:
+            rate, _, burst = raw.partition(":")
+            return float(rate), int(burst or 1)
+        except ValueError:
+            log.warning("bad THROTTLE_%s=%r — using default", kind.upper(), raw)
+    return PROVIDER_RATES.get(kind, PROVIDER_RATES["default"])
+
+
+def bucket(name: str) -> TokenBucket:
+    with _buckets_lock:
+        b = _buckets.get(name)
+        if b is None:
+            b = _buckets[name] = TokenBucket(*_config(name))
+        return b
+
+
+def acquire(name: str, timeout: Optional[float] = None) -> bool:
+    return bucket(name).acquire(timeout)
+
+
+def acquire_host(url: str, timeout: Optional[float] = None) -> bool:
+    """Per-hostname bucket, so different supplier sites proceed in parallel."""
+    try:
+        host = urlparse(url).netloc.lower()
+    except Exception:
+        host = ""
+    return acquire(f"host:{host or 'unknown'}", timeout)
+
+
+def throttle_stats() -> dict:
+    with _buckets_lock:
+        return {name: {"rate": b.rate, "burst": b.burst, "acquired": b.acquired,
+                       "waited_s": round(b.waited_s, 2)}
+                for name, b in _buckets.items()}
+
+
+def reset() -> None:
+    """Drop all buckets (tests, or after changing THROTTLE_* at runtime)."""
+    with _buckets_lock:
+        _buckets.clear()
@@ -0,0 +1,120 @@
+"""
+Layout Cache — persistent AMS 704 overlay layouts keyed by template fingerprint.
+
+`_detect_ams704_overlay_positions` runs pdfplumber word/rect extraction
+over every page of the source PDF on every fill. For an unchanged
+template (the same buyer revision regenerated, a repeat DocuSign 704)
+the answer never changes, and pdfplumber is the dominant cost of the
+fill.
+
+The fingerprint is structural and cheap — pypdf only, no layout
+analysis:
+
+    page count, per-page media box + rotation, sorted form-field names,
+    sha1 of each page's content stream (the static text and rules)
+
+Anything pdfplumber's detection could see is in the content streams, so
+a matching fingerprint means a matching layout. Different values in
+form *fields* don't change it; different printed text does.
+
+Layouts live in the shared SQLite cache (`research_cache` table,
+namespace "ams704_layout") so they survive deploys and are shared by
+every worker; tuples round-trip intact.
+
+Usage:
+    from src.forms.layout_cache import cached_layout
+
+    pages = cached_layout("overlay", source_pdf, _scan_overlay_positions)
+"""
+
+import hashlib
+import json
+import logging
+from typing import Callable, Optional
+
+from src.core.research_cache import ResearchCache
+
+log = logging.getLogger("reytech.layout_cache")
+
+# Bump when the detection code changes what it returns — old entries
+# then simply stop matching.
+LAYOUT_VERSION = "1"
+
+_CACHE = ResearchCache("ams704_layout", ttl_days=365, max_entries=2000)
+
+
+def layout_fingerprint(pdf_path: str) -> Optional[str]:
+    """Structural fingerprint of a PDF template, or None if unreadable."""
+    try:
+        from pypdf import PdfReader
+        reader = PdfReader(pdf_path)
+        h = hashlib.sha1()
+        h.update(f"v{LAYOUT_VERSION}|{len(reader.pages)}".encode())
+        for page in reader.pages:
+            box = page.mediabox
+            h.update(f"|{float(box.width):.1f}x{float(box.height):.1f}"
+                     f"r{int(page.get('/Rotate', 0) or 0)}".encode())
+            contents = page.get_contents()
+            h.update(hashlib.sha1(contents.get_data() if contents else b"").digest())
+        fields = sorted((reader.get_fields() or {}).keys())
+        h.update("|".join(fields).encode())
+        return h.hexdigest()
+    except Exception as e:
+        log.debug("layout_fingerprint %s: %s", pdf_path, e)
+        return None
+
+
+def _encode(obj):
+    if isinstance(obj, tuple):
+        return {"__t": [_encode(v) for v in obj]}
+    if isinstance(obj, list):
+        return [_encode(v) for v in obj]
+    if isinstance(obj, dict):
+        return {k: _encode(v) for k, v in obj.items()}
+    return obj
+
+
+def _decode(obj):
+    if isinstance(obj, dict):
+        if set(obj) == {"__t"}:
+            return tuple(_decode(v) for v in obj["__t"])
+        return {k: _decode(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_decode(v) for v in obj]
+    return obj
+
+
+def cached_layout(kind: str, pdf_path: str, detect: Callable[[str], object],
+                  fingerprint: Optional[str] = None):
+    """Return `detect(pdf_path)`, served from the cache when the template
+    fingerprint has been seen before. `None` results (detector
+    unavailable or failed) are not cached."""
+    fp = fingerprint or layout_fingerprint(pdf_path)
+    if not fp:
+        return detect(pdf_path)
+    key = f"{kind}:{fp}"
+    try:
+        hit = _CACHE.get(key)
+    except Exception as e:
+        log.debug("layout cache read failed: %s", e)
+        hit = None
+    if hit is not None:
+        log.info("LAYOUT cache hit: %s %s", kind, fp[:12])
+        return _decode(hit["layout"])
+    layout = detect(pdf_path)
+    if layout is not None:
+        try:
+            # Round-trip check: only cache what JSON can faithfully carry.
+            encoded = _encode(layout)
+            if json.loads(json.dumps(encoded)) != encoded:
+                raise ValueError("non-string keys")
+            _CACHE.put(key, {"layout": encoded})
+        except (TypeError, ValueError) as e:
+            log.debug("layout not cacheable (%s): %s", kind, e)
+        except Exception as e:
+            log.debug("layout cache write failed: %s", e)
+    return layout
+
+
+def layout_cache_stats() -> dict:
+    return _CACHE.stats()
@@ -74,6 +74,7 @@ import json
 import os
 import re
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 
 
@@ -1681,178 +1682,313 @@ def _parse_ams704_ocr(pdf_path: str, result: dict) -> dict:
     return result
 
 
-def parse_multi_pc(pdf_path: str) -> list:
+MULTI_PC_WORKERS = 4
+MULTI_PC_POOL_MIN_PAGES = 12   # below this, pool start-up costs more than it saves
+MULTI_PC_CHUNK_PAGES = 6
+
+_MULTI_PC_BOUNDARY = [
+    re.compile(r'Institution or HQ Program', re.IGNORECASE),
+    re.compile(r'PRICE\s+CHECK\s+#', re.IGNORECASE),
+    re.compile(r'AMS\s*704', re.IGNORECASE),
+]
+_PURCHASE_JUST = re.compile(r'PURCHASE\s+JUSTIFICATION', re.IGNORECASE)
+
+
+def _is_pc_boundary(text: str) -> bool:
+    return sum(1 for pat in _MULTI_PC_BOUNDARY if pat.search(text)) >= 2
+
+
+def _extract_page_texts(pdf_path: str, first: int, last: int) -> list:
+    """Text of pages first..last (0-based, inclusive). Runs in pool workers."""
+    import pdfplumber
+    texts = []
+    with pdfplumber.open(pdf_path, pages=list(range(first + 1, last + 2))) as pdf:
+        for page in pdf.pages:
+            texts.append(page.extract_text() or "")
+            _release_page(page)
+    return texts
+
+
+def _release_page(page) -> None:
+    # pdfplumber caches chars/objects per page until the PDF closes.
+    close = getattr(page, "close", None) or getattr(page, "flush_cache", None)
+    if close:
+        try:
+            close()
+        except Exception as _e:
+            log.debug("page release: %s", _e)
+
+
+def _iter_page_texts(pdf_path: str, total_pages: int, pool=None, depth: int = 2):
+    """Yield (page_index, text) in page order.
+
+    Inline: one page at a time from a single pdfplumber handle. With a
+    process pool: MULTI_PC_CHUNK_PAGES-page chunks extracted in parallel,
+    at most `depth` chunks ahead of the consumer.
+    """
+    if pool is None:
+        import pdfplumber
+        with pdfplumber.open(pdf_path) as pdf:
+            for i, page in enumerate(pdf.pages):
+                text = page.extract_text() or ""
+                _release_page(page)
+                yield i, text
+        return
+    import collections
+    chunks = iter([(a, min(a + MULTI_PC_CHUNK_PAGES, total_pages) - 1)
+                   for a in range(0, total_pages, MULTI_PC_CHUNK_PAGES)])
+    pending = collections.deque()
+    while True:
+        while len(pending) < depth:
+            rng = next(chunks, None)
+            if rng is None:
+                break
+            pending.append((rng[0], pool.submit(_extract_page_texts, pdf_path, *rng)))
+        if not pending:
+            return
+        first, fut = pending.popleft()
+        for offset, text in enumerate(fut.result()):
+            yield first + offset, text
+
+
+def _iter_pc_sections(page_texts, total_pages: int):
+    """Stream (start_page, end_page, section_text) as each PC closes.
+
+    Only the open section's page texts are held; pages before the first
+    boundary are dropped. A PURCHASE JUSTIFICATION page directly before a
+    boundary belongs to the next PC and is trimmed from the previous one.
+    """
+    start, texts = None, []
+    for i, text in page_texts:
+        if _is_pc_boundary(text):
+            if start is not None:
+                end = i - 1
+                if end > start and _PURCHASE_JUST.search(texts[-1]):
+                    log.info("parse_multi_pc: page %d is purchase justification — trimmed from section starting %d",
+                             end, start)
+                    texts.pop()
+                    end -= 1
+                yield start, end, "\n".join(texts)
+            start, texts = i, []
+        if start is not None:
+            texts.append(text)
+    if start is not None:
+        yield start, total_pages - 1, "\n".join(texts)
+
+
+def _parse_pc_section(section_text: str, pdf_path: str, start_page: int, end_page: int,
+                      section_idx: int) -> dict:
+    """Header + line items for one PC of a multi-PC bundle (pure text →
+    dict, so it can run in a worker process)."""
+    import re as _re
+
+    header = {}
+
+    # ── Parse header from the line AFTER the column headers ──
+    # DocuSign 704 text comes as:
+    #   "Requestor Institution or HQ Program Delivery Zip Code Phone Number Date of Request"
+    #   "Magana- CIW ML EOP 92880 909 597-1771 3/24/2026"
+    # The data line has: requestor, institution, zip, phone, date — all concatenated.
+    _hdr_m = _re.search(
+        r'Requestor\s+Institution.*?Date of Request\s*\n\s*(.+)',
+        section_text, _re.IGNORECASE)
+    if _hdr_m:
+        _data_line = _hdr_m.group(1).strip()
+        # Extract zip code (5 digits) — anchor for splitting
+        _zip_m = _re.search(r'\b(\d{5})\b', _data_line)
+        if _zip_m:
+            header["zip_code"] = _zip_m.group(1)
+            _before_zip = _data_line[:_zip_m.start()].strip()
+            _after_zip = _data_line[_zip_m.end():].strip()
+            # Before zip: "Requestor Institution" — split on double-space or known patterns
+            _parts = _re.split(r'\s{2,}', _before_zip)
+            if len(_parts) >= 2:
+                header["requestor"] = _parts[0].strip()
+                header["institution"] = " ".join(_parts[1:]).strip()
+            elif _before_zip:
+                # Try splitting at transition from name to institution code
+                _inst_m = _re.search(r'(.*?)\s+((?:CIW|CHCF|CMF|CSP|CCWF|SATF|MCSP|HDSP|KVSP|RJD|SCC|LAC|SVSP|CTF|COR|SOL|SAC|WSP|ISP|CIM|CAL|DVI|SQ|NKSP|FSP|CCI|PBSP|VSP|ASP|CMC)\b.+)', _before_zip)
+                if _inst_m:
+                    header["requestor"] = _inst_m.group(1).strip()
+                    header["institution"] = _inst_m.group(2).strip()
+                else:
+                    header["institution"] = _before_zip
+            # After zip: phone and date
+            _phone_m = _re.search(r'(\d{3}[\s\-]?\d{3}[\s\-]?\d{4}(?:\s*(?:x|ext)\.?\s*\d+)?)', _after_zip)
+            if _phone_m:
+                header["phone"] = _phone_m.group(1).strip()
+            _date_m = _re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', _after_zip)
+            if _date_m:
+                header["due_date"] = _date_m.group(1).strip()
+    else:
+        # Fallback: try individual field patterns
+        inst_m = _re.search(r'Institution or HQ Program\s*[\n:]+\s*([^\n]+)', section_text, _re.IGNORECASE)
+        if inst_m:
+            header["institution"] = inst_m.group(1).strip()
+        req_m = _re.search(r'Requestor\s*[\n:]+\s*([^\n]+)', section_text, _re.IGNORECASE)
+        if req_m:
+            header["requestor"] = req_m.group(1).strip()
+        zip_m = _re.search(r'(?:Zip|Delivery Zip)[:\s]+(\d{5})', section_text, _re.IGNORECASE)
+        if zip_m:
+            header["zip_code"] = zip_m.group(1)
+
+    pc_num_m = _re.search(r'PRICE\s+CHECK\s*#\s*([A-Z0-9\-]+)', section_text, _re.IGNORECASE)
+    if pc_num_m:
+        header["price_check_number"] = pc_num_m.group(1).strip()
+
+    if "due_date" not in header:
+        due_m = _re.search(r'Date of Request\s*\n.*?(\d{1,2}/\d{1,2}/\d{2,4})', section_text)
+        if not due_m:
+            due_m = _re.search(r'(\d{1,2}/\d{1,2}/\d{4})', section_text)
+        if due_m:
+            header["due_date"] = due_m.group(1).strip()
+
+    section_result = {
+        "header": header, "line_items": [], "existing_prices": {},
+        "ship_to": "", "source_pdf": pdf_path, "field_count": 0,
+        "parse_method": "multi_pc_text",
+        "page_start": start_page, "page_end": end_page,
+        "section_index": section_idx,
+    }
+
+    ITEM_ROW = _re.compile(
+        r'^\s*(\d{1,2})\s+(\d+)\s+(EA|BX|CS|PK|PKG|PCK|PACK|BAG|SET|DZ|PR|GL|LB|OZ|CASE|EACH|CTN|RL|BT|TB|JR|CT|CA)\s+'
+        r'(?:(\d+)\s+)?(.+?)(?:\s+\$[\d,]+\.\d{2}\s+\$[\d,]+\.\d{2})?\s*$',
+        _re.IGNORECASE | _re.MULTILINE)
+
+    items = []
+    for m in ITEM_ROW.finditer(section_text):
+        desc = m.group(5).strip()
+        if any(h in desc.upper() for h in ["ITEM DESCRIPTION", "INCLUDE MANUFACTURER", "NOUN FIRST"]):
+            continue
+        items.append({
+            "item_number": int(m.group(1)), "row_index": int(m.group(1)),
+            "qty": int(m.group(2)), "uom": m.group(3).upper(),
+            "qty_per_uom": int(m.group(4)) if m.group(4) else 1,
+            "description": desc[:200], "part_number": "", "pricing": {},
+        })
+
+    section_result["line_items"] = items
+    log.info("parse_multi_pc: section %d (%s, pages %d-%d): %d items",
+             section_idx, header.get("institution", "?"), start_page, end_page, len(items))
+    return section_result
+
+
+_multi_pc_executor = None
+_multi_pc_executor_lock = threading.Lock()
+
+
+def _multi_pc_pool(workers: int):
+    """The process pool for bundle parsing, or None if one can't be started.
+
+    Started on first use with `workers` processes and kept for the life
+    of the process (shut down at exit), so each large bundle doesn't pay
+    for pool start-up; later callers bound their own in-flight chunks.
+    Workers come from the shared forkserver (src.core.forkserver) rather
+    than a fork of the web process.
+    """
+    global _multi_pc_executor
+    with _multi_pc_executor_lock:
+        if _multi_pc_executor is not None:
+            return _multi_pc_executor
+        import atexit
+        from concurrent.futures import ProcessPoolExecutor
+        from src.core.forkserver import context
+        try:
+            _multi_pc_executor = ProcessPoolExecutor(max_workers=workers,
+                                                     mp_context=context())
+        except (OSError, NotImplementedError) as e:
+            log.warning("parse_multi_pc: process pool unavailable (%s) — parsing inline", e)
+            return None
+        atexit.register(_shutdown_multi_pc_pool)
+        return _multi_pc_executor
+
+
+def _shutdown_multi_pc_pool(wait: bool = True) -> None:
+    """Shut the bundle-parsing pool down; the next large bundle starts a
+    new one. Runs at exit, and after a worker dies (broken pool)."""
+    global _multi_pc_executor
+    with _multi_pc_executor_lock:
+        pool, _multi_pc_executor = _multi_pc_executor, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def parse_multi_pc(pdf_path: str, workers: int = None) -> list:
     """Parse a combined DocuSign AMS 704 PDF containing multiple price checks.
     Detects PC boundaries by looking for new header blocks.
-    Returns list of parsed PC dicts with page_start/page_end."""
-    import re as _re
+    Returns list of parsed PC dicts with page_start/page_end.
 
+    Boundaries are detected while page text streams in, so memory holds
+    one PC's text rather than the whole bundle. Bundles of
+    MULTI_PC_POOL_MIN_PAGES+ pages extract text and parse sections on the
+    shared process pool (`workers`, default MULTI_PC_WORKERS / env).
+    """
     if not os.path.exists(pdf_path):
         return []
 
-    results = []
     try:
+        import pdfplumber
+    except ImportError:
+        log.warning("parse_multi_pc: pdfplumber not available, falling back to single parse")
+        result = parse_ams704(pdf_path)
+        result["page_start"] = 0
+        result["page_end"] = 0
+        return [result]
+
+    if workers is None:
         try:
-            import pdfplumber
-        except ImportError:
-            log.warning("parse_multi_pc: pdfplumber not available, falling back to single parse")
-            result = parse_ams704(pdf_path)
-            result["page_start"] = 0
-            result["page_end"] = 0
-            return [result]
+            workers = int(os.environ.get("MULTI_PC_WORKERS", MULTI_PC_WORKERS))
+        except ValueError:
+            workers = MULTI_PC_WORKERS
+    workers = max(1, min(workers, os.cpu_count() or 1))
 
+    pool, parsed = None, []   # parsed: futures (pool) or dicts (inline), in section order
+    try:
         with pdfplumber.open(pdf_path) as pdf:
             total_pages = len(pdf.pages)
-            log.info("parse_multi_pc: %d pages in %s", total_pages, os.path.basename(pdf_path))
+        log.info("parse_multi_pc: %d pages in %s", total_pages, os.path.basename(pdf_path))
 
-            page_texts = []
-            for page in pdf.pages:
-                page_texts.append(page.extract_text() or "")
-
-            BOUNDARY_PATTERNS = [
-                _re.compile(r'Institution or HQ Program', _re.IGNORECASE),
-                _re.compile(r'PRICE\s+CHECK\s+#', _re.IGNORECASE),
-                _re.compile(r'AMS\s*704', _re.IGNORECASE),
-            ]
-
-            boundary_pages = []
-            for i, text in enumerate(page_texts):
-                hit_count = sum(1 for pat in BOUNDARY_PATTERNS if pat.search(text))
-                if hit_count >= 2:
-                    boundary_pages.append(i)
-
-            if not boundary_pages:
-                log.info("parse_multi_pc: no boundaries found, treating as single PC")
-                result = parse_ams704(pdf_path)
-                result["page_start"] = 0
-                result["page_end"] = total_pages - 1
-                return [result]
-
-            log.info("parse_multi_pc: found %d PC boundaries at pages %s",
-                     len(boundary_pages), boundary_pages)
-
-            # ── Trim purchase justification pages from section ends ──
-            # If the page immediately before a boundary is a "PURCHASE JUSTIFICATION"
-            # page (not an AMS 704 page), shrink the previous section's range.
-            _PURCHASE_JUST = _re.compile(r'PURCHASE\s+JUSTIFICATION', _re.IGNORECASE)
-            _trimmed_pages = set()
-            for bi in range(1, len(boundary_pages)):
-                prev_page = boundary_pages[bi] - 1
-                if prev_page > boundary_pages[bi - 1] and _PURCHASE_JUST.search(page_texts[prev_page]):
-                    _trimmed_pages.add(prev_page)
-                    log.info("parse_multi_pc: page %d is purchase justification — trimmed from section %d",
-                             prev_page, bi - 1)
-
-            for section_idx, start_page in enumerate(boundary_pages):
-                end_page = boundary_pages[section_idx + 1] - 1 if section_idx + 1 < len(boundary_pages) else total_pages - 1
-                # Shrink end if the last page(s) are purchase justifications for the next section
-                while end_page in _trimmed_pages and end_page > start_page:
-                    end_page -= 1
-                section_text = "\n".join(page_texts[start_page:end_page + 1])
-
-                header = {}
-
-                # ── Parse header from the line AFTER the column headers ──
-                # DocuSign 704 text comes as:
-                #   "Requestor Institution or HQ Program Delivery Zip Code Phone Number Date of Request"
-                #   "Magana- CIW ML EOP 92880 909 597-1771 3/24/2026"
-                # The data line has: requestor, institution, zip, phone, date — all concatenated.
-                _hdr_m = _re.search(
-                    r'Requestor\s+Institution.*?Date of Request\s*\n\s*(.+)',
-                    section_text, _re.IGNORECASE)
-                if _hdr_m:
-                    _data_line = _hdr_m.group(1).strip()
-                    # Extract zip code (5 digits) — anchor for splitting
-                    _zip_m = _re.search(r'\b(\d{5})\b', _data_line)
-                    if _zip_m:
-                        header["zip_code"] = _zip_m.group(1)
-                        _before_zip = _data_line[:_zip_m.start()].strip()
-                        _after_zip = _data_line[_zip_m.end():].strip()
-                        # Before zip: "Requestor Institution" — split on double-space or known patterns
-                        _parts = _re.split(r'\s{2,}', _before_zip)
-                        if len(_parts) >= 2:
-                            header["requestor"] = _parts[0].strip()
-                            header["institution"] = " ".join(_parts[1:]).strip()
-                        elif _before_zip:
-                            # Try splitting at transition from name to institution code
-                            _inst_m = _re.search(r'(.*?)\s+((?:CIW|CHCF|CMF|CSP|CCWF|SATF|MCSP|HDSP|KVSP|RJD|SCC|LAC|SVSP|CTF|COR|SOL|SAC|WSP|ISP|CIM|CAL|DVI|SQ|NKSP|FSP|CCI|PBSP|VSP|ASP|CMC)\b.+)', _before_zip)
-                            if _inst_m:
-                                header["requestor"] = _inst_m.group(1).strip()
-                                header["institution"] = _inst_m.group(2).strip()
-                            else:
-                                header["institution"] = _before_zip
-                        # After zip: phone and date
-                        _phone_m = _re.search(r'(\d{3}[\s\-]?\d{3}[\s\-]?\d{4}(?:\s*(?:x|ext)\.?\s*\d+)?)', _after_zip)
-                        if _phone_m:
-                            header["phone"] = _phone_m.group(1).strip()
-                        _date_m = _re.search(r'(\d{1,2}/\d{1,2}/\d{2,4})', _after_zip)
-                        if _date_m:
-                            header["due_date"] = _date_m.group(1).strip()
-                else:
-                    # Fallback: try individual field patterns
-                    inst_m = _re.search(r'Institution or HQ Program\s*[\n:]+\s*([^\n]+)', section_text, _re.IGNORECASE)
-                    if inst_m:
-                        header["institution"] = inst_m.group(1).strip()
-                    req_m = _re.search(r'Requestor\s*[\n:]+\s*([^\n]+)', section_text, _re.IGNORECASE)
-                    if req_m:
-                        header["requestor"] = req_m.group(1).strip()
-                    zip_m = _re.search(r'(?:Zip|Delivery Zip)[:\s]+(\d{5})', section_text, _re.IGNORECASE)
-                    if zip_m:
-                        header["zip_code"] = zip_m.group(1)
-
-                pc_num_m = _re.search(r'PRICE\s+CHECK\s*#\s*([A-Z0-9\-]+)', section_text, _re.IGNORECASE)
-                if pc_num_m:
-                    header["price_check_number"] = pc_num_m.group(1).strip()
-
-                if "due_date" not in header:
-                    due_m = _re.search(r'Date of Request\s*\n.*?(\d{1,2}/\d{1,2}/\d{2,4})', section_text)
-                    if not due_m:
-                        due_m = _re.search(r'(\d{1,2}/\d{1,2}/\d{4})', section_text)
-                    if due_m:
-                        header["due_date"] = due_m.group(1).strip()
-
-                section_result = {
-                    "header": header, "line_items": [], "existing_prices": {},
-                    "ship_to": "", "source_pdf": pdf_path, "field_count": 0,
-                    "parse_method": "multi_pc_text",
-                    "page_start": start_page, "page_end": end_page,
-                    "section_index": section_idx, "total_sections": len(boundary_pages),
-                }
+        if workers > 1 and total_pages >= MULTI_PC_POOL_MIN_PAGES:
+            pool = _multi_pc_pool(workers)
 
-                ITEM_ROW = _re.compile(
-                    r'^\s*(\d{1,2})\s+(\d+)\s+(EA|BX|CS|PK|PKG|PCK|PACK|BAG|SET|DZ|PR|GL|LB|OZ|CASE|EACH|CTN|RL|BT|TB|JR|CT|CA)\s+'
-                    r'(?:(\d+)\s+)?(.+?)(?:\s+\$[\d,]+\.\d{2}\s+\$[\d,]+\.\d{2})?\s*$',
-                    _re.IGNORECASE | _re.MULTILINE)
+        pages = _iter_page_texts(pdf_path, total_pages, pool=pool, depth=workers)
+        for idx, (start_page, end_page, text) in enumerate(_iter_pc_sections(pages, total_pages)):
+            if pool is not None:
+                parsed.append(pool.submit(_parse_pc_section, text, pdf_path, start_page, end_page, idx))
+            else:
+                parsed.append(_parse_pc_section(text, pdf_path, start_page, end_page, idx))
+        results = [p.result() if pool is not None else p for p in parsed]
 
-                items = []
-                for m in ITEM_ROW.finditer(section_text):
-                    desc = m.group(5).strip()
-                    if any(h in desc.upper() for h in ["ITEM DESCRIPTION", "INCLUDE MANUFACTURER", "NOUN FIRST"]):
-                        continue
-                    items.append({
-                        "item_number": int(m.group(1)), "row_index": int(m.group(1)),
-                        "qty": int(m.group(2)), "uom": m.group(3).upper(),
-                        "qty_per_uom": int(m.group(4)) if m.group(4) else 1,
-                        "description": desc[:200], "part_number": "", "pricing": {},
-                    })
+        if not results:
+            log.info("parse_multi_pc: no boundaries found, treating as single PC")
+            result = parse_ams704(pdf_path)
+            result["page_start"] = 0
+            result["page_end"] = total_pages - 1
+            return [result]
+
+        log.info("parse_multi_pc: found %d PC boundaries at pages %s",
+                 len(results), [s["page_start"] for s in results])
 
-                section_result["line_items"] = items
-                log.info("parse_multi_pc: section %d (%s, pages %d-%d): %d items",
-                         section_idx, header.get("institution", "?"), start_page, end_page, len(items))
-                results.append(section_result)
-
-            # ── Compute non-PC pages (purchase justifications, blank overflow, etc.) ──
-            all_pc_pages = set()
-            for s in results:
-                all_pc_pages.update(range(s["page_start"], s["page_end"] + 1))
-            non_pc_pages = sorted(set(range(total_pages)) - all_pc_pages)
-            for s in results:
-                s["non_pc_pages"] = non_pc_pages
-            if non_pc_pages:
-                log.info("parse_multi_pc: non-PC pages (purchase justifications etc.): %s", non_pc_pages)
+        # ── Compute non-PC pages (purchase justifications, blank overflow, etc.) ──
+        all_pc_pages = set()
+        for s in results:
+            all_pc_pages.update(range(s["page_start"], s["page_end"] + 1))
+        non_pc_pages = sorted(set(range(total_pages)) - all_pc_pages)
+        for s in results:
+            s["total_sections"] = len(results)
+            s["non_pc_pages"] = non_pc_pages
+        if non_pc_pages:
+            log.info("parse_multi_pc: non-PC pages (purchase justifications etc.): %s", non_pc_pages)
 
     except Exception as e:
+        from concurrent.futures.process import BrokenProcessPool
         log.error("parse_multi_pc %s: %s", os.path.basename(pdf_path), e, exc_info=True)
+        if pool is not None:
+            for p in parsed:
+                p.cancel()
+            if isinstance(e, BrokenProcessPool):
+                _shutdown_multi_pc_pool(wait=False)
         result = parse_ams704(pdf_path)
         result["page_start"] = 0
         result["page_end"] = 0
@@ -3660,6 +3796,82 @@ def _append_overflow_pages(
              page_num - 3, len(overflow_items))
 
 
+BUNDLE_GEN_WORKERS = 4
+
+
+def generate_bundle_parts(bundle_pcs: list, generate_fn, workers: int = None,
+                          on_progress=None) -> tuple:
+    """Run `generate_fn(pc_id)` for every PC of a bundle on a bounded pool.
+
+    Each fill is independent (own source pages, own output file), so a
+    15-PC bundle costs roughly the slowest ceil(15/workers) fills instead
+    of the sum of all of them. `generate_fn` must be safe to call from
+    several threads (_generate_pc_pdf serializes per PC id).
+
+    Args:
+        bundle_pcs: PC dicts (need "id", "page_start", "page_end").
+        generate_fn: `_generate_pc_pdf`-shaped callable →
+                     {"ok", "output_path", "summary"} or {"ok": False, "error"}.
+        workers: pool size (default BUNDLE_GEN_WORKERS / env BUNDLE_GEN_WORKERS).
+        on_progress: called on the calling thread after each PC finishes as
+                     on_progress(done, total, pc_id, ok, error).
+    Returns:
+        (pc_outputs sorted by page_start, errors in bundle order)
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    if workers is None:
+        try:
+            workers = int(os.environ.get("BUNDLE_GEN_WORKERS", BUNDLE_GEN_WORKERS))
+        except ValueError:
+            workers = BUNDLE_GEN_WORKERS
+    workers = max(1, min(workers, len(bundle_pcs) or 1))
+
+    def _one(pc):
+        pcid = pc["id"]
+        try:
+            result = generate_fn(pcid)
+        except Exception as e:
+            log.error("bundle part %s crashed: %s", pcid, e, exc_info=True)
+            result = {"ok": False, "error": f"Server error: {e}"}
+        finally:
+            try:
+                from src.core.db import close_thread_db
+                close_thread_db()
+            except Exception as _e:
+                log.debug("suppressed: %s", _e)
+        if not result.get("ok"):
+            return pcid, None, result.get("error", "Unknown")
+        return pcid, {
+            "pc_id": pcid,
+            "page_start": int(pc.get("page_start", 0)),
+            "page_end": int(pc.get("page_end", 0)),
+            "output_pdf": result["output_path"],
+            "summary": result.get("summary", {}),
+        }, None
+
+    outputs, failed = {}, {}
+    total = len(bundle_pcs)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bundle-gen") as pool:
+        futures = [pool.submit(_one, pc) for pc in bundle_pcs]
+        for done, fut in enumerate(as_completed(futures), start=1):
+            pcid, part, error = fut.result()
+            if part:
+                outputs[pcid] = part
+            else:
+                failed[pcid] = error
+            if on_progress:
+                try:
+                    on_progress(done, total, pcid, part is not None, error)
+                except Exception as _e:
+                    log.debug("bundle progress callback: %s", _e)
+
+    pc_outputs = sorted(outputs.values(), key=lambda p: p["page_start"])
+    errors = [{"pc_id": pc["id"], "error": failed[pc["id"]]}
+              for pc in bundle_pcs if pc["id"] in failed]
+    return pc_outputs, errors
+
+
 def merge_bundle_pdfs(
     source_pdf: str,
     pc_outputs: list,
@@ -3753,7 +3965,17 @@ def merge_bundle_pdfs(
         return {"ok": False, "error": f"PDF merge error: {e}"}
 
 
-def _detect_ams704_overlay_positions(source_pdf):
+def _detect_ams704_overlay_positions(source_pdf, use_cache=True):
+    """Overlay layout for `source_pdf`, from the template-fingerprint cache
+    when this exact template was detected before (see layout_cache.py),
+    otherwise via _scan_ams704_overlay_positions."""
+    if not use_cache:
+        return _scan_ams704_overlay_positions(source_pdf)
+    from src.forms.layout_cache import cached_layout
+    return cached_layout("overlay", source_pdf, _scan_ams704_overlay_positions)
+
+
+def _scan_ams704_overlay_positions(source_pdf):
     """Use pdfplumber to detect item table layout for AMS 704 overlay.
 
     Scans each page for:
@@ -70,11 +70,16 @@ def _sol_display(val: str) -> str:
 # AMS 703B/703C (Bid Response) — Reytech's form, we fill everything.
 # Certification forms (CUF, Darfur, DVBE, OBS1600, etc.) — we fill all.
 # ═══════════════════════════════════════════════════════════════════════════
-from pypdf import PdfReader, PdfWriter
-from pypdf.generic import NameObject, TextStringObject
-from reportlab.pdfgen import canvas as rl_canvas
-from reportlab.lib.utils import ImageReader
-from PIL import Image
+# pypdf / reportlab / Pillow resolve on first use — dashboard imports this
+# module at boot for load_config(), which needs none of them.
+from src.core.lazy_import import lazy_attr
+PdfReader = lazy_attr("pypdf", "PdfReader")
+PdfWriter = lazy_attr("pypdf", "PdfWriter")
+NameObject = lazy_attr("pypdf.generic", "NameObject")
+TextStringObject = lazy_attr("pypdf.generic", "TextStringObject")
+rl_canvas = lazy_attr("reportlab.pdfgen", "canvas")
+ImageReader = lazy_attr("reportlab.lib.utils", "ImageReader")
+Image = lazy_attr("PIL", "Image")
 import logging
 log = logging.getLogger("reytech.reytech_filler_v4")
 
@@ -6,13 +6,15 @@ RFQ Parser — extracts structured data from CCHCS RFQ PDF attachments.
 Reads pre-filled fields from the 703B (solicitation details) and 704B (line items).
 """
 
-from pypdf import PdfReader
 import re, os, json
 from datetime import datetime
 
 import logging
 log = logging.getLogger("reytech.rfq_parser")
 
+from src.core.lazy_import import lazy_attr
+PdfReader = lazy_attr("pypdf", "PdfReader")  # resolved on first parse, not at boot
+
 # Re-export generic parser functions for unified import path
 from src.forms.generic_rfq_parser import (  # noqa: F401
     parse_generic_rfq,
@@ -10,6 +10,17 @@ PDF pages, images, screenshots, and photographs. Handles:
 - Non-standard layouts
 
 Falls back gracefully when API key is not available.
+
+PDFs are rendered one page at a time, at the lowest dpi that still fills
+the model's image size, and each page goes to the model as soon as it is
+rendered (VISION_CONCURRENCY calls in flight) while the next one renders.
+Per-page results are cached by (page image sha256, prompt version), so a
+re-upload or a re-parse of the same scan costs no API calls.
+set_vision_client(FakeVisionClient(...)) swaps the API out for offline
+tests and benchmarks.
+
+Env:
+    VISION_CONCURRENCY=2  — concurrent model calls per document
 """
 
 import os
@@ -43,31 +54,76 @@ ANTHROPIC_API_KEY = _get_api_key()
 # PDF → Image Conversion
 # ═══════════════════════════════════════════════════════════════════════
 
-def _pdf_pages_to_base64(pdf_path: str, dpi: int = 200, max_pages: int = 30) -> list:
-    """Convert PDF pages to base64-encoded PNG images.
-    Returns list of {"base64": str, "page": int}."""
-    results = []
+# Claude's recommended max image edge — anything larger is downscaled
+# server-side anyway, so rendering above it only costs memory.
+_MAX_IMAGE_DIM = 1568
+
+
+def _page_count(pdf_path: str) -> Optional[int]:
+    try:
+        from pdf2image import pdfinfo_from_path
+        return int(pdfinfo_from_path(pdf_path).get("Pages") or 0) or None
+    except Exception:
+        return None
+
+
+def _render_dpi(pdf_path: str, page_no: int, dpi: int) -> int:
+    """Lowest dpi at which the page's long edge still reaches
+    _MAX_IMAGE_DIM (capped at `dpi`) — no point rendering 200 dpi just
+    to shrink it again."""
+    try:
+        from pypdf import PdfReader
+        box = PdfReader(pdf_path).pages[page_no - 1].mediabox
+        long_in = max(float(box.width), float(box.height)) / 72.0
+        if long_in > 0:
+            return max(72, min(dpi, int(_MAX_IMAGE_DIM / long_in) + 1))
+    except Exception as _e:
+        log.debug("render dpi fallback: %s", _e)
+    return dpi
+
+
+def _encode_page(img, page_no: int) -> dict:
+    import io
+    if img.width > _MAX_IMAGE_DIM or img.height > _MAX_IMAGE_DIM:
+        ratio = min(_MAX_IMAGE_DIM / img.width, _MAX_IMAGE_DIM / img.height)
+        img = img.resize((int(img.width * ratio), int(img.height * ratio)))
+    buf = io.BytesIO()
+    img.save(buf, format="PNG", optimize=True)
+    return {"base64": base64.b64encode(buf.getvalue()).decode("utf-8"), "page": page_no}
+
+
+def _iter_pdf_pages(pdf_path: str, dpi: int = 200, max_pages: int = 30):
+    """Yield {"base64": str, "page": int} one page at a time.
+
+    Only the page being rendered (plus whatever the caller still holds)
+    is in memory — a 30-page scan no longer materialises 30 PNGs and
+    their base64 copies before the first API call.
+    """
     try:
         from pdf2image import convert_from_path
-        images = convert_from_path(pdf_path, dpi=dpi, first_page=1,
-                                    last_page=max_pages, fmt="png")
-        for i, img in enumerate(images):
-            # Resize if too large (Claude has token limits for images)
-            max_dim = 1568  # Claude's recommended max
-            if img.width > max_dim or img.height > max_dim:
-                ratio = min(max_dim / img.width, max_dim / img.height)
-                new_size = (int(img.width * ratio), int(img.height * ratio))
-                img = img.resize(new_size)
-
-            # Convert to base64
-            import io
-            buf = io.BytesIO()
-            img.save(buf, format="PNG", optimize=True)
-            b64 = base64.b64encode(buf.getvalue()).decode("utf-8")
-            results.append({"base64": b64, "page": i + 1})
     except Exception as e:
         log.error("PDF to image conversion failed: %s", e)
-    return results
+        return
+    last = min(max_pages, _page_count(pdf_path) or max_pages)
+    page_dpi = None
+    for page_no in range(1, last + 1):
+        if page_dpi is None:
+            page_dpi = _render_dpi(pdf_path, page_no, dpi)
+        try:
+            images = convert_from_path(pdf_path, dpi=page_dpi, first_page=page_no,
+                                       last_page=page_no, fmt="png")
+        except Exception as e:
+            log.error("PDF to image conversion failed on page %d: %s", page_no, e)
+            return
+        if not images:
+            return
+        yield _encode_page(images[0], page_no)
+
+
+def _pdf_pages_to_base64(pdf_path: str, dpi: int = 200, max_pages: int = 30) -> list:
+    """Convert PDF pages to base64-encoded PNG images.
+    Returns list of {"base64": str, "page": int}."""
+    return list(_iter_pdf_pages(pdf_path, dpi=dpi, max_pages=max_pages))
 
 
 def _image_file_to_base64(image_path: str) -> Optional[dict]:
@@ -186,7 +242,13 @@ Rules:
 - Return ONLY the JSON object, no markdown fences, no explanation"""
 
 
-def _call_vision_api(page_images: list, system_prompt: str = None) -> Optional[dict]:
+_VISION_INSTRUCTION = ("Extract ALL header fields and ALL line items from this document. "
+                       "Count items first, then extract that exact count. Return ONLY JSON, no markdown fences.")
+_VISION_MODEL = "claude-opus-4-7"
+
+
+def _call_vision_api(page_images: list, system_prompt: str = None,
+                     instruction: str = None) -> Optional[dict]:
     """Send page images to Claude API and get structured extraction.
     Returns parsed JSON dict or None."""
     api_key = _get_api_key()  # re-read live — env var may be set after module load
@@ -210,8 +272,7 @@ def _call_vision_api(page_images: list, system_prompt: str = None) -> Optional[d
         })
     content.append({
         "type": "text",
-        "text": ("Extract ALL header fields and ALL line items from this document. "
-                 "Count items first, then extract that exact count. Return ONLY JSON, no markdown fences.")
+        "text": instruction or _VISION_INSTRUCTION,
     })
 
     # Use structured system prompt with cache_control for prompt caching
@@ -224,7 +285,7 @@ def _call_vision_api(page_images: list, system_prompt: str = None) -> Optional[d
     if check_quota(agent="vision_parser._call_vision_api"):
         return None
 
-    _model = "claude-opus-4-7"
+    _model = _VISION_MODEL
     import time as _time
     try:
         _t0 = _time.time()
@@ -283,6 +344,141 @@ def _call_vision_api(page_images: list, system_prompt: str = None) -> Optional[d
         return None
 
 
+# ═══════════════════════════════════════════════════════════════════════
+# Per-page extraction: result cache, pluggable client, render/call overlap
+# ═══════════════════════════════════════════════════════════════════════
+
+_PAGE_INSTRUCTION = ("Extract ALL header fields and ALL line items from this page. "
+                     "Count items first, then extract that exact count. Return ONLY JSON, no markdown fences.")
+
+# Concurrent model calls per document; the next page renders meanwhile.
+try:
+    VISION_CONCURRENCY = max(1, int(os.environ.get("VISION_CONCURRENCY", "2")))
+except ValueError:
+    VISION_CONCURRENCY = 2
+
+_PAGE_CACHE = None
+_client = None
+
+
+def _page_cache():
+    global _PAGE_CACHE
+    if _PAGE_CACHE is None:
+        from src.core.research_cache import ResearchCache
+        _PAGE_CACHE = ResearchCache("vision_page", ttl_days=90, max_entries=5000)
+    return _PAGE_CACHE
+
+
+def _prompt_version(system_prompt: str, instruction: str) -> str:
+    """Changes whenever the model, system prompt or instruction does, so
+    an edited prompt never serves results produced by the old one."""
+    import hashlib
+    blob = "\x00".join((_VISION_MODEL, system_prompt, instruction))
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()[:12]
+
+
+def _page_hash(page: dict) -> str:
+    import hashlib
+    return hashlib.sha256(page["base64"].encode("ascii")).hexdigest()
+
+
+def set_vision_client(client) -> None:
+    """Route page extraction through `client(page_images, system_prompt=,
+    instruction=)` instead of the Anthropic API (None restores it)."""
+    global _client
+    _client = client
+
+
+class FakeVisionClient:
+    """Offline stand-in for the vision API — deterministic per-page output
+    with an optional artificial latency, for tests and benchmarks.
+
+        set_vision_client(FakeVisionClient(items_per_page=5, latency=0.8))
+    """
+
+    def __init__(self, items_per_page: int = 3, latency: float = 0.0, header: dict = None):
+        import threading
+        self.items_per_page = items_per_page
+        self.latency = latency
+        self.header = header if header is not None else {"price_check_number": "FAKE-1"}
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, page_images, system_prompt=None, instruction=None):
+        import time as _time
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            _time.sleep(self.latency)
+        tag = _page_hash(page_images[0])[:8]
+        return {
+            "header": dict(self.header),
+            "items": [{"qty": 1, "uom": "EA", "description": f"item {tag}-{n}"}
+                      for n in range(1, self.items_per_page + 1)],
+        }
+
+
+def _extract_page(page: dict, system_prompt: str, cache_key: str) -> Optional[dict]:
+    client = _client or _call_vision_api
+    result = client([page], system_prompt=system_prompt, instruction=_PAGE_INSTRUCTION)
+    if result is not None and cache_key:
+        try:
+            _page_cache().put(cache_key, result)
+        except Exception as e:
+            log.debug("vision page cache write: %s", e)
+    return result
+
+
+def _extract_pages(pages, system_prompt: str = None, use_cache: bool = True,
+                   workers: int = None) -> tuple:
+    """Extract every page from the `pages` iterator.
+
+    Pages are pulled from the (lazy) iterator only as call slots free up,
+    so at most `workers` rendered pages wait on the API at once. Each page
+    is looked up by (image sha256, prompt version) first; hits cost no
+    API call. Returns ([per-page result or None, in page order], stats).
+    """
+    from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+    sys_prompt = system_prompt or _VISION_SYSTEM
+    version = _prompt_version(sys_prompt, _PAGE_INSTRUCTION)
+    workers = max(1, workers or VISION_CONCURRENCY)
+    results, pending = {}, {}
+    stats = {"pages": 0, "cache_hits": 0, "api_calls": 0, "errors": 0}
+
+    def _collect(done):
+        for fut in done:
+            idx = pending.pop(fut)
+            try:
+                results[idx] = fut.result()
+            except Exception as e:
+                log.error("Vision page %d failed: %s", idx + 1, e)
+                stats["errors"] += 1
+                results[idx] = None
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vision") as pool:
+        for idx, page in enumerate(pages):
+            stats["pages"] += 1
+            key = f"{version}:{_page_hash(page)}" if use_cache else ""
+            hit = None
+            if key:
+                try:
+                    hit = _page_cache().get(key)
+                except Exception as e:
+                    log.debug("vision page cache read: %s", e)
+            if hit is not None:
+                stats["cache_hits"] += 1
+                results[idx] = hit
+                continue
+            if len(pending) >= workers:
+                done, _ = wait(list(pending), return_when=FIRST_COMPLETED)
+                _collect(done)
+            pending[pool.submit(_extract_page, page, sys_prompt, key)] = idx
+            stats["api_calls"] += 1
+        _collect(wait(list(pending)).done)
+    return [results.get(i) for i in range(stats["pages"])], stats
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # Main Parser
 # ═══════════════════════════════════════════════════════════════════════
@@ -309,7 +505,7 @@ def parse_with_vision(file_path: str, mode: str = "standard") -> Optional[dict]:
     }
     Or None if vision parsing is unavailable/fails.
     """
-    if not _get_api_key():
+    if not _client and not _get_api_key():
         return None
 
     ext = os.path.splitext(file_path)[1].lower()
@@ -321,22 +517,34 @@ def parse_with_vision(file_path: str, mode: str = "standard") -> Optional[dict]:
         if not img_data:
             log.warning("Vision parser: failed to load image %s", file_path)
             return None
-        page_images = [img_data]
+        pages = iter([img_data])
         log.info("Vision parser: loaded image %s (%s)", os.path.basename(file_path), img_data["media_type"])
     else:
-        # PDF: convert to images
-        page_images = _pdf_pages_to_base64(file_path, dpi=200)
-        if not page_images:
-            log.warning("Vision parser: no images generated from %s", file_path)
-            return None
-        log.info("Vision parser: %d page images from %s", len(page_images), os.path.basename(file_path))
+        # PDF: rendered page by page while earlier pages are with the model
+        pages = _iter_pdf_pages(file_path, dpi=200)
 
-    # Call API
     sys_prompt = _VISION_SYSTEM_URLS if mode == "screenshot_urls" else None
-    vision_result = _call_vision_api(page_images, system_prompt=sys_prompt)
-    if not vision_result:
+    page_results, stats = _extract_pages(pages, system_prompt=sys_prompt)
+    if not stats["pages"]:
+        log.warning("Vision parser: no images generated from %s", file_path)
+        return None
+    log.info("Vision parser: %d pages from %s (%d cached, %d API calls)",
+             stats["pages"], os.path.basename(file_path),
+             stats["cache_hits"], stats["api_calls"])
+    if not any(page_results):
         return None
 
+    # Merge pages: first non-empty value wins per header field, items in page order
+    header, raw_items = {}, []
+    for res in page_results:
+        if not res:
+            continue
+        for k, v in (res.get("header") or {}).items():
+            if v and not header.get(k):
+                header[k] = v
+        raw_items.extend(res.get("items") or [])
+    vision_result = {"header": header, "items": raw_items}
+
     # Convert to standard parse_ams704 format
     header = vision_result.get("header", {})
     raw_items = vision_result.get("items", [])
@@ -520,6 +728,8 @@ def parse_from_text(text: str, source_path: str = "") -> Optional[dict]:
 
 def is_available() -> bool:
     """Check if vision parsing is available (API key + dependencies)."""
+    if _client:
+        return True
     return bool(_get_api_key()) and HAS_REQUESTS
 
 
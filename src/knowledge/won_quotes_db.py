@@ -22,6 +22,8 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional
 from collections import defaultdict
 
+from src.core.rule_engine import KeywordCategorizer
+
 log = logging.getLogger("reytech.wonquotes")
 
 # ─── Configuration ───────────────────────────────────────────────────────────
@@ -192,6 +194,8 @@ def save_won_quotes(quotes: list):
             ))
         conn.commit()
         conn.close()
+        from src.core.dashboard_snapshot import mark_dirty
+        mark_dirty("won_quotes")
         log.debug("save_won_quotes: upserted %d records to SQLite", len(quotes))
     except Exception as e:
         log.error("save_won_quotes SQLite error: %s", e)
@@ -236,19 +240,13 @@ def tokenize(text: str) -> set:
     return tokens
 
 
+_CATEGORIZER = KeywordCategorizer(CATEGORY_KEYWORDS, default="general",
+                                  name="won_quote_categories")
+
+
 def classify_category(description: str) -> str:
     """Classify an item into a category based on keyword matching."""
-    desc_lower = description.lower()
-    best_category = "general"
-    best_score = 0
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        if category == "general":
-            continue
-        score = sum(1 for kw in keywords if kw in desc_lower)
-        if score > best_score:
-            best_score = score
-            best_category = category
-    return best_category
+    return _CATEGORIZER.best(description)
 
 
 def generate_record_id(po_number: str, item_number: str, description: str) -> str:
@@ -974,6 +972,8 @@ def sync_from_scprs_tables() -> dict:
                 stats["errors"] += 1
 
         conn.commit()
+        from src.core.dashboard_snapshot import mark_dirty
+        mark_dirty("won_quotes")
         log.info("SCPRS→won_quotes sync: %d synced, %d skipped, %d errors (from %d lines)",
                  stats["synced"], stats["skipped"], stats["errors"], len(rows))
     except Exception as e:
@@ -1253,6 +1253,8 @@ def repair_existing_rows(dry_run: bool = True) -> dict:
         except Exception:
             conn.rollback()
             raise
+        from src.core.dashboard_snapshot import mark_dirty
+        mark_dirty("won_quotes")
         log.warning("won_quotes repair: %s", plan)
         return plan
     finally:
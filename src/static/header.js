@@ -124,30 +124,32 @@ function _resetBtn(btn,label){
 
 // ── Notifications ──
 (function initBell(){
+  function renderBell(total,draftCount,csDrafts){
+    var badge=document.getElementById('notif-badge');
+    if(!badge)return;
+    var combined=total+draftCount;
+    if(combined>0){badge.textContent=combined>99?'99+':combined;badge.classList.add('show')}
+    else{badge.classList.remove('show')}
+    var csEl=document.getElementById('notif-cs-count');
+    if(csEl&&csDrafts>0){csEl.textContent=csDrafts+' CS draft(s)';csEl.style.display='inline'}
+    else if(csEl){csEl.style.display='none'}
+  }
   function updateBellCount(){
+    if(window.ReytechLive&&ReytechLive.active())return;  // pushed instead
     fetch('/api/notifications/bell-count',{credentials:'same-origin'})
     .then(function(r){return r.json()}).then(function(d){
-      var badge=document.getElementById('notif-badge');
-      if(!badge||!d.ok)return;
+      if(!d.ok)return;
       var total=d.total_badge||0;
       // Also fetch pending draft count and add to badge
       fetch('/api/outbox/pending-count',{credentials:'same-origin'})
       .then(function(r2){return r2.json()}).then(function(d2){
-        var draftCount=(d2.ok&&d2.count)?d2.count:0;
-        var combined=total+draftCount;
-        if(combined>0){badge.textContent=combined>99?'99+':combined;badge.classList.add('show')}
-        else{badge.classList.remove('show')}
-      }).catch(function(){
-        if(total>0){badge.textContent=total>99?'99+':total;badge.classList.add('show')}
-        else{badge.classList.remove('show')}
-      });
-      var csEl=document.getElementById('notif-cs-count');
-      if(csEl&&d.cs_drafts>0){csEl.textContent=d.cs_drafts+' CS draft(s)';csEl.style.display='inline'}
-      else if(csEl){csEl.style.display='none'}
+        renderBell(total,(d2.ok&&d2.count)?d2.count:0,d.cs_drafts);
+      }).catch(function(){renderBell(total,0,d.cs_drafts)});
     }).catch(function(){});
   }
+  if(window.ReytechLive)ReytechLive.on('bell',function(d){renderBell(d.total_badge||0,d.drafts||0,d.cs_drafts)});
   updateBellCount();
-  setInterval(updateBellCount,300000); // 5 min (was 30s)
+  setInterval(updateBellCount,300000); // 5 min (was 30s); skipped while live
 })();
 function toggleNotifPanel(){
   var panel=document.getElementById('notif-panel');
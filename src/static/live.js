@@ -0,0 +1,74 @@
+// Reytech RFQ — live updates over one SSE stream per browser.
+//
+// One tab (the holder of the 'reytech-live' Web Lock) opens
+// /api/live/stream and relays every event to the other tabs over a
+// BroadcastChannel, so N open tabs cost one server thread, not N sets
+// of pollers. Widgets subscribe with ReytechLive.on(channel, fn) and
+// skip their own polling while ReytechLive.active() is true; if the
+// browser lacks these APIs or the server answers 503 (all stream slots
+// taken), active() stays false and the pollers carry on as before.
+(function(){
+ var handlers={}, last={}, lastSeen=0, isLeader=false;
+ var bc=('BroadcastChannel' in window)?new BroadcastChannel('reytech-live'):null;
+ var supported=!!(bc&&window.EventSource&&navigator.locks);
+
+ function sid(){
+  try{
+   var v=localStorage.getItem('reytech_live_sid');
+   if(!v){v=Math.random().toString(36).slice(2)+Date.now().toString(36);localStorage.setItem('reytech_live_sid',v)}
+   return v;
+  }catch(e){return ''}
+ }
+ function deliver(ch,data){
+  lastSeen=Date.now();
+  if(ch==='ping'||ch==='bye')return;
+  last[ch]=data;
+  (handlers[ch]||[]).forEach(function(fn){try{fn(data)}catch(e){console.warn('live '+ch+':',e)}});
+ }
+
+ window.ReytechLive={
+  on:function(ch,fn){
+   (handlers[ch]=handlers[ch]||[]).push(fn);
+   if(last[ch]!==undefined)fn(last[ch]);
+  },
+  // Fresh data within the server's heartbeat window (25s ping + slack).
+  active:function(){return supported&&Date.now()-lastSeen<70000}
+ };
+ if(!supported)return;
+
+ bc.onmessage=function(e){
+  var m=e.data||{};
+  if(m.type==='event')deliver(m.ch,m.data);
+  else if(m.type==='hello'&&isLeader){
+   Object.keys(last).forEach(function(ch){bc.postMessage({type:'event',ch:ch,data:last[ch]})});
+  }
+ };
+
+ function lead(){
+  isLeader=true;
+  return new Promise(function(){
+   var es, backoff=0;
+   function relay(ch){
+    es.addEventListener(ch,function(ev){
+     var data;try{data=JSON.parse(ev.data)}catch(e){return}
+     deliver(ch,data);
+     bc.postMessage({type:'event',ch:ch,data:data});
+     if(ch==='bye'&&data.reason==='superseded')es.close();
+    });
+   }
+   function connect(){
+    es=new EventSource('/api/live/stream?sid='+encodeURIComponent(sid()));
+    ['bell','deadlines','pulse','ping','bye'].forEach(relay);
+    es.onopen=function(){backoff=0};
+    es.onerror=function(){
+     // CLOSED = the server refused (503: no free slot) — retry later and
+     // let the pollers cover the gap. CONNECTING = normal SSE reconnect.
+     if(es.readyState===2){backoff=Math.min((backoff||30000)*2,600000);setTimeout(connect,backoff)}
+    };
+   }
+   connect();
+  });  // never resolves: the lock is held until this tab closes
+ }
+ navigator.locks.request('reytech-live',lead);
+ bc.postMessage({type:'hello'});
+})();
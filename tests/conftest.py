@@ -172,6 +172,13 @@ def temp_data_dir(tmp_path, monkeypatch):
         _db_mod.close_thread_db()  # Reset connection after init
     except Exception:
         pass
+    # Single-flight caches (PC load, dashboard init) outlive a test; drop
+    # what they built against the previous test's DB.
+    try:
+        from src.core.flight_cache import invalidate_all
+        invalidate_all()
+    except Exception:
+        pass
 
     return data
 
@@ -227,13 +234,10 @@ def app(temp_data_dir, monkeypatch):
     monkeypatch.setattr(dashboard, "UPLOAD_DIR",
                         os.path.join(temp_data_dir, "uploads"))
     # Clear price check cache so tests get fresh data from temp_data_dir
-    monkeypatch.setattr(dashboard, "_pc_cache", None)
-    monkeypatch.setattr(dashboard, "_pc_cache_time", 0)
-    # Also patch data_layer (canonical location after refactor)
+    # (data_layer is the canonical location after the refactor)
     try:
         import src.api.data_layer as _dl
-        monkeypatch.setattr(_dl, "_pc_cache", None)
-        monkeypatch.setattr(_dl, "_pc_cache_time", 0)
+        _dl._pc_cache.invalidate()
         monkeypatch.setattr(_dl, "DATA_DIR", temp_data_dir)
     except Exception:
         pass
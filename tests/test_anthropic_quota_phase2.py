@@ -128,9 +128,9 @@ def test_web_price_research_skipped_when_quota_closed(monkeypatch):
 
     monkeypatch.setattr(
         "src.agents.web_price_research.requests.post", fail_post)
-    # Bypass the on-disk cache by stubbing _load_cache to return {}.
+    # Bypass the research cache so the lookup reaches the quota gate.
     monkeypatch.setattr(
-        "src.agents.web_price_research._load_cache", lambda: {})
+        "src.agents.web_price_research._CACHE.get", lambda key: None)
 
     from src.agents.web_price_research import search_product_price
     out = search_product_price(
@@ -29,7 +29,6 @@ Guard rails this test pins:
 from __future__ import annotations
 
 import importlib
-import json
 from pathlib import Path
 
 import pytest
@@ -37,8 +36,8 @@ import pytest
 
 @pytest.fixture
 def isolated_cache(tmp_path, monkeypatch):
-    """Point product_research at a temp cache file so tests don't pollute
-    the real `data/product_research_cache.json`."""
+    """Point product_research at a temp legacy cache file. Entries live in
+    the `research_cache` table of the per-test reytech.db (conftest)."""
     from src.agents import product_research as pr
     cache_path = tmp_path / "product_research_cache.json"
     monkeypatch.setattr(pr, "DATA_DIR", str(tmp_path))
@@ -93,8 +92,7 @@ def test_cache_store_flips_recycled_when_titles_diverge(isolated_cache):
         "asin": asin, "price": 7.99, "url": f"https://amazon.com/dp/{asin}",
     })
 
-    cache = json.loads(cache_path.read_text())
-    entry = cache[pr._cache_key(f"asin:{asin}")]
+    entry = pr._ASIN_CACHE.peek(pr._cache_key(f"asin:{asin}"))
     assert entry.get("recycled_suspected") is True, (
         "ASIN cache write with disjoint title MUST flag recycled_suspected"
     )
@@ -116,8 +114,7 @@ def test_cache_store_no_flag_when_titles_similar(isolated_cache):
         "asin": asin, "price": 8.49, "url": "",
     })
 
-    cache = json.loads(cache_path.read_text())
-    entry = cache[pr._cache_key(f"asin:{asin}")]
+    entry = pr._ASIN_CACHE.peek(pr._cache_key(f"asin:{asin}"))
     assert not entry.get("recycled_suspected"), (
         "Title refresh with high token overlap MUST NOT flip the flag"
     )
@@ -130,8 +127,7 @@ def test_cache_store_first_write_no_false_positive(isolated_cache):
         "title": "Some Brand New Product",
         "asin": "B0NEWASIN1", "price": 19.99, "url": "",
     })
-    cache = json.loads(cache_path.read_text())
-    entry = list(cache.values())[0]
+    entry = pr._ASIN_CACHE.peek(pr._cache_key("asin:B0NEWASIN1"))
     assert not entry.get("recycled_suspected")
 
 
@@ -151,8 +147,8 @@ def test_cache_store_non_asin_key_never_flags(isolated_cache):
         "price": 7.99, "url": "",
     })
 
-    cache = json.loads(cache_path.read_text())
-    entry = list(cache.values())[0]
+    entry = pr._QUERY_CACHE.peek(pr._cache_key("Echo Dot Smart Speaker"))
+    assert entry["title"] == "Heel Donut Cushion"
     assert not entry.get("recycled_suspected"), (
         "Non-asin: cache keys must NOT participate in recycle detection."
     )
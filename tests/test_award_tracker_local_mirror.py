@@ -0,0 +1,201 @@
+"""award_tracker.run_award_check resolves awards from the local SCPRS
+mirror (scprs_po_master/scprs_po_lines) before touching FI$Cal.
+
+Pins: a quote whose winning PO is already harvested is matched with no
+session and no search budget spent; only unresolved quotes reach the
+live session, including ones whose best local match is below
+HIGH_CONFIDENCE_THRESHOLD; a PO that predates the quote isn't a candidate; when the
+live budget is gone, locally resolved quotes are still processed and
+the rest — including medium-confidence-only ones — are deferred (not
+logged as checked).
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_ITEMS = json.dumps([
+    {"description": "Blood pressure cuff adult", "qty": 5,
+     "unit_price": 45.00, "cost": 25.00, "margin_pct": 45.0},
+    {"description": "Stethoscope dual-head", "qty": 2,
+     "unit_price": 120.00, "cost": 70.00, "margin_pct": 41.7},
+])
+
+
+@pytest.fixture
+def mirror_db(tmp_path, monkeypatch):
+    db_path = tmp_path / "reytech.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript("""
+        CREATE TABLE quotes (
+            id TEXT PRIMARY KEY, quote_number TEXT, agency TEXT,
+            institution TEXT, total REAL, line_items TEXT, items_text TEXT,
+            sent_at TEXT, created_at TEXT, contact_email TEXT,
+            contact_name TEXT, source_pc_id TEXT, status TEXT,
+            status_notes TEXT, close_reason TEXT, closed_by_agent TEXT,
+            updated_at TEXT, is_test INTEGER DEFAULT 0
+        );
+        CREATE TABLE rfqs (
+            id TEXT PRIMARY KEY, rfq_number TEXT, agency TEXT,
+            institution TEXT, total REAL, items TEXT, sent_at TEXT,
+            received_at TEXT, requestor_email TEXT, requestor_name TEXT,
+            status TEXT
+        );
+        CREATE TABLE scprs_po_master (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, pulled_at TEXT,
+            po_number TEXT UNIQUE, dept_code TEXT, dept_name TEXT,
+            supplier TEXT, grand_total REAL, start_date TEXT,
+            buyer_email TEXT, agency_key TEXT
+        );
+        CREATE TABLE scprs_po_lines (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, po_id INTEGER,
+            po_number TEXT, line_num INTEGER, item_id TEXT,
+            description TEXT, uom TEXT, quantity REAL, unit_price REAL,
+            line_total REAL
+        );
+    """)
+    for qid, qn, desc in (("q-1", "Q26T001", "Blood pressure cuff adult"),
+                          ("q-2", "Q26T002", "Wheelchair cushion gel")):
+        items = _ITEMS if qid == "q-1" else json.dumps(
+            [{"description": desc, "qty": 1, "unit_price": 80.0}])
+        conn.execute("""
+            INSERT INTO quotes (id, quote_number, agency, institution, total,
+                                line_items, sent_at, created_at, status, is_test)
+            VALUES (?,?, 'CDCR', 'CDCR HQ', ?, ?, datetime('now', '-5 days'),
+                    datetime('now', '-7 days'), 'sent', 0)
+        """, (qid, qn, 465.00 if qid == "q-1" else 80.0, items))
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr("src.core.paths.DATA_DIR", str(tmp_path))
+    monkeypatch.setattr("src.core.db.DB_PATH", str(db_path))
+    monkeypatch.setattr("src.agents.award_tracker.time.sleep", lambda *_: None)
+    return str(db_path)
+
+
+def _harvest(db_path, start_days_ago=1, po="4500099999", total="$420.00"):
+    start = (datetime.now() - timedelta(days=start_days_ago)).strftime("%m/%d/%Y")
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO scprs_po_master (pulled_at, po_number, dept_code, dept_name, "
+        "supplier, grand_total, start_date, agency_key) "
+        "VALUES (datetime('now'), ?, '5225', 'CDCR HEADQUARTERS', "
+        "'Acme Medical Supply', ?, ?, 'CCHCS')", (po, total, start))
+    conn.executemany(
+        "INSERT INTO scprs_po_lines (po_number, line_num, description, quantity, unit_price) "
+        "VALUES (?,?,?,?,?)",
+        [(po, 1, "Blood pressure cuff adult", 5, 38.00),
+         (po, 2, "Stethoscope dual-head", 2, 115.00)])
+    conn.commit()
+    conn.close()
+
+
+def _session(monkeypatch, results=()):
+    session = MagicMock()
+    session.init_session.return_value = True
+    session.search.return_value = list(results)
+    factory = MagicMock(return_value=session)
+    monkeypatch.setattr("src.agents.scprs_lookup.FiscalSession", factory)
+    return factory, session
+
+
+def test_harvested_award_resolves_without_live_search(mirror_db, monkeypatch):
+    _harvest(mirror_db)
+    factory, session = _session(monkeypatch)
+    with patch("src.core.pricing_oracle_v2.calibrate_from_outcome") as calibrate:
+        from src.agents.award_tracker import run_award_check
+        result = run_award_check(force=True)
+
+    assert result["local_resolved"] == 1 and result["losses"] == 1
+    assert calibrate.call_count == 1
+    searched = [c.kwargs["description"] for c in session.search.call_args_list]
+    assert searched and all("Blood" not in k for k in searched)   # only Q26T002 went live
+    conn = sqlite3.connect(mirror_db)
+    row = conn.execute("SELECT po_number, match_method FROM quote_po_matches "
+                       "WHERE quote_number='Q26T001'").fetchone()
+    assert row[0] == "4500099999" and "local_mirror" in row[1]
+
+
+def test_no_session_when_mirror_resolves_everything(mirror_db, monkeypatch):
+    _harvest(mirror_db)
+    sqlite3.connect(mirror_db).execute("DELETE FROM quotes WHERE id='q-2'").connection.commit()
+    factory, _ = _session(monkeypatch)
+    with patch("src.core.pricing_oracle_v2.calibrate_from_outcome"):
+        from src.agents.award_tracker import run_award_check
+        result = run_award_check(force=True)
+    assert result["ok"] and result["checked"] == 1 and result["scprs_searches"] == 0
+    factory.assert_not_called()
+
+
+def test_medium_confidence_local_match_still_searches_live(mirror_db, monkeypatch):
+    # Same agency and items, but the total is far off: 0.70 confidence,
+    # a candidate but not enough to trust over a live search.
+    _harvest(mirror_db, total="$200.00")
+    sqlite3.connect(mirror_db).execute("DELETE FROM quotes WHERE id='q-2'").connection.commit()
+    live_po = {"po_number": "4500011111", "supplier_name": "Bedside Medical",
+               "dept": "CDCR HEADQUARTERS", "grand_total_num": 440.0,
+               "first_item": "Blood pressure cuff adult"}
+    factory, session = _session(monkeypatch, results=[live_po])
+    session.get_detail.return_value = {"line_items": []}
+    from src.agents import award_tracker as at
+    with patch("src.core.pricing_oracle_v2.calibrate_from_outcome"):
+        result = at.run_award_check(force=True)
+
+    conn = at._db()
+    try:
+        quote = dict(conn.execute("SELECT * FROM quotes WHERE id='q-1'").fetchone())
+        local = at._local_po_matches(conn, quote, ["Blood pressure cuff"],
+                                     at._quote_search_from(quote, datetime.now()))
+    finally:
+        conn.close()
+    assert [round(m["confidence"], 2) for m in local] == [0.7]
+    assert result["local_resolved"] == 0 and result["scprs_searches"] > 0
+    factory.assert_called_once()
+    row = sqlite3.connect(mirror_db).execute(
+        "SELECT po_number FROM quote_po_matches WHERE quote_number='Q26T001'").fetchone()
+    assert row[0] == "4500011111"
+
+
+def test_po_older_than_quote_is_not_a_candidate(mirror_db):
+    _harvest(mirror_db, start_days_ago=30)
+    from src.agents import award_tracker as at
+    conn = at._db()
+    try:
+        quote = dict(conn.execute("SELECT * FROM quotes WHERE id='q-1'").fetchone())
+        sent = at._quote_search_from(quote, datetime.now())
+        assert at._local_po_matches(conn, quote, ["Blood pressure cuff"], sent) == []
+    finally:
+        conn.close()
+
+
+def test_exhausted_budget_defers_live_quotes_only(mirror_db, monkeypatch):
+    _harvest(mirror_db)
+    _, session = _session(monkeypatch)
+    monkeypatch.setattr("src.agents.award_tracker.MAX_SCPRS_SEARCHES_PER_RUN", 0)
+    with patch("src.core.pricing_oracle_v2.calibrate_from_outcome"):
+        from src.agents.award_tracker import run_award_check
+        result = run_award_check(force=True)
+    assert result["checked"] == 1 and result["live_deferred"] == 1
+    session.search.assert_not_called()
+    logged = sqlite3.connect(mirror_db).execute(
+        "SELECT quote_number FROM award_tracker_log").fetchall()
+    assert logged == [("Q26T001",)]
+
+
+def test_exhausted_budget_defers_medium_confidence_quote(mirror_db, monkeypatch):
+    # 0.70 local candidate only: without a live search it stays unchecked.
+    _harvest(mirror_db, total="$200.00")
+    sqlite3.connect(mirror_db).execute("DELETE FROM quotes WHERE id='q-2'").connection.commit()
+    _, session = _session(monkeypatch)
+    monkeypatch.setattr("src.agents.award_tracker.MAX_SCPRS_SEARCHES_PER_RUN", 0)
+    with patch("src.core.pricing_oracle_v2.calibrate_from_outcome"):
+        from src.agents.award_tracker import run_award_check
+        result = run_award_check(force=True)
+    assert result["checked"] == 0 and result["live_deferred"] == 1
+    session.search.assert_not_called()
+    logged = sqlite3.connect(mirror_db).execute(
+        "SELECT quote_number FROM award_tracker_log").fetchall()
+    assert logged == []
@@ -0,0 +1,83 @@
+"""Tests for the offline benchmark harness — scripts/gen_synthetic_data.py
+and scripts/bench_hot_paths.py.
+
+Pins: the generator is deterministic per seed and scales every table
+from the prod volumes; the regression check needs both the relative
+threshold and the absolute floor to trip; skipped/errored benchmarks
+never count as regressions; and the loaders run in-process against the
+per-test DB.
+"""
+from __future__ import annotations
+
+import sqlite3
+
+from scripts import bench_hot_paths as bench
+from scripts import gen_synthetic_data as gen
+
+
+def _digest(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(
+            "SELECT group_concat(id || status || items, '|') FROM "
+            "(SELECT * FROM price_checks ORDER BY id)").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_generator_scales_and_is_deterministic(tmp_path):
+    a, b, c = (str(tmp_path / f"{n}.db") for n in "abc")
+    counts = gen.generate(a, scale=0.002, seed=7)
+    gen.generate(b, scale=0.002, seed=7)
+    gen.generate(c, scale=0.002, seed=8)
+    assert counts["product_catalog"] == 100
+    assert counts["price_checks"] == 10
+    assert counts["scprs_po_lines"] == 400
+    assert _digest(a) == _digest(b) != _digest(c)
+
+
+def _result(name, ms, status="ok"):
+    r = bench.Result(name, status=status)
+    if status == "ok":
+        r.samples_ms = [ms]
+    return r
+
+
+def test_compare_needs_ratio_and_absolute_delta():
+    base = {"results": {"slow": {"median_ms": 100.0}, "tiny": {"median_ms": 1.0},
+                        "fast": {"median_ms": 100.0}, "same": {"median_ms": 100.0}}}
+    verdicts = bench.compare({
+        "slow": _result("slow", 140.0),
+        "tiny": _result("tiny", 3.0),          # 3x, but only 2ms
+        "fast": _result("fast", 60.0),
+        "same": _result("same", 110.0),
+        "new": _result("new", 5.0),
+    }, base, threshold=0.25, min_delta_ms=5.0)
+    assert {n: v["verdict"] for n, v in verdicts.items()} == {
+        "slow": "regressed", "tiny": "ok", "fast": "improved",
+        "same": "ok", "new": "no-baseline"}
+    assert verdicts["slow"]["ratio"] == 1.4
+
+
+def test_skipped_and_errored_benchmarks_are_not_regressions():
+    base = {"results": {"fill_704a": {"median_ms": 10.0}}}
+    verdicts = bench.compare({"fill_704a": _result("fill_704a", 0, "skipped")}, base)
+    assert verdicts == {"fill_704a": {"verdict": "skipped"}}
+
+
+def test_save_baselines_keeps_entries_for_skipped(tmp_path):
+    path = str(tmp_path / "baselines.json")
+    bench.save_baselines({"fill_704a": _result("fill_704a", 12.0)}, {"scale": 1.0}, path)
+    bench.save_baselines({"fill_704a": _result("fill_704a", 0, "skipped"),
+                          "load_rfqs": _result("load_rfqs", 4.0)}, {"scale": 1.0}, path)
+    stored = bench.load_baselines(path)["results"]
+    assert stored == {"fill_704a": {"median_ms": 12.0}, "load_rfqs": {"median_ms": 4.0}}
+
+
+def test_loaders_run_against_current_db():
+    from src.core.db import DB_PATH
+    gen.generate(DB_PATH, scale=0.002)
+    results = bench.run_benchmarks(["load_price_checks", "load_rfqs"], repeat=2)
+    assert {n: r.status for n, r in results.items()} == {
+        "load_price_checks": "ok", "load_rfqs": "ok"}
+    assert all(len(r.samples_ms) == 2 for r in results.values())
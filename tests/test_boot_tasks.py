@@ -0,0 +1,167 @@
+"""Tests for src/core/boot_tasks.py — the deferred-init watermark ledger.
+
+Pins: unchanged inputs skip the task, any input change (file content,
+table insert/update) re-runs it, one task's writes to another's inputs
+within a pass don't, failures keep retrying, version bumps
+force a run, the lease blocks a concurrent pass, and durations reach
+the health summary.
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from src.core import boot_tasks as bt
+from src.core.boot_tasks import BootTask, file_source, run_boot_tasks, table_source
+
+
+@pytest.fixture
+def counter():
+    calls = {"n": 0}
+
+    def fn():
+        calls["n"] += 1
+    return calls, fn
+
+
+def _write(path, text, mtime=None):
+    with open(path, "w") as f:
+        f.write(text)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_file_source_skips_until_content_changes(temp_data_dir, counter):
+    calls, fn = counter
+    path = os.path.join(temp_data_dir, "boot_input.json")
+    _write(path, '{"a": 1}')
+    task = BootTask("t_file", fn, sources=(file_source("boot_input.json"),))
+
+    assert run_boot_tasks([task])["ran"] == ["t_file"]
+    assert run_boot_tasks([task])["skipped"] == ["t_file"]
+
+    # Same bytes, new mtime (save-on-load rewrite) — still unchanged.
+    _write(path, '{"a": 1}', mtime=1_700_000_000_000_000_000)
+    assert run_boot_tasks([task])["skipped"] == ["t_file"]
+
+    _write(path, '{"a": 2}')
+    assert run_boot_tasks([task])["ran"] == ["t_file"]
+    assert calls["n"] == 2
+
+
+def test_table_source_sees_inserts_and_updates(counter):
+    from src.core.db import get_db
+    calls, fn = counter
+    with get_db() as conn:
+        conn.execute("CREATE TABLE boot_t (id INTEGER PRIMARY KEY, v TEXT, updated_at TEXT)")
+        conn.execute("INSERT INTO boot_t (v, updated_at) VALUES ('a', '2026-01-01')")
+    task = BootTask("t_table", fn, sources=(table_source("boot_t"),))
+    run_boot_tasks([task])
+    assert run_boot_tasks([task])["skipped"] == ["t_table"]
+
+    with get_db() as conn:
+        conn.execute("UPDATE boot_t SET v='b', updated_at='2026-02-01'")
+    assert run_boot_tasks([task])["ran"] == ["t_table"]
+
+    with get_db() as conn:
+        conn.execute("INSERT INTO boot_t (v, updated_at) VALUES ('c', '2026-01-01')")
+    assert run_boot_tasks([task])["ran"] == ["t_table"]
+    assert calls["n"] == 3
+
+
+def test_chained_tasks_settle_after_one_boot():
+    """B rewrites A's input (dedup rewriting what the sync reads): the
+    second boot must skip both, not re-run A because of B's write."""
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("CREATE TABLE boot_a (id INTEGER PRIMARY KEY, v TEXT, updated_at TEXT)")
+        conn.execute("CREATE TABLE boot_b (id INTEGER PRIMARY KEY, v TEXT, updated_at TEXT)")
+        conn.execute("INSERT INTO boot_a (v, updated_at) VALUES ('x', '2026-01-01')")
+    runs = []
+
+    def a():
+        runs.append("a")
+        with get_db() as conn:      # A feeds B ...
+            conn.execute("INSERT OR REPLACE INTO boot_b (id, v, updated_at) "
+                         "SELECT id, v, updated_at FROM boot_a")
+
+    def b():
+        runs.append("b")
+        with get_db() as conn:      # ... and B normalizes A's rows in place
+            conn.execute("UPDATE boot_a SET v=upper(v), updated_at='2026-01-02'")
+
+    tasks = [BootTask("t_chain_a", a, sources=(table_source("boot_a"),)),
+             BootTask("t_chain_b", b, sources=(table_source("boot_b"),))]
+    assert run_boot_tasks(tasks)["ran"] == ["t_chain_a", "t_chain_b"]
+    assert run_boot_tasks(tasks)["skipped"] == ["t_chain_a", "t_chain_b"]
+    assert runs == ["a", "b"]
+
+
+def test_sourceless_task_always_runs(counter):
+    calls, fn = counter
+    task = BootTask("t_always", fn)
+    run_boot_tasks([task])
+    run_boot_tasks([task])
+    assert calls["n"] == 2
+
+
+def test_failed_task_is_retried_and_recorded():
+    def boom():
+        raise RuntimeError("disk on fire")
+    task = BootTask("t_fail", boom, sources=(table_source("quotes"),))
+    assert run_boot_tasks([task])["failed"] == ["t_fail"]
+    assert run_boot_tasks([task])["failed"] == ["t_fail"]
+    row = next(t for t in bt.boot_task_summary()["tasks"] if t["name"] == "t_fail")
+    assert row["status"] == "error"
+    assert "disk on fire" in row["last_error"]
+    assert row["runs"] == 2
+
+
+def test_version_bump_and_force_rerun(counter, monkeypatch):
+    calls, fn = counter
+    src = (table_source("quotes"),)
+    run_boot_tasks([BootTask("t_ver", fn, sources=src)])
+    run_boot_tasks([BootTask("t_ver", fn, sources=src, version="2")])
+    assert calls["n"] == 2
+    monkeypatch.setenv("BOOT_TASKS_FORCE", "1")
+    run_boot_tasks([BootTask("t_ver", fn, sources=src, version="2")])
+    assert calls["n"] == 3
+
+
+def test_lease_held_elsewhere_blocks_pass(counter):
+    calls, fn = counter
+    assert bt._acquire_lease("other-host:1:1")
+    try:
+        assert run_boot_tasks([BootTask("t_lock", fn)]) == {"locked": True}
+        assert calls["n"] == 0
+    finally:
+        bt._release_lease("other-host:1:1")
+    run_boot_tasks([BootTask("t_lock", fn)])
+    assert calls["n"] == 1
+
+
+def test_summary_reports_durations_and_skips(counter):
+    calls, fn = counter
+    task = BootTask("t_sum", fn, sources=(table_source("quotes"),))
+    run_boot_tasks([task])
+    run_boot_tasks([task])
+    summary = bt.boot_task_summary()
+    row = next(t for t in summary["tasks"] if t["name"] == "t_sum")
+    assert row["runs"] == 1 and row["skips"] == 1
+    assert row["duration_ms"] >= 0
+    assert summary["last_pass"]["skipped"] == ["t_sum"]
+
+
+def test_deferred_init_registers_listed_backfills():
+    """Every full-table backfill in _deferred_init goes through the ledger."""
+    import re
+    from pathlib import Path
+    body = (Path(__file__).resolve().parent.parent / "app.py").read_text(encoding="utf-8")
+    for name in ("dedup_price_checks", "reconcile_quotes_json", "boot_sync_quotes",
+                 "boot_sync_pcs", "cleanup_polluted_catalog_rows",
+                 "cleanup_placeholder_asin_urls", "cleanup_placeholder_asin_in_json",
+                 "rebuild_scprs_price_stats", "purge_stale_cs_drafts",
+                 "purge_stale_email_outbox"):
+        assert re.search(rf'BootTask\(\s*"{name}"', body), name
+    assert "run_boot_tasks(_boot_tasks)" in body
@@ -0,0 +1,121 @@
+"""generate_bundle_parts — parallel per-PC fills for multi-PC bundles.
+
+api_bundle_generate used to fill bundle PCs one after another before
+merging. These pin the pool contract:
+fills overlap, progress fires once per PC on the request thread, output
+order follows page_start regardless of finish order, a failing or
+crashing PC is reported without sinking the rest, and the same PC is never
+filled twice at once.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from src.forms.price_check import generate_bundle_parts
+
+
+def _pcs(n):
+    return [{"id": f"pc{i}", "page_start": i * 2, "page_end": i * 2 + 1} for i in range(n)]
+
+
+def _ok(pcid):
+    return {"ok": True, "output_path": f"/tmp/{pcid}.pdf", "summary": {"items_total": 1}}
+
+
+def test_fills_run_concurrently():
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def slow(pcid):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.15)
+        with lock:
+            active[0] -= 1
+        return _ok(pcid)
+
+    t0 = time.monotonic()
+    outputs, errors = generate_bundle_parts(_pcs(4), slow, workers=4)
+    assert time.monotonic() - t0 < 0.5
+    assert peak[0] > 1
+    assert len(outputs) == 4 and errors == []
+
+
+def test_progress_reported_per_pc_on_calling_thread():
+    seen = []
+    caller = threading.current_thread()
+
+    def progress(done, total, pcid, ok, error):
+        assert threading.current_thread() is caller
+        seen.append((done, total, ok))
+
+    generate_bundle_parts(_pcs(3), _ok, workers=2, on_progress=progress)
+    assert [d for d, _, _ in seen] == [1, 2, 3]
+    assert all(t == 3 and ok for _, t, ok in seen)
+
+
+def test_output_order_follows_page_start_not_finish_order():
+    def reversed_finish(pcid):
+        time.sleep(0.05 * (5 - int(pcid[2:])))
+        return _ok(pcid)
+
+    outputs, _ = generate_bundle_parts(_pcs(5), reversed_finish, workers=5)
+    assert [o["pc_id"] for o in outputs] == [f"pc{i}" for i in range(5)]
+    assert outputs[1]["page_start"] == 2 and outputs[1]["page_end"] == 3
+
+
+def test_failures_and_crashes_are_collected_in_bundle_order():
+    def flaky(pcid):
+        if pcid == "pc1":
+            return {"ok": False, "error": "missing cost"}
+        if pcid == "pc3":
+            raise RuntimeError("pdf exploded")
+        return _ok(pcid)
+
+    outputs, errors = generate_bundle_parts(_pcs(4), flaky, workers=3)
+    assert [o["pc_id"] for o in outputs] == ["pc0", "pc2"]
+    assert [e["pc_id"] for e in errors] == ["pc1", "pc3"]
+    assert errors[0]["error"] == "missing cost"
+    assert "pdf exploded" in errors[1]["error"]
+
+
+def test_same_pc_generates_serially_other_pcs_overlap(monkeypatch):
+    from src.api.modules import routes_pricecheck as rp
+
+    active, peak, lock = {}, [0], threading.Lock()
+
+    def body(pcid):
+        with lock:
+            active[pcid] = active.get(pcid, 0) + 1
+            peak[0] = max(peak[0], active[pcid])
+        time.sleep(0.05)
+        with lock:
+            active[pcid] -= 1
+        return _ok(pcid)
+
+    monkeypatch.setattr(rp, "_generate_pc_pdf_locked", body)
+    pcs = [{"id": "pcA", "page_start": 0, "page_end": 0}] * 3 + \
+          [{"id": "pcB", "page_start": 1, "page_end": 1}]
+    t0 = time.monotonic()
+    outputs, errors = generate_bundle_parts(pcs, rp._generate_pc_pdf, workers=4)
+    assert peak[0] == 1                      # pcA never ran twice at once
+    assert time.monotonic() - t0 < 0.25      # pcB did not wait behind pcA
+    assert errors == [] and {o["pc_id"] for o in outputs} == {"pcA", "pcB"}
+
+
+def test_source_restore_is_atomic(tmp_path, monkeypatch):
+    from src.api.modules import routes_pricecheck as rp
+
+    monkeypatch.setattr(rp, "DATA_DIR", str(tmp_path))
+    row = {"filename": "bundle.pdf", "data": b"%PDF-1.4 combined"}
+    paths = []
+    threads = [threading.Thread(target=lambda: paths.append(rp._restore_source_pdf("pc1", row)))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert set(paths) == {str(tmp_path / "pc_pdfs" / "bundle.pdf")}
+    assert (tmp_path / "pc_pdfs" / "bundle.pdf").read_bytes() == row["data"]
+    assert sorted(p.name for p in (tmp_path / "pc_pdfs").iterdir()) == ["bundle.pdf"]
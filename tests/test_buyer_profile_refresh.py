@@ -0,0 +1,152 @@
+"""Tests for buyer_intelligence.refresh_buyer_profiles — set-based,
+incremental rebuild of scprs_buyers.
+
+Pins: grouped aggregates give the same figures the per-buyer queries did
+("$1,234" text totals included, via the generated grand_total_num);
+only buyers whose POs or lines changed are rebuilt; new rows are found by
+id without any trigger write; a buyer re-dirtied mid-refresh stays dirty;
+outreach states survive; full=True redoes all; a DB from the trigger-kept
+design is migrated.
+"""
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.agents import buyer_intelligence as bi
+
+
+def _q(sql, args=()):
+    from src.core.db import get_db
+    with get_db() as conn:
+        return [tuple(r) for r in conn.execute(sql, args).fetchall()]
+
+
+@pytest.fixture
+def seeded(temp_data_dir):
+    from src.core.db import get_db
+    recent = (datetime.now() - timedelta(days=20)).strftime("%m/%d/%Y")
+    old = (datetime.now() - timedelta(days=400)).strftime("%m/%d/%Y")
+    masters = [
+        ("PO-1", "alice@cdcr.ca.gov", "Alice", "CDCR", "Medline", "$1,200.50", old),
+        ("PO-2", "alice@cdcr.ca.gov", "Alice B", "CDCR", "Reytech Inc.", 300, recent),
+        ("PO-3", "bob@cchcs.ca.gov", "Bob", "CCHCS", "McKesson", "2,000", recent),
+        ("PO-4", "", "", "CDCR", "Medline", 99999, recent),
+    ]
+    lines = [
+        ("PO-1", "Nitrile exam gloves medium"), ("PO-1", "Nitrile exam gloves large"),
+        ("PO-2", "Wheelchair cushion"), ("PO-3", "Adult incontinence briefs"),
+        ("PO-4", "Ignored - no buyer"),
+    ]
+    with get_db() as conn:
+        conn.executemany(
+            "INSERT INTO scprs_po_master (po_number, buyer_email, buyer_name, "
+            "dept_name, supplier, grand_total, start_date) VALUES (?,?,?,?,?,?,?)",
+            masters)
+        conn.executemany(
+            "INSERT INTO scprs_po_lines (po_number, description, quantity, unit_price) "
+            "VALUES (?,?,1,10)", lines)
+    return recent
+
+
+def _buyer(email):
+    rows = _q("SELECT buyer_name, total_pos, total_spend, total_line_items, "
+              "buys_from_reytech, reytech_spend, relationship_status, last_po_date "
+              "FROM scprs_buyers WHERE buyer_email=?", (email,))
+    return rows[0] if rows else None
+
+
+def test_first_refresh_builds_every_buyer(seeded):
+    assert bi.refresh_buyer_profiles() == 2
+    name, pos, spend, lines, rt, rt_spend, status, last = _buyer("alice@cdcr.ca.gov")
+    assert (name, pos, lines, rt, status) == ("Alice B", 2, 3, 1, "active_customer")
+    assert spend == pytest.approx(1500.50) and rt_spend == pytest.approx(300)
+    assert last == seeded
+    assert _buyer("bob@cchcs.ca.gov")[2] == pytest.approx(2000)
+    assert _q("SELECT COUNT(*) FROM scprs_buyers")[0][0] == 2
+    assert _q("SELECT COUNT(*) FROM scprs_buyer_items")[0][0] == 4
+    assert _q("SELECT COUNT(*) FROM scprs_buyer_dirty")[0][0] == 0
+
+
+def test_only_changed_buyers_are_rebuilt(seeded):
+    bi.refresh_buyer_profiles()
+    assert bi.refresh_buyer_profiles() == 0
+
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("INSERT INTO scprs_po_lines (po_number, description) "
+                     "VALUES ('PO-3', 'Disposable underpads')")
+        conn.execute("UPDATE scprs_po_master SET grand_total='$2,500' WHERE po_number='PO-3'")
+    assert _q("SELECT buyer_email FROM scprs_buyer_dirty") == [("bob@cchcs.ca.gov",)]
+    assert bi.refresh_buyer_profiles() == 1
+    _, _, spend, lines, *_ = _buyer("bob@cchcs.ca.gov")
+    assert (spend, lines) == (2500, 2)
+
+
+def test_new_rows_found_by_id_without_trigger_writes(seeded):
+    bi.refresh_buyer_profiles()
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("INSERT INTO scprs_po_master (po_number, buyer_email, buyer_name, "
+                     "supplier, grand_total, start_date) "
+                     "VALUES ('PO-5', 'carol@dsh.ca.gov', 'Carol', 'Medline', '$75', '01/01/2026')")
+        conn.execute("INSERT INTO scprs_po_lines (po_number, description) "
+                     "VALUES ('PO-1', 'Nitrile exam gloves small')")
+    assert _q("SELECT COUNT(*) FROM scprs_buyer_dirty")[0][0] == 0
+    assert _q("SELECT name FROM sqlite_master WHERE type='trigger' "
+              "AND name LIKE '%bp_ai'") == []
+    assert bi.refresh_buyer_profiles() == 2            # carol + alice
+    assert _buyer("carol@dsh.ca.gov")[2] == 75
+    assert _buyer("alice@cdcr.ca.gov")[3] == 4
+    assert bi.refresh_buyer_profiles() == 0
+
+
+def test_trigger_kept_column_is_migrated(seeded):
+    from src.core.db import _install_buyer_refresh, get_db
+    with get_db() as conn:
+        conn.execute("ALTER TABLE scprs_po_master DROP COLUMN grand_total_num")
+        conn.execute("ALTER TABLE scprs_po_master ADD COLUMN grand_total_num REAL")
+        conn.execute("CREATE TRIGGER scprs_po_master_bp_ai AFTER INSERT ON scprs_po_master "
+                     "BEGIN UPDATE scprs_po_master SET grand_total_num = 0 "
+                     "WHERE rowid = NEW.rowid; END")
+        _install_buyer_refresh(conn)
+    assert _q("SELECT name FROM sqlite_master WHERE type='trigger' "
+              "AND name LIKE 'scprs_po_%_bp_%' ORDER BY name") == [
+        ("scprs_po_lines_bp_ad",), ("scprs_po_lines_bp_au",),
+        ("scprs_po_master_bp_ad",), ("scprs_po_master_bp_au",)]
+    assert _q("SELECT grand_total_num FROM scprs_po_master "
+              "WHERE po_number='PO-1'") == [(1200.5,)]
+
+
+def test_buyer_redirtied_mid_refresh_stays_dirty(seeded, monkeypatch):
+    from src.core.db import DB_PATH
+    real = bi._extract_categories
+
+    def write_during_read(descs):
+        conn = sqlite3.connect(DB_PATH)
+        conn.execute("UPDATE scprs_po_master SET supplier='Cardinal' WHERE po_number='PO-3'")
+        conn.commit()
+        conn.close()
+        return real(descs)
+    monkeypatch.setattr(bi, "_extract_categories", write_during_read)
+    bi.refresh_buyer_profiles()
+    assert ("bob@cchcs.ca.gov",) in _q("SELECT buyer_email FROM scprs_buyer_dirty")
+
+
+def test_outreach_status_survives_and_full_rebuilds_all(seeded):
+    bi.refresh_buyer_profiles()
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("UPDATE scprs_buyers SET relationship_status='outreach_sent' "
+                     "WHERE buyer_email='bob@cchcs.ca.gov'")
+    assert bi.refresh_buyer_profiles(full=True) == 2
+    assert _buyer("bob@cchcs.ca.gov")[6] == "outreach_sent"
+
+
+def test_no_sleeps_or_per_row_spend_parsing():
+    import inspect
+    src = inspect.getsource(bi.refresh_buyer_profiles) + bi._STATS_SQL
+    assert "sleep" not in src
+    assert "REPLACE(" not in src
@@ -0,0 +1,178 @@
+"""Tests for src/core/change_feed.py and dal.page_rfqs / page_pcs /
+page_orders — the keyset pages behind /api/v1/rfqs, /pcs and /orders.
+
+Pins: paging with next_cursor returns every record exactly once; a
+record written mid-walk moves past the cursor instead of being skipped,
+and polling with the last cursor returns only what changed since; every
+writer (including a bare status UPDATE) moves the row without a second
+UPDATE of it (other AFTER UPDATE triggers fire once); filters run in SQL;
+paging never commits the caller's transaction; rows that predate the
+triggers — or carry the old changed_at column — are backfilled on
+install; drain() hands a consumer each change once, deletes as None;
+malformed cursors are rejected.
+"""
+from __future__ import annotations
+
+import pytest
+
+from src.core import change_feed
+from src.core.dal import (
+    page_orders, page_pcs, page_rfqs, update_pc_status, update_rfq_status,
+)
+
+
+def _save_rfq(rid, status="new", agency="CDCR", received="2026-01-01T00:00:00"):
+    from src.api.data_layer import _save_single_rfq
+    _save_single_rfq(rid, {"id": rid, "status": status, "agency": agency,
+                           "received_at": received}, raise_on_error=True)
+
+
+def _save_pc(pcid, status="parsed"):
+    from src.api.data_layer import _save_single_pc
+    _save_single_pc(pcid, {"id": pcid, "status": status, "created_at": "2026-01-01",
+                           "items": []}, raise_on_error=True)
+
+
+def _walk(pager, **kw):
+    ids, cursor = [], ""
+    while True:
+        page = pager(cursor=cursor, limit=2, **kw)
+        ids += [r["id"] for r in page["items"]]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            return ids, cursor
+
+
+def test_pages_cover_every_record_once():
+    for i in range(5):
+        _save_rfq(f"rfq-{i}")
+    ids, cursor = _walk(page_rfqs)
+    assert ids == [f"rfq-{i}" for i in range(5)]
+    assert page_rfqs(cursor=cursor)["items"] == []
+    assert page_rfqs(cursor=cursor)["next_cursor"] == cursor
+
+
+def test_write_mid_walk_moves_row_past_cursor():
+    for i in range(4):
+        _save_pc(f"pc-{i}")
+    first = page_pcs(limit=2)
+    assert [r["id"] for r in first["items"]] == ["pc-0", "pc-1"]
+    update_pc_status("pc-0", "priced")          # raw UPDATE, no data_layer
+    rest = []
+    cursor = first["next_cursor"]
+    while True:
+        page = page_pcs(cursor=cursor, limit=2)
+        rest += [(r["id"], r["status"]) for r in page["items"]]
+        cursor = page["next_cursor"]
+        if not page["has_more"]:
+            break
+    assert rest == [("pc-2", "parsed"), ("pc-3", "parsed"), ("pc-0", "priced")]
+    _save_pc("pc-9")
+    update_pc_status("pc-2", "sent")
+    assert [r["id"] for r in page_pcs(cursor=cursor)["items"]] == ["pc-9", "pc-2"]
+
+
+def test_filters_run_in_sql():
+    page_rfqs()                                 # install triggers first
+    _save_rfq("r-a", status="new", agency="CDCR")
+    _save_rfq("r-b", status="sent", agency="CalVet")
+    _save_rfq("r-c", status="priced", agency="cdcr")
+    assert [r["id"] for r in page_rfqs(statuses=["new", "priced"])["items"]] == ["r-a", "r-c"]
+    assert [r["id"] for r in page_rfqs(agency="CDCR")["items"]] == ["r-a", "r-c"]
+    cut = page_rfqs()["items"][-1]["changed_at"]
+    assert [r["id"] for r in page_rfqs(updated_since=cut)["items"]] == ["r-c"]
+    update_rfq_status("r-a", "sent")
+    assert [r["id"] for r in page_rfqs(updated_since=cut)["items"]] == ["r-c", "r-a"]
+
+
+def test_stamp_does_not_refire_other_update_triggers():
+    from src.core.db import get_db
+    _save_pc("pc-1")
+    page_pcs()
+    with get_db() as conn:
+        conn.execute("CREATE TABLE au_log (id TEXT)")
+        conn.execute("CREATE TRIGGER t_count_au AFTER UPDATE ON price_checks "
+                     "BEGIN INSERT INTO au_log VALUES (NEW.id); END")
+    update_pc_status("pc-1", "priced")
+    with get_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM au_log").fetchone()[0] == 1
+    assert [r["status"] for r in page_pcs()["items"]] == ["priced"]
+
+
+def test_page_leaves_callers_transaction_open():
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("INSERT INTO rfqs (id, status, received_at) VALUES ('r-open', 'new', '2026-01-01')")
+        assert conn.in_transaction
+        change_feed.page(conn, "rfqs")
+        assert conn.in_transaction
+        conn.rollback()
+    assert page_rfqs()["items"] == []
+
+
+def _drop_feed_triggers(table):
+    from src.core.db import get_db
+    with get_db() as conn:
+        for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='trigger' "
+                "AND name LIKE ?", (f"cf_{table}_%",)).fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+
+
+def test_existing_rows_backfilled_on_install():
+    from src.core.db import get_db
+    _drop_feed_triggers("rfqs")
+    _save_rfq("old-2", received="2025-06-01T00:00:00")
+    _save_rfq("old-1", received="2025-01-01T00:00:00")
+    with get_db() as conn:
+        conn.execute("UPDATE rfqs SET updated_at = NULL")
+        assert page_rfqs()["items"] == []
+        change_feed.install_schema(conn)
+    items = page_rfqs()["items"]
+    assert [r["id"] for r in items] == ["old-1", "old-2"]
+    assert items[0]["changed_at"] == pytest.approx(
+        change_feed.parse_since("2025-01-01T00:00:00"), abs=1)
+    _save_rfq("new-1")
+    assert [r["id"] for r in page_rfqs()["items"]][-1] == "new-1"
+
+
+def test_install_migrates_changed_at_column():
+    from src.core.db import get_db
+    _drop_feed_triggers("orders")
+    with get_db() as conn:
+        conn.execute("ALTER TABLE orders ADD COLUMN changed_at REAL")
+        conn.execute("CREATE INDEX idx_orders_changed ON orders(changed_at, id)")
+        conn.execute("INSERT INTO orders (id, status, created_at, changed_at) "
+                     "VALUES ('o-7', 'new', '2023-11-14', 1700000000.5)")
+        change_feed.install_schema(conn)
+        assert "changed_at" not in {r[1] for r in conn.execute("PRAGMA table_info(orders)")}
+    assert [(r["order_id"], r["changed_at"]) for r in page_orders()["items"]] == \
+        [("o-7", 1700000000.5)]
+
+
+def test_orders_page_and_bad_input():
+    from src.core.order_dal import save_order
+    save_order("o-1", {"id": "o-1", "status": "new", "created_at": "2026-01-01"}, actor="test")
+    assert page_orders()["items"][0]["order_id"] == "o-1"
+    with pytest.raises(ValueError):
+        page_orders(cursor="not-a-cursor")
+    assert change_feed.parse_since("1700000000") == 1700000000.0
+    assert change_feed.parse_since("2026-01-01T00:00:00Z") == \
+        change_feed.parse_since("2026-01-01")
+
+
+def test_drain_hands_each_change_once_and_deletes_as_none():
+    from src.core.db import get_db
+    _save_rfq("r-1")
+    _save_rfq("r-2")
+    seen = []
+    handle = lambda rid, at, row: seen.append((rid, row and row["status"]))
+    with get_db() as conn:
+        assert change_feed.drain(conn, "test", "rfqs", handle) == 2
+        assert change_feed.drain(conn, "test", "rfqs", handle) == 0
+    update_rfq_status("r-2", "sent")
+    with get_db() as conn:
+        conn.execute("DELETE FROM rfqs WHERE id='r-1'")
+        assert change_feed.pending(conn, "test", "rfqs") == 2
+        change_feed.drain(conn, "test", "rfqs", handle)
+    assert seen[2:] == [("r-2", "sent"), ("r-1", None)]
@@ -10,6 +10,10 @@ into `_scan_deadlines()`, which is now shared by both endpoints AND
 the new deadline-escalation watcher. The is_test filter still runs
 on every RFQ, but it now lives in the shared helper instead of being
 duplicated in each endpoint. Tests updated to match.
+
+Indexed view (2026-10): `_scan_deadlines` now reads the incrementally kept
+`deadline_index` table instead of loading every record; the is_test
+filter moved into that table's range query. Tests follow it there.
 """
 from __future__ import annotations
 
@@ -35,41 +39,41 @@ def _strip_comment_lines(src: str) -> str:
     return "\n".join(kept)
 
 
-def _helper_body() -> str:
-    """Return the body of `_scan_deadlines` — where CR-5 filters now live."""
-    src = ROUTES_DEADLINES.read_text(encoding="utf-8")
-    m = re.search(
-        r"def _scan_deadlines\([^)]*\)[\s\S]*?(?=\n@bp\.route|\ndef [a-zA-Z_]|\Z)",
-        src,
-    )
-    assert m, "_scan_deadlines() body not located — GRILL-Q3 refactor broken?"
-    return m.group(0)
+DEADLINE_INDEX = ROUTES_DEADLINES.parents[2] / "core" / "deadline_index.py"
 
 
-def test_scan_deadlines_rfq_loop_skips_is_test():
-    """The shared scan helper's RFQ loop must skip `is_test` records."""
-    body = _strip_comment_lines(_helper_body())
+def _body(name: str) -> str:
+    src = ROUTES_DEADLINES.read_text(encoding="utf-8")
     m = re.search(
-        r"for\s+rid\s*,\s*r\s+in\s+rfqs\.items\(\)\s*:[\s\S]{0,400}?r\.get\(\s*[\"']is_test[\"']",
-        body,
+        rf"def {name}\([^)]*\)[\s\S]*?(?=\n@bp\.route|\ndef [a-zA-Z_]|\n_[A-Z_]+ = |\Z)",
+        src,
     )
-    assert m, (
-        "CR-5 regression: _scan_deadlines RFQ loop is missing the "
-        "`if r.get('is_test'): continue` skip — test RFQs can still fire "
-        "the hard-alert modal and the new deadline-escalation SMS/email."
+    assert m, f"{name}() body not located — GRILL-Q3 refactor broken?"
+    return _strip_comment_lines(m.group(0))
+
+
+def test_scan_deadlines_reads_filtered_index():
+    """The shared scan helper is served by `_indexed_deadlines`, which
+    goes through deadline_index.query — where the is_test filter lives
+    since the per-poll full scans were replaced by an indexed view."""
+    assert "_indexed_deadlines(" in _body("_scan_deadlines")
+    assert "deadline_index.query(" in _body("_indexed_deadlines")
+    src = DEADLINE_INDEX.read_text(encoding="utf-8")
+    m = re.search(r"def query\([\s\S]*?(?=\ndef )", src)
+    assert m and re.search(r"WHERE is_test = 0", m.group(0)), (
+        "CR-5 regression: deadline_index.query no longer excludes test "
+        "records — test RFQs can fire the hard-alert modal again."
     )
 
 
-def test_scan_deadlines_pc_loop_skips_is_test():
-    """PC loop parity — test PCs must be skipped too."""
-    body = _strip_comment_lines(_helper_body())
-    m = re.search(
-        r"for\s+pcid\s*,\s*pc\s+in\s+pcs\.items\(\)\s*:[\s\S]{0,400}?pc\.get\(\s*[\"']is_test[\"']",
-        body,
-    )
-    assert m, (
-        "CR-5 regression: _scan_deadlines PC loop is missing the "
-        "`if pc.get('is_test'): continue` skip."
+def test_index_records_is_test_for_pcs_and_rfqs():
+    """PC / RFQ parity — both indexers go through `_index_fields`, which
+    carries the record's `is_test` flag into the index."""
+    assert "_index_fields(\"pc\"" in _body("_index_pc")
+    assert "_index_fields(\"rfq\"" in _body("_index_rfq")
+    assert re.search(r"[\"']is_test[\"']\s*:\s*bool\(\s*doc\.get\(\s*[\"']is_test[\"']",
+                     _body("_index_fields")), (
+        "CR-5 regression: _index_fields stopped recording is_test."
     )
 
 
@@ -15,6 +15,7 @@ from src.core.dal import (
     get_rfq, list_rfqs, update_rfq_status,
     get_pc, list_pcs, update_pc_status,
     get_order, list_orders, update_order_status,
+    count_rfqs_by_status, count_pcs_by_status, count_orders_by_status,
     get_line_items, save_line_items,
 )
 from src.api.data_layer import _save_single_rfq, _save_single_pc
@@ -123,6 +124,41 @@ class TestOrder:
         assert row["status"] == "shipped"
 
 
+class TestCountByStatus:
+    """count_*_by_status must agree with Counter over the list_* rows —
+    /api/v1/pipeline switched from one to the other."""
+
+    def test_counts_match_list(self):
+        from collections import Counter
+        for i, st in enumerate(("new", "new", "sent")):
+            save_rfq({"id": f"CNT{i}", "status": st, "received_at": "2026-01-01"})
+            save_pc({"id": f"CNTPC{i}", "status": st, "created_at": "2026-01-01"})
+            save_order({"id": f"CNTO{i}", "status": st, "created_at": "2026-01-01"})
+        for count, lister in ((count_rfqs_by_status, list_rfqs),
+                              (count_pcs_by_status, list_pcs),
+                              (count_orders_by_status, list_orders)):
+            expected = Counter(r.get("status", "unknown") for r in lister(limit=10000))
+            assert count() == dict(expected)
+
+    def test_pc_empty_status_falls_back_to_blob(self):
+        save_pc({"id": "CNTB1", "status": "priced", "created_at": "2026-01-01"})
+        from src.core.db import get_db
+        with get_db() as conn:
+            conn.execute("UPDATE price_checks SET status = '' WHERE id = 'CNTB1'")
+        assert get_pc("CNTB1")["status"] == "priced"
+        assert count_pcs_by_status().get("priced", 0) == \
+            sum(1 for p in list_pcs(limit=10000) if p["status"] == "priced")
+
+    def test_grouped_query_uses_status_index(self):
+        from src.core.db import get_db
+        with get_db() as conn:
+            for table in ("rfqs", "price_checks", "orders"):
+                plan = " ".join(r[-1] for r in conn.execute(
+                    f"EXPLAIN QUERY PLAN SELECT status, COUNT(*) FROM {table} "
+                    "GROUP BY status"))
+                assert "INDEX" in plan and "status" in plan, (table, plan)
+
+
 class TestLineItems:
     def test_get_and_save(self):
         save_rfq({"id": "LI1", "status": "new", "received_at": "2026-01-01",
@@ -27,8 +27,7 @@ def test_save_single_pc_invalidates_dash_init_cache():
     src = _read("src/api/data_layer.py")
     # The hook must reach into routes_prd28 and zero the cache.
     assert "from src.api.modules import routes_prd28 as _rprd" in src
-    assert "_rprd._dash_init_cache[\"data\"] = None" in src
-    assert "_rprd._dash_init_cache[\"ts\"] = 0" in src
+    assert "_rprd._dash_init_cache.invalidate()" in src
 
 
 def test_save_price_checks_also_invalidates():
@@ -37,7 +36,7 @@ def test_save_price_checks_also_invalidates():
     src = _read("src/api/data_layer.py")
     # Two invalidation blocks expected — one in _save_single_pc, one in
     # _save_price_checks.
-    occurrences = src.count("_rprd._dash_init_cache[\"data\"] = None")
+    occurrences = src.count("_rprd._dash_init_cache.invalidate()")
     assert occurrences >= 2, (
         f"Expected dash_init_cache invalidation in BOTH save paths "
         f"(_save_single_pc + _save_price_checks); found {occurrences} occurrence(s)."
@@ -0,0 +1,184 @@
+"""Tests for src/core/dashboard_snapshot.py — the persistent home-dashboard
+snapshot behind /api/dashboard/init.
+
+Pins: a section is built once and then served from the table until a
+write to one of its source tables bumps its version (writes to other
+tables don't), including the outbox / growth / award tables the home
+sections read; bulk-ingest tables carry no trigger and are invalidated by
+mark_dirty() instead; init_db installs the triggers; a TTL-expired
+section is rebuilt before responding; funnel counts reclassify only the
+records a write touched (drained from the change feed), follow status
+changes and deletes, start over after invalidate(), and match the old
+full-load buckets.
+"""
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from src.core import dashboard_snapshot as snap
+from src.core.db import get_db
+
+
+def _pc(pid, status, items=1, **extra):
+    blob = {"id": pid, "status": status,
+            "items": [{"description": "gloves"}] * items, **extra}
+    with get_db() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO price_checks (id, created_at, status, data_json) "
+            "VALUES (?, datetime('now'), ?, ?)", (pid, status, json.dumps(blob)))
+
+
+def _rfq(rid, status, is_test=False):
+    blob = {"id": rid, "status": status, "is_test": is_test}
+    with get_db() as conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO rfqs (id, received_at, status, data_json) "
+            "VALUES (?, datetime('now'), ?, ?)", (rid, status, json.dumps(blob)))
+
+
+def _set_status(table, rid, status):
+    with get_db() as conn:
+        conn.execute(f"UPDATE {table} SET status=? WHERE id=?", (status, rid))
+
+
+_BUCKETS = {"new": "inbox", "pending": "inbox", "ready": "priced",
+            "priced": "priced", "generated": "quoted", "sent": "sent"}
+
+
+@pytest.fixture
+def classifiers():
+    """Status → bucket classifiers that record which rows they saw."""
+    from src.api.data_layer import _decode_pc_row, _decode_rfq_row
+    seen = []
+
+    def pc(row):
+        seen.append(row["id"])
+        return _BUCKETS.get(_decode_pc_row(row).get("status"))
+
+    def rfq(row):
+        return _BUCKETS.get(_decode_rfq_row(row).get("status"))
+    return {"price_checks": pc, "rfqs": rfq}, seen
+
+
+class TestSections:
+
+    def _counting(self, ttl=600, sources=("orders",)):
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"ok": True, "n": len(calls)}
+        return {"s": (build, ttl, sources)}, calls
+
+    def test_built_once_then_served_from_table(self):
+        builders, calls = self._counting()
+        assert snap.read_sections(builders)["s"] == {"ok": True, "n": 1}
+        assert snap.read_sections(builders)["s"] == {"ok": True, "n": 1}
+        assert len(calls) == 1
+
+    def test_source_write_rebuilds_unrelated_write_does_not(self):
+        builders, calls = self._counting(sources=("price_checks",))
+        snap.read_sections(builders)
+        _rfq("r1", "new")
+        snap.read_sections(builders)
+        assert len(calls) == 1
+        _pc("p1", "new")
+        assert snap.read_sections(builders)["s"]["n"] == 2
+
+    def test_ttl_expiry_rebuilds_before_responding(self):
+        builders, calls = self._counting(ttl=0.01)
+        snap.read_sections(builders)
+        time.sleep(0.05)
+        assert snap.read_sections(builders)["s"]["n"] == 2
+        assert snap.snapshot_stats()["expired"] >= 1
+        assert snap.read_sections({"s": (builders["s"][0], 600, ("orders",))})["s"]["n"] == 2
+
+    def test_outbox_write_rebuilds_actions_style_section(self):
+        """Failed-email / draft alerts read email_outbox — a write there
+        must show on the next read, not after the TTL."""
+        builders, calls = self._counting(sources=("orders", "email_outbox"))
+        snap.read_sections(builders)
+        from src.core.dal import upsert_outbox_email
+        upsert_outbox_email({"id": "ob-1", "status": "permanently_failed",
+                             "to": "buyer@cdcr.ca.gov", "subject": "Quote"})
+        assert snap.read_sections(builders)["s"]["n"] == 2
+
+    def test_bulk_table_has_no_trigger_and_is_marked_dirty(self):
+        builders, calls = self._counting(sources=("won_quotes",))
+        snap.read_sections(builders)
+        with get_db() as conn:
+            assert not conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='trigger' "
+                "AND tbl_name='won_quotes' AND name LIKE 'dash_%'").fetchone()
+            conn.execute("INSERT INTO won_quotes (id, description) VALUES ('wq-1', 'gloves')")
+        assert snap.read_sections(builders)["s"]["n"] == 1
+        snap.mark_dirty("won_quotes")
+        assert snap.read_sections(builders)["s"]["n"] == 2
+
+    def test_init_db_installs_only_source_table_triggers(self):
+        with get_db() as conn:
+            tables = {r[0] for r in conn.execute(
+                "SELECT DISTINCT tbl_name FROM sqlite_master "
+                "WHERE type='trigger' AND name LIKE 'dash\\_%' ESCAPE '\\'")}
+        assert tables == set(snap.SOURCE_TABLES)
+
+    def test_failing_builder_isolated_and_retried(self):
+        def boom():
+            raise RuntimeError("metrics down")
+        out = snap.read_sections({"bad": (boom, 60, ()), **self._counting()[0]})
+        assert out["bad"] == {"ok": False, "error": "metrics down"}
+        assert out["s"]["ok"]
+        assert snap.snapshot_stats()["sections"]["bad"]["stale"]
+
+
+class TestFunnel:
+
+    def test_dashboard_classifiers_match_old_buckets(self):
+        pytest.importorskip("flask")
+        from src.api.modules.routes_prd28 import _pc_funnel_bucket, _rfq_funnel_bucket
+        _pc("p-new", "new")
+        _pc("p-priced", "priced")
+        _pc("p-sent", "completed")
+        _pc("p-dup", "duplicate")
+        _pc("p-empty", "new", items=0)          # not user-facing
+        _rfq("r-new", "pending")
+        _rfq("r-quoted", "generated")
+        _rfq("r-test", "new", is_test=True)
+        counts = snap.funnel_counts({"price_checks": _pc_funnel_bucket,
+                                     "rfqs": _rfq_funnel_bucket})
+        assert counts == {"inbox": 2, "priced": 1, "quoted": 1, "sent": 1}
+
+    def test_only_touched_records_reclassified(self, classifiers):
+        cls, seen = classifiers
+        for i in range(5):
+            _pc(f"p{i}", "new")
+        snap.funnel_counts(cls)
+        seen.clear()
+        assert snap.funnel_counts(cls) == {"inbox": 5}
+        assert seen == []
+        _set_status("price_checks", "p3", "priced")
+        assert snap.funnel_counts(cls) == {"inbox": 4, "priced": 1}
+        assert seen == ["p3"]
+
+    def test_column_status_wins_and_delete_drops(self, classifiers):
+        cls, _ = classifiers
+        _pc("p1", "new")
+        _rfq("r1", "new")
+        snap.funnel_counts(cls)
+        _set_status("rfqs", "r1", "sent")
+        with get_db() as conn:
+            conn.execute("DELETE FROM price_checks WHERE id='p1'")
+        assert snap.funnel_counts(cls) == {"sent": 1}
+
+    def test_invalidate_reclassifies_every_record(self, classifiers):
+        cls, seen = classifiers
+        _pc("p1", "new")
+        _pc("p2", "ready")
+        snap.funnel_counts(cls)
+        seen.clear()
+        snap.invalidate()
+        assert snap.funnel_counts(cls) == {"inbox": 1, "priced": 1}
+        assert sorted(seen) == ["p1", "p2"]
@@ -462,3 +462,159 @@ def test_event_shaped_tables_all_have_retention_classification():
         f"(routine purge) or COMPLIANCE_OPT_IN_ALLOWLIST (explicit "
         f"opt-in only) in src/core/db_retention.py, along with "
         f"_DATE_COLUMN + RETENTION_POLICY entries.")
+
+
+# ─── Archival mode: move cold rows to monthly attached DBs ────────
+
+def _file_conn(tmp_path) -> sqlite3.Connection:
+    """The sandbox tables, but on disk so archive/ lands next to it."""
+    conn = sqlite3.connect(tmp_path / "hot.db")
+    conn.row_factory = sqlite3.Row
+    mem = _new_conn()
+    for (sql,) in mem.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' "
+            "AND name NOT LIKE 'sqlite_%'"):
+        conn.execute(sql)
+    conn.commit()
+    return conn
+
+
+def _seed_months(conn, table="lifecycle_events"):
+    for d in ("2025-01-05T10:00:00", "2025-01-20T10:00:00",
+              "2025-03-02T08:00:00"):
+        conn.execute(f"INSERT INTO {table} (occurred_at, event_type) "
+                     "VALUES (?, 'old')", (d,))
+    conn.execute(f"INSERT INTO {table} (occurred_at, event_type) "
+                 "VALUES (datetime('now'), 'fresh')")
+    conn.commit()
+
+
+def test_archive_moves_rows_into_monthly_files(tmp_path):
+    from src.core.db_retention import archive_older_than, archive_files
+    conn = _file_conn(tmp_path)
+    _seed_months(conn)
+
+    dry = archive_older_than("lifecycle_events", 30, conn=conn)
+    assert dry["would_delete"] == 3 and dry["months"] == {"2025_01": 2, "2025_03": 1}
+    assert conn.execute("SELECT COUNT(*) FROM lifecycle_events").fetchone()[0] == 4
+
+    r = archive_older_than("lifecycle_events", 30, dry_run=False,
+                           batch_size=1, conn=conn)
+    assert r["archived"] == 3 and r["months"] == {"2025_01": 2, "2025_03": 1}
+    assert [m for m, _ in archive_files(str(tmp_path / "archive"))] == ["2025_01", "2025_03"]
+    hot = conn.execute("SELECT event_type FROM lifecycle_events").fetchall()
+    assert [row[0] for row in hot] == ["fresh"]
+    jan = sqlite3.connect(tmp_path / "archive" / "reytech_archive_2025_01.db")
+    assert jan.execute("SELECT COUNT(*) FROM lifecycle_events").fetchone()[0] == 2
+    jan.close()
+
+
+def test_archive_compliance_table_needs_no_force_and_rerun_is_idempotent(tmp_path):
+    """Archiving keeps every row, so lifecycle_events is allowed; a
+    row copied twice (crash between copy and delete) keeps one copy."""
+    from src.core.db_retention import archive_older_than, attach_archives
+    conn = _file_conn(tmp_path)
+    _seed_months(conn)
+    archive_older_than("lifecycle_events", 30, dry_run=False, conn=conn)
+    # Simulate the crash: the same old row reappears in the hot table.
+    conn.execute("INSERT INTO lifecycle_events (id, occurred_at, event_type) "
+                 "SELECT 1, '2025-01-05T10:00:00', 'old'")
+    conn.commit()
+    archive_older_than("lifecycle_events", 30, dry_run=False, conn=conn)
+    with attach_archives(conn, "lifecycle_events") as view:
+        n = conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0]
+    assert n == 4
+    with pytest.raises(RetentionError):
+        archive_older_than("quotes", 30, conn=conn)
+
+
+def test_attach_archives_unions_hot_and_archive_then_detaches(tmp_path):
+    from src.core.db_retention import archive_older_than, attach_archives
+    conn = _file_conn(tmp_path)
+    _seed_months(conn)
+    archive_older_than("lifecycle_events", 30, dry_run=False, conn=conn)
+    # Hot table grows a column after the archive was written.
+    conn.execute("ALTER TABLE lifecycle_events ADD COLUMN actor TEXT")
+
+    with attach_archives(conn, "lifecycle_events") as view:
+        rows = conn.execute(
+            f"SELECT event_type, actor FROM {view} ORDER BY occurred_at").fetchall()
+        assert [r[0] for r in rows] == ["old", "old", "old", "fresh"]
+    with attach_archives(conn, "lifecycle_events", since_month="2025_03") as view:
+        assert conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0] == 2
+    names = [r[1] for r in conn.execute("PRAGMA database_list")]
+    assert not [n for n in names if n.startswith("arc_")]
+
+
+def test_run_daily_purge_archive_mode_includes_compliance_table(tmp_path, monkeypatch):
+    conn = _file_conn(tmp_path)
+    _seed_months(conn)
+    _seed_old_and_new(conn, "email_log", "logged_at", old_rows=2, new_rows=1)
+    monkeypatch.setenv("DB_RETENTION_MODE", "archive")
+    summary = run_daily_purge(dry_run=False, conn=conn)
+    assert summary["mode"] == "archive" and not summary["errors"]
+    assert summary["total_archived"] == 5
+    assert conn.execute("SELECT COUNT(*) FROM email_log").fetchone()[0] == 1
+
+    monkeypatch.delenv("DB_RETENTION_MODE")
+    assert run_daily_purge(dry_run=True, conn=conn)["mode"] == "delete"
+
+
+def test_get_lifecycle_events_reads_archive_when_asked():
+    from src.core.dal import get_lifecycle_events, log_lifecycle_event
+    from src.core.db import get_db
+    from src.core.db_retention import archive_older_than
+    log_lifecycle_event("rfq", "R1", "created", "new rfq")
+    with get_db() as c:
+        c.execute("UPDATE lifecycle_events SET occurred_at='2025-02-01T00:00:00'")
+    log_lifecycle_event("rfq", "R1", "priced", "priced")
+    archive_older_than("lifecycle_events", 30, dry_run=False)
+
+    assert [e["event_type"] for e in get_lifecycle_events("rfq", "R1")] == ["priced"]
+    full = get_lifecycle_events("rfq", "R1", include_archive=True)
+    assert [e["event_type"] for e in full] == ["priced", "created"]
+
+
+def test_query_archives_reads_past_the_attach_limit(tmp_path):
+    from src.core.db_retention import archive_older_than, attach_archives, query_archives
+    conn = _file_conn(tmp_path)
+    for month in range(1, 6):
+        conn.execute("INSERT INTO lifecycle_events (occurred_at, event_type) "
+                     "VALUES (?, 'old')", (f"2025-{month:02d}-10T10:00:00",))
+    conn.execute("INSERT INTO lifecycle_events (occurred_at, event_type) "
+                 "VALUES (datetime('now'), 'fresh')")
+    conn.commit()
+    archive_older_than("lifecycle_events", 30, dry_run=False, conn=conn)
+    conn.setlimit(sqlite3.SQLITE_LIMIT_ATTACHED, 2)
+
+    with attach_archives(conn, "lifecycle_events") as view:   # newest 2 only
+        assert conn.execute(f"SELECT COUNT(*) FROM {view}").fetchone()[0] == 3
+    rows = query_archives(conn, "lifecycle_events",
+                          "SELECT occurred_at FROM {view} ORDER BY occurred_at")
+    assert len(rows) == 6
+    assert sorted(r[0][:7] for r in rows)[:5] == [f"2025-{m:02d}" for m in range(1, 6)]
+    names = [r[1] for r in conn.execute("PRAGMA database_list")]
+    assert not [n for n in names if n.startswith("arc_")]
+
+
+def test_get_lifecycle_events_sees_more_months_than_attach_limit():
+    """api_rfq_timeline asks for the full history; an RFQ older than the
+    ATTACH limit's worth of monthly archives must keep its first events."""
+    from src.core.dal import get_lifecycle_events, log_lifecycle_event
+    from src.core.db import get_db
+    from src.core.db_retention import archive_older_than
+    for month in range(1, 13):
+        log_lifecycle_event("rfq", "R9", f"step_{month:02d}", "step")
+        with get_db() as c:
+            c.execute("UPDATE lifecycle_events SET occurred_at=? "
+                      "WHERE entity_id='R9' AND event_type=?",
+                      (f"2024-{month:02d}-15T00:00:00", f"step_{month:02d}"))
+    log_lifecycle_event("rfq", "R9", "priced", "priced")
+    archive_older_than("lifecycle_events", 30, dry_run=False)
+
+    full = get_lifecycle_events("rfq", "R9", limit=200, include_archive=True)
+    assert [e["event_type"] for e in full] == \
+        ["priced"] + [f"step_{m:02d}" for m in range(12, 0, -1)]
+    assert [e["event_type"] for e in
+            get_lifecycle_events("rfq", "R9", limit=3, include_archive=True)] == \
+        ["priced", "step_12", "step_11"]
@@ -0,0 +1,175 @@
+"""Tests for src/core/db_writer.py — single-writer queue + read-only pool.
+
+Pins: queued closures commit in grouped transactions and resolve their
+futures with results, a failing closure doesn't undo its batch-mates,
+the priority lane jumps queued background writes, inline mode (flag off)
+behaves the same, read_db() connections refuse writes, lock-wait
+timings reach writer_stats(), inline writes use their own connection, a
+lock error is counted once, and stop() never closes a busy writer.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.core import db_writer as dw
+from src.core.db import get_db
+
+
+@pytest.fixture
+def queue_on(monkeypatch):
+    monkeypatch.setenv("DB_WRITE_QUEUE", "1")
+    monkeypatch.setenv("DB_WRITE_BATCH_WINDOW_MS", "50")
+    with get_db() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS w_t (id INTEGER PRIMARY KEY, v TEXT)")
+    yield
+    dw.stop_writer()
+
+
+def _insert(v):
+    return lambda conn: conn.execute("INSERT INTO w_t (v) VALUES (?)", (v,)).lastrowid
+
+
+def _values():
+    with get_db() as conn:
+        return [r[0] for r in conn.execute("SELECT v FROM w_t ORDER BY id")]
+
+
+def test_queued_writes_are_batched_and_return_results(queue_on):
+    before = dw.writer_stats()["batches"]
+    futures = [dw.submit(_insert(f"v{i}")) for i in range(20)]
+    ids = [f.result(timeout=10) for f in futures]
+    assert ids == sorted(ids) and len(set(ids)) == 20
+    assert _values() == [f"v{i}" for i in range(20)]
+    stats = dw.writer_stats()
+    assert stats["running"]
+    assert stats["batches"] - before < 20
+
+
+def test_failing_closure_does_not_undo_batch_mates(queue_on):
+    def boom(conn):
+        conn.execute("INSERT INTO w_t (v) VALUES ('doomed')")
+        raise ValueError("bad row")
+
+    futs = [dw.submit(_insert("a")), dw.submit(boom), dw.submit(_insert("b"))]
+    futs[0].result(10)
+    futs[2].result(10)
+    with pytest.raises(ValueError):
+        futs[1].result(10)
+    assert _values() == ["a", "b"]
+
+
+def test_priority_lane_runs_before_queued_background(queue_on):
+    gate = threading.Event()
+    order = []
+
+    def blocker(conn):
+        gate.wait(5)
+
+    def tag(name):
+        def fn(conn):
+            order.append(name)
+        return fn
+
+    dw.submit(blocker)                    # occupies the writer
+    time.sleep(0.1)
+    bg = [dw.submit(tag(f"bg{i}")) for i in range(3)]
+    user = dw.submit(tag("user"), priority=True)
+    gate.set()
+    for f in bg + [user]:
+        f.result(10)
+    assert order[0] == "user"
+
+
+def test_write_is_inline_when_queue_disabled(monkeypatch):
+    monkeypatch.delenv("DB_WRITE_QUEUE", raising=False)
+    with get_db() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS w_t (id INTEGER PRIMARY KEY, v TEXT)")
+    before = dw.writer_stats()["inline_jobs"]
+    assert dw.write(_insert("inline")) >= 1
+    assert _values() == ["inline"]
+    assert dw.writer_stats()["inline_jobs"] == before + 1
+    assert not dw.submit(_insert("x")).running()
+
+
+def test_read_pool_is_read_only_and_reused():
+    with dw.read_db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM price_checks").fetchone()[0] == 0
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO price_checks (id) VALUES ('nope')")
+        first = conn
+    with dw.read_db() as conn:
+        assert conn is first
+
+
+def test_record_price_goes_through_writer(queue_on):
+    from src.core.db import get_price_history_db, record_price
+    before = dw.writer_stats()["jobs"]
+    rowid = record_price("Nitrile gloves, large", 12.5, "amazon")
+    assert rowid
+    assert get_price_history_db("nitrile")[0]["unit_price"] == 12.5
+    assert dw.writer_stats()["jobs"] == before + 1
+
+
+def test_get_price_check_reads_from_pool():
+    from src.core.db import get_price_check
+    with get_db() as conn:
+        conn.execute("INSERT INTO price_checks (id, created_at, pc_number, items) "
+                     "VALUES ('pc-r1', '2026-01-01', 'R1', '[{\"qty\": 2}]')")
+    pc = get_price_check("pc-r1")
+    assert pc["pc_number"] == "R1" and pc["items"] == [{"qty": 2}]
+
+
+def test_lock_wait_and_lock_errors_are_reported():
+    before = dw.writer_stats()
+    dw.write(lambda conn: None)
+    dw.note_lock_error()
+    after = dw.writer_stats()
+    assert after["lock_wait"]["samples"] >= min(before["lock_wait"]["samples"] + 1, 500)
+    assert after["lock_errors"] == before["lock_errors"] + 1
+
+
+def test_inline_write_uses_its_own_connection(monkeypatch):
+    monkeypatch.delenv("DB_WRITE_QUEUE", raising=False)
+    with get_db() as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS w_t (id INTEGER PRIMARY KEY, v TEXT)")
+        shared = conn
+    seen = []
+    dw.write(lambda conn: seen.append(conn) or conn.execute(
+        "INSERT INTO w_t (v) VALUES ('own')"))
+    assert seen[0] is not shared
+    assert not shared.in_transaction
+    assert _values() == ["own"]
+
+    # Inside a caller's get_db() write transaction, the closure joins it.
+    with get_db() as conn:
+        conn.execute("INSERT INTO w_t (v) VALUES ('outer')")
+        dw.write(lambda c: seen.append(c))
+    assert seen[1] is shared
+
+
+def test_db_retry_counts_each_lock_error_once():
+    from src.core.db import db_retry
+
+    def locked():
+        raise sqlite3.OperationalError("database is locked")
+
+    before = dw.writer_stats()["lock_errors"]
+    with pytest.raises(sqlite3.OperationalError):
+        db_retry(locked, max_retries=3, delay=0)
+    assert dw.writer_stats()["lock_errors"] == before + 3
+
+
+def test_stop_keeps_a_writer_that_is_still_draining(queue_on):
+    release = threading.Event()
+    fut = dw.submit(lambda conn: release.wait(5))
+    time.sleep(0.1)
+    dw.stop_writer(timeout=0.05)
+    assert dw._writer.running() and dw._writer._conn is not None
+    release.set()
+    assert fut.result(5) is True
+    dw._writer._thread.join(5)
+    assert not dw._writer.running()
@@ -0,0 +1,135 @@
+"""Tests for src/core/deadline_index.py — the change-feed-maintained
+due-date index behind routes_deadlines._scan_deadlines.
+
+Pins: a data_layer save re-indexes the touched row before returning, and
+a sync re-reads only rows written since the last one; the read is a
+range query on due_ts that never returns test records, excluded
+statuses or quarantined rows (when asked) and never syncs — changes from
+other writers are picked up by a background refresh; deletes drop the
+row; a write racing a sync stays pending; invalidate re-indexes all; a DB
+from the trigger-kept design loses its dl_ triggers and ver columns.
+"""
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from src.core import deadline_index as di
+
+_NOW = time.time()
+
+
+def _index(row):
+    doc = json.loads(row.get("data_json") or "{}")
+    due = doc.get("due_ts")
+    return {"due_ts": due, "status": doc.get("status", ""),
+            "is_test": doc.get("is_test"), "quarantined": doc.get("hidden_reason"),
+            "item": {"doc_id": row["id"], "due_ts": due} if due else None}
+
+
+_INDEXERS = {"price_checks": _index, "rfqs": _index}
+
+
+@pytest.fixture(autouse=True)
+def indexers(monkeypatch):
+    monkeypatch.setattr(di, "_indexers", dict(_INDEXERS))
+
+
+def _save_pc(pcid, hours, **extra):
+    from src.api.data_layer import _save_single_pc
+    _save_single_pc(pcid, {"id": pcid, "status": extra.pop("status", "new"),
+                           "due_ts": _NOW + hours * 3600, "items": [], **extra},
+                    raise_on_error=True)
+
+
+def _ids(**kw):
+    return sorted(i["doc_id"] for i in di.query(**kw))
+
+
+def _wait_refresh():
+    t = di._refresher
+    if t is not None:
+        t.join(5)
+
+
+@pytest.fixture
+def pcs():
+    _save_pc("pc-soon", 2)
+    _save_pc("pc-later", 100)
+    _save_pc("pc-stale", -500)
+    _save_pc("pc-test", 1, is_test=True)
+    _save_pc("pc-sent", 1, status="sent")
+    _save_pc("pc-ghost", 3, hidden_reason="ghost")
+
+
+def test_range_query_filters_in_sql(pcs):
+    assert _ids() == ["pc-ghost", "pc-later", "pc-sent", "pc-soon", "pc-stale"]
+    assert _ids(since=_NOW - 72 * 3600, until=_NOW + 4 * 3600,
+                exclude_statuses=("sent",)) == ["pc-ghost", "pc-soon"]
+    assert _ids(include_quarantined=False, exclude_statuses=("sent",)) == \
+        ["pc-later", "pc-soon", "pc-stale"]
+
+
+def test_only_written_rows_are_reindexed(pcs, monkeypatch):
+    assert di.sync() == 0
+    monkeypatch.setattr(di, "_indexers", {})      # no sync on save
+    _save_pc("pc-later", 1)
+    assert di.sync(_INDEXERS) == 1
+    assert _ids(since=_NOW, until=_NOW + 4 * 3600, exclude_statuses=("sent",)) == \
+        ["pc-ghost", "pc-later", "pc-soon"]
+
+
+def test_raw_write_is_refreshed_in_background_not_on_read(pcs):
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("DELETE FROM price_checks WHERE id='pc-soon'")
+    assert di.index_stats()["dirty"] == 1
+    assert "pc-soon" in _ids()          # answered from the index as-is
+    _wait_refresh()
+    assert "pc-soon" not in _ids()
+    assert di.index_stats()["records"] == 5
+    assert di.index_stats()["dirty"] == 0
+
+
+def test_write_racing_sync_stays_dirty(pcs):
+    def racing(row):
+        if row["id"] == "pc-soon":
+            from src.core.db import get_db
+            with get_db() as conn:
+                conn.execute("UPDATE price_checks SET data_json = "
+                             "json_set(data_json, '$.status', 'priced') WHERE id='pc-soon'")
+        return _index(row)
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("UPDATE price_checks SET status='new' WHERE id='pc-soon'")
+    di.sync({"price_checks": racing})
+    assert di.index_stats()["dirty"] == 1
+    assert di.sync() == 1
+    assert "pc-soon" not in _ids(exclude_statuses=("priced",))
+
+
+def test_invalidate_reindexes_everything(pcs):
+    di.invalidate()
+    _wait_refresh()
+    assert di.index_stats()["reindexed"] >= 12
+    assert _ids(exclude_statuses=("sent",)) == \
+        ["pc-ghost", "pc-later", "pc-soon", "pc-stale"]
+
+
+def test_install_migrates_trigger_kept_design(pcs):
+    from src.core.db import get_db
+    with get_db() as conn:
+        conn.execute("ALTER TABLE deadline_index ADD COLUMN ver INTEGER NOT NULL DEFAULT 1")
+        conn.execute("ALTER TABLE deadline_index ADD COLUMN built_ver INTEGER NOT NULL DEFAULT 0")
+        conn.execute("CREATE INDEX idx_deadline_index_dirty ON deadline_index(kind) "
+                     "WHERE ver != built_ver")
+        conn.execute("CREATE TRIGGER dl_price_checks_ai AFTER INSERT ON price_checks "
+                     "BEGIN SELECT 1; END")
+        di.install_schema(conn)
+        assert {"ver", "built_ver"}.isdisjoint(
+            r[1] for r in conn.execute("PRAGMA table_info(deadline_index)"))
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master "
+                            "WHERE name LIKE 'dl\\_%' ESCAPE '\\'").fetchone()[0] == 0
+    assert di.index_stats()["dirty"] == 6
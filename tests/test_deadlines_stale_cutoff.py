@@ -18,7 +18,6 @@ from __future__ import annotations
 import os
 import sys
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
 
 import pytest
 
@@ -43,20 +42,21 @@ def _pc(due_offset_hours, *, status="open", desc="Test PC"):
     }
 
 
-def _stub_load(pcs=None, rfqs=None):
-    """Patch the data-layer loaders for the duration of a test."""
-    pcs = pcs or {}
-    rfqs = rfqs or {}
-    return patch("src.api.data_layer._load_price_checks", return_value=pcs), \
-           patch("src.api.data_layer.load_rfqs", return_value=rfqs)
+def _seed(pcs=None, rfqs=None):
+    """Write the records to the (per-test) DB — `_scan_deadlines` reads
+    them back through the change-feed-kept deadline_index."""
+    from src.api.data_layer import _save_single_pc, _save_single_rfq
+    for pcid, pc in (pcs or {}).items():
+        _save_single_pc(pcid, dict(pc, id=pcid), raise_on_error=True)
+    for rid, r in (rfqs or {}).items():
+        _save_single_rfq(rid, dict(r, id=rid), raise_on_error=True)
 
 
 def test_recent_overdue_within_72h_is_kept():
     """A PC overdue by 24h should still appear — operator can act."""
     pcs = {"pc_recent": _pc(due_offset_hours=-24, desc="Recent")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert len(out) == 1
     assert out[0]["urgency"] == "overdue"
 
@@ -64,9 +64,8 @@ def test_recent_overdue_within_72h_is_kept():
 def test_stale_overdue_past_72h_is_dropped():
     """Karaoke at 864h past due (36 days) must NOT appear."""
     pcs = {"pc_karaoke": _pc(due_offset_hours=-864, desc="Karaoke")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert out == [], f"Stale-overdue Karaoke should be filtered, got: {out}"
 
 
@@ -74,17 +73,15 @@ def test_boundary_exactly_72h_overdue_is_kept():
     """The cutoff is `> 72h` (strict), so exactly 72h is still actionable."""
     # Use 71.5 to be safe across run-time drift; 72.5 is the first stale value.
     pcs = {"pc_edge": _pc(due_offset_hours=-71.5, desc="EdgeKept")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert len(out) == 1
 
 
 def test_boundary_just_past_72h_is_dropped():
     pcs = {"pc_edge": _pc(due_offset_hours=-72.5, desc="EdgeDropped")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert out == []
 
 
@@ -94,26 +91,23 @@ def test_include_stale_true_returns_full_backlog():
         "pc_recent": _pc(due_offset_hours=-24, desc="Recent"),
         "pc_karaoke": _pc(due_offset_hours=-864, desc="Karaoke"),
     }
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines(include_stale=True)
+    _seed(pcs=pcs)
+    out = _scan_deadlines(include_stale=True)
     assert len(out) == 2
 
 
 def test_future_due_is_unaffected_by_cutoff():
     """A future deadline should always pass the stale check."""
     pcs = {"pc_future": _pc(due_offset_hours=+48, desc="Future")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert len(out) == 1
 
 
 def test_sent_status_still_skipped_independent_of_cutoff():
     pcs = {"pc_sent": _pc(due_offset_hours=-24, status="sent", desc="AlreadySent")}
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines()
+    _seed(pcs=pcs)
+    out = _scan_deadlines()
     assert out == []
 
 
@@ -123,9 +117,8 @@ def test_urgencies_filter_combines_with_cutoff():
         "pc_stale": _pc(due_offset_hours=-200, desc="Stale"),
         "pc_critical": _pc(due_offset_hours=2, desc="Critical"),
     }
-    p1, p2 = _stub_load(pcs=pcs)
-    with p1, p2:
-        out = _scan_deadlines(urgencies={"overdue", "critical"})
+    _seed(pcs=pcs)
+    out = _scan_deadlines(urgencies={"overdue", "critical"})
     descs = sorted(o["pc_number"] for o in out)
     assert descs == ["Critical", "RecentOverdue"]
 
@@ -0,0 +1,73 @@
+"""pc_enrichment_pipeline._fan_out — concurrent per-item lookups.
+
+The enrichment steps used to call Grok / supplier sites / web search
+one item at a time with a fixed sleep after each. These pin the
+replacement: lookups overlap, results come back in item order, a step
+with a success cap never has more calls in flight than it still needs,
+and a failing lookup is handed to the step instead of aborting it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+from src.agents import pc_enrichment_pipeline as pipe
+
+
+def test_lookups_overlap_and_yield_in_order():
+    def slow(n):
+        time.sleep(0.1 * (5 - n) / 5)
+        return n * 10
+
+    t0 = time.monotonic()
+    out = [(job, res) for job, res, _err in pipe._fan_out(range(5), slow)]
+    assert time.monotonic() - t0 < 0.3
+    assert out == [(n, n * 10) for n in range(5)]
+
+
+def test_window_bounds_calls_to_what_the_cap_still_needs():
+    calls, lock = [], threading.Lock()
+
+    def ok(n):
+        with lock:
+            calls.append(n)
+        time.sleep(0.02)
+        return True
+
+    found = 0
+    for _job, res, _err in pipe._fan_out(range(20), ok, window=lambda: 3 - found):
+        found += 1
+        if found >= 3:
+            break
+    assert found == 3
+    assert sorted(calls) == [0, 1, 2]
+
+
+def test_window_keeps_looking_past_misses():
+    def hit_on_odd(n):
+        return n % 2 == 1
+
+    found, seen = 0, []
+    for job, res, _err in pipe._fan_out(range(10), hit_on_odd, window=lambda: 2 - found):
+        seen.append(job)
+        if res:
+            found += 1
+        if found >= 2:
+            break
+    assert found == 2 and seen == [0, 1, 2, 3]
+
+
+def test_errors_are_yielded_not_raised():
+    def boom(n):
+        if n == 1:
+            raise RuntimeError("429")
+        return n
+
+    out = list(pipe._fan_out(range(3), boom))
+    assert [o[1] for o in out] == [0, None, 2]
+    assert isinstance(out[1][2], RuntimeError)
+
+
+def test_pipeline_has_no_fixed_sleeps():
+    import inspect
+    assert "time.sleep(" not in inspect.getsource(pipe._run_pipeline)
@@ -7,12 +7,12 @@ are correctly reset to 'failed' on startup.
 import json
 import pytest
 import src.api.dashboard as _dash
+import src.api.data_layer as _dl
 
 
 def _clear_pc_cache():
-    """Reset the in-memory PC cache so tests get fresh DB reads."""
-    _dash._pc_cache = None
-    _dash._pc_cache_time = 0
+    """Reset the PC load cache so tests get fresh DB reads."""
+    _dl._pc_cache.invalidate()
 
 
 def _seed_pc(pc_id, enrichment_status="raw", enrichment_error=None):
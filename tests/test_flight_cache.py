@@ -0,0 +1,138 @@
+"""Tests for src/core/flight_cache.py — single-flight TTL cache with an
+optional SQLite persistent tier.
+
+Pins: concurrent cold callers share one build; a builder error reaches
+every waiter and isn't cached; a build that an invalidate() overtook is
+returned but not stored; `cacheable=False` values aren't held; a new
+instance of a persisted namespace (recycled worker) starts warm, and
+invalidate() clears that tier too; _load_price_checks rides on it.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.core.flight_cache import FlightCache
+
+
+def _slow_builder(calls, delay=0.1, value=None):
+    def build():
+        calls.append(1)
+        time.sleep(delay)
+        return value if value is not None else {"n": len(calls)}
+    return build
+
+
+def _hammer(fn, n=8):
+    out, barrier = [None] * n, threading.Barrier(n)
+
+    def run(i):
+        barrier.wait()
+        try:
+            out[i] = fn()
+        except Exception as e:
+            out[i] = e
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return out
+
+
+def test_concurrent_cold_callers_share_one_build():
+    cache, calls = FlightCache("t_single", ttl=60), []
+    results = _hammer(lambda: cache.get("k", _slow_builder(calls)))
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert cache.get("k", _slow_builder(calls)) is results[0]
+    stats = cache.stats()
+    assert stats["builds"] == 1 and stats["waits"] + stats["hits"] >= 8
+
+
+def test_builder_error_shared_then_retried():
+    cache, calls = FlightCache("t_error", ttl=60), []
+
+    def boom():
+        calls.append(1)
+        time.sleep(0.1)
+        raise RuntimeError("db down")
+    results = _hammer(lambda: cache.get("k", boom))
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.get("k", lambda: "ok") == "ok"
+
+
+def test_invalidate_during_build_is_not_stored():
+    cache, started = FlightCache("t_race", ttl=60), threading.Event()
+
+    def stale():
+        started.set()
+        time.sleep(0.1)
+        return "pre-write"
+    t = threading.Thread(target=cache.get, args=("k", stale))
+    t.start()
+    started.wait()
+    cache.invalidate()
+    assert cache.get("k", lambda: "post-write") == "post-write"
+    t.join()
+    assert cache.get("k", lambda: "rebuilt") == "post-write"
+
+
+def test_uncacheable_value_returned_not_held():
+    cache = FlightCache("t_big", ttl=60, cacheable=lambda v: len(v) < 3)
+    calls = []
+    assert cache.get("k", _slow_builder(calls, 0, [1, 2, 3])) == [1, 2, 3]
+    cache.get("k", _slow_builder(calls, 0, [1, 2, 3]))
+    assert len(calls) == 2 and cache.peek("k") is None
+
+
+def test_ttl_expiry_rebuilds():
+    cache, calls = FlightCache("t_ttl", ttl=0.05), []
+    cache.get("k", _slow_builder(calls, 0))
+    time.sleep(0.08)
+    assert cache.get("k", _slow_builder(calls, 0)) == {"n": 2}
+
+
+class TestPersistentTier:
+
+    def test_recycled_worker_starts_warm(self):
+        calls = []
+        FlightCache("t_persist", ttl=60, persist=True).get("all", _slow_builder(calls, 0))
+        recycled = FlightCache("t_persist", ttl=60, persist=True)
+        assert recycled.get("all", _slow_builder(calls, 0)) == {"n": 1}
+        assert len(calls) == 1
+        assert recycled.stats()["warm_loads"] == 1
+
+    def test_invalidate_clears_persisted_row(self):
+        calls = []
+        first = FlightCache("t_persist_inv", ttl=60, persist=True)
+        first.get("all", _slow_builder(calls, 0))
+        first.invalidate()
+        FlightCache("t_persist_inv", ttl=60, persist=True).get("all", _slow_builder(calls, 0))
+        assert len(calls) == 2
+
+    def test_expired_row_not_loaded(self):
+        calls = []
+        FlightCache("t_persist_ttl", ttl=0.05, persist=True).get("all", _slow_builder(calls, 0))
+        time.sleep(0.08)
+        FlightCache("t_persist_ttl", ttl=0.05, persist=True).get("all", _slow_builder(calls, 0))
+        assert len(calls) == 2
+
+
+def test_load_price_checks_single_flight(monkeypatch):
+    from src.api import data_layer as dl
+    dl._save_single_pc("pc-sf", {"id": "pc-sf", "status": "new", "items": []})
+    calls = []
+    real = dl._build_price_checks
+
+    def counted():
+        calls.append(1)
+        time.sleep(0.05)
+        return real()
+    monkeypatch.setattr(dl, "_build_price_checks", counted)
+    results = _hammer(dl._load_price_checks)
+    assert len(calls) == 1
+    assert all("pc-sf" in r for r in results)
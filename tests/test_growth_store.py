@@ -0,0 +1,156 @@
+"""Tests for the SQLite-backed growth store in src/agents/growth_agent.py.
+
+Prospects, outreach campaigns and timelines used to be three JSON files
+that every status change, response or bounce rewrote whole. They are now
+rows in growth_prospects / growth_outreach(_entries) / growth_timeline.
+
+Pins: the legacy JSON is imported once per database and the files are left
+untouched; a corrupt file leaves just that file unmarked so it retries; a
+status change is one row plus one timeline event; responses and bounces
+update only the matching outreach entries; outreach never re-contacts an
+address already emailed; load_prospects_data / load_outreach_data keep
+the old document shapes.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from src.agents import growth_agent as ga
+
+
+@pytest.fixture
+def growth_files(tmp_path, monkeypatch):
+    paths = {
+        "PROSPECTS_FILE": tmp_path / "growth_prospects.json",
+        "OUTREACH_FILE": tmp_path / "growth_outreach.json",
+        "TIMELINE_FILE": tmp_path / "growth_timeline.json",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(ga, name, str(path))
+    monkeypatch.setattr(ga, "_store_ready", set())
+    monkeypatch.setattr(ga, "log_growth_action", lambda *a, **k: None)
+    return paths
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+
+
+def _seed(files):
+    _write(files["PROSPECTS_FILE"], {
+        "generated_at": "2026-01-01T00:00:00", "from_date": "01/01/2019",
+        "prospects": [
+            {"id": "PRO-1", "buyer_email": "A@cdcr.ca.gov", "agency": "CDCR",
+             "outreach_status": "emailed"},
+            {"id": "PRO-2", "buyer_email": "b@calvet.ca.gov", "agency": "CalVet"},
+        ]})
+    _write(files["OUTREACH_FILE"], {"campaigns": [
+        {"id": "GC-1", "created_at": "2026-01-02T00:00:00", "dry_run": False,
+         "outreach": [{"prospect_id": "PRO-1", "email": "a@cdcr.ca.gov",
+                       "email_sent": True, "response_received": False}]},
+    ]})
+    _write(files["TIMELINE_FILE"], {"PRO-1": [
+        {"type": "email_sent", "detail": "Sent", "timestamp": "2026-01-02T00:00:00"}]})
+
+
+def test_legacy_json_imported_once(growth_files):
+    _seed(growth_files)
+    before = {n: p.read_text() for n, p in growth_files.items()}
+
+    data = ga.load_prospects_data()
+    assert [p["id"] for p in data["prospects"]] == ["PRO-1", "PRO-2"]
+    assert data["total_prospects"] == 2
+    assert data["from_date"] == "01/01/2019"
+    outreach = ga.load_outreach_data()
+    assert [c["id"] for c in outreach["campaigns"]] == ["GC-1"]
+    assert outreach["campaigns"][0]["dry_run"] is False
+    assert outreach["total_sent"] == 1
+    assert ga.get_prospect("PRO-1")["timeline"][0]["type"] == "email_sent"
+
+    # Files untouched; a second boot (fresh _store_ready) does not re-import.
+    assert {n: p.read_text() for n, p in growth_files.items()} == before
+    ga._store_ready.clear()
+    assert len(ga._load_prospects_list()) == 2
+    assert len(ga.load_outreach_data()["campaigns"]) == 1
+
+
+def test_corrupt_file_leaves_only_that_file_unmarked(growth_files, monkeypatch):
+    from src.core.db import DB_PATH, get_setting
+    _seed(growth_files)
+    growth_files["OUTREACH_FILE"].write_text("{not json")
+    ga.drain_skips()
+    assert len(ga._load_prospects_list()) == 2          # prospects still imported
+    assert ga.load_outreach_data()["campaigns"] == []
+    assert get_setting(ga._IMPORT_MARKER + ":prospects")
+    assert not get_setting(ga._IMPORT_MARKER + ":campaigns")
+    assert not get_setting(ga._IMPORT_MARKER)
+    assert DB_PATH not in ga._store_ready
+    assert any(s.name == "json_corruption" for s in ga.drain_skips())
+
+    # Fixed file is picked up on the next retry, without a restart and
+    # without importing the prospects or timelines a second time.
+    _seed(growth_files)
+    monkeypatch.setattr(ga, "_import_failed_at", {})
+    assert [c["id"] for c in ga.load_outreach_data()["campaigns"]] == ["GC-1"]
+    assert len(ga._load_prospects_list()) == 2
+    assert len(ga.get_prospect("PRO-1")["timeline"]) == 1
+    assert get_setting(ga._IMPORT_MARKER)
+    assert DB_PATH in ga._store_ready
+
+
+def test_status_counts_and_recent_sent_outreach(growth_files):
+    _seed(growth_files)
+    assert ga.prospect_status_counts() == {"emailed": 1, "new": 1}
+    sent = ga.recent_sent_outreach(5)
+    assert [(o["prospect_id"], o["email"]) for o in sent] == [("PRO-1", "a@cdcr.ca.gov")]
+
+
+def test_status_change_is_one_row_and_one_event(growth_files):
+    _seed(growth_files)
+    ga._update_prospect_status("PRO-2", "called")
+    out = ga.get_prospect("PRO-2")
+    assert out["prospect"]["outreach_status"] == "called"
+    assert [(e["type"], e["detail"]) for e in out["timeline"]] == \
+        [("status_change", "new → called")]
+    assert ga.get_prospect("PRO-1")["prospect"]["outreach_status"] == "emailed"
+    assert ga.get_growth_status()["prospects"]["total"] == 2
+
+
+def test_response_and_bounce_update_matching_entries(growth_files):
+    _seed(growth_files)
+    ga.mark_responded("PRO-1", "phone")
+    rec = ga.get_prospect("PRO-1")
+    assert rec["prospect"]["outreach_status"] == "responded"
+    assert rec["outreach_records"][0]["response_received"] is True
+    assert rec["outreach_records"][0]["response_type"] == "phone"
+
+    res = ga.process_bounceback("A@CDCR.ca.gov", "550 user unknown")
+    assert res == {"ok": True, "prospect_id": "PRO-1", "agency": "CDCR"}
+    entry = ga.get_prospect("PRO-1")["outreach_records"][0]
+    assert entry["bounced"] is True and entry["bounce_reason"] == "550 user unknown"
+    assert ga.process_bounceback("nobody@x.gov")["ok"] is False
+
+
+def test_outreach_skips_contacted_and_saves_entries(growth_files):
+    _seed(growth_files)
+    res = ga.launch_outreach(max_prospects=10, dry_run=True)
+    assert res["ok"] and res["emails_built"] == 1
+    assert [p["to"] for p in res["preview"]] == ["b@calvet.ca.gov"]
+    camp = ga.load_outreach_data()["campaigns"][-1]
+    assert camp["id"] == res["campaign_id"] and camp["dry_run"] is True
+    assert [o["prospect_id"] for o in camp["outreach"]] == ["PRO-2"]
+
+
+def test_add_prospects_dedupes_by_email(growth_files):
+    _seed(growth_files)
+    added = ga.add_prospects([
+        {"id": "PRO-3", "buyer_email": "a@CDCR.ca.gov"},
+        {"id": "PRO-4", "email": "new@dsh.ca.gov"},
+        {"id": "PRO-5", "buyer_email": "NEW@dsh.ca.gov"},
+        {"id": "PRO-6", "buyer_email": ""},
+    ])
+    assert added == 1
+    assert ga.prospect_emails() == {"a@cdcr.ca.gov", "b@calvet.ca.gov", "new@dsh.ca.gov"}
+    assert [p["id"] for p in ga._load_prospects_list()] == ["PRO-1", "PRO-2", "PRO-4"]
@@ -0,0 +1,141 @@
+"""Tests for src/core/incremental_backup.py — page-level incremental
+backups with point-in-time restore.
+
+Pins: the first run writes a base with every page, later runs ship only
+the pages that changed; commits still sitting in the WAL are captured;
+restore replays base + increments up to the requested time and passes
+integrity_check; a new chain starts after BASE_EVERY increments and old
+chains rotate out; scheduler.run_backup delegates in incremental mode.
+"""
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core import incremental_backup as ib
+
+
+@pytest.fixture
+def live(tmp_path):
+    """A WAL-mode reytech.db with enough rows to span many pages."""
+    db = tmp_path / "reytech.db"
+    conn = sqlite3.connect(db)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE quotes (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.executemany("INSERT INTO quotes (body) VALUES (?)",
+                     [(f"R26Q{i} " + "lorem ipsum " * 40,) for i in range(2000)])
+    conn.commit()
+    yield tmp_path, conn
+    conn.close()
+
+
+def _rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT id, body FROM quotes ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+def test_base_then_increment_ships_only_changed_pages(live):
+    data_dir, conn = live
+    base = ib.run_incremental_backup(str(data_dir))
+    assert base["ok"] and base["kind"] == "base"
+    assert base["changed_pages"] == base["page_count"] > 100
+
+    conn.execute("UPDATE quotes SET body='changed' WHERE id=1500")
+    conn.commit()
+    inc = ib.run_incremental_backup(str(data_dir))
+    assert inc["kind"] == "incremental"
+    assert 1 <= inc["changed_pages"] <= 5
+    assert inc["size"] < base["size"] / 20
+
+    out = data_dir / "restored.db"
+    assert ib.restore(str(out), data_dir=str(data_dir))["ok"]
+    assert _rows(out) == _rows(data_dir / "reytech.db")
+
+
+def test_commits_still_in_wal_are_captured(live):
+    data_dir, conn = live
+    ib.run_incremental_backup(str(data_dir))
+    conn.execute("PRAGMA wal_autocheckpoint=0")
+    reader = sqlite3.connect(data_dir / "reytech.db")
+    reader.execute("BEGIN")
+    reader.execute("SELECT count(*) FROM quotes").fetchone()   # blocks backfill
+    try:
+        conn.executemany("INSERT INTO quotes (body) VALUES (?)", [("fresh",)] * 300)
+        conn.commit()
+        assert (data_dir / "reytech.db-wal").stat().st_size > 0
+        inc = ib.run_incremental_backup(str(data_dir))
+    finally:
+        reader.rollback()
+        reader.close()
+    assert inc["ok"] and inc["changed_pages"] > 0
+
+    out = data_dir / "restored.db"
+    assert ib.restore(str(out), data_dir=str(data_dir))["ok"]
+    assert len(_rows(out)) == 2300
+
+
+def test_point_in_time_restore(live):
+    data_dir, conn = live
+    first = ib.run_incremental_backup(str(data_dir))
+    conn.execute("DELETE FROM quotes WHERE id > 1000")
+    conn.commit()
+    ib.run_incremental_backup(str(data_dir))
+
+    out = data_dir / "restored.db"
+    at = datetime.fromisoformat(first["created_at"])
+    result = ib.restore(str(out), at=at, data_dir=str(data_dir))
+    assert result["ok"] and result["created_at"] == first["created_at"]
+    assert len(_rows(out)) == 2000
+
+    assert ib.restore(str(out), data_dir=str(data_dir))["ok"]
+    assert len(_rows(out)) == 1000
+
+    early = ib.restore(str(out), at=at - timedelta(days=1), data_dir=str(data_dir))
+    assert not early["ok"]
+
+
+def test_new_chain_after_base_every_and_rotation(live, monkeypatch):
+    data_dir, conn = live
+    monkeypatch.setattr(ib, "BASE_EVERY", 1)
+    monkeypatch.setattr(ib, "KEEP_CHAINS", 2)
+    kinds = []
+    for i in range(6):
+        conn.execute("UPDATE quotes SET body=? WHERE id=7", (f"v{i}",))
+        conn.commit()
+        kinds.append(ib.run_incremental_backup(str(data_dir))["kind"])
+    assert kinds == ["base", "incremental"] * 3
+    assert len(ib._chains(str(data_dir))) == 2
+    points = ib.list_points(str(data_dir))
+    assert len(points) == 4
+
+    out = data_dir / "restored.db"
+    assert ib.restore(str(out), data_dir=str(data_dir))["ok"]
+    assert dict(_rows(out))[7] == "v5"
+
+
+def test_scheduler_incremental_mode(live, monkeypatch):
+    data_dir, _ = live
+    monkeypatch.setattr("src.core.scheduler.heartbeat", lambda *a, **kw: None)
+    monkeypatch.setenv("BACKUP_MODE", "incremental")
+    from src.core.scheduler import backup_health, run_backup
+    result = run_backup(data_dir=str(data_dir))
+    assert result["ok"] and result["filename"].endswith(".pages.gz")
+    assert list((data_dir / "backups").glob("reytech_*")) == []
+    health = backup_health(str(data_dir))
+    assert health["healthy"] and health["latest"].startswith("incremental/")
+
+
+def test_restore_script_exit_codes(live):
+    from scripts import restore_backup
+    data_dir, _ = live
+    out = str(data_dir / "r.db")
+    assert restore_backup.main(["--data-dir", str(data_dir), "--out", out]) == 2
+    ib.run_incremental_backup(str(data_dir))
+    assert restore_backup.main(["--data-dir", str(data_dir), "--out", out]) == 0
+    at = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    assert restore_backup.main(["--data-dir", str(data_dir), "--out", out, "--at", at]) == 2
@@ -0,0 +1,81 @@
+"""Tests for src/forms/layout_cache.py — AMS 704 overlay layout cache.
+
+Pins: a repeat template (same fingerprint) skips detection entirely and
+gets back the identical structure, tuples included; a different
+fingerprint re-detects; failed detections and JSON-unsafe layouts are
+not cached; and price_check's overlay detection goes through the cache.
+"""
+from __future__ import annotations
+
+from src.forms import layout_cache as lc
+
+_LAYOUT = [
+    {"item_rows": [(100.0, 120.5), (80.0, 99.5)],
+     "desc_tops": [130.0, 110.0],
+     "price_x": (600.0, 650.0),
+     "supplier_cells": {"COMPANY NAME": (33.1, 421.3, 278.3, 441.4)},
+     "fob_area": None},
+    None,
+]
+
+
+def _counting(result):
+    calls = []
+
+    def detect(path):
+        calls.append(path)
+        return result
+    return calls, detect
+
+
+def test_repeat_fingerprint_skips_detection_and_keeps_tuples():
+    calls, detect = _counting(_LAYOUT)
+    first = lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-same")
+    again = lc.cached_layout("overlay", "b.pdf", detect, fingerprint="fp-same")
+    assert calls == ["a.pdf"]
+    assert first == again == _LAYOUT
+    assert isinstance(again[0]["item_rows"][0], tuple)
+    assert isinstance(again[0]["desc_tops"], list)
+
+
+def test_new_fingerprint_detects_again():
+    calls, detect = _counting(_LAYOUT)
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-1")
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-2")
+    assert len(calls) == 2
+
+
+def test_failed_detection_is_not_cached():
+    calls, detect = _counting(None)
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-none")
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-none")
+    assert len(calls) == 2
+
+
+def test_json_unsafe_layout_is_not_cached():
+    calls, detect = _counting([{"rows": {1: (0, 1)}}])
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-intkeys")
+    lc.cached_layout("overlay", "a.pdf", detect, fingerprint="fp-intkeys")
+    assert len(calls) == 2
+
+
+def test_unreadable_pdf_falls_through_to_detection(tmp_path):
+    bogus = tmp_path / "not.pdf"
+    bogus.write_text("nope")
+    assert lc.layout_fingerprint(str(bogus)) is None
+    calls, detect = _counting(_LAYOUT)
+    lc.cached_layout("overlay", str(bogus), detect)
+    lc.cached_layout("overlay", str(bogus), detect)
+    assert len(calls) == 2
+
+
+def test_price_check_overlay_detection_uses_cache(monkeypatch):
+    from src.forms import price_check as pc
+    calls, detect = _counting(_LAYOUT)
+    monkeypatch.setattr(lc, "layout_fingerprint", lambda path: "fp-pc")
+    monkeypatch.setattr(pc, "_scan_ams704_overlay_positions", detect)
+    assert pc._detect_ams704_overlay_positions("x.pdf") == _LAYOUT
+    assert pc._detect_ams704_overlay_positions("x.pdf") == _LAYOUT
+    assert len(calls) == 1
+    pc._detect_ams704_overlay_positions("x.pdf", use_cache=False)
+    assert len(calls) == 2
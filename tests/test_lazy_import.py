@@ -0,0 +1,86 @@
+"""Tests for src/core/lazy_import.py and the boot-path modules that use it.
+
+Pins: a lazy stand-in imports nothing until first use, then behaves like
+the real object; the form filler / RFQ parser that dashboard imports at
+boot no longer pull pypdf or Pillow in; and the import-time profiler
+parses `-X importtime` output.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+from src.core.lazy_import import lazy_attr, lazy_module, resolved
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_lazy_attr_defers_import_until_call():
+    dedent = lazy_attr("textwrap", "dedent")
+    assert not resolved(dedent)
+    assert dedent("  a\n  b") == "a\nb"
+    assert resolved(dedent)
+    assert "resolved" in repr(dedent)
+
+
+def test_lazy_module_forwards_attributes():
+    tw = lazy_module("textwrap")
+    assert tw.TextWrapper is textwrap.TextWrapper
+    assert resolved(tw)
+
+
+def test_missing_module_raises_on_first_use_not_definition():
+    ghost = lazy_attr("no_such_module_xyz", "Thing")
+    try:
+        ghost()
+    except ImportError:
+        pass
+    else:
+        raise AssertionError("expected ImportError on first use")
+
+
+def test_lazy_attr_resolves_unimported_submodule():
+    """`lazy_attr("PIL", "Image")` is `from PIL import Image` — the
+    submodule must be imported, not looked up as a package attribute."""
+    code = (
+        "import sys\n"
+        "from src.core.lazy_import import lazy_attr\n"
+        "assert 'xml.dom.minidom' not in sys.modules\n"
+        "minidom = lazy_attr('xml.dom', 'minidom')\n"
+        "print(minidom.parseString('<a/>').documentElement.tagName)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO,
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr[-1500:]
+    assert proc.stdout.strip() == "a"
+
+
+def test_boot_imports_do_not_load_pdf_stack():
+    code = (
+        "import sys\n"
+        "import src.forms.reytech_filler_v4, src.forms.rfq_parser\n"
+        "heavy = [m for m in ('pypdf', 'PIL') if m in sys.modules]\n"
+        "print(','.join(heavy))\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=REPO,
+                          capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr[-1500:]
+    assert proc.stdout.strip() == ""
+
+
+def test_profiler_rolls_importtime_up_by_package():
+    sys.path.insert(0, os.path.join(REPO, "scripts"))
+    try:
+        from profile_route_imports import parse_importtime
+    finally:
+        sys.path.pop(0)
+    stderr = textwrap.dedent("""\
+        import time: self [us] | cumulative | imported package
+        import time:       120 |        120 |   pypdf._utils
+        import time:       380 |        500 | pypdf
+        import time:        50 |         50 | src.api.config
+        not an importtime line
+    """)
+    assert parse_importtime(stderr) == {"pypdf": 500, "src": 50}
@@ -0,0 +1,121 @@
+"""Tests for the multiplexed live-updates stream — src/core/live_events.py
+and GET /api/live/stream.
+
+Pins: a new stream sends every channel once, then only channels whose
+fingerprint changed; a reconnect's Last-Event-ID suppresses what the
+browser already has; one stream per sid (the old one is told it was
+superseded); a process-wide slot cap answers 503 so pages keep polling;
+concurrent streams share one payload build per TTL.
+"""
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from src.core import live_events
+
+
+@pytest.fixture
+def hub(monkeypatch):
+    monkeypatch.setattr(live_events, "_channels", {})
+    monkeypatch.setattr(live_events, "_streams", {})
+    monkeypatch.setattr(live_events, "MAX_STREAMS", 2)
+    state = {"bell": {"unread": 1}, "pulse": {"advanced": 0}, "builds": 0}
+
+    def producer(name):
+        def build():
+            state["builds"] += 1
+            return dict(state[name])
+        return build
+    live_events.register("bell", producer("bell"), ttl=0)
+    live_events.register("pulse", producer("pulse"), ttl=0)
+    return state
+
+
+def _parse(chunks):
+    out = []
+    for chunk in chunks:
+        fields = dict(line.split(": ", 1) for line in chunk.strip().split("\n")
+                      if ": " in line)
+        if "event" in fields:
+            out.append((fields["event"], json.loads(fields["data"]), fields.get("id", "")))
+    return out
+
+
+def test_first_stream_sends_each_channel_then_bye(hub):
+    chunks = list(live_events.open_stream("sid-aaaaaaaa").events(max_seconds=0, tick=0))
+    assert chunks[0].startswith("retry: ")
+    events = _parse(chunks)
+    assert [e[0] for e in events] == ["bell", "pulse", "bye"]
+    assert events[0][1] == {"unread": 1}
+    assert events[-1][1] == {"reason": "expired"}
+    assert live_events.live_stats()["open"] == 0
+
+
+def test_reconnect_only_resends_changed_channels(hub):
+    events = _parse(live_events.open_stream("sid-aaaaaaaa").events(max_seconds=0, tick=0))
+    last_id = [e[2] for e in events if e[2]][-1]
+    hub["bell"] = {"unread": 2}
+    again = _parse(live_events.open_stream("sid-aaaaaaaa", last_event_id=last_id)
+                   .events(max_seconds=0, tick=0))
+    assert [(e[0], e[1]) for e in again] == [("bell", {"unread": 2}), ("bye", {"reason": "expired"})]
+
+
+def test_unchanged_data_is_not_pushed_again(hub):
+    stream = live_events.open_stream("sid-aaaaaaaa")
+    gen = stream.events(max_seconds=60, tick=0.01)
+    first = [next(gen) for _ in range(3)]           # retry + bell + pulse
+    assert [e[0] for e in _parse(first)] == ["bell", "pulse"]
+    hub["pulse"] = {"advanced": 3}
+    assert _parse([next(gen)])[0][:2] == ("pulse", {"advanced": 3})
+    stream.stop("test")
+    assert _parse(list(gen)) == [("bye", {"reason": "test"}, "")]
+
+
+def test_same_sid_supersedes_and_cap_is_per_session(hub):
+    old = live_events.open_stream("sid-aaaaaaaa")
+    live_events.open_stream("sid-bbbbbbbb")
+    with pytest.raises(live_events.StreamBusy):
+        live_events.open_stream("sid-cccccccc")
+    new = live_events.open_stream("sid-aaaaaaaa")     # same browser: allowed
+    assert old.reason == "superseded"
+    old.close()                                       # old stream winding down
+    assert live_events._streams["sid-aaaaaaaa"] is new
+    new.close()
+    live_events.open_stream("sid-cccccccc").close()
+
+
+def test_streams_share_one_build_per_ttl(hub, monkeypatch):
+    live_events.register("bell", lambda: hub.__setitem__("builds", hub["builds"] + 1) or {"n": 1},
+                         ttl=60)
+    barrier = threading.Barrier(2)
+
+    def run(sid):
+        barrier.wait()
+        list(live_events.open_stream(sid, ["bell"]).events(max_seconds=0, tick=0))
+    threads = [threading.Thread(target=run, args=(f"sid-{i}xxxxxxx",)) for i in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert hub["builds"] == 1
+
+
+def test_stream_route_pushes_channels(client, monkeypatch):
+    monkeypatch.setattr(live_events, "_streams", {})
+    monkeypatch.setattr(live_events, "STREAM_MAX_SECONDS", 0)
+    resp = client.get("/api/live/stream?sid=testsid01&channels=bell,deadlines")
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    events = [e[0] for e in _parse(resp.get_data(as_text=True).split("\n\n"))]
+    assert events == ["bell", "deadlines", "bye"]
+
+
+def test_stream_route_busy_falls_back_to_poll(client, monkeypatch):
+    monkeypatch.setattr(live_events, "_streams", {})
+    monkeypatch.setattr(live_events, "MAX_STREAMS", 0)
+    resp = client.get("/api/live/stream?sid=testsid01")
+    assert resp.status_code == 503
+    assert resp.get_json()["fallback"] == "poll"
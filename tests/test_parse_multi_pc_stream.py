@@ -0,0 +1,126 @@
+"""parse_multi_pc — streaming boundary detection + pooled section parsing.
+
+Pins: sections are emitted as soon as the next boundary page arrives
+(before later pages are read), pages ahead of the first boundary are
+dropped, a PURCHASE JUSTIFICATION page before a boundary is trimmed from
+the previous PC, chunked extraction yields pages in order, the
+assembled result keeps the old shape (page ranges, total_sections,
+non_pc_pages, parsed header + items), and the process pool is started once
+and kept across calls.
+"""
+from __future__ import annotations
+
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.forms import price_check as pc
+
+_HDR = ("STATE OF CALIFORNIA AMS 704 PRICE CHECK # {num}\n"
+        "Requestor Institution or HQ Program Delivery Zip Code Phone Number Date of Request\n"
+        "Magana  CIW ML EOP 92880 909 597-1771 3/24/2026\n")
+_ROW = "{n} {qty} EA Nitrile gloves size {n}\n"
+
+
+def _pc_page(num, rows=2):
+    return _HDR.format(num=num) + "".join(_ROW.format(n=i, qty=i * 10) for i in range(1, rows + 1))
+
+
+def _bundle():
+    return [
+        "cover letter",                        # 0 — before first PC
+        _pc_page("A-1"),                       # 1
+        "3 30 EA Paper towels continued\n",    # 2
+        "PURCHASE JUSTIFICATION for next PC",  # 3 — trimmed
+        _pc_page("B-2", rows=3),               # 4
+        _pc_page("C-3", rows=1),               # 5
+    ]
+
+
+def test_sections_stream_before_later_pages_are_read():
+    read = []
+
+    def pages():
+        for i, text in enumerate(_bundle()):
+            read.append(i)
+            yield i, text
+
+    sections = pc._iter_pc_sections(pages(), total_pages=6)
+    start, end, text = next(sections)
+    assert (start, end) == (1, 2)
+    assert read == [0, 1, 2, 3, 4]
+    assert "PURCHASE JUSTIFICATION" not in text
+    assert [(s, e) for s, e, _ in sections] == [(4, 4), (5, 5)]
+
+
+def test_section_parse_reads_header_and_items():
+    sec = pc._parse_pc_section(_pc_page("B-2", rows=3), "x.pdf", 4, 4, 1)
+    assert sec["header"]["price_check_number"] == "B-2"
+    assert sec["header"]["zip_code"] == "92880"
+    assert [it["qty"] for it in sec["line_items"]] == [10, 20, 30]
+    assert sec["page_start"] == 4 and sec["section_index"] == 1
+
+
+def test_chunked_extraction_yields_pages_in_order(monkeypatch):
+    monkeypatch.setattr(pc, "MULTI_PC_CHUNK_PAGES", 2)
+    monkeypatch.setattr(pc, "_extract_page_texts",
+                        lambda path, first, last: [f"p{i}" for i in range(first, last + 1)])
+    with ThreadPoolExecutor(2) as pool:
+        got = list(pc._iter_page_texts("x.pdf", 5, pool=pool, depth=2))
+    assert got == [(i, f"p{i}") for i in range(5)]
+
+
+@pytest.fixture
+def fake_bundle(monkeypatch, tmp_path):
+    pdf = tmp_path / "bundle.pdf"
+    pdf.write_bytes(b"%PDF-1.4")
+    texts = _bundle()
+
+    class _Pdf:
+        pages = [object()] * len(texts)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *a):
+            return False
+
+    mod = types.ModuleType("pdfplumber")
+    mod.open = lambda path, **kw: _Pdf()
+    monkeypatch.setitem(sys.modules, "pdfplumber", mod)
+    monkeypatch.setattr(pc, "_iter_page_texts",
+                        lambda path, total, pool=None, depth=2: iter(enumerate(texts)))
+    return str(pdf)
+
+
+def test_parse_multi_pc_assembles_sections(fake_bundle):
+    results = pc.parse_multi_pc(fake_bundle, workers=1)
+    assert [(r["page_start"], r["page_end"]) for r in results] == [(1, 2), (4, 4), (5, 5)]
+    assert [r["header"]["price_check_number"] for r in results] == ["A-1", "B-2", "C-3"]
+    assert all(r["total_sections"] == 3 for r in results)
+    assert results[0]["non_pc_pages"] == [0, 3]
+    assert len(results[0]["line_items"]) == 3
+
+
+def test_pool_is_started_once_and_shut_down_on_demand(fake_bundle, monkeypatch):
+    import concurrent.futures
+    started = []
+
+    class _Pool(ThreadPoolExecutor):
+        def __init__(self, max_workers=None, mp_context=None):
+            super().__init__(max_workers)
+            started.append(self)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", _Pool)
+    monkeypatch.setattr(pc, "MULTI_PC_POOL_MIN_PAGES", 1)
+    monkeypatch.setattr(pc, "_multi_pc_executor", None)
+    monkeypatch.setattr(pc.os, "cpu_count", lambda: 4)
+    first = pc.parse_multi_pc(fake_bundle, workers=2)
+    second = pc.parse_multi_pc(fake_bundle, workers=2)
+    assert len(started) == 1 and pc._multi_pc_executor is started[0]
+    assert [r["page_start"] for r in first] == [r["page_start"] for r in second] == [1, 4, 5]
+
+    pc._shutdown_multi_pc_pool()
+    assert pc._multi_pc_executor is None and started[0]._shutdown
@@ -15,14 +15,14 @@ before catalog match runs.
 import pytest
 
 import src.api.dashboard as _dash
+import src.api.data_layer as _dl
 from scripts.import_mckesson_catalog import import_csv
 import tempfile
 import os
 
 
 def _clear_pc_cache():
-    _dash._pc_cache = None
-    _dash._pc_cache_time = 0
+    _dl._pc_cache.invalidate()
 
 
 def _seed_supplier_sku(supplier_sku, mfg_number, description):
@@ -83,9 +83,11 @@ class TestRoutesPrd28DataPathDrained:
 
     def test_uses_data_dir_path_construction(self):
         src = _read("src/api/modules/routes_prd28.py")
-        # Both sites must build paths via pathlib.Path(DATA_DIR) / filename
+        # quotes_log builds its path via pathlib.Path(DATA_DIR) / filename;
+        # growth outreach reads the growth_outreach tables, not the old JSON.
         assert 'pathlib.Path(DATA_DIR) / "quotes_log.json"' in src
-        assert 'pathlib.Path(DATA_DIR) / "growth_outreach.json"' in src
+        assert "growth_outreach.json" not in src
+        assert "recent_sent_outreach" in src
 
 
 class TestRealNamesResolve:
@@ -88,10 +88,9 @@ class TestQuoteNumberSequence:
                        "pricing": {"recommended_price": 10.00}}],
         }
         with app.app_context():
-            from src.api.dashboard import _save_single_pc, _pc_cache
-            import src.api.dashboard as _dash
-            _dash._pc_cache = None  # clear cache
-            _dash._pc_cache_time = 0
+            from src.api.dashboard import _save_single_pc
+            import src.api.data_layer as _dl
+            _dl._pc_cache.invalidate()  # clear cache
             _save_single_pc("test-pc-002", pc2)
 
         r2 = client.post("/pricecheck/test-pc-002/generate-quote")
@@ -260,6 +260,113 @@ class TestPythonScan:
         assert result["stats"]["warning_count"] > 0
 
 
+# ─── Test Incremental Source Scan ─────────────────────────────────────────────
+
+class TestIncrementalSourceScan:
+    @pytest.fixture
+    def src_tree(self, tmp_path, monkeypatch):
+        from src.agents import qa_agent
+        monkeypatch.setattr(qa_agent, "QA_DB_PATH", str(tmp_path / "qa.db"))
+        src = tmp_path / "src"
+        (src / "pkg").mkdir(parents=True)
+        (src / "a.py").write_text("x = 1\n")
+        (src / "pkg" / "b.py").write_text("try:\n    x = 1\nexcept Exception:\n    pass\n")
+        return src
+
+    def test_unchanged_files_come_from_cache(self, src_tree, monkeypatch):
+        from src.agents import qa_agent
+        first = qa_agent.scan_sources(str(src_tree))
+        assert first["rescanned"] == 2
+        assert first["files"]["a.py"]["lines"] == 1
+
+        calls = []
+        real = qa_agent.scan_python_source
+        monkeypatch.setattr(qa_agent, "scan_python_source",
+                            lambda fp: calls.append(fp) or real(fp))
+        again = qa_agent.scan_sources(str(src_tree))
+        assert calls == [] and again["files"] == first["files"]
+
+        (src_tree / "a.py").write_text("try:\n    y = 2\nexcept Exception:\n    pass\n")
+        third = qa_agent.scan_sources(str(src_tree))
+        assert [os.path.basename(c) for c in calls] == ["a.py"]
+        assert third["files"]["a.py"]["result"]["stats"]["critical_count"] == 1
+
+    def test_deleted_files_dropped(self, src_tree):
+        from src.agents import qa_agent
+        qa_agent.scan_sources(str(src_tree))
+        (src_tree / "pkg" / "b.py").unlink()
+        assert list(qa_agent.scan_sources(str(src_tree))["files"]) == ["a.py"]
+        conn = qa_agent._qa_db()
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM qa_source_scan").fetchone()[0] == 1
+        finally:
+            conn.close()
+
+
+# ─── Test Out-of-Process Monitor Cycle ────────────────────────────────────────
+
+class TestIsolatedCycle:
+    def test_runs_in_low_priority_child(self):
+        from src.agents import qa_agent
+        assert qa_agent._run_isolated(os.getpid) != os.getpid()
+        assert qa_agent._run_isolated(os.nice, 0) > os.nice(0)
+
+    def test_timeout_kills_child(self):
+        import multiprocessing
+        import time
+        from src.agents import qa_agent
+        with pytest.raises(multiprocessing.TimeoutError):
+            qa_agent._run_isolated(time.sleep, 30, timeout=1)
+
+    def test_pool_is_reused_and_replaced_after_timeout(self):
+        import multiprocessing
+        import time
+        from src.agents import qa_agent
+        qa_agent._run_isolated(os.getpid)
+        pool = qa_agent._qa_pool
+        qa_agent._run_isolated(os.getpid)
+        assert qa_agent._qa_pool is pool
+        with pytest.raises(multiprocessing.TimeoutError):
+            qa_agent._run_isolated(time.sleep, 30, timeout=1)
+        assert qa_agent._qa_pool is None
+        assert qa_agent._run_isolated(os.getpid) != os.getpid()
+
+    def test_shared_forkserver_context(self):
+        from src.core.forkserver import context
+        assert context() is context()
+
+    def test_cycle_timeout_is_skipped_not_rerun_inline(self, monkeypatch):
+        import multiprocessing
+        from src.agents import qa_agent
+
+        def hung(func, *args, timeout=None):
+            raise multiprocessing.TimeoutError()
+        monkeypatch.setattr(qa_agent, "_run_isolated", hung)
+        monkeypatch.setattr(qa_agent, "_run_monitor_checks",
+                            lambda *a: pytest.fail("re-ran in-process"))
+        assert qa_agent.QAMonitor()._run_cycle(["routes"]) is None
+
+    def test_failing_trace_still_fails_cycle(self, monkeypatch):
+        """The trace buffer lives in this process; the child's is empty.
+        A failed email poll recorded here must still fail the cycle."""
+        from src.agents import qa_agent
+        from src.api import trace
+        monkeypatch.setattr(qa_agent, "_save_qa_report", lambda report: None)
+        monkeypatch.setattr(qa_agent, "save_qa_run_to_db", lambda report: None)
+
+        def child(func, *args, timeout=None):
+            trace.clear_traces()        # what the child process sees
+            return func(*args)
+        monkeypatch.setattr(qa_agent, "_run_isolated", child)
+
+        trace.clear_traces()
+        trace.Trace("email_poll").fail("Gmail API 401: invalid_grant")
+        report = qa_agent.QAMonitor()._run_cycle(["trace_health", "email_pipeline_traces"])
+        failed = [r for r in report["results"] if r["status"] == "fail"]
+        assert {r["check"] for r in failed} == {"trace_health", "email_pipeline_traces"}
+        assert any("invalid_grant" in r["message"] for r in report["critical_issues"])
+
+
 # ─── Test Full HTML Scan ──────────────────────────────────────────────────────
 
 class TestFullScan:
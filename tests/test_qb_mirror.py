@@ -0,0 +1,197 @@
+"""Tests for the QuickBooks local mirror — quickbooks_agent._sync_entity and
+the fetch_* / find_* readers over qb_vendors / qb_customers / qb_invoices.
+
+A fake QuickBooks query endpoint stands in for `_qb_request`: it parses
+the SELECT the agent sends (LastUpdatedTime filter, ORDERBY, STARTPOSITION,
+MAXRESULTS) and pages like the real API — including hiding inactive
+vendors/customers unless the query asks for `Active IN (true,false)`.
+
+Pins: nothing is cut off at a fixed MAXRESULTS; a second sync only asks
+for rows changed since the cursor and still sees deactivations; pages that
+share one timestamp are stepped through, not looped on; a failed page
+leaves the cursor alone; force_refresh, or QB_FULL_SYNC_SECONDS since the
+last full pass, drops rows QB deleted; the network paging runs without
+_sync_lock and a concurrent sync of the same entity is skipped; lookups
+hit the indexed tables.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from datetime import datetime, timedelta
+from urllib.parse import unquote
+
+import pytest
+
+from src.agents import quickbooks_agent as qb
+
+
+def _ts(n):
+    return f"2026-01-01T10:{n // 60:02d}:{n % 60:02d}-08:00"
+
+
+class FakeQuickBooks:
+    """In-process stand-in for the QBO `query` and create endpoints."""
+
+    def __init__(self):
+        self.rows = {"Vendor": {}, "Customer": {}, "Invoice": {}}
+        self.queries = []
+        self.fail_at = None       # index into self.queries that returns None
+        self.clock = 0
+        self.during_query = None  # called on each query (lock-scope checks)
+
+    def put(self, entity, id_, ts=None, **fields):
+        if ts is None:
+            self.clock += 1
+            ts = self.clock
+        self.rows[entity][str(id_)] = {"Id": str(id_), "MetaData": {"LastUpdatedTime": _ts(ts)},
+                                       **fields}
+
+    def request(self, method, endpoint, data=None):
+        if method == "POST":
+            entity = endpoint.capitalize()
+            new_id = str(900 + len(self.rows[entity]))
+            self.put(entity, new_id, **data)
+            return {entity: self.rows[entity][new_id]}
+        q = unquote(endpoint.split("query=", 1)[1].split("&minorversion", 1)[0])
+        self.queries.append(q)
+        if self.during_query:
+            self.during_query()
+        if self.fail_at == len(self.queries) - 1:
+            return None
+        entity = re.search(r"FROM (\w+)", q).group(1)
+        since = re.search(r"LastUpdatedTime >= '([^']+)'", q)
+        start, limit = map(int, re.search(r"STARTPOSITION (\d+) MAXRESULTS (\d+)", q).groups())
+        rows = sorted(self.rows[entity].values(),
+                      key=lambda r: (r["MetaData"]["LastUpdatedTime"], int(r["Id"])))
+        if since:
+            rows = [r for r in rows if r["MetaData"]["LastUpdatedTime"] >= since.group(1)]
+        if entity in ("Vendor", "Customer") and "Active IN (true,false)" not in q:
+            rows = [r for r in rows if r.get("Active", True)]
+        return {"QueryResponse": {entity: rows[start - 1:start - 1 + limit]}}
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fq = FakeQuickBooks()
+    monkeypatch.setattr(qb, "_qb_request", fq.request)
+    monkeypatch.setattr(qb, "is_configured", lambda: True)
+    monkeypatch.setattr(qb, "QB_PAGE_SIZE", 3)
+    return fq
+
+
+def _always_sync(monkeypatch):
+    monkeypatch.setattr(qb, "QB_SYNC_INTERVALS", dict.fromkeys(qb.QB_SYNC_INTERVALS, 0))
+
+
+def test_full_sync_pages_past_page_size(fake):
+    for i in range(1, 6):
+        fake.put("Vendor", i, DisplayName=f"Vendor {i}", Active=True)
+    fake.put("Vendor", 6, DisplayName="Gone Co", Active=False)
+    names = [v["name"] for v in qb.fetch_vendors()]
+    assert names == [f"Vendor {i}" for i in range(1, 6)]
+    # [1,2,3] then keyset from 3's timestamp: [3,4,5], [5,6]
+    assert len(fake.queries) == 3
+    assert qb.fetch_vendors() and len(fake.queries) == 3   # within the interval
+
+
+def test_incremental_sync_asks_only_for_changes(fake, monkeypatch):
+    for i in range(1, 5):
+        fake.put("Vendor", i, DisplayName=f"Vendor {i}", Active=True)
+    qb.fetch_vendors()
+    _always_sync(monkeypatch)
+    fake.queries.clear()
+    fake.put("Vendor", 2, DisplayName="Vendor 2 Renamed", Active=True)
+    fake.put("Vendor", 3, DisplayName="Vendor 3", Active=False)
+    names = [v["name"] for v in qb.fetch_vendors()]
+    assert names == ["Vendor 1", "Vendor 2 Renamed", "Vendor 4"]
+    assert all(f">= '{_ts(4)}'" in q for q in fake.queries[:1])
+    assert len(fake.queries) == 2                 # [4,2,3] then [3]
+
+
+def test_full_pass_after_full_sync_interval_prunes_deletes(fake, monkeypatch):
+    for i in range(1, 5):
+        fake.put("Customer", i, DisplayName=f"Agency {i}")
+    qb.fetch_customers()
+    _always_sync(monkeypatch)
+    del fake.rows["Customer"]["2"]
+    assert len(qb.fetch_customers()) == 4          # incremental can't see it
+    later = qb.time.time() + qb.QB_FULL_SYNC_SECONDS + 1
+    monkeypatch.setattr(qb.time, "time", lambda: later)
+    fake.queries.clear()
+    assert [c["id"] for c in qb.fetch_customers()] == ["1", "3", "4"]
+    assert "LastUpdatedTime >=" not in fake.queries[0]
+
+
+def test_paging_runs_outside_sync_lock(fake):
+    for i in range(1, 6):
+        fake.put("Vendor", i, DisplayName=f"Vendor {i}", Active=True)
+    held, nested = [], []
+
+    def check():
+        held.append(qb._sync_lock.locked())
+        if len(held) == 1:
+            # A second caller while this sync pages: skipped, not blocked.
+            t = threading.Thread(target=lambda: nested.append(
+                qb._sync_entity("Vendor", force=True)), daemon=True)
+            t.start()
+            t.join(5)
+    fake.during_query = check
+    assert qb._sync_entity("Vendor") > 0
+    assert qb.get_agent_status()["cached_vendors"] == 5
+    assert held and not any(held)
+    assert nested == [0]
+    assert not qb._syncing
+
+
+def test_rows_sharing_one_timestamp_are_stepped_through(fake):
+    for i in range(1, 8):
+        fake.put("Customer", i, ts=1, DisplayName=f"Agency {i}")
+    assert len(qb.fetch_customers()) == 7
+
+
+def test_failed_page_keeps_cursor_and_retries_soon(fake, monkeypatch):
+    for i in range(1, 6):
+        fake.put("Customer", i, DisplayName=f"Agency {i}")
+    fake.fail_at = 1
+    assert qb._sync_entity("Customer") == 0
+    status = qb.get_agent_status()
+    assert status["cached_customers"] == 3       # the page that did arrive
+    status = status["sync"]["Customer"]
+    assert status["cursor"] == ""
+    assert status["synced_at"] <= qb.time.time() - qb.QB_SYNC_INTERVALS["Customer"] + 300
+    fake.fail_at = None
+    assert len(qb.fetch_customers()) == 3        # not hammering QB meanwhile
+    later = qb.time.time() + 301
+    monkeypatch.setattr(qb.time, "time", lambda: later)
+    assert len(qb.fetch_customers()) == 5
+
+
+def test_invoices_window_status_and_force_prune(fake, monkeypatch):
+    today = datetime.now()
+    day = lambda n: (today + timedelta(days=n)).strftime("%Y-%m-%d")
+    fake.put("Invoice", 1, TxnDate=day(-10), DueDate=day(-1), Balance=50, TotalAmt=50)
+    fake.put("Invoice", 2, TxnDate=day(-5), DueDate=day(20), Balance=80, TotalAmt=80)
+    fake.put("Invoice", 3, TxnDate=day(-3), DueDate=day(20), Balance=0, TotalAmt=10)
+    fake.put("Invoice", 4, TxnDate=day(-200), DueDate=day(-170), Balance=0, TotalAmt=5)
+    assert [i["id"] for i in qb.fetch_invoices()] == ["3", "2", "1"]
+    assert [i["id"] for i in qb.fetch_invoices(status="overdue")] == ["1"]
+    assert len(qb.fetch_invoices(days_back=365)) == 4
+    del fake.rows["Invoice"]["2"]
+    assert len(qb.fetch_invoices()) == 3          # deletes need a full pass
+    assert [i["id"] for i in qb.fetch_invoices(force_refresh=True)] == ["3", "1"]
+    assert qb.get_agent_status()["cached_invoices"] == 3
+
+
+def test_lookups_and_create_use_the_mirror(fake):
+    fake.put("Vendor", 1, DisplayName="Grainger", Active=True)
+    fake.put("Vendor", 2, DisplayName="Grainger Industrial Supply", Active=True)
+    fake.put("Customer", 1, DisplayName="CDCR Folsom", CompanyName="Dept of Corrections")
+    assert qb.find_vendor("GRAINGER")["qb_id"] == "1"
+    assert qb.find_vendor("industrial")["qb_id"] == "2"
+    assert qb.find_vendor("") is None
+    assert qb.find_customer("corrections")["id"] == "1"
+    before = len(fake.queries)
+    assert qb.create_vendor("Uline", email="ap@uline.com")["Id"]
+    assert qb.find_vendor("uline")["email"] == "ap@uline.com"
+    assert len(fake.queries) == before            # no resync needed to see it
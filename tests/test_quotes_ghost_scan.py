@@ -41,8 +41,7 @@ def _wipe(conn):
     # that seed a PC after a sibling test ran see fresh data.
     try:
         from src.api import data_layer as _dl
-        _dl._pc_cache = None
-        _dl._pc_cache_time = 0
+        _dl._pc_cache.invalidate()
     except Exception:
         pass
 
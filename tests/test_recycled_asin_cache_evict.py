@@ -28,7 +28,6 @@ Guard rails this test pins:
 """
 from __future__ import annotations
 
-import json
 import pytest
 
 
@@ -60,10 +59,8 @@ def test_cache_evict_removes_existing_entry(isolated_cache):
 
     assert evicted is True
     assert pr._cache_lookup("asin:B00Y0L8FPW") is None
-    # Cache file persisted without the evicted key.
-    on_disk = json.loads(cache_path.read_text())
-    key = pr._cache_key("asin:B00Y0L8FPW")
-    assert key not in on_disk
+    # Row is gone from the store, not just hidden from lookups.
+    assert pr._ASIN_CACHE.peek(pr._cache_key("asin:B00Y0L8FPW")) is None
 
 
 def test_cache_evict_missing_key_is_noop(isolated_cache):
@@ -75,8 +72,8 @@ def test_cache_evict_missing_key_is_noop(isolated_cache):
 def test_cache_evict_corrupt_cache_file_does_not_raise(isolated_cache):
     pr, cache_path = isolated_cache
     cache_path.write_text("{ this is not valid json")
-    # Corrupt cache file → _load_cache returns {} (per existing behavior),
-    # so eviction reports no-op rather than crashing the URL-paste handler.
+    # Corrupt legacy cache file → the one-time import skips it, so
+    # eviction reports no-op rather than crashing the URL-paste handler.
     assert pr._cache_evict("asin:B00Y0L8FPW") is False
 
 
@@ -0,0 +1,239 @@
+"""Tests for src/core/research_cache.py — the shared SQLite research cache.
+
+Pins the contract product_research, web_price_research and
+item_link_lookup rely on: per-key get/put in the per-test reytech.db,
+TTL (positive and negative) expiry, incremental LRU trimming,
+namespace isolation, hit-rate metrics and the one-time legacy JSON
+import.
+"""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core import research_cache as rc
+from src.core.research_cache import ResearchCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable `_now()` so TTL tests don't sleep."""
+    state = {"t": 1_800_000_000.0}
+    monkeypatch.setattr(rc, "_now", lambda: state["t"])
+    return state
+
+
+def _ns(name):
+    # Fresh namespace per test so the in-process counters start at zero.
+    return f"{name}_{datetime.now().timestamp()}"
+
+
+class TestGetPut:
+
+    def test_roundtrip(self):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        assert cache.get("k") is None
+        assert cache.put("k", {"found": True, "price": 4.5})
+        assert cache.get("k") == {"found": True, "price": 4.5}
+
+    def test_get_returns_independent_copy(self):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        cache.put("k", {"title": "A"})
+        cache.get("k")["title"] = "mutated"
+        assert cache.get("k")["title"] == "A"
+
+    def test_namespaces_are_isolated(self):
+        a = ResearchCache(_ns("a"), ttl_days=7, max_entries=10)
+        b = ResearchCache(_ns("b"), ttl_days=7, max_entries=10)
+        a.put("same", {"v": 1})
+        assert b.get("same") is None
+        assert a.delete("same") is True
+        assert a.delete("same") is False
+
+    def test_concurrent_writers_do_not_lose_updates(self):
+        """The JSON file lost entries when two threads load/modify/save."""
+        import threading
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=1000)
+
+        def writer(start):
+            for i in range(start, start + 25):
+                cache.put(f"k{i}", {"i": i})
+
+        threads = [threading.Thread(target=writer, args=(n * 25,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(cache) == 100
+
+
+class TestExpiry:
+
+    def test_positive_entry_expires_after_ttl(self, clock):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        cache.put("k", {"found": True})
+        clock["t"] += 6.9 * 86400
+        assert cache.get("k") is not None
+        clock["t"] += 0.2 * 86400
+        assert cache.get("k") is None
+
+    def test_negative_entry_uses_short_ttl(self, clock):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10,
+                              negative_ttl_days=1)
+        cache.put("miss", {"found": False}, negative=True)
+        assert cache.is_negative("miss")
+        clock["t"] += 1.1 * 86400
+        assert cache.get("miss") is None
+
+    def test_backdated_put_past_ttl_is_dropped(self, clock):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        assert not cache.put("old", {"v": 1}, created_at=clock["t"] - 8 * 86400)
+        assert cache.get("old") is None
+
+
+class TestEviction:
+
+    def test_lru_trim_keeps_recently_read_entries(self, clock):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=3)
+        for k in ("a", "b", "c"):
+            cache.put(k, {"k": k})
+            clock["t"] += 1
+        cache.get("a")           # a becomes most recently used
+        clock["t"] += 1
+        cache.put("d", {"k": "d"})
+        assert cache.peek("b") is None
+        assert {k for k in "acd" if cache.peek(k)} == set("acd")
+
+    def test_put_removes_expired_rows_in_bounded_batches(self, clock, monkeypatch):
+        monkeypatch.setattr(rc, "EVICT_BATCH", 5)
+        cache = ResearchCache(_ns("t"), ttl_days=1, max_entries=1000)
+        for i in range(12):
+            cache.put(f"k{i}", {"i": i})
+        clock["t"] += 2 * 86400
+
+        def stored():
+            from src.core.db import get_db
+            with get_db() as conn:
+                return conn.execute(
+                    "SELECT COUNT(*) FROM research_cache WHERE namespace=?",
+                    (cache.namespace,)).fetchone()[0]
+
+        cache.put("fresh", {})
+        assert stored() == 13 - 5
+        cache.put("fresh2", {})
+        assert stored() == 14 - 10
+        assert cache.stats()["evictions"] == 10
+
+
+class TestStats:
+
+    def test_hit_rate_counts_hits_misses_and_negatives(self):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        cache.put("hit", {"found": True})
+        cache.put("neg", {"found": False}, negative=True)
+        cache.get("hit")
+        cache.get("neg")
+        cache.get("absent")
+        cache.get("absent")
+        s = cache.stats()
+        assert (s["hits"], s["negative_hits"], s["misses"]) == (1, 1, 2)
+        assert s["hit_rate"] == 0.5
+        assert (s["entries"], s["negative_entries"]) == (2, 1)
+
+    def test_peek_does_not_count(self):
+        cache = ResearchCache(_ns("t"), ttl_days=7, max_entries=10)
+        cache.put("k", {})
+        cache.peek("k")
+        cache.peek("absent")
+        s = cache.stats()
+        assert s["hits"] == s["misses"] == 0
+
+    def test_all_stats_groups_by_namespace(self):
+        a = ResearchCache(_ns("a"), ttl_days=7, max_entries=10)
+        a.put("x", {})
+        a.put("y", {}, negative=True)
+        assert rc.all_stats()[a.namespace]["entries"] == 2
+        assert rc.all_stats()[a.namespace]["negative_entries"] == 1
+
+
+class TestLegacyImport:
+
+    def test_imports_fresh_entries_once_and_renames_file(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        path = tmp_path / "legacy.json"
+        path.write_text(json.dumps({
+            "fresh": {"cached_at": now.isoformat(), "found": True},
+            "stale": {"cached_at": (now - timedelta(days=30)).isoformat()},
+            "nots": {"cached_at": now.isoformat(), "found": False},
+            "junk": "not-a-dict",
+        }))
+        cache = ResearchCache(_ns("legacy"), ttl_days=7, max_entries=10)
+        n = rc.import_legacy_json(
+            str(path), lambda k, e: (cache, k, not e.get("found")))
+        assert n == 2
+        assert cache.get("fresh") == {"cached_at": now.isoformat(), "found": True}
+        assert cache.is_negative("nots")
+        assert cache.get("stale") is None
+        assert not path.exists()
+        assert (tmp_path / "legacy.json.migrated").exists()
+        assert rc.import_legacy_json(str(path), lambda k, e: None) == 0
+
+    def test_corrupt_file_is_skipped_and_left_in_place(self, tmp_path):
+        path = tmp_path / "broken.json"
+        path.write_text("{ nope")
+        assert rc.import_legacy_json(str(path), lambda k, e: None) == 0
+        assert path.exists()
+
+
+class TestCallers:
+
+    def test_product_research_negative_results_use_short_ttl(self, clock):
+        from src.agents import product_research as pr
+        pr._cache_store("mystery widget", {"found": False, "price": None})
+        assert pr._QUERY_CACHE.is_negative(pr._cache_key("mystery widget"))
+        clock["t"] += (pr.NEGATIVE_CACHE_TTL_DAYS + 0.1) * 86400
+        assert pr._cache_lookup("mystery widget") is None
+
+    def test_web_price_cache_hit_skips_api(self, monkeypatch):
+        from src.agents import web_price_research as wpr
+        ck = wpr._cache_key("Nitrile gloves", "N100")
+        wpr._get_cache().put(ck, {"found": True, "price": 9.99})
+
+        def boom(*a, **kw):
+            raise AssertionError("cache hit must not call the API")
+
+        monkeypatch.setattr(wpr, "_get_api_key", boom)
+        out = wpr.search_product_price("Nitrile gloves", "N100")
+        assert out["price"] == 9.99 and out["cached"] is True
+
+    def test_item_link_lookup_caches_successful_scrape(self, monkeypatch):
+        from src.agents import item_link_lookup as ill
+        calls = []
+
+        def fake(url):
+            calls.append(url)
+            return {"ok": True, "title": "Box", "price": 2.0,
+                    "supplier": "Staples", "url": url}
+
+        monkeypatch.setattr(ill, "_lookup_from_url", fake)
+        url = "https://www.staples.com/product_1"
+        assert ill.lookup_from_url(url)["title"] == "Box"
+        assert ill.lookup_from_url(url)["from_cache"] is True
+        ill.lookup_from_url(url, use_cache=False)
+        assert len(calls) == 2
+
+    def test_item_link_lookup_does_not_cache_exceptions(self, monkeypatch):
+        from src.agents import item_link_lookup as ill
+        calls = []
+
+        def fake(url):
+            calls.append(url)
+            return {"ok": False, "error": "boom", "supplier": "Staples",
+                    "url": url, "exception": True}
+
+        monkeypatch.setattr(ill, "_lookup_from_url", fake)
+        ill.lookup_from_url("https://www.staples.com/p/2")
+        ill.lookup_from_url("https://www.staples.com/p/2")
+        assert len(calls) == 2
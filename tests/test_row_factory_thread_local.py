@@ -73,8 +73,7 @@ def test_load_price_checks_survives_after_row_factory_mutation(_seed_one_pc):
     _trip_the_bug()
 
     # Cache may have been populated by the seed save — force a real DB read.
-    _dl._pc_cache = None
-    _dl._pc_cache_time = 0
+    _dl._pc_cache.invalidate()
 
     pcs = _load_price_checks()
     assert pc_id in pcs, (
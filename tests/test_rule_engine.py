@@ -0,0 +1,244 @@
+"""Tests for src/core/rule_engine.py — merged classifier rule sets.
+
+The classifiers used to scan each signal pattern with its own
+`re.search`. `RuleSet` merges a family into one alternation; these tests
+pin that the merged answers are identical to the per-pattern loop — both
+on hand-built edge cases (shadowing, `\\b` context, anchoring) and for
+every production family in request_classifier / email_poller over a
+mixed corpus of realistic buyer emails. `KeywordCategorizer` is pinned
+the same way against the item-category loops it replaced.
+"""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from src.core.rule_engine import KeywordCategorizer, RuleSet
+
+
+# ─── Semantics ───────────────────────────────────────────────────────────
+
+
+class TestRuleSetSemantics:
+
+    def test_hits_are_in_rule_order(self):
+        rs = RuleSet([r"zeta", r"alpha", r"mid"])
+        assert [r.pattern for r in rs.hits("alpha mid zeta")] == ["zeta", "alpha", "mid"]
+
+    def test_shadowed_rule_at_same_position_is_found(self):
+        """'ab' starts where 'abc' starts — the alternation records only
+        'abc' there, but hits() must still report both."""
+        rs = RuleSet([r"abc", r"ab"])
+        assert [r.index for r in rs.hits("xxabcxx")] == [0, 1]
+
+    def test_rule_starting_inside_another_match_is_found(self):
+        rs = RuleSet([r"price check", r"check"])
+        assert [r.index for r in rs.hits("PRICE CHECK".lower())] == [0, 1]
+
+    def test_word_boundary_context_is_respected(self):
+        rs = RuleSet([r"abc", r"\bbc"], flags=re.IGNORECASE)
+        assert [r.pattern for r in rs.hits("xxABCx")] == ["abc"]
+        assert rs.first("x bc") is not None
+
+    def test_first_is_lowest_index_not_leftmost(self):
+        rs = RuleSet([r"late", r"early"])
+        assert rs.first("early ... late").pattern == "late"
+
+    def test_values_carried_through(self):
+        rs = RuleSet([(r"\bCDCR\b", "cchcs"), (r"\bCALVET\b", "calvet")])
+        assert [r.value for r in rs.hits("CALVET and CDCR")] == ["cchcs", "calvet"]
+
+    def test_anchored_uses_match_semantics(self):
+        rs = RuleSet([r"^quote\s*-\s*", r"pc\s*[-#]"], anchored=True)
+        assert rs.first("pc - gloves").index == 1
+        assert rs.first("re: pc - gloves") is None
+        assert rs.any("quote - x")
+
+    def test_empty_text(self):
+        rs = RuleSet([r"a", r"b"])
+        assert rs.hits("") == []
+        assert rs.first("") is None
+        assert not rs.any("")
+
+    def test_backreference_family_falls_back_to_loop(self):
+        rs = RuleSet([r"(a)\1", r"b"])
+        assert "loop" in repr(rs)
+        assert [r.index for r in rs.hits("aab")] == [0, 1]
+
+    def test_guarded_and_unguarded_families_both_merge(self):
+        assert "merged" in repr(RuleSet([r"\bfoo", r"bar"]))
+        assert "merged" in repr(RuleSet([r"\w+ing", r"bar"]))
+
+
+# ─── Parity with the per-pattern loop for every production family ─────────
+
+_CORPUS = [
+    "",
+    "Hello, please see attached AMS 704 Price Check Worksheet for CSP-SAC.",
+    "PRICE CHECK # 12345 — California Correctional Health Care Services",
+    "Request For Quotation - LPA IT Goods and Services. LPA # 22-123",
+    "You have received a secure message. Click here to read the secure message. "
+    "Read the Message at https://securemail.dsh.ca.gov/formpostdir/securereader",
+    "This is a secure message from DSH Atascadero State Hospital.",
+    "Veterans Home of California - Barstow, VHC-WLA, CalVet procurement",
+    "To unsubscribe or manage your preferences, view this email in your browser. "
+    "You're receiving this because you opted in. © 2026 Vendor Inc.",
+    "QTY UOM UNIT PRICE EXTENSION — Attachment B Goods and Services Pricing Page",
+    "CDCR CIW CIM SATF KVSP — CA STATE PRISON, Corrections and Rehabilitation",
+    "cal fire forestry dgs.ca.gov Department of General Services",
+    "re: quote - gloves 02.19.26",
+    "pc # 44 nitrile gloves",
+    "rfq_703b_bid.package_attachment.2.pdf pr.10840486.pdf scope.of.work.pdf",
+    "Docusign Envelope ID: 1234 AMS704 price check",
+    "nothing interesting here at all",
+]
+
+
+def _families():
+    from src.core import request_classifier as rc
+    from src.agents import email_poller as ep
+    return [
+        rc._AGENCY_RULES, rc._INSTITUTION_RULES, rc._LPA_BODY_RULES,
+        rc._AMS_704_HEADLINE_RULES, rc._PRICING_PAGE_RULES,
+        rc._PROOFPOINT_SENDER_RULES, rc._PROOFPOINT_SUBJECT_RULES,
+        rc._PROOFPOINT_BODY_RULES,
+        ep._NEWSLETTER_RULES, ep._PC_SUBJECT_RULES, ep._RFQ_PDF_RULES,
+    ]
+
+
+@pytest.mark.parametrize("text", _CORPUS)
+@pytest.mark.parametrize("variant", ["raw", "upper", "lower"])
+def test_production_families_match_loop(text, variant):
+    text = {"raw": text, "upper": text.upper(), "lower": text.lower()}[variant]
+    for rs in _families():
+        loop = [r.index for r in rs.naive_hits(text)]
+        assert [r.index for r in rs.hits(text)] == loop, rs
+        assert rs.any(text) == bool(loop), rs
+        first = rs.first(text)
+        assert (first.index if first else None) == (loop[0] if loop else None), rs
+
+
+def test_agency_detection_matches_legacy_loop():
+    """classify_request's agency step, old loop vs merged rule sets."""
+    from src.core.request_classifier import (
+        AGENCY_KEYWORDS, INSTITUTION_TO_AGENCY, _AGENCY_RULES, _INSTITUTION_RULES,
+    )
+    for text in _CORPUS:
+        corpus = text.upper()
+        legacy = [a for p, a in AGENCY_KEYWORDS if re.search(p, corpus, re.IGNORECASE)]
+        legacy += [a for code, a in INSTITUTION_TO_AGENCY.items()
+                   if re.search(rf"\b{re.escape(code)}\b", corpus)]
+        merged = [r.value for r in _AGENCY_RULES.hits(corpus)]
+        merged += [r.value for r in _INSTITUTION_RULES.hits(corpus)]
+        assert merged == legacy, text
+
+
+def test_proofpoint_reasons_match_legacy_loop():
+    """Reasons name the first pattern in list order, as the loop did."""
+    from src.core.request_classifier import (
+        PROOFPOINT_BODY_PATTERNS, _detect_proofpoint_securemessage,
+    )
+    body = _CORPUS[4]
+    legacy = next(p for p in PROOFPOINT_BODY_PATTERNS if re.search(p, body, re.IGNORECASE))
+    hit, reasons = _detect_proofpoint_securemessage(
+        email_subject="Secure Message from DSH", email_body=body,
+        email_sender="securemail@dsh.ca.gov",
+    )
+    assert hit
+    assert f"proofpoint body pattern: {legacy}" in reasons
+
+
+# ─── Item categories ─────────────────────────────────────────────────────
+
+
+class TestKeywordCategorizer:
+
+    def test_prefix_keywords_at_same_position_all_count(self):
+        """'pen' starts where 'pencil' does — the lookahead captures only
+        'pencil', so the prefix expansion must add 'pen' back."""
+        kc = KeywordCategorizer({"a": ["pencil"], "b": ["pen", "pe"]})
+        assert kc.scores("Pencil #2") == {"a": 1, "b": 2}
+        assert kc.scores("pencil, pen") == {"a": 1, "b": 2}
+
+    def test_overlapping_and_repeated_keywords(self):
+        kc = KeywordCategorizer({"light": ["light bulb", "bulb", "led"]})
+        assert kc.scores("LED light bulb, bulb pack, labeled") == {"light": 3}
+
+    def test_best_breaks_ties_to_earlier_category(self):
+        kc = KeywordCategorizer({"x": ["foo"], "y": ["bar"]}, default="none")
+        assert kc.best("bar foo") == "x"
+        assert kc.best("bar bar") == "y"
+        assert kc.best("") == kc.best(None) == "none"
+
+    def test_first_is_mapping_order(self):
+        kc = KeywordCategorizer({"x": ["foo"], "y": ["bar"]}, default="none")
+        assert kc.first("bar then foo") == "x"
+        assert kc.first("baz") == "none"
+
+    def test_repeated_descriptions_are_cached(self):
+        kc = KeywordCategorizer({"x": ["foo"]}, cache_size=8)
+        for _ in range(5):
+            kc.best("FOO bar")
+        assert kc._scan.cache_info().hits == 4
+
+
+_ITEMS = [
+    "Nitrile Exam Gloves, Powder-Free, Large, 100/BX",
+    "COPY PAPER 8.5X11 20LB WHITE 10 REAMS/CS",
+    "Pencil #2 yellow, 12/pk; ballpoint pen blue",
+    "Safety glasses clear lens, ANSI Z87 - safety glass",
+    "LED light bulb A19 60W equiv, 4/pk",
+    "Trash bag liner 55 gallon 1.5 mil black",
+    "Paper towel roll, toilet paper, facial tissue",
+    "USB-C to HDMI adapter cable 6ft",
+    "Wheelchair cushion, patient restraint, Stryker",
+    "Coffee cup 12oz with lid; food tray; napkin",
+    "Hard hat, high-vis vest, steel toe boot",
+    "HVAC filter 20x25x1 MERV 8",
+    "IV start kit with catheter and gauze",
+    "Hospital grade disinfectant wipe canister",
+    "misc hardware: bolt, wrench, drill bit, hose",
+    "",
+    "nothing categorizable 12345",
+]
+
+
+def _legacy_growth(description):
+    from src.agents.growth_agent import CATEGORY_KEYWORDS
+    desc_lower = (description or "").lower()
+    scores = {}
+    for cat, keywords in CATEGORY_KEYWORDS.items():
+        score = sum(1 for kw in keywords if kw in desc_lower)
+        if score > 0:
+            scores[cat] = score
+    return max(scores, key=scores.get) if scores else "General Supplies"
+
+
+def _legacy_won_quotes(description):
+    from src.knowledge.won_quotes_db import CATEGORY_KEYWORDS
+    desc_lower = description.lower()
+    best_category, best_score = "general", 0
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if category == "general":
+            continue
+        score = sum(1 for kw in keywords if kw in desc_lower)
+        if score > best_score:
+            best_score, best_category = score, category
+    return best_category
+
+
+@pytest.mark.parametrize("text", _ITEMS)
+@pytest.mark.parametrize("variant", ["raw", "upper", "lower"])
+def test_item_categorizers_match_legacy_loops(text, variant):
+    from src.agents.growth_agent import ITEM_CATEGORIZER, categorize_item
+    from src.agents.pricing_feedback import _LOSS_CATEGORIES
+    from src.knowledge.won_quotes_db import _CATEGORIZER, classify_category
+    text = {"raw": text, "upper": text.upper(), "lower": text.lower()}[variant]
+    assert categorize_item(text) == _legacy_growth(text)
+    assert classify_category(text) == _legacy_won_quotes(text)
+    for kc in (ITEM_CATEGORIZER, _CATEGORIZER, _LOSS_CATEGORIES):
+        assert kc.scores(text) == kc.naive_scores(text), kc
+    legacy_loss = next((cat for cat, kws in _LOSS_CATEGORIES.categories.items()
+                        if any(kw in text.lower() for kw in kws)), "Other")
+    assert _LOSS_CATEGORIES.first(text) == legacy_loss
@@ -0,0 +1,72 @@
+"""Tests for src/core/throttle.py — blocking token buckets.
+
+Pins: a bucket hands out its burst immediately and then paces callers
+at `rate`, concurrent callers share one budget, per-host buckets are
+independent, and THROTTLE_<NAME> overrides the default rate.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from src.core import throttle
+
+
+@pytest.fixture(autouse=True)
+def _fresh_buckets():
+    throttle.reset()
+    yield
+    throttle.reset()
+
+
+def test_burst_then_paced():
+    b = throttle.TokenBucket(rate=20, burst=2)
+    t0 = time.monotonic()
+    for _ in range(4):
+        b.acquire()
+    elapsed = time.monotonic() - t0
+    assert 0.08 <= elapsed < 0.5          # 2 free, then 2 × 50ms
+    assert b.acquired == 4
+
+
+def test_timeout_returns_false():
+    b = throttle.TokenBucket(rate=0.5, burst=1)
+    assert b.acquire()
+    assert b.acquire(timeout=0.05) is False
+
+
+def test_concurrent_callers_share_the_budget():
+    b = throttle.TokenBucket(rate=50, burst=1)
+    stamps, lock = [], threading.Lock()
+
+    def worker():
+        b.acquire()
+        with lock:
+            stamps.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    t0 = time.monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(stamps) == 6
+    assert max(stamps) - t0 >= 0.09       # 5 paced tokens at 20ms
+
+
+def test_hosts_have_independent_buckets(monkeypatch):
+    monkeypatch.setenv("THROTTLE_HOST", "1:1")
+    t0 = time.monotonic()
+    throttle.acquire_host("https://www.grainger.com/p/1")
+    throttle.acquire_host("https://www.uline.com/p/2")
+    assert time.monotonic() - t0 < 0.2
+    assert throttle.acquire_host("https://www.grainger.com/p/3", timeout=0.05) is False
+    assert set(throttle.throttle_stats()) == {"host:www.grainger.com", "host:www.uline.com"}
+
+
+def test_env_override(monkeypatch):
+    monkeypatch.setenv("THROTTLE_GROK", "7:3")
+    b = throttle.bucket("grok")
+    assert (b.rate, b.burst) == (7.0, 3)
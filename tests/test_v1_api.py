@@ -98,6 +98,30 @@ class TestV1Pipeline:
         assert "pcs" in data
         assert "orders" in data
         assert "agents" in data
+        assert data["rfqs"]["by_status"]["new"] >= 1
+        assert data["pcs"]["by_status"]["parsed"] >= 1
+        assert data["orders"]["by_status"]["new"] >= 1
+        for key in ("rfqs", "pcs", "orders"):
+            assert data[key]["total"] == sum(data[key]["by_status"].values())
+
+
+class TestV1Lists:
+    def test_rfqs_paged_by_cursor(self, client, headers):
+        for i in range(3):
+            save_rfq({"id": f"LST{i}", "status": "new", "received_at": "2026-01-01"})
+        resp = client.get("/api/v1/rfqs?status=new&limit=2", headers=headers)
+        assert resp.status_code == 200
+        first = resp.get_json()["data"]
+        assert first["count"] == 2 and first["has_more"] is True
+        resp = client.get(f"/api/v1/rfqs?limit=2&cursor={first['next_cursor']}",
+                          headers=headers)
+        rest = resp.get_json()["data"]
+        assert [r["id"] for r in first["items"] + rest["items"]] == ["LST0", "LST1", "LST2"]
+        assert rest["has_more"] is False
+
+    def test_bad_cursor_is_400(self, client, headers):
+        resp = client.get("/api/v1/orders?cursor=bogus", headers=headers)
+        assert resp.status_code == 400
 
 
 class TestV1CreateRFQ:
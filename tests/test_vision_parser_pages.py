@@ -0,0 +1,125 @@
+"""Vision parser — per-page rendering, page-hash result cache, fake client.
+
+Pins: PDF pages are rendered one at a time and only as call slots free
+up; a repeat page (same image bytes, same prompt) is served from the
+cache with no model call; a prompt change invalidates it; page results
+merge into one parse in page order; and a failing page doesn't sink the
+rest of the document.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+from src.forms import vision_parser as vp
+
+
+class _Img:
+    def __init__(self, page):
+        self.page = page
+        self.width, self.height = 1200, 1553
+
+    def save(self, buf, format=None, optimize=False):
+        buf.write(f"png-page-{self.page}".encode())
+
+
+@pytest.fixture
+def fake_pdf(monkeypatch):
+    """pdf2image stand-in: a 4-page PDF, one convert call per page."""
+    rendered = []
+    mod = types.ModuleType("pdf2image")
+    mod.pdfinfo_from_path = lambda path: {"Pages": 4}
+
+    def convert_from_path(path, dpi=200, first_page=None, last_page=None, fmt="png"):
+        assert first_page == last_page
+        rendered.append(first_page)
+        return [_Img(first_page)]
+    mod.convert_from_path = convert_from_path
+    monkeypatch.setitem(sys.modules, "pdf2image", mod)
+    return rendered
+
+
+@pytest.fixture
+def client():
+    fake = vp.FakeVisionClient(items_per_page=2)
+    vp.set_vision_client(fake)
+    yield fake
+    vp.set_vision_client(None)
+
+
+def test_pages_render_lazily(fake_pdf):
+    it = vp._iter_pdf_pages("x.pdf")
+    first = next(it)
+    assert fake_pdf == [1] and first["page"] == 1
+    assert [p["page"] for p in it] == [2, 3, 4]
+    assert vp._pdf_pages_to_base64("x.pdf", max_pages=2)[-1]["page"] == 2
+
+
+def test_parse_merges_pages_and_repeat_costs_no_calls(fake_pdf, client):
+    result = vp.parse_with_vision("scan.pdf")
+    assert client.calls == 4
+    assert [it["line_number"] for it in result["line_items"]] == list(range(1, 9))
+    assert result["header"]["price_check_number"] == "FAKE-1"
+    assert result["parse_method"] == "vision"
+
+    again = vp.parse_with_vision("scan-copy.pdf")
+    assert client.calls == 4
+    assert [it["description"] for it in again["line_items"]] == \
+        [it["description"] for it in result["line_items"]]
+
+
+def test_prompt_change_invalidates_cache(fake_pdf, client):
+    vp.parse_with_vision("scan.pdf")
+    vp.parse_with_vision("scan.pdf", mode="screenshot_urls")
+    assert client.calls == 8
+
+
+def test_rendering_overlaps_calls_with_bounded_in_flight():
+    active, peak, lock = [0], [0], threading.Lock()
+    pulled = []
+
+    def slow(page_images, system_prompt=None, instruction=None):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.1)
+        with lock:
+            active[0] -= 1
+        return {"header": {}, "items": [{"description": page_images[0]["base64"]}]}
+
+    def pages():
+        for n in range(6):
+            pulled.append((n, active[0]))
+            yield {"base64": f"p{n}", "page": n + 1}
+
+    vp.set_vision_client(slow)
+    try:
+        t0 = time.monotonic()
+        results, stats = vp._extract_pages(pages(), use_cache=False, workers=2)
+    finally:
+        vp.set_vision_client(None)
+    assert time.monotonic() - t0 < 0.5
+    assert peak[0] == 2
+    assert any(busy for _, busy in pulled[1:])
+    assert [r["items"][0]["description"] for r in results] == [f"p{n}" for n in range(6)]
+    assert stats == {"pages": 6, "cache_hits": 0, "api_calls": 6, "errors": 0}
+
+
+def test_failed_page_is_skipped_not_fatal():
+    def flaky(page_images, system_prompt=None, instruction=None):
+        if page_images[0]["base64"] == "bad":
+            raise RuntimeError("timeout")
+        return {"header": {}, "items": [{"description": "ok"}]}
+
+    vp.set_vision_client(flaky)
+    try:
+        pages = [{"base64": b, "page": i} for i, b in enumerate(["a", "bad", "c"], 1)]
+        results, stats = vp._extract_pages(iter(pages), use_cache=False)
+    finally:
+        vp.set_vision_client(None)
+    assert results[1] is None and results[0] and results[2]
+    assert stats["errors"] == 1